@@ -85,10 +85,11 @@ async def eval_comprehensive_comparison() -> EvalSuite:
 
     print("\n  Loading tool sources...")
 
-    # Load from Arcade Gateway
-    try:
-        print("  → Loading Arcade Gateway (Math)...")
-        await asyncio.wait_for(
+    # Load both sources concurrently; each registers its tools as it finishes,
+    # in the order the sources are listed here
+    print("  → Loading Arcade Gateway (Math) and stdio MCP server (simple)...")
+    sources = {
+        "arcade_gateway": asyncio.wait_for(
             suite.add_arcade_gateway(
                 gateway_slug="Math",
                 arcade_api_key=ARCADE_API_KEY,
@@ -96,31 +97,25 @@ async def eval_comprehensive_comparison() -> EvalSuite:
                 track="arcade_gateway",
             ),
             timeout=10.0,
-        )
-        loaded_tracks.append("arcade_gateway")
-        print("  ✓ Arcade Gateway")
-    except asyncio.TimeoutError:
-        print("  ✗ Arcade Gateway - timeout")
-    except Exception as e:
-        print(f"  ✗ Arcade Gateway - {type(e).__name__}: {e}")
-
-    # Load from stdio MCP server
-    try:
-        print("  → Loading stdio MCP server (simple)...")
-        await asyncio.wait_for(
+        ),
+        "stdio_simple": asyncio.wait_for(
             suite.add_mcp_stdio_server(
                 command=SIMPLE_SERVER_COMMAND,
                 env={"PYTHONUNBUFFERED": "1"},
                 track="stdio_simple",
             ),
             timeout=15.0,
-        )
-        loaded_tracks.append("stdio_simple")
-        print("  ✓ Stdio MCP server")
-    except asyncio.TimeoutError:
-        print("  ✗ Stdio MCP server - timeout")
-    except Exception as e:
-        print(f"  ✗ Stdio MCP server - {type(e).__name__}: {e}")
+        ),
+    }
+    results = await asyncio.gather(*sources.values(), return_exceptions=True)
+    for track, result in zip(sources, results):
+        if isinstance(result, asyncio.TimeoutError):
+            print(f"  ✗ {track} - timeout")
+        elif isinstance(result, Exception):
+            print(f"  ✗ {track} - {type(result).__name__}: {result}")
+        else:
+            loaded_tracks.append(track)
+            print(f"  ✓ {track}")
 
     print(f"\n  Loaded tracks: {loaded_tracks}\n")
 
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -440,6 +441,7 @@ def display_eval_results(
     # Also write to file(s) if requested using the specified formatter(s)
     if output_file and output_formats:
         from arcade_cli.formatters import get_formatter
+        from arcade_cli.formatters.base import ReportFragments
 
         # Get base path without extension
         base_path = Path(output_file)
@@ -460,19 +462,27 @@ def display_eval_results(
             output_path = parent_dir / f"{base_name}.{fmt}"
             try:
                 formatter = get_formatter(fmt)
-                formatted_output = formatter.format(
-                    results,
-                    show_details=show_details,
-                    failed_only=failed_only,
-                    original_counts=original_counts,
-                    include_context=include_context,
-                )
 
                 # Build output path with proper extension
                 output_path = parent_dir / f"{base_name}.{formatter.file_extension}"
 
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(formatted_output)
+                # Stream the report into a temporary file so a failure midway
+                # never leaves a truncated report behind.
+                tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+                try:
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        formatter.write(
+                            results,
+                            f,
+                            show_details=show_details,
+                            failed_only=failed_only,
+                            original_counts=original_counts,
+                            include_context=include_context,
+                            fragments=ReportFragments.for_report(output_path),
+                        )
+                    os.replace(tmp_path, output_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
 
                 console.print(f"[green]✓ Results written to {output_path}[/green]")
 
@@ -8,8 +8,11 @@ and capture mode operations.
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
-from dataclasses import dataclass
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -19,10 +22,10 @@ from rich.text import Text
 
 from arcade_cli.display import display_eval_results
 from arcade_cli.formatters import get_capture_formatter
-from arcade_cli.utils import ModelSpec, filter_failed_evaluations
+from arcade_cli.utils import ModelSpec, filter_failed_evaluations, load_eval_suites
 
 if TYPE_CHECKING:
-    from arcade_evals import CaptureResult
+    from arcade_evals import CaptureResult, EvalJournal, RateLimiterStats, ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -163,6 +166,8 @@ async def _run_eval_task(
     seed: str | int,
     multi_run_pass_rule: str,
     include_context: bool = False,
+    response_cache: ResponseCache | None = None,
+    journal: EvalJournal | None = None,
 ) -> EvalTaskResult:
     """
     Run a single evaluation task with error handling.
@@ -181,6 +186,8 @@ async def _run_eval_task(
             num_runs=num_runs,
             seed=seed,
             multi_run_pass_rule=multi_run_pass_rule,
+            response_cache=response_cache,
+            journal=journal,
         )
         return EvalTaskResult.from_success(
             suite_name, model_spec.model, model_spec.provider.value, result
@@ -206,6 +213,7 @@ async def _run_capture_task(
     include_context: bool,
     num_runs: int,
     seed: str | int,
+    response_cache: ResponseCache | None = None,
 ) -> CaptureTaskResult:
     """
     Run a single capture task with error handling.
@@ -224,6 +232,7 @@ async def _run_capture_task(
             include_context=include_context,
             num_runs=num_runs,
             seed=seed,
+            response_cache=response_cache,
         )
         return CaptureTaskResult.from_success(
             suite_name, model_spec.model, model_spec.provider.value, result
@@ -244,6 +253,192 @@ async def _run_capture_task(
         )
 
 
+# --- Process Pool (--processes) ---
+
+
+@dataclass
+class EvalWorkerSettings:
+    """Process-wide eval settings that worker processes must apply themselves.
+
+    Rate limit budgets are split evenly between the workers, so the run as a
+    whole stays within them.
+    """
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    tools_cache_dir: str | None = None
+    tools_cache_ttl: float = 3600
+    refresh_tools: bool = False
+    processes: int = 1
+    journal_path: str | None = None
+
+    def apply(self) -> None:
+        # Lazy import: arcade_evals requires optional deps (openai)
+        from arcade_evals import configure_tools_cache, set_default_rate_limits
+
+        set_default_rate_limits(
+            self.requests_per_minute / self.processes if self.requests_per_minute else None,
+            self.tokens_per_minute / self.processes if self.tokens_per_minute else None,
+        )
+        if self.tools_cache_dir is not None:
+            configure_tools_cache(
+                self.tools_cache_dir, ttl=self.tools_cache_ttl, refresh=self.refresh_tools
+            )
+
+
+@dataclass
+class _EvalWorkUnit:
+    """One (suite, model) evaluation, addressed by file so a worker can import it."""
+
+    eval_file: str
+    suite_name: str
+    model_spec: ModelSpec
+    max_concurrent: int
+    num_runs: int
+    seed: str | int
+    multi_run_pass_rule: str
+    include_context: bool
+    response_cache: ResponseCache | None
+
+
+@dataclass
+class _EvalWorkOutcome:
+    result: EvalTaskResult
+    rate_limiter_stats: list[RateLimiterStats] = field(default_factory=list)
+    resumed: int = 0
+
+
+# Suites imported by this worker process, by eval file
+_worker_suites: dict[str, list[Callable[..., Any]]] = {}
+
+# The run's journal, read once per worker process rather than once per unit
+_worker_journal: EvalJournal | None = None
+
+
+def _init_eval_worker(settings: EvalWorkerSettings) -> None:
+    global _worker_journal
+
+    settings.apply()
+    if settings.journal_path is not None:
+        from arcade_evals import EvalJournal
+
+        # The parent created (or resumed) the journal; workers append to it.
+        _worker_journal = EvalJournal(settings.journal_path, resume=True)
+
+
+def _run_eval_unit(unit: _EvalWorkUnit) -> _EvalWorkOutcome:
+    """Run one work unit in a worker process (the pool's target function)."""
+    from arcade_evals import rate_limiter_stats, reset_rate_limiters
+
+    suites = _worker_suites.get(unit.eval_file)
+    if suites is None:
+        suites = _worker_suites[unit.eval_file] = load_eval_suites([Path(unit.eval_file)])
+    suite_func = next((f for f in suites if f.__name__ == unit.suite_name), None)
+    if suite_func is None:
+        error = LookupError(f"Suite {unit.suite_name} not found in {unit.eval_file}")
+        return _EvalWorkOutcome(
+            EvalTaskResult.from_error(
+                unit.suite_name, unit.model_spec.model, unit.model_spec.provider.value, error
+            )
+        )
+
+    journal = _worker_journal
+    resumed_before = journal.resumed if journal is not None else 0
+    result = asyncio.run(
+        _run_eval_task(
+            suite_func=suite_func,
+            model_spec=unit.model_spec,
+            max_concurrent=unit.max_concurrent,
+            num_runs=unit.num_runs,
+            seed=unit.seed,
+            multi_run_pass_rule=unit.multi_run_pass_rule,
+            include_context=unit.include_context,
+            response_cache=unit.response_cache,
+            journal=journal,
+        )
+    )
+    outcome = _EvalWorkOutcome(
+        result,
+        rate_limiter_stats(),
+        journal.resumed - resumed_before if journal is not None else 0,
+    )
+    # Report each unit's throughput once: start the next unit with fresh limiters.
+    reset_rate_limiters(keep_limits=True)
+    return outcome
+
+
+async def _run_eval_task_in_pool(
+    pool: ProcessPoolExecutor,
+    unit: _EvalWorkUnit,
+    outcomes: list[_EvalWorkOutcome],
+) -> EvalTaskResult:
+    """Run a work unit in the pool, collecting its outcome as it completes."""
+    try:
+        outcome = await asyncio.get_running_loop().run_in_executor(pool, _run_eval_unit, unit)
+    except Exception as e:
+        # Typically a crashed worker (BrokenProcessPool) or an unpicklable result
+        logger.warning(
+            "Evaluation worker failed: suite=%s, model=%s, error=%s: %s",
+            unit.suite_name,
+            unit.model_spec.model,
+            type(e).__name__,
+            str(e),
+            exc_info=True,
+        )
+        return EvalTaskResult.from_error(
+            unit.suite_name, unit.model_spec.model, unit.model_spec.provider.value, e
+        )
+    outcomes.append(outcome)
+    return outcome.result
+
+
+def _merge_rate_limiter_stats(stats: list[RateLimiterStats]) -> list[RateLimiterStats]:
+    """Combine per-unit limiter stats into one entry per provider/model."""
+    from arcade_evals import RateLimiterStats
+
+    merged: dict[tuple[str, str], RateLimiterStats] = {}
+    for entry in stats:
+        key = (entry.provider, entry.model)
+        if key not in merged:
+            merged[key] = RateLimiterStats(entry.provider, entry.model, 0, 0, 0, 0.0)
+        total = merged[key]
+        total.requests += entry.requests
+        total.tokens += entry.tokens
+        total.rate_limited += entry.rate_limited
+        # Units run side by side, so the longest one approximates the wall time.
+        total.elapsed = max(total.elapsed, entry.elapsed)
+    return list(merged.values())
+
+
+def _print_throughput_summary(
+    console: Console, stats: list[RateLimiterStats] | None = None
+) -> None:
+    """Print the request and token throughput achieved per provider/model.
+
+    Args:
+        console: Rich console for output.
+        stats: Throughput to report; defaults to this process's rate limiters.
+    """
+    # Lazy import: arcade_evals requires optional deps (openai)
+    from arcade_evals import rate_limiter_stats
+
+    if stats is None:
+        stats = rate_limiter_stats()
+    if not stats:
+        return
+    console.print("\n[bold]Provider throughput:[/bold]")
+    for entry in stats:
+        line = (
+            f"  • {entry.provider}/{entry.model}: {entry.requests} requests "
+            f"({entry.requests_per_minute:.1f}/min)"
+        )
+        if entry.tokens:
+            line += f", {entry.tokens} tokens ({entry.tokens_per_minute:.0f}/min)"
+        if entry.rate_limited:
+            line += f", [yellow]{entry.rate_limited} rate limited[/yellow]"
+        console.print(line)
+
+
 # --- Main Runner Functions ---
 
 
@@ -260,11 +455,17 @@ async def run_evaluations(
     seed: str | int,
     multi_run_pass_rule: str,
     include_context: bool = False,
+    response_cache: ResponseCache | None = None,
+    journal: EvalJournal | None = None,
+    processes: int = 1,
+    worker_settings: EvalWorkerSettings | None = None,
 ) -> None:
     """
     Run evaluation suites and display results.
 
     Individual task failures are caught and reported without crashing the entire batch.
+    With processes > 1, each (suite, model) pair runs in a pool of worker processes,
+    which import the suite from its eval file; results are merged here as they complete.
 
     Args:
         eval_suites: List of decorated evaluation suite functions.
@@ -279,8 +480,33 @@ async def run_evaluations(
         seed: Seed policy ("constant", "random", or an integer seed).
         multi_run_pass_rule: How to determine pass/warn for multi-run cases.
         include_context: Whether to include system_message and additional_messages.
+        response_cache: Optional record/replay cache for model responses.
+        journal: Optional journal recording completed cases; cases it already holds are skipped.
+        processes: Number of worker processes (1 runs everything in this process).
+        worker_settings: Process-wide settings for the workers to apply.
     """
+    # Lazy import: arcade_evals requires optional deps (openai)
+    from arcade_evals import reset_rate_limiters
+
+    # Throughput is reported per run, not accumulated over the process.
+    reset_rate_limiters(keep_limits=True)
+
     tasks = []
+    pool: ProcessPoolExecutor | None = None
+    outcomes: list[_EvalWorkOutcome] = []
+    if processes > 1:
+        settings = replace(
+            worker_settings or EvalWorkerSettings(),
+            processes=processes,
+            journal_path=str(journal.path) if journal is not None else None,
+        )
+        # spawn: forking a process that runs an event loop (and its threads) is unsafe
+        pool = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_eval_worker,
+            initargs=(settings,),
+        )
 
     for suite_func in eval_suites:
         console.print(
@@ -290,17 +516,33 @@ async def run_evaluations(
             )
         )
         for model_spec in model_specs:
-            task = asyncio.create_task(
-                _run_eval_task(
-                    suite_func=suite_func,
+            if pool is None:
+                task = asyncio.create_task(
+                    _run_eval_task(
+                        suite_func=suite_func,
+                        model_spec=model_spec,
+                        max_concurrent=max_concurrent,
+                        include_context=include_context,
+                        num_runs=num_runs,
+                        seed=seed,
+                        multi_run_pass_rule=multi_run_pass_rule,
+                        response_cache=response_cache,
+                        journal=journal,
+                    )
+                )
+            else:
+                unit = _EvalWorkUnit(
+                    eval_file=inspect.getfile(inspect.unwrap(suite_func)),
+                    suite_name=suite_func.__name__,
                     model_spec=model_spec,
                     max_concurrent=max_concurrent,
-                    include_context=include_context,
                     num_runs=num_runs,
                     seed=seed,
                     multi_run_pass_rule=multi_run_pass_rule,
+                    include_context=include_context,
+                    response_cache=response_cache,
                 )
-            )
+                task = asyncio.create_task(_run_eval_task_in_pool(pool, unit, outcomes))
             tasks.append(task)
 
     # Track progress with Rich progress bar (compatible with Rich console)
@@ -308,24 +550,41 @@ async def run_evaluations(
     # The append() is atomic in CPython due to the GIL, and we await each future
     # sequentially within the for-loop, so this is safe.
     task_results: list[EvalTaskResult] = []
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-        transient=False,
-    ) as progress:
-        task_id = progress.add_task("[cyan]Running evaluations...", total=len(tasks))
-        for f in asyncio.as_completed(tasks):
-            result = await f
-            task_results.append(result)
-            # Update progress with completed task info
-            progress.update(
-                task_id,
-                advance=1,
-                description=f"[cyan]Completed: {result.suite_name} ({result.display_name})",
-            )
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            transient=False,
+        ) as progress:
+            task_id = progress.add_task("[cyan]Running evaluations...", total=len(tasks))
+            for f in asyncio.as_completed(tasks):
+                result = await f
+                task_results.append(result)
+                # Update progress with completed task info
+                progress.update(
+                    task_id,
+                    advance=1,
+                    description=f"[cyan]Completed: {result.suite_name} ({result.display_name})",
+                )
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    if pool is None:
+        _print_throughput_summary(console)
+    else:
+        _print_throughput_summary(
+            console, _merge_rate_limiter_stats([s for o in outcomes for s in o.rate_limiter_stats])
+        )
+        if journal is not None:
+            journal.resumed += sum(o.resumed for o in outcomes)
+    if journal is not None:
+        if journal.resumed:
+            console.print(f"\nResumed {journal.resumed} completed case(s) from {journal.path}")
+        console.print(f"Journal: {journal.path} (continue with --resume {journal.path})")
 
     # Separate successes and failures
     successful = [r for r in task_results if r.success]
@@ -358,6 +617,76 @@ async def run_evaluations(
         console.print("\n[bold red]❌ No evaluations completed successfully.[/bold red]")
         return
 
+    _display_evaluations(
+        all_evaluations,
+        show_details=show_details,
+        output_file=output_file,
+        output_format=output_format,
+        failed_only=failed_only,
+        console=console,
+        include_context=include_context,
+    )
+
+    # Summary when there were failures
+    if failed:
+        console.print(f"\n[bold]Summary:[/bold] {len(successful)} succeeded, {len(failed)} failed")
+
+
+def report_from_journal(
+    journal_path: str,
+    show_details: bool,
+    output_file: str | None,
+    output_format: str,
+    failed_only: bool,
+    console: Console,
+    include_context: bool = False,
+) -> None:
+    """
+    Display the results recorded in a journal without running any evaluation.
+
+    The journal is read in one streaming pass that keeps only the latest
+    result of each case, so a journal holding resumed or repeated runs
+    renders like the run it records.
+
+    Args:
+        journal_path: The journal written by --journal or --resume.
+        show_details: Whether to show detailed results.
+        output_file: Optional file path to write results.
+        output_format: Format for file output ('txt', 'md', 'html', 'json', or 'all').
+        failed_only: Whether to show only failed evaluations.
+        console: Rich console for output.
+        include_context: Whether to include system_message and additional_messages.
+    """
+    # Lazy import: arcade_evals requires optional deps (openai)
+    from arcade_evals import load_journal_results
+
+    all_evaluations = load_journal_results(journal_path)
+    if not all_evaluations:
+        console.print(f"\n[bold red]❌ No completed cases in {journal_path}.[/bold red]")
+        return
+
+    _display_evaluations(
+        all_evaluations,
+        show_details=show_details,
+        output_file=output_file,
+        output_format=output_format,
+        failed_only=failed_only,
+        console=console,
+        include_context=include_context,
+    )
+
+
+def _display_evaluations(
+    all_evaluations: list[list[dict[str, Any]]],
+    *,
+    show_details: bool,
+    output_file: str | None,
+    output_format: str,
+    failed_only: bool,
+    console: Console,
+    include_context: bool,
+) -> None:
+    """Show results in the terminal and write them to the requested report files."""
     # Filter to show only failed evaluations if requested
     original_counts = None
     if failed_only:
@@ -376,10 +705,6 @@ async def run_evaluations(
         include_context=include_context,
     )
 
-    # Summary when there were failures
-    if failed:
-        console.print(f"\n[bold]Summary:[/bold] {len(successful)} succeeded, {len(failed)} failed")
-
 
 async def run_capture(
     eval_suites: list[Callable[..., Any]],
@@ -391,6 +716,7 @@ async def run_capture(
     console: Console,
     num_runs: int,
     seed: str | int,
+    response_cache: ResponseCache | None = None,
 ) -> None:
     """
     Run evaluation suites in capture mode and output results.
@@ -408,6 +734,7 @@ async def run_capture(
         console: Rich console for output.
         num_runs: Number of runs per case.
         seed: Seed policy ("constant", "random", or an integer seed).
+        response_cache: Optional record/replay cache for model responses.
     """
     tasks = []
 
@@ -427,6 +754,7 @@ async def run_capture(
                     include_context=include_context,
                     num_runs=num_runs,
                     seed=seed,
+                    response_cache=response_cache,
                 )
             )
             tasks.append(task)
@@ -455,6 +783,8 @@ async def run_capture(
                 description=f"[cyan]Completed: {result.suite_name} ({result.display_name})",
             )
 
+    _print_throughput_summary(console)
+
     # Separate successes and failures
     successful = [r for r in task_results if r.success]
     failed = [r for r in task_results if not r.success]
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
 
 if TYPE_CHECKING:
     from arcade_evals import CaptureResult
@@ -31,6 +34,9 @@ ComparativeGroups = dict[str, dict[str, ComparativeSuiteData]]  # model -> suite
 MAX_FIELD_DISPLAY_LENGTH = 60
 TRUNCATION_SUFFIX = "..."
 
+# Rendered conversations at least this large are moved out of streamed reports
+FRAGMENT_MIN_SIZE = 256 * 1024
+
 
 def truncate_field_value(value: str, max_length: int = MAX_FIELD_DISPLAY_LENGTH) -> str:
     """
@@ -745,6 +751,67 @@ def group_captures_by_case_then_track(
     return grouped, model_order, track_order
 
 
+def write_lines(sink: TextIO, lines: Iterable[str]) -> None:
+    """Write lines to a sink as they are produced, separated like ``"\\n".join(lines)``."""
+    separator = ""
+    for line in lines:
+        sink.write(separator)
+        sink.write(line)
+        separator = "\n"
+
+
+class ReportFragments:
+    """
+    Moves very large report sections into separate files next to the report.
+
+    Streamed reports link to fragments by a path relative to the report, so
+    ``directory`` must be a sibling of the report file.
+
+    Args:
+        directory: Where fragment files are written (created on first use).
+        min_size: Sections at least this many characters long become fragments.
+    """
+
+    def __init__(self, directory: str | Path, min_size: int = FRAGMENT_MIN_SIZE) -> None:
+        self.directory = Path(directory)
+        self.min_size = min_size
+        self.count = 0
+
+    @classmethod
+    def for_report(
+        cls, report_path: str | Path, min_size: int = FRAGMENT_MIN_SIZE
+    ) -> ReportFragments:
+        """Fragments for a report, kept in ``<report name>_files/`` beside it."""
+        report_path = Path(report_path)
+        return cls(report_path.with_name(f"{report_path.stem}_files"), min_size)
+
+    def should_split(self, content: str) -> bool:
+        return len(content) >= self.min_size
+
+    def clear(self, extension: str) -> None:
+        """Remove the ``extension`` fragments of an earlier report and restart numbering.
+
+        Called before a report is written, so a shorter run does not leave a
+        previous run's higher-numbered fragments behind. Fragments of other
+        formats sharing the directory are kept.
+        """
+        self.count = 0
+        if not self.directory.is_dir():
+            return
+        for stale in self.directory.glob(f"conversation-*.{extension}"):
+            stale.unlink(missing_ok=True)
+        with contextlib.suppress(OSError):
+            self.directory.rmdir()  # Only succeeds when nothing else is left
+
+    def write(self, content: str, extension: str) -> str:
+        """Write a conversation fragment and return its path relative to the report."""
+        self.count += 1
+        name = f"conversation-{self.count:05d}.{extension}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / name).write_text(content, encoding="utf-8")
+        return f"{self.directory.name}/{name}"
+
+
 class EvalResultFormatter(ABC):
     """
     Abstract base class for evaluation result formatters.
@@ -782,6 +849,36 @@ class EvalResultFormatter(ABC):
         """
         ...
 
+    def write(
+        self,
+        results: EvalResults,
+        sink: TextIO,
+        show_details: bool = False,
+        failed_only: bool = False,
+        original_counts: EvalStats | None = None,
+        include_context: bool = False,
+        fragments: ReportFragments | None = None,
+    ) -> None:
+        """
+        Write formatted results to a file-like sink.
+
+        Formatters that can stream override this to write the report section
+        by section instead of building it in memory first; the output is the
+        same as ``format``, except for sections moved into ``fragments``.
+
+        Args:
+            results: Nested list of evaluation results by suite and model.
+            sink: Text stream the report is written to.
+            show_details: Whether to show detailed results for each case.
+            failed_only: Whether only failed cases are being displayed.
+            original_counts: Optional (total, passed, failed, warned) from before filtering.
+            include_context: Whether to include system_message and additional_messages.
+            fragments: Where to put very large conversations, if anywhere.
+        """
+        sink.write(
+            self.format(results, show_details, failed_only, original_counts, include_context)
+        )
+
 
 class CaptureFormatter(ABC):
     """
@@ -1,14 +1,16 @@
 """HTML formatter for evaluation and capture results with full color support."""
 
 import json
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, TextIO
 
 from arcade_cli.formatters.base import (
     CaptureFormatter,
     CaptureResults,
     ComparativeCaseData,
     EvalResultFormatter,
+    ReportFragments,
     compute_track_differences,
     find_best_model,
     group_comparative_by_case,
@@ -20,6 +22,7 @@ from arcade_cli.formatters.base import (
     is_multi_model_comparative,
     is_multi_model_eval,
     truncate_field_value,
+    write_lines,
 )
 
 
@@ -39,6 +42,7 @@ class HtmlFormatter(EvalResultFormatter):
         super().__init__()
         self._id_cache: dict[tuple[str, str, str], str] = {}
         self._used_ids: set[str] = set()
+        self._fragments: ReportFragments | None = None
 
     @property
     def file_extension(self) -> str:
@@ -52,30 +56,70 @@ class HtmlFormatter(EvalResultFormatter):
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
     ) -> str:
+        return "\n".join(
+            self._iter_lines(results, show_details, failed_only, original_counts, include_context)
+        )
+
+    def write(
+        self,
+        results: list[list[dict[str, Any]]],
+        sink: TextIO,
+        show_details: bool = False,
+        failed_only: bool = False,
+        original_counts: tuple[int, int, int, int] | None = None,
+        include_context: bool = False,
+        fragments: ReportFragments | None = None,
+    ) -> None:
+        """Write the report to ``sink`` one section at a time.
+
+        With ``fragments``, conversations too large to inline are written to
+        separate files and loaded from there.
+        """
+        if fragments is not None:
+            fragments.clear("html")
+        self._fragments = fragments
+        try:
+            write_lines(
+                sink,
+                self._iter_lines(
+                    results, show_details, failed_only, original_counts, include_context
+                ),
+            )
+        finally:
+            self._fragments = None
+
+    def _iter_lines(
+        self,
+        results: list[list[dict[str, Any]]],
+        show_details: bool = False,
+        failed_only: bool = False,
+        original_counts: tuple[int, int, int, int] | None = None,
+        include_context: bool = False,
+    ) -> Iterator[str]:
         # Check if this is a comparative evaluation
         if is_comparative_result(results):
-            return self._format_comparative(
+            return self._iter_comparative(
                 results, show_details, failed_only, original_counts, include_context
             )
 
         # Check if this is a multi-model evaluation
         if is_multi_model_eval(results):
-            return self._format_multi_model(
+            return self._iter_multi_model(
                 results, show_details, failed_only, original_counts, include_context
             )
 
-        return self._format_regular(
+        return self._iter_regular(
             results, show_details, failed_only, original_counts, include_context
         )
 
-    def _format_regular(
+    def _iter_regular(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format regular (non-comparative) evaluation results."""
         # Use shared grouping logic
         model_groups, total_passed, total_failed, total_warned, total_cases = (
@@ -92,90 +136,62 @@ class HtmlFormatter(EvalResultFormatter):
             pass_rate = 0
 
         # Build HTML
-        html_parts = [self._get_html_header()]
+        yield self._get_html_header()
 
         # Title and timestamp
-        html_parts.append('<div class="container">')
-        html_parts.append("<h1>🎯 Evaluation Results</h1>")
-        html_parts.append(
-            f'<p class="timestamp">Generated: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}</p>'
-        )
+        yield '<div class="container">'
+        yield "<h1>🎯 Evaluation Results</h1>"
+        yield f'<p class="timestamp">Generated: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}</p>'
 
         # Summary section
-        html_parts.append('<div class="summary-section">')
-        html_parts.append("<h2>📊 Summary</h2>")
+        yield '<div class="summary-section">'
+        yield "<h2>📊 Summary</h2>"
 
         if failed_only and original_counts:
             orig_total, orig_passed, orig_failed, orig_warned = original_counts
-            html_parts.append(
-                f'<div class="warning-banner">⚠️ Showing only {total_cases} failed evaluation(s)</div>'
-            )
-            html_parts.append('<div class="stats-grid">')
-            html_parts.append(
-                f'<div class="stat-card total"><span class="label">Total</span><span class="value">{orig_total}</span></div>'
-            )
-            html_parts.append(
-                f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{orig_passed}</span></div>'
-            )
+            yield f'<div class="warning-banner">⚠️ Showing only {total_cases} failed evaluation(s)</div>'
+            yield '<div class="stats-grid">'
+            yield f'<div class="stat-card total"><span class="label">Total</span><span class="value">{orig_total}</span></div>'
+            yield f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{orig_passed}</span></div>'
             if orig_warned > 0:
-                html_parts.append(
-                    f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{orig_warned}</span></div>'
-                )
-            html_parts.append(
-                f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{orig_failed}</span></div>'
-            )
+                yield f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{orig_warned}</span></div>'
+            yield f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{orig_failed}</span></div>'
         else:
-            html_parts.append('<div class="stats-grid">')
-            html_parts.append(
-                f'<div class="stat-card total"><span class="label">Total</span><span class="value">{total_cases}</span></div>'
-            )
-            html_parts.append(
-                f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{total_passed}</span></div>'
-            )
+            yield '<div class="stats-grid">'
+            yield f'<div class="stat-card total"><span class="label">Total</span><span class="value">{total_cases}</span></div>'
+            yield f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{total_passed}</span></div>'
             if total_warned > 0:
-                html_parts.append(
-                    f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{total_warned}</span></div>'
-                )
+                yield f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{total_warned}</span></div>'
             if total_failed > 0:
-                html_parts.append(
-                    f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{total_failed}</span></div>'
-                )
+                yield f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{total_failed}</span></div>'
 
-        html_parts.append("</div>")  # stats-grid
-        html_parts.append(
-            f'<div class="pass-rate">Pass Rate: <strong>{pass_rate:.1f}%</strong></div>'
-        )
-        html_parts.append("</div>")  # summary-section
+        yield "</div>"  # stats-grid
+        yield f'<div class="pass-rate">Pass Rate: <strong>{pass_rate:.1f}%</strong></div>'
+        yield "</div>"  # summary-section
 
         # Results by model
-        html_parts.append("<h2>📋 Results by Model</h2>")
+        yield "<h2>📋 Results by Model</h2>"
 
         for model, suites in model_groups.items():
-            html_parts.append('<div class="model-section">')
-            html_parts.append(f"<h3>🤖 {self._escape_html(model)}</h3>")
+            yield '<div class="model-section">'
+            yield f"<h3>🤖 {self._escape_html(model)}</h3>"
 
             for suite_name, cases in suites.items():
                 # Show suite/file name
-                html_parts.append('<div class="suite-section">')
-                html_parts.append(
-                    f'<h4 class="suite-header">📁 {self._escape_html(suite_name)}</h4>'
-                )
+                yield '<div class="suite-section">'
+                yield f'<h4 class="suite-header">📁 {self._escape_html(suite_name)}</h4>'
 
                 # Show summary table only when NOT showing details (avoid duplication)
                 if not show_details:
                     has_run_stats = any(
                         case.get("run_stats", {}).get("num_runs", 1) > 1 for case in cases
                     )
-                    html_parts.append('<table class="results-table">')
+                    yield '<table class="results-table">'
                     if has_run_stats:
-                        html_parts.append(
-                            "<thead><tr><th>Status</th><th>Case</th><th>Score</th><th>Runs</th></tr></thead>"
-                        )
+                        yield "<thead><tr><th>Status</th><th>Case</th><th>Score</th><th>Runs</th></tr></thead>"
                     else:
-                        html_parts.append(
-                            "<thead><tr><th>Status</th><th>Case</th><th>Score</th></tr></thead>"
-                        )
-                    html_parts.append("<tbody>")
+                        yield "<thead><tr><th>Status</th><th>Case</th><th>Score</th></tr></thead>"
+                    yield "<tbody>"
 
                     for case in cases:
                         evaluation = case["evaluation"]
@@ -199,21 +215,19 @@ class HtmlFormatter(EvalResultFormatter):
                             score_display = f"{score_pct:.1f}% ± {std_pct:.1f}%"
                             runs_display = str(run_stats.get("num_runs", 1))
 
-                        html_parts.append(f'<tr class="{status_class}">')
-                        html_parts.append(f'<td class="status-cell">{status_text}</td>')
-                        html_parts.append(f"<td>{case_name}</td>")
-                        html_parts.append(f'<td class="score-cell">{score_display}</td>')
+                        yield f'<tr class="{status_class}">'
+                        yield f'<td class="status-cell">{status_text}</td>'
+                        yield f"<td>{case_name}</td>"
+                        yield f'<td class="score-cell">{score_display}</td>'
                         if has_run_stats:
-                            html_parts.append(f"<td>{runs_display or '-'}</td>")
-                        html_parts.append("</tr>")
+                            yield f"<td>{runs_display or '-'}</td>"
+                        yield "</tr>"
 
-                    html_parts.append("</tbody></table>")
+                    yield "</tbody></table>"
 
                 # Detailed results - each case is individually expandable
                 if show_details:
-                    html_parts.append(
-                        '<p class="expand-hint">💡 Click on any case below to expand details</p>'
-                    )
+                    yield '<p class="expand-hint">💡 Click on any case below to expand details</p>'
                     for case in cases:
                         evaluation = case["evaluation"]
                         if evaluation.passed:
@@ -233,64 +247,58 @@ class HtmlFormatter(EvalResultFormatter):
                         score_pct = evaluation.score * 100
 
                         # Each case is a collapsible details element (collapsed by default)
-                        html_parts.append(f'<details class="case-expandable {status_class}">')
-                        html_parts.append(
+                        yield f'<details class="case-expandable {status_class}">'
+                        yield (
                             f'<summary class="case-summary">'
                             f"{status_icon} <strong>{case_name}</strong> "
                             f'<span class="score-inline">{score_pct:.1f}%</span> '
                             f"{status_badge}"
                             f"</summary>"
                         )
-                        html_parts.append('<div class="case-content">')
-                        html_parts.append(
-                            f"<p><strong>Input:</strong> <code>{self._escape_html(case['input'])}</code></p>"
-                        )
+                        yield '<div class="case-content">'
+                        yield f"<p><strong>Input:</strong> <code>{self._escape_html(case['input'])}</code></p>"
 
                         # Context section (if include_context is True)
                         if include_context:
                             system_msg = case.get("system_message")
                             addl_msgs = case.get("additional_messages")
                             if system_msg or addl_msgs:
-                                html_parts.append('<div class="context-section">')
-                                html_parts.append("<h4>📋 Context</h4>")
+                                yield '<div class="context-section">'
+                                yield "<h4>📋 Context</h4>"
                                 if system_msg:
-                                    html_parts.append(
+                                    yield (
                                         f'<div class="context-item">'
                                         f"<strong>System Message:</strong> "
                                         f"<code>{self._escape_html(system_msg)}</code>"
                                         f"</div>"
                                     )
                                 if addl_msgs:
-                                    conversation_html = self._format_conversation(addl_msgs)
-                                    html_parts.append(
+                                    conversation_html = self._conversation_html(addl_msgs)
+                                    yield (
                                         f'<details class="context-item conversation-context" open>'
                                         f"<summary>💬 Conversation Context ({len(addl_msgs)} messages)</summary>"
                                         f"{conversation_html}"
                                         f"</details>"
                                     )
-                                html_parts.append("</div>")
+                                yield "</div>"
 
                         # Evaluation details
                         run_id = self._make_safe_id(suite_name, case["name"], model)
-                        html_parts.append(
-                            self._format_evaluation_details(
-                                evaluation,
-                                case.get("run_stats"),
-                                case.get("critic_stats"),
-                                run_id=run_id,
-                            )
+                        yield self._format_evaluation_details(
+                            evaluation,
+                            case.get("run_stats"),
+                            case.get("critic_stats"),
+                            run_id=run_id,
                         )
-                        html_parts.append("</div>")
-                        html_parts.append("</details>")
-
-                html_parts.append("</div>")  # suite-section
+                        yield "</div>"
+                        yield "</details>"
 
-            html_parts.append("</div>")  # model-section
+                yield "</div>"  # suite-section
 
-        html_parts.append("</div>")  # container
-        html_parts.append("</body></html>")
+            yield "</div>"  # model-section
 
-        return "\n".join(html_parts)
+        yield "</div>"  # container
+        yield "</body></html>"
 
     def _format_evaluation_details(
         self,
@@ -605,6 +613,24 @@ class HtmlFormatter(EvalResultFormatter):
         self._used_ids.add(unique_id)
         return unique_id
 
+    def _conversation_html(self, messages: list[dict]) -> str:
+        """Format a conversation inline, or as a lazily loaded fragment if it is very large."""
+        conversation_html = self._format_conversation(messages)
+        fragments = self._fragments
+        if fragments is None or not fragments.should_split(conversation_html):
+            return conversation_html
+
+        src = self._escape_html(
+            fragments.write(
+                f"{self._get_html_header()}\n{conversation_html}\n</body></html>", "html"
+            )
+        )
+        return (
+            f'<iframe class="conversation-fragment" src="{src}" loading="lazy" '
+            f'title="Conversation"></iframe>'
+            f'<p><a href="{src}" target="_blank">Open conversation in a new tab</a></p>'
+        )
+
     def _format_conversation(self, messages: list[dict]) -> str:
         """Format conversation messages as rich HTML for context display."""
         html_parts = ['<div class="conversation">']
@@ -677,38 +703,34 @@ class HtmlFormatter(EvalResultFormatter):
     # MULTI-MODEL EVALUATION FORMATTING
     # =========================================================================
 
-    def _format_multi_model(
+    def _iter_multi_model(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format multi-model evaluation results with comparison tables."""
         comparison_data, model_order, per_model_stats = group_eval_for_comparison(results)
 
         # Build HTML
-        html_parts = [self._get_html_header()]
-        html_parts.append(self._get_multi_model_styles())
+        yield self._get_html_header()
+        yield self._get_multi_model_styles()
 
         # Container
-        html_parts.append('<div class="container">')
-        html_parts.append("<h1>🔄 Multi-Model Evaluation Results</h1>")
-        html_parts.append(
-            f'<p class="timestamp">Generated: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}</p>'
-        )
-        html_parts.append(f'<p class="models-info">Models: {", ".join(model_order)}</p>')
+        yield '<div class="container">'
+        yield "<h1>🔄 Multi-Model Evaluation Results</h1>"
+        yield f'<p class="timestamp">Generated: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}</p>'
+        yield f'<p class="models-info">Models: {", ".join(model_order)}</p>'
 
         # Per-Model Summary Section
-        html_parts.append('<div class="section">')
-        html_parts.append("<h2>📊 Per-Model Summary</h2>")
-        html_parts.append('<table class="summary-table multi-model-summary">')
-        html_parts.append("<thead><tr>")
-        html_parts.append(
-            "<th>Model</th><th>Passed</th><th>Failed</th><th>Warned</th><th>Total</th><th>Pass Rate</th>"
-        )
-        html_parts.append("</tr></thead><tbody>")
+        yield '<div class="section">'
+        yield "<h2>📊 Per-Model Summary</h2>"
+        yield '<table class="summary-table multi-model-summary">'
+        yield "<thead><tr>"
+        yield "<th>Model</th><th>Passed</th><th>Failed</th><th>Warned</th><th>Total</th><th>Pass Rate</th>"
+        yield "</tr></thead><tbody>"
 
         best_model = None
         best_rate = -1.0
@@ -721,43 +743,41 @@ class HtmlFormatter(EvalResultFormatter):
                 best_model = model
 
             row_class = "best-model" if rate == best_rate and best_model == model else ""
-            html_parts.append(f'<tr class="{row_class}">')
-            html_parts.append(f'<td class="model-name">{self._escape_html(model)}</td>')
-            html_parts.append(f'<td class="passed">{stats["passed"]}</td>')
-            html_parts.append(f'<td class="failed">{stats["failed"]}</td>')
-            html_parts.append(f'<td class="warned">{stats["warned"]}</td>')
-            html_parts.append(f"<td>{stats['total']}</td>")
-            html_parts.append(f'<td class="pass-rate">{rate:.1f}%</td>')
-            html_parts.append("</tr>")
+            yield f'<tr class="{row_class}">'
+            yield f'<td class="model-name">{self._escape_html(model)}</td>'
+            yield f'<td class="passed">{stats["passed"]}</td>'
+            yield f'<td class="failed">{stats["failed"]}</td>'
+            yield f'<td class="warned">{stats["warned"]}</td>'
+            yield f"<td>{stats['total']}</td>"
+            yield f'<td class="pass-rate">{rate:.1f}%</td>'
+            yield "</tr>"
 
-        html_parts.append("</tbody></table>")
+        yield "</tbody></table>"
 
         if best_model:
-            html_parts.append(
-                f'<p class="best-overall">🏆 Best Overall: <strong>{self._escape_html(best_model)}</strong> ({best_rate:.1f}% pass rate)</p>'
-            )
-        html_parts.append("</div>")
+            yield f'<p class="best-overall">🏆 Best Overall: <strong>{self._escape_html(best_model)}</strong> ({best_rate:.1f}% pass rate)</p>'
+        yield "</div>"
 
         # Cross-Model Comparison Section
-        html_parts.append('<div class="section">')
-        html_parts.append("<h2>⚔️ Cross-Model Comparison</h2>")
+        yield '<div class="section">'
+        yield "<h2>⚔️ Cross-Model Comparison</h2>"
 
         for suite_name, cases in comparison_data.items():
-            html_parts.append('<div class="suite-section">')
-            html_parts.append(f"<h3>Suite: {self._escape_html(suite_name)}</h3>")
+            yield '<div class="suite-section">'
+            yield f"<h3>Suite: {self._escape_html(suite_name)}</h3>"
 
             # Comparison table
-            html_parts.append('<table class="comparison-table">')
-            html_parts.append("<thead><tr>")
-            html_parts.append("<th>Case</th>")
+            yield '<table class="comparison-table">'
+            yield "<thead><tr>"
+            yield "<th>Case</th>"
             for model in model_order:
-                html_parts.append(f"<th>{self._escape_html(model)}</th>")
-            html_parts.append("<th>Best</th>")
-            html_parts.append("</tr></thead><tbody>")
+                yield f"<th>{self._escape_html(model)}</th>"
+            yield "<th>Best</th>"
+            yield "</tr></thead><tbody>"
 
             for case_name, case_models in cases.items():
-                html_parts.append("<tr>")
-                html_parts.append(f'<td class="case-name">{self._escape_html(case_name)}</td>')
+                yield "<tr>"
+                yield f'<td class="case-name">{self._escape_html(case_name)}</td>'
 
                 for model in model_order:
                     if model in case_models:
@@ -776,37 +796,37 @@ class HtmlFormatter(EvalResultFormatter):
                         if run_stats and run_stats.get("num_runs", 1) > 1:
                             std_pct = run_stats.get("std_deviation", 0.0) * 100
                             runs = run_stats.get("num_runs", 1)
-                            html_parts.append(
+                            yield (
                                 f'<td class="{cell_class}">{icon} '
                                 f"{score:.0f}% ± {std_pct:.0f}%<br><small>n={runs}</small></td>"
                             )
                         else:
-                            html_parts.append(f'<td class="{cell_class}">{icon} {score:.0f}%</td>')
+                            yield f'<td class="{cell_class}">{icon} {score:.0f}%</td>'
                     else:
-                        html_parts.append('<td class="no-data">-</td>')
+                        yield '<td class="no-data">-</td>'
 
                 # Best model
                 best, _ = find_best_model(case_models)
                 if best == "Tie":
-                    html_parts.append('<td class="tie">🤝 Tie</td>')
+                    yield '<td class="tie">🤝 Tie</td>'
                 elif best and best != "N/A":
-                    html_parts.append(f'<td class="best">🏆 {self._escape_html(best)}</td>')
+                    yield f'<td class="best">🏆 {self._escape_html(best)}</td>'
                 else:
-                    html_parts.append('<td class="no-data">-</td>')
+                    yield '<td class="no-data">-</td>'
 
-                html_parts.append("</tr>")
+                yield "</tr>"
 
-            html_parts.append("</tbody></table>")
-            html_parts.append("</div>")
+            yield "</tbody></table>"
+            yield "</div>"
 
             # Detailed results
             if show_details:
-                html_parts.append('<div class="details-section">')
-                html_parts.append("<h4>Detailed Results</h4>")
+                yield '<div class="details-section">'
+                yield "<h4>Detailed Results</h4>"
 
                 for case_name, case_models in cases.items():
-                    html_parts.append('<div class="case-details">')
-                    html_parts.append(f"<h5>{self._escape_html(case_name)}</h5>")
+                    yield '<div class="case-details">'
+                    yield f"<h5>{self._escape_html(case_name)}</h5>"
 
                     for model in model_order:
                         if model not in case_models:
@@ -815,32 +835,26 @@ class HtmlFormatter(EvalResultFormatter):
                         case_result = case_models[model]
                         evaluation = case_result["evaluation"]
 
-                        html_parts.append('<div class="model-result">')
-                        html_parts.append(
-                            f"<strong>{self._escape_html(model)}</strong>: Score {evaluation.score * 100:.1f}%"
-                        )
+                        yield '<div class="model-result">'
+                        yield f"<strong>{self._escape_html(model)}</strong>: Score {evaluation.score * 100:.1f}%"
                         run_id = self._make_safe_id(suite_name, case_name, model)
-                        html_parts.append(
-                            self._format_evaluation_details(
-                                evaluation,
-                                case_result.get("run_stats"),
-                                case_result.get("critic_stats"),
-                                run_id=run_id,
-                            )
+                        yield self._format_evaluation_details(
+                            evaluation,
+                            case_result.get("run_stats"),
+                            case_result.get("critic_stats"),
+                            run_id=run_id,
                         )
-                        html_parts.append("</div>")
+                        yield "</div>"
 
-                    html_parts.append("</div>")
+                    yield "</div>"
 
-                html_parts.append("</div>")
+                yield "</div>"
 
-        html_parts.append("</div>")
+        yield "</div>"
 
         # Footer
-        html_parts.append("</div>")  # container
-        html_parts.append("</body></html>")
-
-        return "\n".join(html_parts)
+        yield "</div>"  # container
+        yield "</body></html>"
 
     def _get_multi_model_styles(self) -> str:
         """Return additional CSS for multi-model views."""
@@ -875,33 +889,33 @@ class HtmlFormatter(EvalResultFormatter):
     # COMPARATIVE EVALUATION FORMATTING
     # =========================================================================
 
-    def _format_comparative(
+    def _iter_comparative(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format comparative evaluation results with tabbed track view."""
         # Check if this is multi-model comparative - use case-first grouping
         if is_multi_model_comparative(results):
-            return self._format_comparative_case_first(
+            return self._iter_comparative_case_first(
                 results, show_details, failed_only, original_counts, include_context
             )
 
-        return self._format_comparative_single_model(
+        return self._iter_comparative_single_model(
             results, show_details, failed_only, original_counts, include_context
         )
 
-    def _format_comparative_single_model(
+    def _iter_comparative_single_model(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format single-model comparative evaluation results."""
         # Use comparative grouping
         (
@@ -930,100 +944,74 @@ class HtmlFormatter(EvalResultFormatter):
             pass_rate = 0
 
         # Build HTML
-        html_parts = [self._get_html_header()]
+        yield self._get_html_header()
 
         # Title and timestamp
-        html_parts.append('<div class="container">')
-        html_parts.append("<h1>📊 Comparative Evaluation Results</h1>")
-        html_parts.append(
-            f'<p class="timestamp">Generated: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}</p>'
-        )
+        yield '<div class="container">'
+        yield "<h1>📊 Comparative Evaluation Results</h1>"
+        yield f'<p class="timestamp">Generated: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}</p>'
 
         # Tracks list (only show if there are multiple tracks)
         if len(all_tracks) > 1:
-            html_parts.append('<div class="tracks-list">')
-            html_parts.append("<strong>All Tracks:</strong>")
+            yield '<div class="tracks-list">'
+            yield "<strong>All Tracks:</strong>"
             for track in all_tracks:
-                html_parts.append(f'<span class="track-badge">{self._escape_html(track)}</span>')
-            html_parts.append("</div>")
+                yield f'<span class="track-badge">{self._escape_html(track)}</span>'
+            yield "</div>"
 
         # Summary section
-        html_parts.append('<div class="summary-section">')
-        html_parts.append("<h2>📊 Summary</h2>")
+        yield '<div class="summary-section">'
+        yield "<h2>📊 Summary</h2>"
 
         if failed_only and original_counts:
             orig_total, orig_passed, orig_failed, orig_warned = original_counts
-            html_parts.append(
-                f'<div class="warning-banner">⚠️ Showing only {total_cases} failed evaluation(s)</div>'
-            )
-            html_parts.append('<div class="stats-grid">')
-            html_parts.append(
-                f'<div class="stat-card total"><span class="label">Total</span><span class="value">{orig_total}</span></div>'
-            )
-            html_parts.append(
-                f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{orig_passed}</span></div>'
-            )
+            yield f'<div class="warning-banner">⚠️ Showing only {total_cases} failed evaluation(s)</div>'
+            yield '<div class="stats-grid">'
+            yield f'<div class="stat-card total"><span class="label">Total</span><span class="value">{orig_total}</span></div>'
+            yield f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{orig_passed}</span></div>'
             if orig_warned > 0:
-                html_parts.append(
-                    f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{orig_warned}</span></div>'
-                )
-            html_parts.append(
-                f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{orig_failed}</span></div>'
-            )
+                yield f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{orig_warned}</span></div>'
+            yield f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{orig_failed}</span></div>'
         else:
-            html_parts.append('<div class="stats-grid">')
-            html_parts.append(
-                f'<div class="stat-card total"><span class="label">Total</span><span class="value">{total_cases}</span></div>'
-            )
-            html_parts.append(
-                f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{total_passed}</span></div>'
-            )
+            yield '<div class="stats-grid">'
+            yield f'<div class="stat-card total"><span class="label">Total</span><span class="value">{total_cases}</span></div>'
+            yield f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{total_passed}</span></div>'
             if total_warned > 0:
-                html_parts.append(
-                    f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{total_warned}</span></div>'
-                )
+                yield f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{total_warned}</span></div>'
             if total_failed > 0:
-                html_parts.append(
-                    f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{total_failed}</span></div>'
-                )
+                yield f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{total_failed}</span></div>'
 
-        html_parts.append("</div>")  # stats-grid
-        html_parts.append(
-            f'<div class="pass-rate">Pass Rate: <strong>{pass_rate:.1f}%</strong></div>'
-        )
-        html_parts.append("</div>")  # summary-section
+        yield "</div>"  # stats-grid
+        yield f'<div class="pass-rate">Pass Rate: <strong>{pass_rate:.1f}%</strong></div>'
+        yield "</div>"  # summary-section
 
         # Results by model
-        html_parts.append("<h2>📋 Comparative Results by Model</h2>")
+        yield "<h2>📋 Comparative Results by Model</h2>"
 
         for model, suites in comparative_groups.items():
-            html_parts.append('<div class="model-section">')
-            html_parts.append(f"<h3>🤖 {self._escape_html(model)}</h3>")
+            yield '<div class="model-section">'
+            yield f"<h3>🤖 {self._escape_html(model)}</h3>"
 
             for suite_name, cases in suites.items():
                 # Get track order for this specific suite
                 track_order = suite_track_order.get(suite_name, [])
 
-                html_parts.append('<div class="suite-section">')
+                yield '<div class="suite-section">'
                 # Only show COMPARATIVE badge if there are multiple tracks
                 badge = (
                     '<span class="comparative-badge">COMPARATIVE</span>'
                     if len(track_order) > 1
                     else ""
                 )
-                html_parts.append(
-                    f'<h4 class="suite-header">📁 {self._escape_html(suite_name)} {badge}</h4>'
-                )
+                yield f'<h4 class="suite-header">📁 {self._escape_html(suite_name)} {badge}</h4>'
 
                 # Show tracks for this suite (only if multiple)
                 if len(track_order) > 1:
-                    html_parts.append('<div class="tracks-list">')
-                    html_parts.append("<strong>Tracks:</strong>")
+                    yield '<div class="tracks-list">'
+                    yield "<strong>Tracks:</strong>"
                     for track in track_order:
-                        html_parts.append(
-                            f'<span class="track-badge">{self._escape_html(track)}</span>'
-                        )
-                    html_parts.append("</div>")
+                        yield f'<span class="track-badge">{self._escape_html(track)}</span>'
+                    yield "</div>"
 
                 for case_name, case_data in cases.items():
                     # Context section (if include_context is True)
@@ -1031,51 +1019,47 @@ class HtmlFormatter(EvalResultFormatter):
                         system_msg = case_data.get("system_message")
                         addl_msgs = case_data.get("additional_messages")
                         if system_msg or addl_msgs:
-                            html_parts.append('<div class="context-section">')
-                            html_parts.append("<h4>📋 Context</h4>")
+                            yield '<div class="context-section">'
+                            yield "<h4>📋 Context</h4>"
                             if system_msg:
-                                html_parts.append(
+                                yield (
                                     f'<div class="context-item">'
                                     f"<strong>System Message:</strong> "
                                     f"<code>{self._escape_html(system_msg)}</code>"
                                     f"</div>"
                                 )
                             if addl_msgs:
-                                conversation_html = self._format_conversation(addl_msgs)
-                                html_parts.append(
+                                conversation_html = self._conversation_html(addl_msgs)
+                                yield (
                                     f'<details class="context-item conversation-context" open>'
                                     f"<summary>💬 Conversation Context ({len(addl_msgs)} messages)</summary>"
                                     f"{conversation_html}"
                                     f"</details>"
                                 )
-                            html_parts.append("</div>")
+                            yield "</div>"
 
-                    html_parts.append(
-                        self._format_comparative_case_html(
-                            case_name, case_data, track_order, show_details, suite_name
-                        )
+                    yield self._format_comparative_case_html(
+                        case_name, case_data, track_order, show_details, suite_name
                     )
 
-                html_parts.append("</div>")  # suite-section
+                yield "</div>"  # suite-section
 
-            html_parts.append("</div>")  # model-section
+            yield "</div>"  # model-section
 
         # JavaScript for tab switching
-        html_parts.append(self._get_tab_script())
+        yield self._get_tab_script()
 
-        html_parts.append("</div>")  # container
-        html_parts.append("</body></html>")
+        yield "</div>"  # container
+        yield "</body></html>"
 
-        return "\n".join(html_parts)
-
-    def _format_comparative_case_first(
+    def _iter_comparative_case_first(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format multi-model comparative evaluation grouped by case first."""
         # Get case-first grouping
         (
@@ -1105,172 +1089,136 @@ class HtmlFormatter(EvalResultFormatter):
             pass_rate = 0
 
         # Build HTML
-        html_parts = [self._get_html_header()]
-        html_parts.append(self._get_multi_model_styles())
+        yield self._get_html_header()
+        yield self._get_multi_model_styles()
 
-        html_parts.append('<div class="container">')
-        html_parts.append("<h1>📊 Comparative Evaluation Results (Multi-Model)</h1>")
-        html_parts.append(
-            f'<p class="timestamp">Generated: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}</p>'
-        )
+        yield '<div class="container">'
+        yield "<h1>📊 Comparative Evaluation Results (Multi-Model)</h1>"
+        yield f'<p class="timestamp">Generated: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}</p>'
 
         # Models and tracks info
-        html_parts.append('<div class="info-section">')
-        html_parts.append(f"<p><strong>Models:</strong> {', '.join(model_order)}</p>")
+        yield '<div class="info-section">'
+        yield f"<p><strong>Models:</strong> {', '.join(model_order)}</p>"
         # Only show tracks list if there are multiple tracks
         if len(all_tracks) > 1:
-            html_parts.append('<div class="tracks-list">')
-            html_parts.append("<strong>Tracks:</strong>")
+            yield '<div class="tracks-list">'
+            yield "<strong>Tracks:</strong>"
             for track in all_tracks:
-                html_parts.append(f'<span class="track-badge">{self._escape_html(track)}</span>')
-            html_parts.append("</div>")
-        html_parts.append("</div>")
+                yield f'<span class="track-badge">{self._escape_html(track)}</span>'
+            yield "</div>"
+        yield "</div>"
 
         # Summary section
-        html_parts.append('<div class="summary-section">')
-        html_parts.append("<h2>📊 Summary</h2>")
+        yield '<div class="summary-section">'
+        yield "<h2>📊 Summary</h2>"
 
         if failed_only and original_counts:
             orig_total, orig_passed, orig_failed, orig_warned = original_counts
-            html_parts.append(
-                f'<div class="warning-banner">⚠️ Showing only {total_cases} failed evaluation(s)</div>'
-            )
-            html_parts.append('<div class="stats-grid">')
-            html_parts.append(
-                f'<div class="stat-card total"><span class="label">Total</span><span class="value">{orig_total}</span></div>'
-            )
-            html_parts.append(
-                f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{orig_passed}</span></div>'
-            )
+            yield f'<div class="warning-banner">⚠️ Showing only {total_cases} failed evaluation(s)</div>'
+            yield '<div class="stats-grid">'
+            yield f'<div class="stat-card total"><span class="label">Total</span><span class="value">{orig_total}</span></div>'
+            yield f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{orig_passed}</span></div>'
             if orig_warned > 0:
-                html_parts.append(
-                    f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{orig_warned}</span></div>'
-                )
-            html_parts.append(
-                f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{orig_failed}</span></div>'
-            )
+                yield f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{orig_warned}</span></div>'
+            yield f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{orig_failed}</span></div>'
         else:
-            html_parts.append('<div class="stats-grid">')
-            html_parts.append(
-                f'<div class="stat-card total"><span class="label">Total</span><span class="value">{total_cases}</span></div>'
-            )
-            html_parts.append(
-                f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{total_passed}</span></div>'
-            )
+            yield '<div class="stats-grid">'
+            yield f'<div class="stat-card total"><span class="label">Total</span><span class="value">{total_cases}</span></div>'
+            yield f'<div class="stat-card passed"><span class="label">Passed</span><span class="value">{total_passed}</span></div>'
             if total_warned > 0:
-                html_parts.append(
-                    f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{total_warned}</span></div>'
-                )
+                yield f'<div class="stat-card warned"><span class="label">Warnings</span><span class="value">{total_warned}</span></div>'
             if total_failed > 0:
-                html_parts.append(
-                    f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{total_failed}</span></div>'
-                )
+                yield f'<div class="stat-card failed"><span class="label">Failed</span><span class="value">{total_failed}</span></div>'
 
-        html_parts.append("</div>")  # stats-grid
-        html_parts.append(
-            f'<div class="pass-rate">Pass Rate: <strong>{pass_rate:.1f}%</strong></div>'
-        )
-        html_parts.append("</div>")  # summary-section
+        yield "</div>"  # stats-grid
+        yield f'<div class="pass-rate">Pass Rate: <strong>{pass_rate:.1f}%</strong></div>'
+        yield "</div>"  # summary-section
 
         # Results grouped by case
-        html_parts.append("<h2>📋 Results by Case</h2>")
+        yield "<h2>📋 Results by Case</h2>"
 
         for suite_name, cases in case_groups.items():
             track_order = suite_track_order.get(suite_name, [])
 
-            html_parts.append('<div class="suite-section">')
+            yield '<div class="suite-section">'
             # Only show COMPARATIVE badge if there are multiple tracks
             badge = (
                 '<span class="comparative-badge">COMPARATIVE</span>' if len(track_order) > 1 else ""
             )
-            html_parts.append(
-                f'<h3 class="suite-header">📁 {self._escape_html(suite_name)} {badge}</h3>'
-            )
+            yield f'<h3 class="suite-header">📁 {self._escape_html(suite_name)} {badge}</h3>'
 
             # Show tracks for this suite (only if multiple)
             if len(track_order) > 1:
-                html_parts.append('<div class="tracks-list">')
-                html_parts.append("<strong>Tracks:</strong>")
+                yield '<div class="tracks-list">'
+                yield "<strong>Tracks:</strong>"
                 for track in track_order:
-                    html_parts.append(
-                        f'<span class="track-badge">{self._escape_html(track)}</span>'
-                    )
-                html_parts.append("</div>")
+                    yield f'<span class="track-badge">{self._escape_html(track)}</span>'
+                yield "</div>"
 
             for case_name, model_data in cases.items():
                 # Case container
-                html_parts.append('<div class="case-group">')
-                html_parts.append(f"<h4>📋 Case: {self._escape_html(case_name)}</h4>")
+                yield '<div class="case-group">'
+                yield f"<h4>📋 Case: {self._escape_html(case_name)}</h4>"
 
                 # Get input and context from first model
                 first_model_data = next(iter(model_data.values()), {})
                 case_input = first_model_data.get("input", "")
                 if case_input:
-                    html_parts.append(
-                        f'<p class="case-input"><strong>Input:</strong> {self._escape_html(case_input)}</p>'
-                    )
+                    yield f'<p class="case-input"><strong>Input:</strong> {self._escape_html(case_input)}</p>'
 
                 # Context section (if include_context is True)
                 if include_context:
                     system_msg = first_model_data.get("system_message")
                     addl_msgs = first_model_data.get("additional_messages")
                     if system_msg or addl_msgs:
-                        html_parts.append('<div class="context-section">')
-                        html_parts.append("<h4>📋 Context</h4>")
+                        yield '<div class="context-section">'
+                        yield "<h4>📋 Context</h4>"
                         if system_msg:
-                            html_parts.append(
+                            yield (
                                 f'<div class="context-item">'
                                 f"<strong>System Message:</strong> "
                                 f"<code>{self._escape_html(system_msg)}</code>"
                                 f"</div>"
                             )
                         if addl_msgs:
-                            conversation_html = self._format_conversation(addl_msgs)
-                            html_parts.append(
+                            conversation_html = self._conversation_html(addl_msgs)
+                            yield (
                                 f'<details class="context-item conversation-context" open>'
                                 f"<summary>💬 Conversation Context ({len(addl_msgs)} messages)</summary>"
                                 f"{conversation_html}"
                                 f"</details>"
                             )
-                        html_parts.append("</div>")
+                        yield "</div>"
 
                 # Show each model's results for this case
                 for model in model_order:
                     if model not in model_data:
-                        html_parts.append('<div class="model-panel">')
-                        html_parts.append(
-                            f'<div class="model-label">🤖 {self._escape_html(model)}</div>'
-                        )
-                        html_parts.append('<div class="no-data">No data</div>')
-                        html_parts.append("</div>")
+                        yield '<div class="model-panel">'
+                        yield f'<div class="model-label">🤖 {self._escape_html(model)}</div>'
+                        yield '<div class="no-data">No data</div>'
+                        yield "</div>"
                         continue
 
                     model_case_data = model_data[model]
-                    html_parts.append('<div class="model-panel">')
-                    html_parts.append(
-                        f'<div class="model-label">🤖 {self._escape_html(model)}</div>'
-                    )
+                    yield '<div class="model-panel">'
+                    yield f'<div class="model-label">🤖 {self._escape_html(model)}</div>'
 
                     # Show track comparison for this model
-                    html_parts.append(
-                        self._format_comparative_case_html(
-                            case_name, model_case_data, track_order, show_details, suite_name, model
-                        )
+                    yield self._format_comparative_case_html(
+                        case_name, model_case_data, track_order, show_details, suite_name, model
                     )
 
-                    html_parts.append("</div>")  # model-panel
+                    yield "</div>"  # model-panel
 
-                html_parts.append("</div>")  # case-group
+                yield "</div>"  # case-group
 
-            html_parts.append("</div>")  # suite-section
+            yield "</div>"  # suite-section
 
         # JavaScript for tab switching
-        html_parts.append(self._get_tab_script())
+        yield self._get_tab_script()
 
-        html_parts.append("</div>")  # container
-        html_parts.append("</body></html>")
-
-        return "\n".join(html_parts)
+        yield "</div>"  # container
+        yield "</body></html>"
 
     def _format_comparative_case_html(
         self,
@@ -2375,6 +2323,13 @@ document.querySelectorAll('.track-tab').forEach(tab => {
             padding: 10px;
         }
 
+        .conversation-fragment {
+            width: 100%;
+            height: 60vh;
+            border: 1px solid var(--border-color);
+            border-radius: 6px;
+        }
+
         .msg {
             padding: 12px 15px;
             border-radius: 8px;
@@ -2553,8 +2508,8 @@ class CaptureHtmlFormatter(CaptureFormatter):
                             )
                         tool_calls_html.append(
                             f'<details class="capture-run" open>'
-                            f'<summary>Run {run_index}</summary>'
-                            f'{"".join(run_calls_html)}'
+                            f"<summary>Run {run_index}</summary>"
+                            f"{''.join(run_calls_html)}"
                             f"</details>"
                         )
                 else:
@@ -2724,7 +2679,7 @@ class CaptureHtmlFormatter(CaptureFormatter):
         """Format multi-model capture results with track tabs."""
         from arcade_cli.formatters.base import group_captures_by_case_then_track
 
-        grouped_data, model_order, track_order = group_captures_by_case_then_track(captures)
+        grouped_data, model_order, _ = group_captures_by_case_then_track(captures)
 
         html_parts: list[str] = []
 
@@ -1,14 +1,16 @@
 """Markdown formatter for evaluation and capture results."""
 
 import json
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, TextIO
 
 from arcade_cli.formatters.base import (
     CaptureFormatter,
     CaptureResults,
     ComparativeCaseData,
     EvalResultFormatter,
+    ReportFragments,
     compute_track_differences,
     find_best_model,
     group_comparative_by_case,
@@ -20,6 +22,7 @@ from arcade_cli.formatters.base import (
     is_multi_model_comparative,
     is_multi_model_eval,
     truncate_field_value,
+    write_lines,
 )
 
 # Markdown-specific truncation length (slightly shorter for table readability)
@@ -33,6 +36,8 @@ class MarkdownFormatter(EvalResultFormatter):
     Produces a well-structured Markdown document with tables and collapsible sections.
     """
 
+    _fragments: ReportFragments | None = None
+
     @property
     def file_extension(self) -> str:
         return "md"
@@ -45,40 +50,76 @@ class MarkdownFormatter(EvalResultFormatter):
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
     ) -> str:
+        return "\n".join(
+            self._iter_lines(results, show_details, failed_only, original_counts, include_context)
+        )
+
+    def write(
+        self,
+        results: list[list[dict[str, Any]]],
+        sink: TextIO,
+        show_details: bool = False,
+        failed_only: bool = False,
+        original_counts: tuple[int, int, int, int] | None = None,
+        include_context: bool = False,
+        fragments: ReportFragments | None = None,
+    ) -> None:
+        """Write the report to ``sink`` one section at a time.
+
+        With ``fragments``, conversations too large to inline are written to
+        separate files and loaded from there.
+        """
+        if fragments is not None:
+            fragments.clear("md")
+        self._fragments = fragments
+        try:
+            write_lines(
+                sink,
+                self._iter_lines(
+                    results, show_details, failed_only, original_counts, include_context
+                ),
+            )
+        finally:
+            self._fragments = None
+
+    def _iter_lines(
+        self,
+        results: list[list[dict[str, Any]]],
+        show_details: bool = False,
+        failed_only: bool = False,
+        original_counts: tuple[int, int, int, int] | None = None,
+        include_context: bool = False,
+    ) -> Iterator[str]:
         # Check if this is a comparative evaluation
         if is_comparative_result(results):
-            return self._format_comparative(
+            return self._iter_comparative(
                 results, show_details, failed_only, original_counts, include_context
             )
 
         # Check if this is a multi-model evaluation
         if is_multi_model_eval(results):
-            return self._format_multi_model(
+            return self._iter_multi_model(
                 results, show_details, failed_only, original_counts, include_context
             )
 
-        return self._format_regular(
+        return self._iter_regular(
             results, show_details, failed_only, original_counts, include_context
         )
 
-    def _format_regular(
+    def _iter_regular(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format regular (non-comparative) evaluation results."""
-        lines: list[str] = []
-
         # Header
-        lines.append("# Evaluation Results")
-        lines.append("")
-        lines.append(
-            f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
-        )
-        lines.append("")
+        yield "# Evaluation Results"
+        yield ""
+        yield f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
+        yield ""
 
         # Use shared grouping logic
         model_groups, total_passed, total_failed, total_warned, total_cases = (
@@ -86,42 +127,40 @@ class MarkdownFormatter(EvalResultFormatter):
         )
 
         # Summary section
-        lines.append("## Summary")
-        lines.append("")
+        yield "## Summary"
+        yield ""
 
-        lines.extend(
-            self._format_summary_table_md(
-                total_cases,
-                total_passed,
-                total_failed,
-                total_warned,
-                failed_only,
-                original_counts,
-            )
+        yield from self._format_summary_table_md(
+            total_cases,
+            total_passed,
+            total_failed,
+            total_warned,
+            failed_only,
+            original_counts,
         )
 
         # Results by model
-        lines.append("## Results by Model")
-        lines.append("")
+        yield "## Results by Model"
+        yield ""
 
         for model, suites in model_groups.items():
-            lines.append(f"### 🤖 {model}")
-            lines.append("")
+            yield f"### 🤖 {model}"
+            yield ""
 
             for suite_name, cases in suites.items():
-                lines.append(f"#### 📁 {suite_name}")
-                lines.append("")
+                yield f"#### 📁 {suite_name}"
+                yield ""
 
                 # Results table
                 has_run_stats = any(
                     case.get("run_stats", {}).get("num_runs", 1) > 1 for case in cases
                 )
                 if has_run_stats:
-                    lines.append("| Status | Case | Score | Runs |")
-                    lines.append("|--------|------|-------|------|")
+                    yield "| Status | Case | Score | Runs |"
+                    yield "|--------|------|-------|------|"
                 else:
-                    lines.append("| Status | Case | Score |")
-                    lines.append("|--------|------|-------|")
+                    yield "| Status | Case | Score |"
+                    yield "|--------|------|-------|"
 
                 for case in cases:
                     evaluation = case["evaluation"]
@@ -140,17 +179,17 @@ class MarkdownFormatter(EvalResultFormatter):
                         std_pct = run_stats.get("std_deviation", 0.0) * 100
                         score_display = f"{score_pct:.1f}% ± {std_pct:.1f}%"
                         runs_value = run_stats.get("num_runs", 1)
-                        lines.append(f"| {status} | {case_name} | {score_display} | {runs_value} |")
+                        yield f"| {status} | {case_name} | {score_display} | {runs_value} |"
                     else:
-                        lines.append(f"| {status} | {case_name} | {score_display} |")
+                        yield f"| {status} | {case_name} | {score_display} |"
 
-                lines.append("")
+                yield ""
 
                 # Detailed results if requested
                 if show_details:
-                    lines.append("<details>")
-                    lines.append("<summary><strong>Detailed Results</strong></summary>")
-                    lines.append("")
+                    yield "<details>"
+                    yield "<summary><strong>Detailed Results</strong></summary>"
+                    yield ""
 
                     for case in cases:
                         evaluation = case["evaluation"]
@@ -161,55 +200,51 @@ class MarkdownFormatter(EvalResultFormatter):
                         else:
                             status_text = "❌ FAILED"
 
-                        lines.append(f"##### {case['name']}")
-                        lines.append("")
-                        lines.append(f"**Status:** {status_text}  ")
-                        lines.append(f"**Score:** {evaluation.score * 100:.2f}%")
-                        lines.append("")
-                        lines.append(f"**Input:** `{case['input']}`")
-                        lines.append("")
+                        yield f"##### {case['name']}"
+                        yield ""
+                        yield f"**Status:** {status_text}  "
+                        yield f"**Score:** {evaluation.score * 100:.2f}%"
+                        yield ""
+                        yield f"**Input:** `{case['input']}`"
+                        yield ""
 
                         run_stats = case.get("run_stats")
-                        lines.extend(self._format_run_stats_summary(run_stats))
+                        yield from self._format_run_stats_summary(run_stats)
 
                         run_detail_lines = self._format_run_details_md(run_stats)
-                        lines.extend(run_detail_lines)
+                        yield from run_detail_lines
 
                         critic_stats = case.get("critic_stats")
                         if critic_stats:
-                            lines.extend(self._format_critic_stats_summary(critic_stats))
+                            yield from self._format_critic_stats_summary(critic_stats)
 
                         # Context section (if include_context is True)
                         if include_context:
                             system_msg = case.get("system_message")
                             addl_msgs = case.get("additional_messages")
                             if system_msg or addl_msgs:
-                                lines.append("**📋 Context:**")
-                                lines.append("")
+                                yield "**📋 Context:**"
+                                yield ""
                                 if system_msg:
-                                    lines.append(f"> **System:** {system_msg}")
-                                    lines.append("")
+                                    yield f"> **System:** {system_msg}"
+                                    yield ""
                                 if addl_msgs:
-                                    lines.append(
-                                        f"<details open><summary>💬 Conversation ({len(addl_msgs)} messages)</summary>"
-                                    )
-                                    lines.append("")
-                                    lines.extend(self._format_conversation_md(addl_msgs))
-                                    lines.append("</details>")
-                                    lines.append("")
+                                    yield f"<details open><summary>💬 Conversation ({len(addl_msgs)} messages)</summary>"
+                                    yield ""
+                                    yield from self._conversation_md(addl_msgs)
+                                    yield "</details>"
+                                    yield ""
 
                         # Only show the critic results table when there are no per-run
                         # details (run details already include per-run field tables)
                         if not run_detail_lines:
-                            lines.append(self._format_evaluation_details(evaluation))
-                        lines.append("")
-                        lines.append("---")
-                        lines.append("")
-
-                    lines.append("</details>")
-                    lines.append("")
+                            yield self._format_evaluation_details(evaluation)
+                        yield ""
+                        yield "---"
+                        yield ""
 
-        return "\n".join(lines)
+                    yield "</details>"
+                    yield ""
 
     def _format_evaluation_details(self, evaluation: Any) -> str:
         """Format evaluation details as markdown."""
@@ -336,24 +371,20 @@ class MarkdownFormatter(EvalResultFormatter):
     # MULTI-MODEL EVALUATION FORMATTING
     # =========================================================================
 
-    def _format_multi_model(
+    def _iter_multi_model(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format evaluation results with multi-model comparison tables."""
-        lines: list[str] = []
-
         # Header
-        lines.append("# Multi-Model Evaluation Results")
-        lines.append("")
-        lines.append(
-            f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
-        )
-        lines.append("")
+        yield "# Multi-Model Evaluation Results"
+        yield ""
+        yield f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
+        yield ""
 
         # Get comparison data
         comparison_data, model_order, per_model_stats = group_eval_for_comparison(results)
@@ -365,14 +396,14 @@ class MarkdownFormatter(EvalResultFormatter):
         total_warned = sum(s["warned"] for s in per_model_stats.values())
 
         # Models being compared
-        lines.append(f"**Models Compared:** {', '.join(f'`{m}`' for m in model_order)}")
-        lines.append("")
+        yield f"**Models Compared:** {', '.join(f'`{m}`' for m in model_order)}"
+        yield ""
 
         # Per-Model Summary Table
-        lines.append("## Per-Model Summary")
-        lines.append("")
-        lines.append("| Model | Passed | Failed | Warned | Total | Pass Rate |")
-        lines.append("|-------|--------|--------|--------|-------|-----------|")
+        yield "## Per-Model Summary"
+        yield ""
+        yield "| Model | Passed | Failed | Warned | Total | Pass Rate |"
+        yield "|-------|--------|--------|--------|-------|-----------|"
 
         best_model = None
         best_rate = -1.0
@@ -386,23 +417,23 @@ class MarkdownFormatter(EvalResultFormatter):
                 best_rate = rate
                 best_model = model
 
-            lines.append(
+            yield (
                 f"| `{model}` | {stats['passed']} | {stats['failed']} | "
                 f"{stats['warned']} | {stats['total']} | {rate_str} |"
             )
 
-        lines.append("")
+        yield ""
         if best_model:
-            lines.append(f"**🏆 Best Overall:** `{best_model}` ({best_rate:.1f}% pass rate)")
-        lines.append("")
+            yield f"**🏆 Best Overall:** `{best_model}` ({best_rate:.1f}% pass rate)"
+        yield ""
 
         # Cross-Model Comparison by Suite
-        lines.append("## Cross-Model Comparison")
-        lines.append("")
+        yield "## Cross-Model Comparison"
+        yield ""
 
         for suite_name, cases in comparison_data.items():
-            lines.append(f"### 📁 {suite_name}")
-            lines.append("")
+            yield f"### 📁 {suite_name}"
+            yield ""
 
             # Build comparison table header
             header = "| Case |"
@@ -413,8 +444,8 @@ class MarkdownFormatter(EvalResultFormatter):
             header += " Best |"
             separator += "------|"
 
-            lines.append(header)
-            lines.append(separator)
+            yield header
+            yield separator
 
             # Build rows for each case
             for case_name, case_models in cases.items():
@@ -435,7 +466,7 @@ class MarkdownFormatter(EvalResultFormatter):
                     row += f" {cell} |"
 
                 # Find best model for this case
-                best, best_score = find_best_model(case_models)
+                best, _ = find_best_model(case_models)
                 if best == "Tie":
                     row += " Tie |"
                 elif best:
@@ -443,19 +474,19 @@ class MarkdownFormatter(EvalResultFormatter):
                 else:
                     row += " — |"
 
-                lines.append(row)
+                yield row
 
-            lines.append("")
+            yield ""
 
             # Detailed results per case (if requested)
             if show_details:
-                lines.append("<details>")
-                lines.append("<summary><strong>📋 Detailed Results</strong></summary>")
-                lines.append("")
+                yield "<details>"
+                yield "<summary><strong>📋 Detailed Results</strong></summary>"
+                yield ""
 
                 for case_name, case_models in cases.items():
-                    lines.append(f"#### {case_name}")
-                    lines.append("")
+                    yield f"#### {case_name}"
+                    yield ""
 
                     for model in model_order:
                         if model not in case_models:
@@ -464,96 +495,91 @@ class MarkdownFormatter(EvalResultFormatter):
                         case_result = case_models[model]
                         evaluation = case_result["evaluation"]
 
-                        lines.append(f"**{model}:** Score {evaluation.score * 100:.1f}%")
-                        lines.append("")
+                        yield f"**{model}:** Score {evaluation.score * 100:.1f}%"
+                        yield ""
                         run_stats = case_result.get("run_stats")
-                        lines.extend(self._format_run_stats_summary(run_stats))
+                        yield from self._format_run_stats_summary(run_stats)
 
                         run_detail_lines = self._format_run_details_md(run_stats)
-                        lines.extend(run_detail_lines)
+                        yield from run_detail_lines
 
                         critic_stats = case_result.get("critic_stats")
                         if critic_stats:
-                            lines.extend(self._format_critic_stats_summary(critic_stats))
+                            yield from self._format_critic_stats_summary(critic_stats)
                         # Only show the critic results table when there are no per-run
                         # details (run details already include per-run field tables)
                         if not run_detail_lines:
-                            lines.append(self._format_evaluation_details(evaluation))
-                        lines.append("")
+                            yield self._format_evaluation_details(evaluation)
+                        yield ""
 
-                    lines.append("---")
-                    lines.append("")
+                    yield "---"
+                    yield ""
 
-                lines.append("</details>")
-                lines.append("")
+                yield "</details>"
+                yield ""
 
         # Overall summary
-        lines.append("## Overall Summary")
-        lines.append("")
+        yield "## Overall Summary"
+        yield ""
         if failed_only and original_counts:
             orig_total, orig_passed, orig_failed, orig_warned = original_counts
-            lines.append("> ⚠️ Showing only failed evaluations")
-            lines.append("")
-            lines.append(f"- **Total Cases:** {orig_total}")
-            lines.append(f"- **Passed:** {orig_passed}")
-            lines.append(f"- **Failed:** {orig_failed}")
+            yield "> ⚠️ Showing only failed evaluations"
+            yield ""
+            yield f"- **Total Cases:** {orig_total}"
+            yield f"- **Passed:** {orig_passed}"
+            yield f"- **Failed:** {orig_failed}"
             if orig_warned > 0:
-                lines.append(f"- **Warned:** {orig_warned}")
+                yield f"- **Warned:** {orig_warned}"
         else:
             # Note: total_cases counts each model's run of each case separately
             unique_cases = sum(len(cases) for cases in comparison_data.values())
-            lines.append(f"- **Unique Cases:** {unique_cases}")
-            lines.append(f"- **Total Evaluations:** {total_cases} ({len(model_order)} models)")
-            lines.append(f"- **Passed:** {total_passed}")
-            lines.append(f"- **Failed:** {total_failed}")
+            yield f"- **Unique Cases:** {unique_cases}"
+            yield f"- **Total Evaluations:** {total_cases} ({len(model_order)} models)"
+            yield f"- **Passed:** {total_passed}"
+            yield f"- **Failed:** {total_failed}"
             if total_warned > 0:
-                lines.append(f"- **Warned:** {total_warned}")
+                yield f"- **Warned:** {total_warned}"
 
-        lines.append("")
-        return "\n".join(lines)
+        yield ""
 
     # =========================================================================
     # COMPARATIVE EVALUATION FORMATTING
     # =========================================================================
 
-    def _format_comparative(
+    def _iter_comparative(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format comparative evaluation results showing tracks side-by-side."""
         # Check if this is multi-model comparative - use case-first grouping
         if is_multi_model_comparative(results):
-            return self._format_comparative_case_first(
+            return self._iter_comparative_case_first(
                 results, show_details, failed_only, original_counts, include_context
             )
 
         # Single model comparative - use original model-first grouping
-        return self._format_comparative_single_model(
+        return self._iter_comparative_single_model(
             results, show_details, failed_only, original_counts, include_context
         )
 
-    def _format_comparative_single_model(
+    def _iter_comparative_single_model(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format single-model comparative evaluation results."""
-        lines: list[str] = []
-
         # Header
-        lines.append("# Comparative Evaluation Results")
-        lines.append("")
-        lines.append(
-            f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
-        )
-        lines.append("")
+        yield "# Comparative Evaluation Results"
+        yield ""
+        yield f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
+        yield ""
 
         # Use comparative grouping
         (
@@ -573,68 +599,58 @@ class MarkdownFormatter(EvalResultFormatter):
                     all_tracks.append(t)
 
         # Summary section
-        lines.append("## Summary")
-        lines.append("")
-        lines.append(f"**Tracks compared:** {', '.join(f'`{t}`' for t in all_tracks)}")
-        lines.append("")
+        yield "## Summary"
+        yield ""
+        yield f"**Tracks compared:** {', '.join(f'`{t}`' for t in all_tracks)}"
+        yield ""
 
-        lines.extend(
-            self._format_summary_table_md(
-                total_cases,
-                total_passed,
-                total_failed,
-                total_warned,
-                failed_only,
-                original_counts,
-            )
+        yield from self._format_summary_table_md(
+            total_cases,
+            total_passed,
+            total_failed,
+            total_warned,
+            failed_only,
+            original_counts,
         )
 
         # Results by model
-        lines.append("## Results by Model")
-        lines.append("")
+        yield "## Results by Model"
+        yield ""
 
         for model, suites in comparative_groups.items():
-            lines.append(f"### 🤖 {model}")
-            lines.append("")
+            yield f"### 🤖 {model}"
+            yield ""
 
             for suite_name, cases in suites.items():
                 # Get track order for this specific suite
                 track_order = suite_track_order.get(suite_name, [])
 
-                lines.append(f"#### 📊 {suite_name} (Comparative)")
-                lines.append("")
-                lines.append(f"**Tracks:** {', '.join(f'`{t}`' for t in track_order)}")
-                lines.append("")
+                yield f"#### 📊 {suite_name} (Comparative)"
+                yield ""
+                yield f"**Tracks:** {', '.join(f'`{t}`' for t in track_order)}"
+                yield ""
 
                 # List all cases with summary comparison
                 for case_name, case_data in cases.items():
                     if include_context:
-                        lines.extend(
-                            self._format_context_section_md(
-                                case_data.get("system_message"),
-                                case_data.get("additional_messages"),
-                            )
+                        yield from self._format_context_section_md(
+                            case_data.get("system_message"),
+                            case_data.get("additional_messages"),
                         )
 
-                    lines.extend(
-                        self._format_comparative_case(
-                            case_name, case_data, track_order, show_details
-                        )
+                    yield from self._format_comparative_case(
+                        case_name, case_data, track_order, show_details
                     )
 
-        return "\n".join(lines)
-
-    def _format_comparative_case_first(
+    def _iter_comparative_case_first(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format multi-model comparative evaluation grouped by case first."""
-        lines: list[str] = []
-
         # Get case-first grouping
         (
             case_groups,
@@ -654,89 +670,79 @@ class MarkdownFormatter(EvalResultFormatter):
                     all_tracks.append(t)
 
         # Header
-        lines.append("# Comparative Evaluation Results (Multi-Model)")
-        lines.append("")
-        lines.append(
-            f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
-        )
-        lines.append("")
-        lines.append(f"**Models:** {', '.join(f'`{m}`' for m in model_order)}")
-        lines.append("")
-        lines.append(f"**Tracks:** {', '.join(f'`{t}`' for t in all_tracks)}")
-        lines.append("")
+        yield "# Comparative Evaluation Results (Multi-Model)"
+        yield ""
+        yield f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
+        yield ""
+        yield f"**Models:** {', '.join(f'`{m}`' for m in model_order)}"
+        yield ""
+        yield f"**Tracks:** {', '.join(f'`{t}`' for t in all_tracks)}"
+        yield ""
 
         # Summary section
-        lines.append("## Summary")
-        lines.append("")
+        yield "## Summary"
+        yield ""
 
-        lines.extend(
-            self._format_summary_table_md(
-                total_cases,
-                total_passed,
-                total_failed,
-                total_warned,
-                failed_only,
-                original_counts,
-            )
+        yield from self._format_summary_table_md(
+            total_cases,
+            total_passed,
+            total_failed,
+            total_warned,
+            failed_only,
+            original_counts,
         )
 
         # Results grouped by case
-        lines.append("## Results by Case")
-        lines.append("")
+        yield "## Results by Case"
+        yield ""
 
         for suite_name, cases in case_groups.items():
             track_order = suite_track_order.get(suite_name, [])
 
-            lines.append(f"### 📊 {suite_name}")
-            lines.append("")
-            lines.append(f"**Tracks:** {', '.join(f'`{t}`' for t in track_order)}")
-            lines.append("")
+            yield f"### 📊 {suite_name}"
+            yield ""
+            yield f"**Tracks:** {', '.join(f'`{t}`' for t in track_order)}"
+            yield ""
 
             for case_name, model_data in cases.items():
                 # Case header
-                lines.append(f"#### 📋 Case: {case_name}")
-                lines.append("")
+                yield f"#### 📋 Case: {case_name}"
+                yield ""
 
                 # Get input and context from first model
                 first_model_data = next(iter(model_data.values()), {})
                 case_input = first_model_data.get("input", "")
                 if case_input:
-                    lines.append(f"**Input:** `{case_input}`")
-                    lines.append("")
+                    yield f"**Input:** `{case_input}`"
+                    yield ""
 
                 # Context section (if include_context is True)
                 if include_context:
-                    lines.extend(
-                        self._format_context_section_md(
-                            first_model_data.get("system_message"),
-                            first_model_data.get("additional_messages"),
-                        )
+                    yield from self._format_context_section_md(
+                        first_model_data.get("system_message"),
+                        first_model_data.get("additional_messages"),
                     )
 
                 # Show each model's results for this case
                 for model in model_order:
                     if model not in model_data:
-                        lines.append(f"##### 🤖 {model}")
-                        lines.append("")
-                        lines.append("*(No data)*")
-                        lines.append("")
+                        yield f"##### 🤖 {model}"
+                        yield ""
+                        yield "*(No data)*"
+                        yield ""
                         continue
 
                     model_case_data = model_data[model]
-                    lines.append(f"##### 🤖 {model}")
-                    lines.append("")
+                    yield f"##### 🤖 {model}"
+                    yield ""
 
                     # Show track comparison for this model
-                    lines.extend(
-                        self._format_comparative_case(
-                            case_name, model_case_data, track_order, show_details
-                        )
+                    yield from self._format_comparative_case(
+                        case_name, model_case_data, track_order, show_details
                     )
 
-                lines.append("---")
-                lines.append("")
-
-        return "\n".join(lines)
+                yield "---"
+                yield ""
 
     def _format_comparative_case(
         self,
@@ -905,11 +911,23 @@ class MarkdownFormatter(EvalResultFormatter):
         if additional_messages:
             lines.append(f"**💬 Conversation ({len(additional_messages)} messages):**")
             lines.append("")
-            lines.extend(self._format_conversation_md(additional_messages))
+            lines.extend(self._conversation_md(additional_messages))
         lines.append("</details>")
         lines.append("")
         return lines
 
+    def _conversation_md(self, messages: list[dict]) -> list[str]:
+        """Format a conversation inline, or as a linked fragment if it is very large."""
+        conversation = self._format_conversation_md(messages)
+        fragments = self._fragments
+        if fragments is None:
+            return conversation
+        content = "\n".join(conversation)
+        if not fragments.should_split(content):
+            return conversation
+        path = fragments.write(content, "md")
+        return [f"[Open conversation ({len(messages)} messages)]({path})", ""]
+
     def _format_conversation_md(self, messages: list[dict]) -> list[str]:
         """Format conversation messages as Markdown for context display."""
         lines: list[str] = []
@@ -1,13 +1,15 @@
 """Plain text formatter for evaluation and capture results."""
 
 import json
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, TextIO
 
 from arcade_cli.formatters.base import (
     CaptureFormatter,
     CaptureResults,
     ComparativeCaseData,
     EvalResultFormatter,
+    ReportFragments,
     compute_track_differences,
     find_best_model,
     group_comparative_by_case,
@@ -18,6 +20,7 @@ from arcade_cli.formatters.base import (
     is_multi_model_capture,
     is_multi_model_comparative,
     is_multi_model_eval,
+    write_lines,
 )
 
 
@@ -40,33 +43,59 @@ class TextFormatter(EvalResultFormatter):
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
     ) -> str:
+        return "\n".join(
+            self._iter_lines(results, show_details, failed_only, original_counts, include_context)
+        )
+
+    def write(
+        self,
+        results: list[list[dict[str, Any]]],
+        sink: TextIO,
+        show_details: bool = False,
+        failed_only: bool = False,
+        original_counts: tuple[int, int, int, int] | None = None,
+        include_context: bool = False,
+        fragments: ReportFragments | None = None,
+    ) -> None:
+        """Write the report to ``sink`` one section at a time (conversations stay inline)."""
+        write_lines(
+            sink,
+            self._iter_lines(results, show_details, failed_only, original_counts, include_context),
+        )
+
+    def _iter_lines(
+        self,
+        results: list[list[dict[str, Any]]],
+        show_details: bool = False,
+        failed_only: bool = False,
+        original_counts: tuple[int, int, int, int] | None = None,
+        include_context: bool = False,
+    ) -> Iterator[str]:
         # Check if this is a comparative evaluation
         if is_comparative_result(results):
-            return self._format_comparative(
+            return self._iter_comparative(
                 results, show_details, failed_only, original_counts, include_context
             )
 
         # Check if this is a multi-model evaluation
         if is_multi_model_eval(results):
-            return self._format_multi_model(
+            return self._iter_multi_model(
                 results, show_details, failed_only, original_counts, include_context
             )
 
-        return self._format_regular(
+        return self._iter_regular(
             results, show_details, failed_only, original_counts, include_context
         )
 
-    def _format_regular(
+    def _iter_regular(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format regular (non-comparative) evaluation results."""
-        lines: list[str] = []
-
         # Use shared grouping logic
         model_groups, total_passed, total_failed, total_warned, total_cases = (
             group_results_by_model(results)
@@ -74,12 +103,12 @@ class TextFormatter(EvalResultFormatter):
 
         # Output grouped results
         for model, suites in model_groups.items():
-            lines.append(f"Model: {model}")
-            lines.append("=" * 60)
+            yield f"Model: {model}"
+            yield "=" * 60
 
             for suite_name, cases in suites.items():
-                lines.append(f"  Suite: {suite_name}")
-                lines.append("  " + "-" * 56)
+                yield f"  Suite: {suite_name}"
+                yield "  " + "-" * 56
 
                 for case in cases:
                     evaluation = case["evaluation"]
@@ -96,55 +125,49 @@ class TextFormatter(EvalResultFormatter):
                     if run_stats.get("num_runs", 1) > 1:
                         std_pct = run_stats.get("std_deviation", 0.0) * 100
                         stats_suffix = f" (n={run_stats['num_runs']}, sd={std_pct:.2f}%)"
-                    lines.append(
-                        f"    {status} {case['name']} -- Score: {score_percentage:.2f}%{stats_suffix}"
-                    )
+                    yield f"    {status} {case['name']} -- Score: {score_percentage:.2f}%{stats_suffix}"
 
                     if show_details:
-                        lines.append(f"    User Input: {case['input']}")
-                        lines.append("")
+                        yield f"    User Input: {case['input']}"
+                        yield ""
 
                         # Context section (if include_context is True)
                         if include_context:
                             system_msg = case.get("system_message")
                             addl_msgs = case.get("additional_messages")
                             if system_msg or addl_msgs:
-                                lines.append("    Context:")
+                                yield "    Context:"
                                 if system_msg:
-                                    lines.append(f"      System: {system_msg}")
+                                    yield f"      System: {system_msg}"
                                 if addl_msgs:
-                                    lines.append(f"      Conversation ({len(addl_msgs)} messages):")
+                                    yield f"      Conversation ({len(addl_msgs)} messages):"
                                     for conv_line in self._format_conversation_text(addl_msgs):
-                                        lines.append(f"        {conv_line}")
-                                lines.append("")
+                                        yield f"        {conv_line}"
+                                yield ""
 
-                        lines.append("    Details:")
+                        yield "    Details:"
                         for stat_line in self._format_run_stats(case):
-                            lines.append(f"    {stat_line}")
+                            yield f"    {stat_line}"
                         for stat_line in self._format_critic_stats(case):
-                            lines.append(f"    {stat_line}")
+                            yield f"    {stat_line}"
                         for detail_line in self._format_evaluation(evaluation).split("\n"):
-                            lines.append(f"    {detail_line}")
-                        lines.append("    " + "-" * 52)
+                            yield f"    {detail_line}"
+                        yield "    " + "-" * 52
 
-                lines.append("")
+                yield ""
 
-            lines.append("")
+            yield ""
 
         # Summary
-        lines.extend(
-            self._format_summary_lines(
-                total_cases,
-                total_passed,
-                total_failed,
-                total_warned,
-                failed_only,
-                original_counts,
-            )
+        yield from self._format_summary_lines(
+            total_cases,
+            total_passed,
+            total_failed,
+            total_warned,
+            failed_only,
+            original_counts,
         )
 
-        return "\n".join(lines)
-
     def _format_evaluation(self, evaluation: Any) -> str:
         """Format evaluation details."""
         result_lines = []
@@ -241,38 +264,36 @@ class TextFormatter(EvalResultFormatter):
     # MULTI-MODEL EVALUATION FORMATTING
     # =========================================================================
 
-    def _format_multi_model(
+    def _iter_multi_model(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format multi-model evaluation results with comparison tables."""
-        lines: list[str] = []
-
         # Get comparison data
         comparison_data, model_order, per_model_stats = group_eval_for_comparison(results)
 
         # Header
-        lines.append("=" * 78)
-        lines.append("MULTI-MODEL EVALUATION RESULTS")
-        lines.append("=" * 78)
-        lines.append("")
-        lines.append(f"Models: {', '.join(model_order)}")
-        lines.append("")
+        yield "=" * 78
+        yield "MULTI-MODEL EVALUATION RESULTS"
+        yield "=" * 78
+        yield ""
+        yield f"Models: {', '.join(model_order)}"
+        yield ""
 
         # Per-Model Summary Table
-        lines.append("-" * 78)
-        lines.append("PER-MODEL SUMMARY")
-        lines.append("-" * 78)
-        lines.append("")
+        yield "-" * 78
+        yield "PER-MODEL SUMMARY"
+        yield "-" * 78
+        yield ""
 
         # Build header row
         header = f"{'Model':<20} {'Passed':>8} {'Failed':>8} {'Warned':>8} {'Total':>8} {'Pass Rate':>10}"
-        lines.append(header)
-        lines.append("-" * len(header))
+        yield header
+        yield "-" * len(header)
 
         best_model = None
         best_rate = -1.0
@@ -284,25 +305,25 @@ class TextFormatter(EvalResultFormatter):
                 best_rate = rate
                 best_model = model
 
-            lines.append(
+            yield (
                 f"{model:<20} {stats['passed']:>8} {stats['failed']:>8} "
                 f"{stats['warned']:>8} {stats['total']:>8} {rate:>9.1f}%"
             )
 
-        lines.append("")
+        yield ""
         if best_model:
-            lines.append(f"Best Overall: {best_model} ({best_rate:.1f}% pass rate)")
-        lines.append("")
+            yield f"Best Overall: {best_model} ({best_rate:.1f}% pass rate)"
+        yield ""
 
         # Cross-Model Comparison by Suite
-        lines.append("-" * 78)
-        lines.append("CROSS-MODEL COMPARISON")
-        lines.append("-" * 78)
-        lines.append("")
+        yield "-" * 78
+        yield "CROSS-MODEL COMPARISON"
+        yield "-" * 78
+        yield ""
 
         for suite_name, cases in comparison_data.items():
-            lines.append(f"Suite: {suite_name}")
-            lines.append("")
+            yield f"Suite: {suite_name}"
+            yield ""
 
             # Build comparison table header - dynamic based on model count
             # Calculate column widths
@@ -320,8 +341,8 @@ class TextFormatter(EvalResultFormatter):
             header_parts.append(f"{'Best':>{best_col_width}}")
 
             header_line = " ".join(header_parts)
-            lines.append(header_line)
-            lines.append("-" * len(header_line))
+            yield header_line
+            yield "-" * len(header_line)
 
             # Build rows for each case
             for case_name, case_models in cases.items():
@@ -359,17 +380,17 @@ class TextFormatter(EvalResultFormatter):
                     best_cell = "-"
                 row_parts.append(f"{best_cell:>{best_col_width}}")
 
-                lines.append(" ".join(row_parts))
+                yield " ".join(row_parts)
 
-            lines.append("")
+            yield ""
 
             # Detailed results per case (if requested)
             if show_details:
-                lines.append("  Detailed Results:")
-                lines.append("  " + "-" * 70)
+                yield "  Detailed Results:"
+                yield "  " + "-" * 70
 
                 for case_name, case_models in cases.items():
-                    lines.append(f"  Case: {case_name}")
+                    yield f"  Case: {case_name}"
 
                     for model in model_order:
                         if model not in case_models:
@@ -378,21 +399,21 @@ class TextFormatter(EvalResultFormatter):
                         case_result = case_models[model]
                         evaluation = case_result["evaluation"]
 
-                        lines.append(f"    [{model}] Score: {evaluation.score * 100:.1f}%")
+                        yield f"    [{model}] Score: {evaluation.score * 100:.1f}%"
 
                         for stat_line in self._format_run_stats(case_result):
-                            lines.append(f"      {stat_line}")
+                            yield f"      {stat_line}"
                         for stat_line in self._format_critic_stats(case_result):
-                            lines.append(f"      {stat_line}")
+                            yield f"      {stat_line}"
 
                         # Show evaluation details indented
                         eval_details = self._format_evaluation(evaluation)
                         for line in eval_details.split("\n"):
-                            lines.append(f"      {line}")
+                            yield f"      {line}"
 
-                    lines.append("")
+                    yield ""
 
-                lines.append("")
+                yield ""
 
         # Overall summary
         total_cases = sum(s["total"] for s in per_model_stats.values())
@@ -400,61 +421,55 @@ class TextFormatter(EvalResultFormatter):
         total_failed = sum(s["failed"] for s in per_model_stats.values())
         total_warned = sum(s["warned"] for s in per_model_stats.values())
 
-        lines.append("=" * 78)
+        yield "=" * 78
         if failed_only and original_counts:
             orig_total, orig_passed, orig_failed, orig_warned = original_counts
-            lines.append("Note: Showing only failed evaluations (--only-failed)")
-            lines.append(
+            yield "Note: Showing only failed evaluations (--only-failed)"
+            yield (
                 f"Summary -- Total: {orig_total} -- Passed: {orig_passed} -- "
                 f"Failed: {orig_failed} -- Warned: {orig_warned}"
             )
         else:
             unique_cases = sum(len(cases) for cases in comparison_data.values())
-            lines.append(
+            yield (
                 f"Summary -- Unique Cases: {unique_cases} -- "
                 f"Total Evaluations: {total_cases} ({len(model_order)} models)"
             )
-            lines.append(
-                f"         Passed: {total_passed} -- Failed: {total_failed} -- Warned: {total_warned}"
-            )
-        lines.append("")
-
-        return "\n".join(lines)
+            yield f"         Passed: {total_passed} -- Failed: {total_failed} -- Warned: {total_warned}"
+        yield ""
 
     # =========================================================================
     # COMPARATIVE EVALUATION FORMATTING
     # =========================================================================
 
-    def _format_comparative(
+    def _iter_comparative(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format comparative evaluation results showing tracks side-by-side."""
         # Check if this is multi-model comparative - use case-first grouping
         if is_multi_model_comparative(results):
-            return self._format_comparative_case_first(
+            return self._iter_comparative_case_first(
                 results, show_details, failed_only, original_counts, include_context
             )
 
-        return self._format_comparative_single_model(
+        return self._iter_comparative_single_model(
             results, show_details, failed_only, original_counts, include_context
         )
 
-    def _format_comparative_single_model(
+    def _iter_comparative_single_model(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format single-model comparative evaluation results."""
-        lines: list[str] = []
-
         # Use comparative grouping
         (
             comparative_groups,
@@ -472,68 +487,58 @@ class TextFormatter(EvalResultFormatter):
                 if t not in all_tracks:
                     all_tracks.append(t)
 
-        lines.append("=" * 76)
-        lines.append("COMPARATIVE EVALUATION RESULTS")
-        lines.append("=" * 76)
-        lines.append("")
-        lines.append(f"All Tracks: {' vs '.join(all_tracks)}")
-        lines.append("")
+        yield "=" * 76
+        yield "COMPARATIVE EVALUATION RESULTS"
+        yield "=" * 76
+        yield ""
+        yield f"All Tracks: {' vs '.join(all_tracks)}"
+        yield ""
 
         # Output grouped results
         for model, suites in comparative_groups.items():
-            lines.append(f"Model: {model}")
-            lines.append("=" * 76)
+            yield f"Model: {model}"
+            yield "=" * 76
 
             for suite_name, cases in suites.items():
                 # Get track order for this specific suite
                 track_order = suite_track_order.get(suite_name, [])
 
-                lines.append(f"  Suite: {suite_name} (Comparative)")
-                lines.append(f"  Tracks: {' vs '.join(track_order)}")
-                lines.append("  " + "-" * 72)
+                yield f"  Suite: {suite_name} (Comparative)"
+                yield f"  Tracks: {' vs '.join(track_order)}"
+                yield "  " + "-" * 72
 
                 for case_name, case_data in cases.items():
                     if include_context:
-                        lines.extend(
-                            self._format_context_block(
-                                case_data.get("system_message"),
-                                case_data.get("additional_messages"),
-                            )
+                        yield from self._format_context_block(
+                            case_data.get("system_message"),
+                            case_data.get("additional_messages"),
                         )
 
-                    lines.extend(
-                        self._format_comparative_case_text(
-                            case_name, case_data, track_order, show_details
-                        )
+                    yield from self._format_comparative_case_text(
+                        case_name, case_data, track_order, show_details
                     )
 
-            lines.append("")
+            yield ""
 
         # Summary
-        lines.extend(
-            self._format_summary_lines(
-                total_cases,
-                total_passed,
-                total_failed,
-                total_warned,
-                failed_only,
-                original_counts,
-            )
+        yield from self._format_summary_lines(
+            total_cases,
+            total_passed,
+            total_failed,
+            total_warned,
+            failed_only,
+            original_counts,
         )
 
-        return "\n".join(lines)
-
-    def _format_comparative_case_first(
+    def _iter_comparative_case_first(
         self,
         results: list[list[dict[str, Any]]],
         show_details: bool = False,
         failed_only: bool = False,
         original_counts: tuple[int, int, int, int] | None = None,
         include_context: bool = False,
-    ) -> str:
+    ) -> Iterator[str]:
         """Format multi-model comparative evaluation grouped by case first."""
-        lines: list[str] = []
-
         # Get case-first grouping
         (
             case_groups,
@@ -552,35 +557,35 @@ class TextFormatter(EvalResultFormatter):
                 if t not in all_tracks:
                     all_tracks.append(t)
 
-        lines.append("=" * 78)
-        lines.append("COMPARATIVE EVALUATION RESULTS (MULTI-MODEL)")
-        lines.append("=" * 78)
-        lines.append("")
-        lines.append(f"Models: {', '.join(model_order)}")
-        lines.append(f"Tracks: {', '.join(all_tracks)}")
-        lines.append("")
+        yield "=" * 78
+        yield "COMPARATIVE EVALUATION RESULTS (MULTI-MODEL)"
+        yield "=" * 78
+        yield ""
+        yield f"Models: {', '.join(model_order)}"
+        yield f"Tracks: {', '.join(all_tracks)}"
+        yield ""
 
         # Results grouped by case
         for suite_name, cases in case_groups.items():
             track_order = suite_track_order.get(suite_name, [])
 
-            lines.append("-" * 78)
-            lines.append(f"SUITE: {suite_name}")
-            lines.append(f"Tracks: {' vs '.join(track_order)}")
-            lines.append("-" * 78)
-            lines.append("")
+            yield "-" * 78
+            yield f"SUITE: {suite_name}"
+            yield f"Tracks: {' vs '.join(track_order)}"
+            yield "-" * 78
+            yield ""
 
             for case_name, model_data in cases.items():
                 # Case header
-                lines.append("  " + "=" * 72)
-                lines.append(f"  CASE: {case_name}")
-                lines.append("  " + "=" * 72)
+                yield "  " + "=" * 72
+                yield f"  CASE: {case_name}"
+                yield "  " + "=" * 72
 
                 # Get input and context from first model
                 first_model_data = next(iter(model_data.values()), {})
                 case_input = first_model_data.get("input", "")
                 if case_input:
-                    lines.append(f"  Input: {case_input}")
+                    yield f"  Input: {case_input}"
 
                 if include_context:
                     context_lines = self._format_context_block(
@@ -588,20 +593,20 @@ class TextFormatter(EvalResultFormatter):
                         first_model_data.get("additional_messages"),
                     )
                     if context_lines:
-                        lines.append("")
-                        lines.extend(context_lines)
+                        yield ""
+                        yield from context_lines
 
-                lines.append("")
+                yield ""
 
                 # Show each model's results for this case
                 for model in model_order:
                     if model not in model_data:
-                        lines.append(f"    [{model}] (no data)")
-                        lines.append("")
+                        yield f"    [{model}] (no data)"
+                        yield ""
                         continue
 
                     model_case_data = model_data[model]
-                    lines.append(f"    [{model}]")
+                    yield f"    [{model}]"
 
                     # Show track comparison for this model
                     case_lines = self._format_comparative_case_text(
@@ -609,25 +614,21 @@ class TextFormatter(EvalResultFormatter):
                     )
                     # Indent the case lines
                     for line in case_lines:
-                        lines.append("    " + line)
+                        yield "    " + line
 
-                lines.append("")
+                yield ""
 
         # Summary
-        lines.append("=" * 78)
-        lines.extend(
-            self._format_summary_lines(
-                total_cases,
-                total_passed,
-                total_failed,
-                total_warned,
-                failed_only,
-                original_counts,
-            )
+        yield "=" * 78
+        yield from self._format_summary_lines(
+            total_cases,
+            total_passed,
+            total_failed,
+            total_warned,
+            failed_only,
+            original_counts,
         )
 
-        return "\n".join(lines)
-
     def _format_comparative_case_text(
         self,
         case_name: str,
@@ -8,7 +8,12 @@ from typing import Any, Optional
 
 import click
 import typer
-from arcade_core.constants import CREDENTIALS_FILE_PATH, PROD_COORDINATOR_HOST, PROD_ENGINE_HOST
+from arcade_core.constants import (
+    ARCADE_CONFIG_PATH,
+    CREDENTIALS_FILE_PATH,
+    PROD_COORDINATOR_HOST,
+    PROD_ENGINE_HOST,
+)
 from arcade_core.subprocess_utils import get_windows_no_window_creationflags
 from arcadepy import Arcade
 
@@ -23,7 +28,12 @@ from arcade_cli.authn import (
     save_credentials_from_whoami,
 )
 from arcade_cli.console import console
-from arcade_cli.evals_runner import run_capture, run_evaluations
+from arcade_cli.evals_runner import (
+    EvalWorkerSettings,
+    report_from_journal,
+    run_capture,
+    run_evaluations,
+)
 from arcade_cli.org import app as org_app
 from arcade_cli.project import app as project_app
 from arcade_cli.secret import app as secret_app
@@ -437,6 +447,11 @@ def evals(
         "-n",
         help="Number of runs per case (default: 1).",
     ),
+    processes: int = typer.Option(
+        1,
+        "--processes",
+        help="Run (suite, model) pairs in this many worker processes (default: 1, in-process)",
+    ),
     seed: str = typer.Option(
         "constant",
         "--seed",
@@ -486,6 +501,67 @@ def evals(
         "--include-context",
         help="Include system_message and additional_messages in output (works for both eval and capture modes)",
     ),
+    record: bool = typer.Option(
+        False,
+        "--record",
+        help="Record model responses to the response cache, reusing recordings that already exist",
+    ),
+    replay: bool = typer.Option(
+        False,
+        "--replay",
+        help="Replay recorded model responses without calling the model (fails on a missing recording)",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Call the model for every request and overwrite the recorded responses",
+    ),
+    cache_dir: Optional[str] = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for recorded model responses (default: ~/.arcade/cache/eval_responses)",
+    ),
+    requests_per_minute: Optional[float] = typer.Option(
+        None,
+        "--requests-per-minute",
+        help="Request budget per provider model, shared by all suites in the run",
+    ),
+    tokens_per_minute: Optional[float] = typer.Option(
+        None,
+        "--tokens-per-minute",
+        help="Token budget per provider model, shared by all suites in the run",
+    ),
+    cache_tools: bool = typer.Option(
+        False,
+        "--cache-tools",
+        help="Cache tool lists loaded from MCP servers on disk and reuse them in later runs",
+    ),
+    tools_cache_ttl: float = typer.Option(
+        3600,
+        "--tools-cache-ttl",
+        help="Seconds a cached tool list stays valid (with --cache-tools)",
+    ),
+    refresh_tools: bool = typer.Option(
+        False,
+        "--refresh-tools",
+        help="Load tools from every MCP server again and update the on-disk tools cache",
+    ),
+    journal_path: Optional[str] = typer.Option(
+        None,
+        "--journal",
+        help="Append each completed case to this JSONL journal (replaces an existing file)",
+    ),
+    resume: Optional[str] = typer.Option(
+        None,
+        "--resume",
+        help="Continue the run recorded in this journal, skipping cases it already holds",
+    ),
+    from_journal: Optional[str] = typer.Option(
+        None,
+        "--from-journal",
+        help="Show the results recorded in this journal (and write them with -o) "
+        "without running any evaluation",
+    ),
     host: Optional[str] = typer.Option(
         None,
         "--host",
@@ -523,6 +599,10 @@ def evals(
         handle_cli_error("--num-runs must be >= 1", should_exit=True)
         return
 
+    if processes < 1:
+        handle_cli_error("--processes must be >= 1", should_exit=True)
+        return
+
     seed_value: str | int
     seed_lower = seed.strip().lower()
     if seed_lower in {"constant", "random"}:
@@ -551,6 +631,89 @@ def evals(
         )
         return
 
+    # --- Response cache (record/replay) ---
+    cache_modes = [
+        mode
+        for mode, enabled in (("record", record), ("replay", replay), ("refresh", refresh))
+        if enabled
+    ]
+    if len(cache_modes) > 1:
+        handle_cli_error("Use only one of --record, --replay, or --refresh.", should_exit=True)
+        return
+
+    response_cache = None
+    if cache_modes:
+        from arcade_evals import ResponseCache
+
+        response_cache = ResponseCache(
+            cache_dir or os.path.join(ARCADE_CONFIG_PATH, "cache", "eval_responses"),
+            mode=cache_modes[0],  # type: ignore[arg-type]
+        )
+    elif cache_dir:
+        console.print(
+            "[yellow]⚠️  --cache-dir is ignored without --record, --replay, or --refresh[/yellow]"
+        )
+
+    # --- Rate limits (shared by every suite in the run) ---
+    for flag, budget in (
+        ("--requests-per-minute", requests_per_minute),
+        ("--tokens-per-minute", tokens_per_minute),
+    ):
+        if budget is not None and budget <= 0:
+            handle_cli_error(f"{flag} must be > 0", should_exit=True)
+            return
+    if requests_per_minute or tokens_per_minute:
+        from arcade_evals import set_default_rate_limits
+
+        set_default_rate_limits(requests_per_minute, tokens_per_minute)
+
+    # --- On-disk cache of MCP tool lists ---
+    if tools_cache_ttl <= 0:
+        handle_cli_error("--tools-cache-ttl must be > 0", should_exit=True)
+        return
+    tools_cache_dir = None
+    if cache_tools or refresh_tools:
+        from arcade_evals import configure_tools_cache
+
+        tools_cache_dir = os.path.join(ARCADE_CONFIG_PATH, "cache", "eval_tools")
+        configure_tools_cache(tools_cache_dir, ttl=tools_cache_ttl, refresh=refresh_tools)
+
+    # --- Journal (incremental results, resume) ---
+    if journal_path and resume:
+        handle_cli_error("Use either --journal or --resume, not both.", should_exit=True)
+        return
+    if resume and not capture and not os.path.isfile(resume):
+        handle_cli_error(f"Journal not found: {resume}", should_exit=True)
+        return
+    if from_journal:
+        if journal_path or resume or capture:
+            handle_cli_error(
+                "--from-journal cannot be combined with --journal, --resume, or --capture.",
+                should_exit=True,
+            )
+            return
+        if not os.path.isfile(from_journal):
+            handle_cli_error(f"Journal not found: {from_journal}", should_exit=True)
+            return
+        report_file: str | None = None
+        report_formats: list[str] = []
+        if output:
+            try:
+                report_file, report_formats = parse_output_paths(output)
+            except ValueError as e:
+                handle_cli_error(str(e), should_exit=True)
+                return
+        report_from_journal(
+            from_journal,
+            show_details=show_details,
+            output_file=report_file,
+            output_format=",".join(report_formats) if report_formats else "txt",
+            failed_only=only_failed,
+            console=console,
+            include_context=include_context,
+        )
+        return
+
     # --- Build model specs from flags ---
     model_specs: list[ModelSpec] = []
 
@@ -603,10 +766,14 @@ def evals(
     # Warn about incompatible flag combinations
     if capture:
         console.print("\nRunning in capture mode", style="bold cyan")
+        if journal_path or resume:
+            console.print("[yellow]⚠️  --journal and --resume are ignored in capture mode[/yellow]")
         if only_failed:
             console.print("[yellow]⚠️  --only-failed is ignored in capture mode[/yellow]")
         if show_details:
             console.print("[yellow]⚠️  --details is ignored in capture mode[/yellow]")
+        if processes > 1:
+            console.print("[yellow]⚠️  --processes is ignored in capture mode[/yellow]")
     else:
         console.print("\nRunning evaluations", style="bold")
 
@@ -657,6 +824,15 @@ def evals(
             handle_cli_error(str(e), should_exit=True)
             return
 
+    journal = None
+    if not capture and (resume or journal_path):
+        from arcade_evals import EvalJournal
+
+        if resume:
+            journal = EvalJournal(resume, resume=True)
+        elif journal_path:
+            journal = EvalJournal(journal_path)
+
     try:
         if capture:
             asyncio.run(
@@ -670,6 +846,7 @@ def evals(
                     console=console,
                     num_runs=num_runs,
                     seed=seed_value,
+                    response_cache=response_cache,
                 )
             )
         else:
@@ -687,6 +864,16 @@ def evals(
                     num_runs=num_runs,
                     seed=seed_value,
                     multi_run_pass_rule=pass_rule,
+                    response_cache=response_cache,
+                    journal=journal,
+                    processes=processes,
+                    worker_settings=EvalWorkerSettings(
+                        requests_per_minute=requests_per_minute,
+                        tokens_per_minute=tokens_per_minute,
+                        tools_cache_dir=tools_cache_dir,
+                        tools_cache_ttl=tools_cache_ttl,
+                        refresh_tools=refresh_tools,
+                    ),
                 )
             )
     except Exception as e:
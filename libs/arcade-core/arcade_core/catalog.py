@@ -52,6 +52,7 @@ from arcade_core.schema import (
     ToolSecretRequirement,
     ValueSchema,
 )
+from arcade_core.streaming import stream_item_type, stream_result_annotation
 from arcade_core.toolkit import Toolkit
 from arcade_core.utils import (
     does_function_return_value,
@@ -91,6 +92,11 @@ def is_typeddict(tp: type) -> bool:
         return False
 
 
+def is_typeddict_model(tp: Any) -> bool:
+    """Check if a type is a Pydantic model generated from a TypedDict."""
+    return isinstance(tp, type) and issubclass(tp, _TypedDictBaseModel)
+
+
 @dataclass
 class WireTypeInfo:
     """
@@ -456,6 +462,13 @@ class ToolCatalog(BaseModel):
         if does_function_return_value(tool) and tool.__annotations__.get("return") is None:
             raise ToolOutputSchemaError(f"Tool '{raw_tool_name}' must have a return type")
 
+        # Async-generator tools stream their result, so their return type says what they yield
+        return_annotation = inspect.signature(tool, follow_wrapped=True).return_annotation
+        if inspect.isasyncgenfunction(tool) and stream_item_type(return_annotation) is None:
+            raise ToolOutputSchemaError(
+                f"Streaming tool '{raw_tool_name}' must have an AsyncIterator return type"
+            )
+
         auth_requirement = create_auth_requirement(tool)
         secrets_requirement = create_secrets_requirement(tool)
         metadata_requirement = create_metadata_requirement(tool, auth_requirement)
@@ -543,7 +556,9 @@ def create_output_definition(func: Callable) -> ToolOutput:
     """
     Create an output model for a function based on its return annotation.
     """
-    return_type = inspect.signature(func, follow_wrapped=True).return_annotation
+    return_type = stream_result_annotation(
+        inspect.signature(func, follow_wrapped=True).return_annotation
+    )
     description = "No description provided."
 
     if return_type is inspect.Signature.empty:
@@ -1191,7 +1206,7 @@ def determine_output_model(func: Callable) -> type[BaseModel]:
     """
     Determine the output model for a function based on its return annotation.
     """
-    return_annotation = inspect.signature(func).return_annotation
+    return_annotation = stream_result_annotation(inspect.signature(func).return_annotation)
     output_model_name = f"{snake_to_pascal_case(func.__name__)}Output"
 
     # If the return annotation is empty, create a model with no fields
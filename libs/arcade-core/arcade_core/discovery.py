@@ -8,6 +8,7 @@ load modules, collect tools, and build a ToolCatalog.
 from __future__ import annotations
 
 import importlib.util
+import os
 from pathlib import Path
 from types import ModuleType
 from typing import Any
@@ -15,7 +16,7 @@ from typing import Any
 from loguru import logger
 
 from arcade_core.catalog import ToolCatalog
-from arcade_core.parse import get_tools_from_file
+from arcade_core.manifest import DiscoveryManifest, scan_files_for_tools
 from arcade_core.toolkit import Toolkit, ToolkitLoadError
 
 DISCOVERY_PATTERNS = ["*.py", "tools/*.py", "arcade_tools/*.py", "tools/**/*.py"]
@@ -63,16 +64,21 @@ def find_candidate_tool_files(root: Path | None = None) -> list[Path]:
 
 
 def analyze_files_for_tools(files: list[Path]) -> list[tuple[Path, list[str]]]:
-    """Parse files with a fast AST pass to find declared @tool function names."""
+    """Parse files with a fast AST pass to find declared @tool function names.
+
+    Files unchanged since they were last parsed are served from the discovery manifest.
+    """
+    manifest = None
+    if files:
+        manifest = DiscoveryManifest.for_directory(os.path.commonpath([f.parent for f in files]))
+
     results: list[tuple[Path, list[str]]] = []
-    for file_path in files:
-        try:
-            names = get_tools_from_file(file_path)
-            if names:
-                logger.info(f"Found {len(names)} tool(s) in {file_path.name}: {', '.join(names)}")
-                results.append((file_path, names))
-        except Exception:
-            logger.exception(f"Could not parse {file_path}")
+    for file_path, names in scan_files_for_tools(files, manifest=manifest):
+        if isinstance(names, Exception):
+            logger.opt(exception=names).error(f"Could not parse {file_path}")
+        elif names:
+            logger.info(f"Found {len(names)} tool(s) in {file_path.name}: {', '.join(names)}")
+            results.append((file_path, names))
     return results
 
 
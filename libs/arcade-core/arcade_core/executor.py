@@ -1,10 +1,19 @@
 import asyncio
+import contextlib
+import datetime
+import decimal
+import enum
+import inspect
 import traceback
-from collections.abc import Callable
-from typing import Any
+import types
+import uuid
+import weakref
+from collections.abc import AsyncIterator, Callable
+from typing import Annotated, Any, Literal, Union, get_args, get_origin
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from arcade_core.catalog import is_typeddict_model
 from arcade_core.errors import (
     ToolInputError,
     ToolOutputError,
@@ -17,6 +26,165 @@ from arcade_core.schema import (
     ToolContext,
     ToolDefinition,
 )
+from arcade_core.streaming import ChunkCallback, StreamSummary, assemble_chunks
+
+# Leaf types whose validated value is already what model_dump() would return.
+_PASSTHROUGH_TYPES: tuple[type, ...] = (
+    str,
+    int,
+    float,
+    bool,
+    bytes,
+    type(None),
+    enum.Enum,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    decimal.Decimal,
+    uuid.UUID,
+)
+
+# Generic origins whose dumped form only differs from the validated value
+# when one of their type arguments does.
+_PASSTHROUGH_ORIGINS: tuple[Any, ...] = (
+    list,
+    dict,
+    tuple,
+    set,
+    frozenset,
+    Union,
+    types.UnionType,
+    Annotated,
+)
+
+
+def _is_passthrough(annotation: Any) -> bool:
+    """
+    Whether a validated value of this type can be handed to the tool as-is.
+
+    Conservative: anything that might hold a Pydantic model, dataclass, or
+    arbitrary object (including ``Any``) is reported as needing a dump.
+    """
+    origin = get_origin(annotation)
+    if origin is None:
+        return isinstance(annotation, type) and issubclass(annotation, _PASSTHROUGH_TYPES)
+    if origin is Literal:
+        return True
+    if origin not in _PASSTHROUGH_ORIGINS:
+        return False
+    args = get_args(annotation)
+    if origin is Annotated:
+        args = args[:1]
+    return all(arg is Ellipsis or _is_passthrough(arg) for arg in args)
+
+
+_Dumper = Callable[[Any], Any]
+
+
+def _dump_model(value: Any) -> Any:
+    return value.model_dump()
+
+
+def _compile_dumper(annotation: Any, seen: dict[type, _Dumper]) -> _Dumper | None:
+    """
+    Build a function converting a validated value of ``annotation`` into what
+    ``model_dump()`` would produce for it, or None when the value is already
+    plain and can be passed through untouched.
+
+    TypedDict-derived models are converted directly from their set fields,
+    skipping the Python-level serializer hook they would otherwise run once
+    per nested instance. Shapes not handled here fall back to a full dump.
+    """
+    if _is_passthrough(annotation):
+        return None
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Annotated:
+        return _compile_dumper(args[0], seen)
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if not is_typeddict_model(annotation):
+            return _dump_model
+        if annotation in seen:
+            return seen[annotation]
+        fields: list[tuple[str, _Dumper | None]] = []
+
+        def dump_typeddict(value: Any) -> dict[str, Any]:
+            values = value.__dict__
+            fields_set = value.__pydantic_fields_set__
+            return {
+                name: dumper(values[name]) if dumper else values[name]
+                for name, dumper in fields
+                if name in fields_set
+            }
+
+        # Registered before compiling fields so self-referencing TypedDicts terminate.
+        seen[annotation] = dump_typeddict
+        fields.extend(
+            (name, _compile_dumper(field.annotation, seen))
+            for name, field in annotation.__pydantic_fields__.items()
+        )
+        return dump_typeddict
+
+    if origin is list and args:
+        item_dumper = _compile_dumper(args[0], seen)
+        if item_dumper is not None:
+            return lambda value: [item_dumper(item) for item in value]
+
+    if origin is dict and len(args) == 2 and _is_passthrough(args[0]):
+        value_dumper = _compile_dumper(args[1], seen)
+        if value_dumper is not None:
+            return lambda value: {key: value_dumper(item) for key, item in value.items()}
+
+    if origin in (Union, types.UnionType):
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) == 1 and len(args) == 2:
+            inner_dumper = _compile_dumper(non_none[0], seen)
+            if inner_dumper is not None:
+                return lambda value: None if value is None else inner_dumper(value)
+
+    adapter = TypeAdapter(annotation)
+    return adapter.dump_python
+
+
+class _ModelPlan:
+    """
+    Per-model execution plan, built once and reused for every call.
+
+    Holds the model's compiled validator and a dumper for each field that
+    may hold nested models (e.g. TypedDict or Pydantic parameters). Fields
+    without one are handed to the tool as-is instead of being deep-copied
+    by ``model_dump()``.
+    """
+
+    __slots__ = ("fields", "validator")
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.validator = model.__pydantic_validator__
+        seen: dict[type, _Dumper] = {}
+        self.fields = tuple(
+            (name, _compile_dumper(field.annotation, seen))
+            for name, field in model.__pydantic_fields__.items()
+        )
+
+    def dump(self, instance: BaseModel) -> dict[str, Any]:
+        """Equivalent of ``instance.model_dump()`` for a validated instance."""
+        values = instance.__dict__
+        return {
+            name: dumper(values[name]) if dumper else values[name] for name, dumper in self.fields
+        }
+
+
+_model_plans: "weakref.WeakKeyDictionary[type[BaseModel], _ModelPlan]" = weakref.WeakKeyDictionary()
+
+
+def _get_plan(model: type[BaseModel]) -> _ModelPlan:
+    plan = _model_plans.get(model)
+    if plan is None:
+        plan = _model_plans[model] = _ModelPlan(model)
+    return plan
 
 
 class ToolExecutor:
@@ -28,10 +196,17 @@ class ToolExecutor:
         output_model: type[BaseModel],
         context: ToolContext,
         *args: Any,
+        _on_chunk: ChunkCallback | None = None,
         **kwargs: Any,
     ) -> ToolCallOutput:
         """
         Execute a callable function with validated inputs and outputs via Pydantic models.
+
+        ``kwargs`` are the tool's inputs. For a streaming (async-generator)
+        tool, ``_on_chunk`` is awaited with each chunk before the next one is
+        requested, and the result is assembled from the chunks (see
+        ``arcade_core.streaming``). Its leading underscore keeps it apart from
+        tool inputs, so a tool may have an input named ``on_chunk``.
         """
         # only gathering deprecation log for now
         tool_call_logs = []
@@ -48,15 +223,22 @@ class ToolExecutor:
             # serialize the input model
             inputs = await ToolExecutor._serialize_input(input_model, **kwargs)
 
-            # prepare the arguments for the function call
-            func_args = inputs.model_dump()
+            # prepare the arguments for the function call; equivalent to
+            # inputs.model_dump() without re-copying already-plain values
+            func_args = _get_plan(input_model).dump(inputs)
 
             # inject ToolContext, if the target function supports it
             if definition.input.tool_context_parameter_name is not None:
                 func_args[definition.input.tool_context_parameter_name] = context
 
             # execute the tool function
-            if asyncio.iscoroutinefunction(func):
+            if inspect.isasyncgenfunction(func):
+                as_text = (
+                    definition.output.value_schema is not None
+                    and definition.output.value_schema.val_type == "string"
+                )
+                results = await ToolExecutor._drain_stream(func(**func_args), _on_chunk, as_text)
+            elif asyncio.iscoroutinefunction(func):
                 results = await func(**func_args)
             else:
                 results = await asyncio.to_thread(func, **func_args)
@@ -64,6 +246,12 @@ class ToolExecutor:
             # serialize the output model
             output = await ToolExecutor._serialize_output(output_model, results)
 
+            # nested models in the result are converted to plain Python once here
+            result = output.result  # type: ignore[attr-defined]
+            if isinstance(result, (BaseModel, list)):
+                dumped = _get_plan(output_model).dump(output)["result"]
+                return output_factory.success(data=dumped, logs=tool_call_logs)
+
             # return the output
             return output_factory.success(data=output, logs=tool_call_logs)
 
@@ -89,6 +277,32 @@ class ToolExecutor:
                 stacktrace=traceback.format_exc(),
             )
 
+    @staticmethod
+    async def _drain_stream(
+        stream: AsyncIterator[Any], on_chunk: ChunkCallback | None, as_text: bool
+    ) -> Any:
+        """
+        Consume a streaming tool, passing each chunk on, and return its result.
+        """
+        chunks: list[Any] = []
+        summary: StreamSummary | None = None
+        # Close the generator even if the caller is cancelled mid-stream
+        async with contextlib.aclosing(stream):  # type: ignore[type-var]
+            async for chunk in stream:
+                if isinstance(chunk, StreamSummary):
+                    summary = chunk
+                    chunks = []
+                    continue
+                if isinstance(chunk, BaseModel):
+                    chunk = chunk.model_dump()
+                if on_chunk is not None:
+                    await on_chunk(chunk)
+                if summary is None:
+                    chunks.append(chunk)
+        if summary is not None:
+            return summary.value
+        return assemble_chunks(chunks, as_text)
+
     @staticmethod
     async def _serialize_input(input_model: type[BaseModel], **kwargs: Any) -> BaseModel:
         """
@@ -98,7 +312,7 @@ class ToolExecutor:
             # TODO Logging and telemetry
 
             # build in the input model to the tool function
-            inputs = input_model(**kwargs)
+            inputs: BaseModel = _get_plan(input_model).validator.validate_python(kwargs)
 
         except ValidationError as e:
             # IMPORTANT: do NOT include err["input"] or str(e) anywhere in the
@@ -133,7 +347,9 @@ class ToolExecutor:
             # TODO Logging and telemetry
 
             # build the output model
-            output = output_model(**{"result": results})
+            output: BaseModel = _get_plan(output_model).validator.validate_python(
+                {"result": results}
+            )
 
         except ValidationError as e:
             raise ToolOutputError(
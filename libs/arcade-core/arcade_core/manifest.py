@@ -0,0 +1,220 @@
+"""
+Persistent manifest of tools found by AST discovery.
+
+Discovering a toolkit's tools parses every Python file in it. The manifest
+records, per file, its mtime, size, and content hash along with the tool names
+found in it, so later startups only parse the files that changed. Files whose
+mtime or size changed but whose content did not (e.g. after a checkout) are
+re-hashed, not re-parsed. Parsing on a miss runs in a thread pool.
+
+Manifests are kept per directory in ~/.arcade/cache/tool_manifests. Set
+ARCADE_DISCOVERY_CACHE=0 to disable them.
+"""
+
+import ast
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from arcade_core.constants import ARCADE_CONFIG_PATH
+from arcade_core.parse import get_tools_from_ast
+
+logger = logging.getLogger(__name__)
+
+ARCADE_DISCOVERY_CACHE = "ARCADE_DISCOVERY_CACHE"
+MANIFEST_DIR = os.path.join(ARCADE_CONFIG_PATH, "cache", "tool_manifests")
+# Bump when the detection rules in arcade_core.parse change
+MANIFEST_VERSION = 1
+MAX_PARSE_WORKERS = 8
+
+FileTools = tuple[Path, list[str] | Exception]
+
+
+def is_discovery_cache_enabled() -> bool:
+    """Check if the discovery manifest is enabled (default) via environment variable."""
+    value = os.environ.get(ARCADE_DISCOVERY_CACHE, "1")
+    return value.lower() not in ("false", "0", "no", "off")
+
+
+class DiscoveryManifest:
+    """Tool names found per file, with the file state they were found in.
+
+    Args:
+        path: The manifest file. Missing or unreadable manifests start empty.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        # Files found unchanged without reading them, and files that had to be read
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = self._load()
+        self._dirty = False
+
+    @classmethod
+    def for_directory(cls, directory: str | Path) -> "DiscoveryManifest | None":
+        """Return the manifest for a directory, or None if the cache is disabled."""
+        if not is_discovery_cache_enabled():
+            return None
+        resolved = str(Path(directory).resolve())
+        key = hashlib.sha256(resolved.encode()).hexdigest()[:32]
+        return cls(Path(MANIFEST_DIR) / f"{key}.json")
+
+    def _header(self) -> dict[str, Any]:
+        return {"version": MANIFEST_VERSION, "python": list(sys.version_info[:2])}
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning(f"Ignoring unreadable discovery manifest {self.path}")
+            return {}
+        if not isinstance(data, dict) or data.get("header") != self._header():
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def save(self) -> None:
+        """Write the manifest if it changed, dropping entries for deleted files."""
+        if not self._dirty:
+            return
+        self._entries = {path: e for path, e in self._entries.items() if os.path.exists(path)}
+        tmp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps({"header": self._header(), "files": self._entries}), encoding="utf-8"
+            )
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError:
+            logger.warning(f"Failed to write discovery manifest {self.path}", exc_info=True)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+
+    def lookup(self, path: Path, stat: os.stat_result, validated: bool) -> list[str] | None:
+        """Return the recorded tool names if the file is unchanged since it was recorded."""
+        entry = self._entries.get(os.path.abspath(path))
+        if (
+            entry is None
+            or entry["mtime_ns"] != stat.st_mtime_ns
+            or entry["size"] != stat.st_size
+            or (validated and not entry["validated"])
+        ):
+            return None
+        return list(entry["tools"])
+
+    def lookup_content(self, path: Path, digest: str, validated: bool) -> list[str] | None:
+        """Return the recorded tool names if the file's content is unchanged."""
+        entry = self._entries.get(os.path.abspath(path))
+        if entry is None or entry["sha256"] != digest or (validated and not entry["validated"]):
+            return None
+        return list(entry["tools"])
+
+    def is_validated(self, path: Path) -> bool:
+        """Whether the recorded entry for a file was compiled when it was scanned."""
+        entry = self._entries.get(os.path.abspath(path))
+        return entry is not None and entry["validated"]
+
+    def record(
+        self,
+        path: Path,
+        stat: os.stat_result,
+        digest: str,
+        tools: list[str],
+        validated: bool,
+    ) -> None:
+        self._entries[os.path.abspath(path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "tools": tools,
+            "validated": validated,
+        }
+        self._dirty = True
+
+
+def _parse_file(
+    path: Path, manifest: DiscoveryManifest | None, validate: bool
+) -> list[str] | Exception:
+    try:
+        stat = path.stat()
+        source = path.read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+        if manifest is not None:
+            tools = manifest.lookup_content(path, digest, validate)
+            if tools is not None:
+                # Keep a validated entry validated when an unvalidated scan hits it
+                validated = validate or manifest.is_validated(path)
+                manifest.record(path, stat, digest, tools, validated)
+                return tools
+
+        tree = ast.parse(source, filename=str(path))
+        if validate:
+            # Compiling the tree catches the errors the parser does not
+            # (e.g. 'return' outside a function), like compiling the source would.
+            compile(tree, str(path), "exec")
+        tools = get_tools_from_ast(tree)
+    except Exception as e:
+        return e
+    if manifest is not None:
+        manifest.record(path, stat, digest, tools, validate)
+    return tools
+
+
+def scan_files_for_tools(
+    files: list[Path],
+    *,
+    manifest: DiscoveryManifest | None = None,
+    validate: bool = False,
+) -> list[FileTools]:
+    """Find the @tool function names in each file.
+
+    Files the manifest holds unchanged are not read at all; the others are
+    parsed concurrently. The manifest is saved afterwards.
+
+    Args:
+        files: The Python files to scan.
+        manifest: Optional manifest of earlier results to reuse and update.
+        validate: Also compile each parsed file to check that it is valid Python.
+
+    Returns:
+        (path, tool names) per file, in the order given. A file that could not
+        be read, parsed, or compiled has the exception instead of tool names.
+    """
+    results: list[list[str] | Exception | None] = [None] * len(files)
+    pending: list[int] = []
+    for index, path in enumerate(files):
+        if manifest is not None:
+            with contextlib.suppress(OSError):
+                results[index] = manifest.lookup(path, path.stat(), validate)
+        if results[index] is None:
+            pending.append(index)
+
+    if manifest is not None:
+        manifest.hits += len(files) - len(pending)
+        manifest.misses += len(pending)
+
+    def parse(index: int) -> list[str] | Exception:
+        return _parse_file(files[index], manifest, validate)
+
+    if len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(pending))) as executor:
+            for index, result in zip(pending, executor.map(parse, pending)):
+                results[index] = result
+    else:
+        for index in pending:
+            results[index] = parse(index)
+
+    if manifest is not None:
+        manifest.save()
+    return [(path, result) for path, result in zip(files, results) if result is not None]
@@ -19,6 +19,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from typing import Any, Literal, Protocol
 
 from pydantic import BaseModel, Field
@@ -397,6 +398,32 @@ class ToolMetadataItem(BaseModel):
     """The value of the metadata."""
 
 
+class _CaseInsensitiveIndex:
+    """Lowercase-key lookup over a list of secret items.
+
+    Rebuilt lazily whenever the indexed list is replaced or resized; callers
+    that mutate entries in place must reset ``source``.
+    """
+
+    __slots__ = ("index", "size", "source")
+
+    def __init__(self) -> None:
+        self.source: list[ToolSecretItem] | None = None
+        self.size = 0
+        self.index: dict[str, str] = {}
+
+    def lookup(self, items: list[ToolSecretItem]) -> dict[str, str]:
+        if items is not self.source or len(items) != self.size:
+            index: dict[str, str] = {}
+            for item in items:
+                # First match wins, mirroring a linear case-insensitive scan.
+                index.setdefault(item.key.lower(), item.value)
+            self.index = index
+            self.source = items
+            self.size = len(items)
+        return self.index
+
+
 class ToolContext(BaseModel):
     """The context for a tool invocation.
 
@@ -427,10 +454,12 @@ class ToolContext(BaseModel):
         """Add or update a secret to the tool context."""
         if self.secrets is None:
             self.secrets = []
-        # Update existing or add new
-        for secret in self.secrets:
+        self._secret_index.source = None
+        # Replace existing or add new. Items are replaced rather than mutated
+        # because the server shares pre-resolved items across calls.
+        for i, secret in enumerate(self.secrets):
             if secret.key == key:
-                secret.value = value
+                self.secrets[i] = ToolSecretItem(key=key, value=value)
                 return
         self.secrets.append(ToolSecretItem(key=key, value=value))
 
@@ -443,7 +472,21 @@ class ToolContext(BaseModel):
 
         Raises a ValueError if the secret is not found.
         """
-        return self._get_item(key, self.secrets, "secret")
+        if not key or not key.strip():
+            raise ValueError("Secret key passed to get_secret cannot be empty.")
+        secrets = self.secrets
+        if not secrets:
+            raise ValueError(f"Secret '{key}' not found in context.")
+        value = self._secret_index.lookup(secrets).get(key.lower())
+        if value is None:
+            raise ValueError(f"Secret '{key}' not found in context.")
+        return value
+
+    @cached_property
+    def _secret_index(self) -> _CaseInsensitiveIndex:
+        # Lives in the instance ``__dict__`` (not a model field), so it is
+        # invisible to validation, serialization, and equality.
+        return _CaseInsensitiveIndex()
 
     def get_metadata(self, key: str) -> str:
         """Retrieve the metadata for the tool invocation.
@@ -0,0 +1,87 @@
+"""
+Streaming tools: async-generator tools that yield their result in chunks.
+
+A streaming tool is declared with an ``AsyncIterator`` (or ``AsyncGenerator``)
+return annotation::
+
+    @tool
+    async def read_log(
+        path: Annotated[str, "Log file"],
+    ) -> Annotated[AsyncIterator[str], "The log lines"]:
+        async for line in tail(path):
+            yield line
+
+Each yielded chunk is handed to the caller as it is produced, and the next
+one is not requested until the caller has accepted it. The tool's result is
+assembled from the chunks: text chunks are concatenated, anything else is
+collected into a list, and the tool's output schema describes that assembled
+value. A tool can instead yield a ``StreamSummary`` last; its value becomes
+the result and the chunks are not kept.
+"""
+
+import collections.abc
+import typing
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any, get_args, get_origin
+
+ChunkCallback = Callable[[Any], Awaitable[None]]
+"""Called with each chunk a streaming tool yields; the tool waits for it to return."""
+
+_STREAM_ORIGINS = (
+    collections.abc.AsyncIterator,
+    collections.abc.AsyncIterable,
+    collections.abc.AsyncGenerator,
+)
+
+
+class StreamSummary:
+    """The result of a streaming tool, yielded after its last chunk.
+
+    The value must match the tool's declared result type (``str`` for a
+    stream of text, ``list[T]`` otherwise).
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+def stream_item_type(annotation: Any) -> Any | None:
+    """Return the chunk type of an async iterator annotation, or None if it is not one."""
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    if get_origin(annotation) in _STREAM_ORIGINS:
+        args = get_args(annotation)
+        return args[0] if args else Any
+    if annotation in _STREAM_ORIGINS or annotation in (
+        typing.AsyncIterator,
+        typing.AsyncIterable,
+        typing.AsyncGenerator,
+    ):
+        return Any
+    return None
+
+
+def stream_result_annotation(annotation: Any) -> Any:
+    """Map a streaming tool's return annotation to the type of its assembled result.
+
+    ``AsyncIterator[str]`` becomes ``str`` and ``AsyncIterator[T]`` becomes
+    ``list[T]``; an ``Annotated`` description is kept. Other annotations are
+    returned unchanged.
+    """
+    item_type = stream_item_type(annotation)
+    if item_type is None:
+        return annotation
+    result_type: Any = str if item_type is str else list[item_type]  # type: ignore[valid-type]
+    if get_origin(annotation) is Annotated:
+        params = (result_type, *annotation.__metadata__)
+        return Annotated[params]
+    return result_type
+
+
+def assemble_chunks(chunks: list[Any], as_text: bool) -> Any:
+    """Build a streaming tool's result from its chunks."""
+    if as_text:
+        return "".join(str(chunk) for chunk in chunks)
+    return chunks
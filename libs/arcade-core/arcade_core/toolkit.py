@@ -12,7 +12,7 @@ import toml
 from pydantic import BaseModel, ConfigDict, field_validator
 
 from arcade_core.errors import ToolkitLoadError
-from arcade_core.parse import get_tools_from_file
+from arcade_core.manifest import DiscoveryManifest, scan_files_for_tools
 
 logger = logging.getLogger(__name__)
 
@@ -311,7 +311,8 @@ class Toolkit(BaseModel):
             if main_spec and main_spec.name:
                 current_module_name = main_spec.name
 
-        tools: dict[str, list[str]] = {}
+        import_paths: list[str] = []
+        module_paths: list[Path] = []
 
         for module_path in modules:
             # Build import path first (needed for module name comparison in skip logic)
@@ -342,8 +343,18 @@ class Toolkit(BaseModel):
             if should_skip:
                 continue
 
-            cls.validate_file(module_path)
-            tools[full_import_path] = get_tools_from_file(str(module_path))
+            import_paths.append(full_import_path)
+            module_paths.append(module_path)
+
+        # Files unchanged since the last startup are not parsed again.
+        tools: dict[str, list[str]] = {}
+        scanned = scan_files_for_tools(
+            module_paths, manifest=DiscoveryManifest.for_directory(package_dir), validate=True
+        )
+        for import_path, (module_path, names) in zip(import_paths, scanned):
+            if isinstance(names, Exception):
+                raise SyntaxError(f"{module_path}: {names}")  # noqa: TRY004
+            tools[import_path] = names
 
         if not tools:
             raise ToolkitLoadError(f"No tools found in package {package_name}")
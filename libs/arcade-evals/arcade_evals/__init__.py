@@ -11,13 +11,24 @@ from .eval import (
     NamedExpectedToolCall,
     tool_eval,
 )
+from .journal import EvalJournal, iter_journal_records, load_journal_results
 from .loaders import (
     clear_tools_cache,
+    configure_tools_cache,
     load_arcade_mcp_gateway_async,
     load_from_stdio_async,
     load_mcp_remote_async,
     load_stdio_arcade_async,
 )
+from .rate_limit import (
+    RateLimiter,
+    RateLimiterStats,
+    get_rate_limiter,
+    rate_limiter_stats,
+    reset_rate_limiters,
+    set_default_rate_limits,
+)
+from .response_cache import ResponseCache, ResponseCacheMissError, ResponseCacheMode
 from .weights import FuzzyWeight, Weight, validate_and_normalize_critic_weights
 
 __all__ = [
@@ -28,6 +39,7 @@ __all__ = [
     "CapturedRun",
     "CapturedToolCall",
     "DatetimeCritic",
+    "EvalJournal",
     "EvalRubric",
     "EvalSuite",
     "ExpectedMCPToolCall",
@@ -38,13 +50,25 @@ __all__ = [
     "NoneCritic",
     "NumericCritic",
     "ProviderName",
+    "RateLimiter",
+    "RateLimiterStats",
+    "ResponseCache",
+    "ResponseCacheMissError",
+    "ResponseCacheMode",
     "SimilarityCritic",
     "Weight",
     "clear_tools_cache",
+    "configure_tools_cache",
+    "get_rate_limiter",
+    "iter_journal_records",
     "load_arcade_mcp_gateway_async",
     "load_from_stdio_async",
+    "load_journal_results",
     "load_mcp_remote_async",
     "load_stdio_arcade_async",
+    "rate_limiter_stats",
+    "reset_rate_limiters",
+    "set_default_rate_limits",
     "tool_eval",
     "validate_and_normalize_critic_weights",
 ]
@@ -35,23 +35,17 @@ class _EvalSuiteCaptureMixin:
     _track_manager: TrackManager
 
     # These methods are defined in EvalSuite
-    async def _run_openai(
+    async def _predict_runs(
         self,
-        client: Any,
-        model: str,
         case: EvalCase,
-        registry: EvalSuiteToolRegistry | None = None,
-        seed: int | None = None,
-    ) -> list[tuple[str, dict[str, Any]]]:
-        raise NotImplementedError  # Implemented in EvalSuite
-
-    async def _run_anthropic(
-        self,
         client: Any,
         model: str,
-        case: EvalCase,
+        provider: ProviderName,
+        run_seeds: list[int | None],
+        *,
         registry: EvalSuiteToolRegistry | None = None,
-    ) -> list[tuple[str, dict[str, Any]]]:
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[list[tuple[str, dict[str, Any]]]]:
         raise NotImplementedError  # Implemented in EvalSuite
 
     def _process_tool_calls(
@@ -109,63 +103,62 @@ class _EvalSuiteCaptureMixin:
             track: str | None = None,
         ) -> CapturedCase:
             """Capture a case using the specified registry."""
-            async with semaphore:
-                use_registry = registry or self._internal_registry
-                if use_registry is None or use_registry.tool_count() == 0:
-                    raise ValueError(
-                        "No tools registered. Use add_* convenience methods or pass catalog=ToolCatalog."
-                    )
-
-                seed_policy, seed_value = _resolve_seed_spec(seed)
-                if provider == "openai":
-                    if seed_policy == "random":
-                        run_seeds: list[int | None] = [
-                            random.randint(0, 2**31 - 1)  # noqa: S311
-                            for _ in range(num_runs)
-                        ]
-                    else:
-                        run_seeds = [seed_value for _ in range(num_runs)]
-                else:
-                    run_seeds = [None for _ in range(num_runs)]
-
-                runs: list[CapturedRun] = []
-                for run_index in range(num_runs):
-                    run_seed = run_seeds[run_index]
-                    # Get tool calls based on provider
-                    if provider == "anthropic":
-                        predicted_args = await self._run_anthropic(
-                            client, model, case, registry=use_registry
-                        )
-                    else:
-                        predicted_args = await self._run_openai(
-                            client, model, case, registry=use_registry, seed=run_seed
-                        )
-
-                    # Process tool calls (resolve names, fill defaults)
-                    filled_actual_tool_calls = self._process_tool_calls(
-                        predicted_args, registry=use_registry
-                    )
+            use_registry = registry or self._internal_registry
+            if use_registry is None or use_registry.tool_count() == 0:
+                raise ValueError(
+                    "No tools registered. Use add_* convenience methods or pass catalog=ToolCatalog."
+                )
 
-                    # Convert to CapturedToolCall objects
-                    tool_calls = [
-                        CapturedToolCall(name=name, args=args)
-                        for name, args in filled_actual_tool_calls
+            seed_policy, seed_value = _resolve_seed_spec(seed)
+            if provider == "openai":
+                if seed_policy == "random":
+                    run_seeds: list[int | None] = [
+                        random.randint(0, 2**31 - 1)  # noqa: S311
+                        for _ in range(num_runs)
                     ]
-
-                    runs.append(CapturedRun(tool_calls=tool_calls))
-
-                primary_tool_calls = runs[0].tool_calls if runs else []
-
-                return CapturedCase(
-                    case_name=case.name,
-                    user_message=case.user_message,
-                    tool_calls=primary_tool_calls,
-                    system_message=case.system_message if include_context else None,
-                    additional_messages=case.additional_messages if include_context else None,
-                    track_name=track,
-                    runs=runs if len(runs) > 1 else [],
+                else:
+                    run_seeds = [seed_value for _ in range(num_runs)]
+            else:
+                run_seeds = [None for _ in range(num_runs)]
+
+            # Runs are scheduled individually under the suite-wide semaphore
+            run_predictions = await self._predict_runs(
+                case,
+                client,
+                model,
+                provider,
+                run_seeds,
+                registry=use_registry,
+                semaphore=semaphore,
+            )
+
+            runs: list[CapturedRun] = []
+            for predicted_args in run_predictions:
+                # Process tool calls (resolve names, fill defaults)
+                filled_actual_tool_calls = self._process_tool_calls(
+                    predicted_args, registry=use_registry
                 )
 
+                # Convert to CapturedToolCall objects
+                tool_calls = [
+                    CapturedToolCall(name=name, args=args)
+                    for name, args in filled_actual_tool_calls
+                ]
+
+                runs.append(CapturedRun(tool_calls=tool_calls))
+
+            primary_tool_calls = runs[0].tool_calls if runs else []
+
+            return CapturedCase(
+                case_name=case.name,
+                user_message=case.user_message,
+                tool_calls=primary_tool_calls,
+                system_message=case.system_message if include_context else None,
+                additional_messages=case.additional_messages if include_context else None,
+                track_name=track,
+                runs=runs if len(runs) > 1 else [],
+            )
+
         # Capture regular cases (using default registry)
         if self.cases:
             tasks = [capture_case(case) for case in self.cases]
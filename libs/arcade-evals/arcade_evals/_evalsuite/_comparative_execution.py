@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 from arcade_evals._evalsuite._comparative import ComparativeCaseBuilder
@@ -23,6 +24,7 @@ if TYPE_CHECKING:
     from arcade_evals._evalsuite._providers import ProviderName
     from arcade_evals._evalsuite._tool_registry import EvalSuiteToolRegistry
     from arcade_evals._evalsuite._tracks import TrackManager
+    from arcade_evals.journal import EvalJournal
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,7 @@ class _EvalSuiteComparativeMixin:
     system_message: str
     rubric: EvalRubric  # EvalSuite always has a rubric (default_factory)
     max_concurrent: int
+    journal: EvalJournal | None
     _comparative_case_builders: list[ComparativeCaseBuilder]
     _track_manager: TrackManager
     _create_eval_case: Any  # Method from EvalSuite to create EvalCase
@@ -55,6 +58,7 @@ class _EvalSuiteComparativeMixin:
         seed: str | int | None,
         pass_rule: str,
         registry: EvalSuiteToolRegistry | None = None,
+        semaphore: asyncio.Semaphore | None = None,
     ) -> dict[str, Any]:
         raise NotImplementedError  # Implemented in EvalSuite
 
@@ -182,9 +186,11 @@ class _EvalSuiteComparativeMixin:
                 "cases": [],
             }
 
-        # Prepare all async tasks for parallel execution
+        # Prepare all async tasks for parallel execution. The semaphore limits
+        # concurrent model calls; each run of each case+track takes one slot.
         semaphore = asyncio.Semaphore(self.max_concurrent)
         tasks: list[tuple[str, Any]] = []  # (track_name, task)
+        occurrences: Counter[tuple[str, str]] = Counter()
 
         for comp_case in comparative_cases:
             for track_name, track_config in comp_case.track_configs.items():
@@ -218,45 +224,76 @@ class _EvalSuiteComparativeMixin:
                     _reg: EvalSuiteToolRegistry,
                     _t_name: str,
                 ) -> dict[str, Any]:
-                    async with semaphore:
-                        start = time.time()
-                        logger.debug("[TASK START] %s @ %s", _case.name, _t_name)
-                        case_result = await self._run_case_with_stats(
-                            _case,
-                            client,
-                            model,
-                            provider,
-                            num_runs=num_runs,
-                            seed=seed,
-                            pass_rule=multi_run_pass_rule,
-                            registry=_reg,
-                        )
-                        elapsed = time.time() - start
-                        logger.debug("[TASK DONE] %s @ %s (%.1fs)", _case.name, _t_name, elapsed)
-
-                        result = {
-                            "name": _case.name,
-                            "track": _t_name,
-                            "input": _case.user_message,
-                            "system_message": _case.system_message,
-                            "additional_messages": _case.additional_messages,
-                            "expected_tool_calls": [
-                                {"name": tc.name, "args": tc.args}
-                                for tc in _case.expected_tool_calls
-                            ],
-                            "predicted_tool_calls": [
-                                {"name": name, "args": args}
-                                for name, args in case_result["predicted_tool_calls"]
-                            ],
-                            "evaluation": case_result["evaluation"],
-                        }
-                        if num_runs > 1:
-                            result["run_stats"] = case_result["run_stats"]
-                            if case_result["critic_stats"]:
-                                result["critic_stats"] = case_result["critic_stats"]
-                        return result
-
-                task = run_track_case(eval_case, registry, track_name)
+                    start = time.time()
+                    logger.debug("[TASK START] %s @ %s", _case.name, _t_name)
+                    case_result = await self._run_case_with_stats(
+                        _case,
+                        client,
+                        model,
+                        provider,
+                        num_runs=num_runs,
+                        seed=seed,
+                        pass_rule=multi_run_pass_rule,
+                        registry=_reg,
+                        semaphore=semaphore,
+                    )
+                    elapsed = time.time() - start
+                    logger.debug("[TASK DONE] %s @ %s (%.1fs)", _case.name, _t_name, elapsed)
+
+                    result = {
+                        "name": _case.name,
+                        "track": _t_name,
+                        "input": _case.user_message,
+                        "system_message": _case.system_message,
+                        "additional_messages": _case.additional_messages,
+                        "expected_tool_calls": [
+                            {"name": tc.name, "args": tc.args} for tc in _case.expected_tool_calls
+                        ],
+                        "predicted_tool_calls": [
+                            {"name": name, "args": args}
+                            for name, args in case_result["predicted_tool_calls"]
+                        ],
+                        "evaluation": case_result["evaluation"],
+                    }
+                    if num_runs > 1:
+                        result["run_stats"] = case_result["run_stats"]
+                        if case_result["critic_stats"]:
+                            result["critic_stats"] = case_result["critic_stats"]
+                    return result
+
+                async def journaled_track_case(
+                    _case: Any,  # EvalCase
+                    _reg: EvalSuiteToolRegistry,
+                    _t_name: str,
+                    _occurrence: int,
+                ) -> dict[str, Any]:
+                    if self.journal is None:
+                        return await run_track_case(_case, _reg, _t_name)
+                    key = self.journal.make_key(
+                        self.name,
+                        _case.name,
+                        provider=provider,
+                        model=model,
+                        track=_t_name,
+                        occurrence=_occurrence,
+                        num_runs=num_runs,
+                        seed=seed,
+                        pass_rule=multi_run_pass_rule,
+                        content=[_case, _reg.tools_hash(provider)],
+                    )
+                    return await self.journal.get_or_run(
+                        key,
+                        lambda: run_track_case(_case, _reg, _t_name),
+                        suite_name=self.name,
+                        provider=provider,
+                        model=model,
+                        rubric=self.rubric,
+                        track=_t_name,
+                    )
+
+                occurrence = occurrences[comp_case.name, track_name]
+                occurrences[comp_case.name, track_name] += 1
+                task = journaled_track_case(eval_case, registry, track_name, occurrence)
                 tasks.append((track_name, task))
 
         # Execute all tasks in parallel (respecting max_concurrent via semaphore)
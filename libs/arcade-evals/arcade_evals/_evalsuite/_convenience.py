@@ -10,7 +10,9 @@ It is intentionally not exported from `arcade_evals.__init__`.
 
 from __future__ import annotations
 
+import asyncio
 import warnings
+from collections.abc import Awaitable
 from typing import TYPE_CHECKING, Any, Callable
 
 from arcade_evals._evalsuite._tool_registry import EvalSuiteToolRegistry, MCPToolDefinition
@@ -32,6 +34,7 @@ class _EvalSuiteConvenienceMixin:
     _track_manager: TrackManager
     _python_tool_func_map: dict[str, Callable]
     _python_func_to_tool_name: dict[Callable, str]
+    _last_tool_source: asyncio.Event | None
     strict_mode: bool  # Attribute from EvalSuite dataclass
 
     def _get_registry(self, track: str | None = None) -> EvalSuiteToolRegistry:
@@ -61,6 +64,33 @@ class _EvalSuiteConvenienceMixin:
             raise RuntimeError("Internal registry not initialized. This should not happen.")
         return self._internal_registry
 
+    async def _load_and_register(
+        self,
+        registry: EvalSuiteToolRegistry,
+        load: Awaitable[list[dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Await a tool source and register its tools.
+
+        Sources added concurrently (e.g. with asyncio.gather) load in parallel,
+        but each registers only after the sources added before it, so tool order
+        does not depend on which server answers first.
+
+        Returns:
+            The loaded tools.
+        """
+        previous = self._last_tool_source
+        done = asyncio.Event()
+        self._last_tool_source = done
+        try:
+            tools = await load
+            if previous is not None:
+                await previous.wait()
+            if tools:
+                registry.add_tools(tools)
+            return tools
+        finally:
+            done.set()
+
     def get_tracks(self) -> list[str]:
         """Get all registered track names.
 
@@ -128,15 +158,16 @@ class _EvalSuiteConvenienceMixin:
             Self for method chaining.
         """
         registry = self._get_registry(track)
-        tools = await load_mcp_remote_async(url, timeout=timeout, headers=headers, use_sse=use_sse)
+        tools = await self._load_and_register(
+            registry,
+            load_mcp_remote_async(url, timeout=timeout, headers=headers, use_sse=use_sse),
+        )
         if not tools:
             warnings.warn(
                 f"No tools loaded from {url}. Server may be unavailable.",
                 UserWarning,
                 stacklevel=2,
             )
-            return self
-        registry.add_tools(tools)
         return self
 
     async def add_mcp_stdio_server(
@@ -159,15 +190,15 @@ class _EvalSuiteConvenienceMixin:
             Self for method chaining.
         """
         registry = self._get_registry(track)
-        tools = await load_from_stdio_async(command, timeout=timeout, env=env)
+        tools = await self._load_and_register(
+            registry, load_from_stdio_async(command, timeout=timeout, env=env)
+        )
         if not tools:
             warnings.warn(
                 f"No tools loaded from stdio command: {' '.join(command)}",
                 UserWarning,
                 stacklevel=2,
             )
-            return self
-        registry.add_tools(tools)
         return self
 
     async def add_arcade_gateway(
@@ -195,12 +226,15 @@ class _EvalSuiteConvenienceMixin:
         """
         registry = self._get_registry(track)
 
-        tools = await load_arcade_mcp_gateway_async(
-            gateway_slug,
-            arcade_api_key=arcade_api_key,
-            arcade_user_id=arcade_user_id,
-            base_url=base_url,  # Let loader handle default/env var
-            timeout=timeout,
+        tools = await self._load_and_register(
+            registry,
+            load_arcade_mcp_gateway_async(
+                gateway_slug,
+                arcade_api_key=arcade_api_key,
+                arcade_user_id=arcade_user_id,
+                base_url=base_url,  # Let loader handle default/env var
+                timeout=timeout,
+            ),
         )
 
         if not tools:
@@ -209,8 +243,6 @@ class _EvalSuiteConvenienceMixin:
                 UserWarning,
                 stacklevel=2,
             )
-            return self
-        registry.add_tools(tools)
         return self
 
     def add_tool_catalog(
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
 from typing import Any, Literal, TypedDict
 
 from arcade_core.converters.anthropic import to_anthropic
@@ -64,6 +67,11 @@ class EvalSuiteToolRegistry:
         self._normalized_to_original: dict[str, str] = {}
         # Store original MaterializedTool objects for direct Anthropic conversion (Python tools only)
         self._materialized_tools: dict[str, Any] = {}
+        # Converted provider tool lists keyed by (format, strict_mode). Suites
+        # request the same list for every case and run, so each conversion is
+        # done once; add_tool() drops the cache.
+        self._formatted_tools: dict[tuple[ToolFormat, bool], tuple[dict[str, Any], ...]] = {}
+        self._formatted_hashes: dict[tuple[ToolFormat, bool], str] = {}
 
     @property
     def strict_mode(self) -> bool:
@@ -93,6 +101,8 @@ class EvalSuiteToolRegistry:
                 "Each tool name must be unique across all sources (MCP servers, gateways, catalogs)."
             )
         self._tools[name] = dict(tool_descriptor)
+        self._formatted_tools.clear()
+        self._formatted_hashes.clear()
 
         # Store MaterializedTool if provided (for direct Anthropic conversion)
         if materialized_tool is not None:
@@ -122,12 +132,44 @@ class EvalSuiteToolRegistry:
             self.add_tool(tool)
 
     def list_tools_for_model(self, tool_format: ToolFormat = "openai") -> list[dict[str, Any]]:
-        if tool_format == "openai":
-            return self._to_openai_format()
-        elif tool_format == "anthropic":
-            return self._to_anthropic_format()
-        else:
-            raise ValueError(f"Tool format '{tool_format}' is not supported")
+        """Return the registered tools in the given provider format.
+
+        The conversion is cached per format and strict-mode setting. Each call
+        returns a new list, but the tool dicts in it are shared between calls:
+        callers must not mutate them.
+        """
+        return list(self._formatted(tool_format))
+
+    def tools_hash(self, tool_format: ToolFormat = "openai") -> str:
+        """Return a stable hash of the tools as sent to the model in the given format."""
+        key = (tool_format, self._strict_mode)
+        digest = self._formatted_hashes.get(key)
+        if digest is None:
+            canonical = json.dumps(
+                list(self._formatted(tool_format)),
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            )
+            digest = hashlib.sha256(canonical.encode()).hexdigest()
+            self._formatted_hashes[key] = digest
+        return digest
+
+    def _formatted(self, tool_format: ToolFormat) -> tuple[dict[str, Any], ...]:
+        key = (tool_format, self._strict_mode)
+        formatted = self._formatted_tools.get(key)
+        if formatted is None:
+            if tool_format == "openai":
+                converted = self._to_openai_format()
+            elif tool_format == "anthropic":
+                converted = self._to_anthropic_format()
+            else:
+                raise ValueError(f"Tool format '{tool_format}' is not supported")
+            # Copied once so the cache does not share schemas with the
+            # registered tool definitions
+            formatted = tuple(copy.deepcopy(converted))
+            self._formatted_tools[key] = formatted
+        return formatted
 
     def _to_openai_format(self) -> list[dict[str, Any]]:
         """Convert stored MCP tools to OpenAI function calling format.
@@ -187,7 +187,7 @@ async def _capture_with_openai(
     seed: str | int | None = "constant",
 ) -> CaptureResult:
     """Run capture mode with OpenAI client."""
-    async with AsyncOpenAI(api_key=api_key) as client:
+    async with AsyncOpenAI(api_key=api_key, max_retries=0) as client:
         return await suite.capture(
             client,
             model,
@@ -215,7 +215,7 @@ async def _capture_with_anthropic(
             "Install it with: pip install anthropic"
         ) from e
 
-    async with AsyncAnthropic(api_key=api_key) as client:
+    async with AsyncAnthropic(api_key=api_key, max_retries=0) as client:
         return await suite.capture(
             client,
             model,
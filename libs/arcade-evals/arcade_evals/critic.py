@@ -1,4 +1,6 @@
+import math
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any, ClassVar
@@ -40,6 +42,20 @@ class Critic(ABC):
     def evaluate(self, expected: Any, actual: Any) -> dict[str, Any]:
         pass
 
+    def evaluate_block(
+        self, expected_values: Sequence[Any], actual_values: Sequence[Any]
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Evaluate every (expected, actual) combination.
+
+        Returns a len(expected_values) x len(actual_values) grid of evaluate() results.
+        Critics that can score many pairs more cheaply at once override this.
+        """
+        return [
+            [self.evaluate(expected, actual) for actual in actual_values]
+            for expected in expected_values
+        ]
+
 
 @dataclass
 class NoneCritic(Critic):
@@ -232,22 +248,32 @@ class SimilarityCritic(Critic):
         self.similarity_threshold = similarity_threshold
         self.metric = metric
 
-    def evaluate(self, expected: Any, actual: Any) -> dict[str, float | bool]:
+    @staticmethod
+    def _to_text(value: Any) -> str:
         # IMPORTANT: Convert non-string values to strings before TF-IDF comparison.
         # sklearn's TfidfVectorizer calls .lower() on inputs, which fails on lists/dicts.
         # This commonly occurs when SimilarityCritic is used for tool arguments that are
         # lists (e.g., teams_to_add=["Engineering", "Platform"]) instead of strings.
         # Lists are joined with spaces to create comparable text representations.
-        if not isinstance(expected, str):
-            expected = (
-                " ".join(str(item) for item in expected)
-                if isinstance(expected, list)
-                else str(expected)
-            )
-        if not isinstance(actual, str):
-            actual = (
-                " ".join(str(item) for item in actual) if isinstance(actual, list) else str(actual)
-            )
+        if isinstance(value, str):
+            return value
+        if isinstance(value, list):
+            return " ".join(str(item) for item in value)
+        return str(value)
+
+    def _exact_result(self, expected: str, actual: str) -> dict[str, float | bool]:
+        is_match = expected == actual
+        return {"match": is_match, "score": self.resolved_weight if is_match else 0.0}
+
+    def _similarity_result(self, similarity: float) -> dict[str, float | bool]:
+        return {
+            "match": similarity >= self.similarity_threshold,
+            "score": min(similarity * self.resolved_weight, self.resolved_weight),
+        }
+
+    def evaluate(self, expected: Any, actual: Any) -> dict[str, float | bool]:
+        expected = self._to_text(expected)
+        actual = self._to_text(actual)
 
         if self.metric == "cosine":
             try:
@@ -283,10 +309,85 @@ class SimilarityCritic(Critic):
                 }
         else:
             raise ValueError(f"Unsupported similarity metric: {self.metric}")
-        return {
-            "match": similarity >= self.similarity_threshold,
-            "score": min(similarity * self.resolved_weight, self.resolved_weight),
-        }
+        return self._similarity_result(similarity)
+
+    def evaluate_block(
+        self, expected_values: Sequence[Any], actual_values: Sequence[Any]
+    ) -> list[list[dict[str, float | bool]]]:
+        """
+        Evaluate every (expected, actual) combination at once.
+
+        Gives the same results as calling evaluate() on each pair, but tokenizes all
+        strings with a single vectorizer fit and computes the whole similarity block
+        with sparse matrix products instead of fitting a TF-IDF model per pair.
+
+        Returns:
+            A len(expected_values) x len(actual_values) grid of evaluate() results.
+        """
+        if self.metric != "cosine":
+            raise ValueError(f"Unsupported similarity metric: {self.metric}")
+        try:
+            import numpy as np
+            from sklearn.feature_extraction.text import CountVectorizer
+        except ImportError:
+            raise ImportError(
+                "Use `pip install 'arcade-evals` to install the required dependencies for similarity metrics."
+            )
+
+        expected_texts = [self._to_text(value) for value in expected_values]
+        actual_texts = [self._to_text(value) for value in actual_values]
+        num_expected = len(expected_texts)
+        if not expected_texts or not actual_texts:
+            return [[] for _ in expected_texts]
+
+        try:
+            counts = CountVectorizer().fit_transform(expected_texts + actual_texts).tocsr()
+        except ValueError:
+            # Empty vocabulary: no string has a token
+            counts = None
+
+        similarity = None
+        if counts is not None:
+            counts = counts.astype(np.float64)
+            expected_counts = counts[:num_expected]
+            actual_counts = counts[num_expected:]
+            expected_present = (expected_counts > 0).astype(np.float64)
+            actual_present = (actual_counts > 0).astype(np.float64)
+            expected_squares = expected_counts.multiply(expected_counts).tocsr()
+            actual_squares = actual_counts.multiply(actual_counts).tocsr()
+
+            # A TF-IDF model fitted on just the pair (smooth idf, two documents) gives
+            # terms found in both strings an idf of 1 and terms found in one an idf
+            # of 1 + ln(3/2). Only shared terms contribute to the dot product, and
+            # each norm splits into its shared and unshared terms.
+            unshared_idf_sq = (1 + math.log(1.5)) ** 2
+            dot = (expected_counts @ actual_counts.T).toarray()
+            expected_norm_sq = (
+                unshared_idf_sq * np.asarray(expected_squares.sum(axis=1))
+                - (unshared_idf_sq - 1) * (expected_squares @ actual_present.T).toarray()
+            )
+            actual_norm_sq = (
+                unshared_idf_sq * np.asarray(actual_squares.sum(axis=1)).T
+                - (unshared_idf_sq - 1) * (expected_present @ actual_squares.T).toarray()
+            )
+            denominator = np.sqrt(expected_norm_sq * actual_norm_sq)
+            similarity = np.divide(dot, denominator, out=np.zeros_like(dot), where=denominator > 0)
+            expected_has_tokens = np.asarray(expected_counts.sum(axis=1)).ravel() > 0
+            actual_has_tokens = np.asarray(actual_counts.sum(axis=1)).ravel() > 0
+
+        block: list[list[dict[str, float | bool]]] = []
+        for i, expected in enumerate(expected_texts):
+            row: list[dict[str, float | bool]] = []
+            for j, actual in enumerate(actual_texts):
+                if not expected.strip() or not actual.strip():
+                    row.append(self._exact_result(expected.strip(), actual.strip()))
+                elif similarity is None or not (expected_has_tokens[i] or actual_has_tokens[j]):
+                    # Matches evaluate()'s fallback when the pair has no vocabulary
+                    row.append(self._exact_result(expected, actual))
+                else:
+                    row.append(self._similarity_result(float(similarity[i, j])))
+            block.append(row)
+        return block
 
 
 @dataclass
@@ -4,6 +4,7 @@ import inspect
 import json
 import logging
 import random
+from collections import Counter
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from statistics import mean, pstdev
@@ -39,6 +40,9 @@ from arcade_evals._evalsuite._types import (
     _resolve_seed_spec,
 )
 from arcade_evals.critic import NoneCritic
+from arcade_evals.journal import EvalJournal
+from arcade_evals.rate_limit import get_rate_limiter
+from arcade_evals.response_cache import ResponseCache
 from arcade_evals.weights import validate_and_normalize_critic_weights
 
 if TYPE_CHECKING:
@@ -345,8 +349,14 @@ class EvalCase:
             evaluation_result.passed = True
             return evaluation_result
 
+        # Score every (expected, actual) pair once; the cost matrix and the final
+        # scoring of the assigned pairs both read from these results.
+        critic_results = self._evaluate_critic_pairs(actual_tool_calls, self.expected_tool_calls)
+
         # Create a cost matrix for the assignment problem
-        cost_matrix = self._create_cost_matrix(actual_tool_calls, self.expected_tool_calls)
+        cost_matrix = self._create_cost_matrix(
+            actual_tool_calls, self.expected_tool_calls, critic_results
+        )
 
         # Use the Linear Sum Assignment algorithm to find the optimal assignment
         row_ind, col_ind = linear_sum_assignment(cost_matrix, maximize=True)
@@ -367,12 +377,14 @@ class EvalCase:
                 total_weight += self.rubric.tool_selection_weight
 
                 # Evaluate arguments using critics
-                for critic in self.critics:
+                for critic_index, critic in enumerate(self.critics):
                     expected_value = expected.args.get(critic.critic_field)
                     actual_value = actual_args.get(critic.critic_field)
 
                     try:
-                        result = critic.evaluate(expected_value, actual_value)
+                        result = critic_results.get((i, j, critic_index))
+                        if result is None:
+                            result = critic.evaluate(expected_value, actual_value)
                         total_score += result["score"]
                         total_weight += critic.resolved_weight
                         evaluation_result.add(
@@ -409,10 +421,67 @@ class EvalCase:
 
         return evaluation_result
 
+    def _evaluate_critic_pairs(
+        self,
+        actual_tool_calls: list[tuple[str, dict[str, Any]]],
+        expected_tool_calls: list[NamedExpectedToolCall],
+    ) -> dict[tuple[int, int, int], dict[str, Any]]:
+        """
+        Run each critic on every (expected, actual) pair where both values are present.
+
+        Each critic scores its whole block of pairs at once (see Critic.evaluate_block).
+        If that fails, the pairs are scored one by one and failing pairs are left out.
+
+        Args:
+            actual_tool_calls: A list of tuples of actual tool calls.
+            expected_tool_calls: A list of NamedExpectedToolCall instances.
+
+        Returns:
+            Critic results keyed by (expected index, actual index, critic index).
+        """
+        results: dict[tuple[int, int, int], dict[str, Any]] = {}
+        for critic_index, critic in enumerate(self.critics or []):
+            field_name = critic.critic_field
+            rows = [
+                (i, expected.args[field_name])
+                for i, expected in enumerate(expected_tool_calls)
+                if expected.args.get(field_name) is not None
+            ]
+            columns = [
+                (j, actual_args[field_name])
+                for j, (_, actual_args) in enumerate(actual_tool_calls)
+                if actual_args.get(field_name) is not None
+            ]
+            if not rows or not columns:
+                continue
+
+            try:
+                block = critic.evaluate_block(
+                    [value for _, value in rows], [value for _, value in columns]
+                )
+            except Exception:
+                block = None
+
+            for row_index, (i, expected_value) in enumerate(rows):
+                for column_index, (j, actual_value) in enumerate(columns):
+                    if block is not None:
+                        results[i, j, critic_index] = block[row_index][column_index]
+                        continue
+                    try:
+                        results[i, j, critic_index] = critic.evaluate(expected_value, actual_value)
+                    except Exception as e:
+                        logger.warning(
+                            "Critic evaluation failed for field '%s': %s",
+                            field_name,
+                            e,
+                        )
+        return results
+
     def _create_cost_matrix(
         self,
         actual_tool_calls: list[tuple[str, dict[str, Any]]],
         expected_tool_calls: list[NamedExpectedToolCall],
+        critic_results: dict[tuple[int, int, int], dict[str, Any]] | None = None,
     ) -> np.ndarray:
         """
         Create a cost matrix for the assignment problem.
@@ -420,10 +489,14 @@ class EvalCase:
         Args:
             actual_tool_calls: A list of tuples of actual tool calls.
             expected_tool_calls: A list of NamedExpectedToolCall instances.
+            critic_results: Precomputed results from _evaluate_critic_pairs.
 
         Returns:
             A numpy array representing the cost matrix.
         """
+        if critic_results is None:
+            critic_results = self._evaluate_critic_pairs(actual_tool_calls, expected_tool_calls)
+
         num_expected = len(expected_tool_calls)
         num_actual = len(actual_tool_calls)
         n = max(num_expected, num_actual)
@@ -434,7 +507,7 @@ class EvalCase:
             for j in range(n):
                 if i < num_expected and j < num_actual:
                     expected = expected_tool_calls[i]
-                    actual_name, actual_args = actual_tool_calls[j]
+                    actual_name = actual_tool_calls[j][0]
                     score = 0.0
 
                     # Tool selection
@@ -442,19 +515,10 @@ class EvalCase:
                         score += self.rubric.tool_selection_weight
 
                     # Critics evaluation
-                    for critic in self.critics:  # type: ignore[union-attr]
-                        expected_value = expected.args.get(critic.critic_field)
-                        actual_value = actual_args.get(critic.critic_field)
-                        if expected_value is not None and actual_value is not None:
-                            try:
-                                result = critic.evaluate(expected_value, actual_value)
-                                score += result.get("score", 0.0)
-                            except Exception as e:
-                                logger.warning(
-                                    "Critic evaluation failed for field '%s': %s",
-                                    critic.critic_field,
-                                    e,
-                                )
+                    for critic_index in range(len(self.critics or [])):
+                        result = critic_results.get((i, j, critic_index))
+                        if result is not None:
+                            score += result.get("score", 0.0)
                     cost_matrix[i, j] = score
 
         return cost_matrix
@@ -476,6 +540,8 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
         rubric: The evaluation rubric for this case.
         max_concurrent: Maximum number of concurrent evaluations.
         strict_mode: Whether to enable strict-mode schema conversion for MCP-style tools.
+        response_cache: Optional record/replay cache for model responses.
+        journal: Optional journal that records completed cases and skips them on resume.
     """
 
     name: str
@@ -485,6 +551,8 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
     rubric: EvalRubric = field(default_factory=EvalRubric)
     max_concurrent: int = 1
     strict_mode: bool = True
+    response_cache: ResponseCache | None = None
+    journal: EvalJournal | None = None
 
     # Internal unified registry for MCP-style tools added via convenience methods.
     _internal_registry: EvalSuiteToolRegistry | None = field(default=None, init=False, repr=False)
@@ -503,6 +571,10 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
         default_factory=dict, init=False, repr=False
     )
 
+    # Set once the most recently started MCP source has registered its tools, so
+    # sources loaded concurrently still register in the order they were added.
+    _last_tool_source: asyncio.Event | None = field(default=None, init=False, repr=False)
+
     def __post_init__(self) -> None:
         """Initialize internal registry and auto-convert catalog if provided."""
         # Always create the internal registry
@@ -857,6 +929,40 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
             }
         return run_scores
 
+    async def _predict_runs(
+        self,
+        case: "EvalCase",
+        client: Any,
+        model: str,
+        provider: ProviderName,
+        run_seeds: Sequence[int | None],
+        *,
+        registry: EvalSuiteToolRegistry | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[list[tuple[str, dict[str, Any]]]]:
+        """Get the model's tool calls for every run of a case, in run order.
+
+        Each run is its own unit of work under ``semaphore``, the suite-wide
+        concurrency limit, so the runs of a multi-run case proceed in parallel
+        when there is headroom. Without a semaphore, the runs are limited to
+        ``max_concurrent`` on their own.
+        """
+        limit = semaphore or asyncio.Semaphore(self.max_concurrent)
+
+        async def predict(run_index: int, run_seed: int | None) -> list[tuple[str, dict[str, Any]]]:
+            async with limit:
+                if provider == "anthropic":
+                    return await self._run_anthropic(
+                        client, model, case, registry=registry, run_index=run_index
+                    )
+                return await self._run_openai(
+                    client, model, case, registry=registry, seed=run_seed, run_index=run_index
+                )
+
+        return list(
+            await asyncio.gather(*(predict(i, run_seed) for i, run_seed in enumerate(run_seeds)))
+        )
+
     async def _run_case_with_stats(
         self,
         case: "EvalCase",
@@ -868,6 +974,7 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
         seed: str | int | None,
         pass_rule: str,
         registry: EvalSuiteToolRegistry | None = None,
+        semaphore: asyncio.Semaphore | None = None,
     ) -> dict[str, Any]:
         if num_runs < 1:
             raise ValueError("num_runs must be >= 1")
@@ -894,15 +1001,10 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
         last_processed_calls: list[tuple[str, dict[str, Any]]] = []
         run_details: list[dict[str, Any]] = []
 
-        for run_index in range(num_runs):
-            run_seed = run_seeds[run_index]
-            if provider == "anthropic":
-                predicted_args = await self._run_anthropic(client, model, case, registry=registry)
-            else:
-                predicted_args = await self._run_openai(
-                    client, model, case, registry=registry, seed=run_seed
-                )
-
+        run_predictions = await self._predict_runs(
+            case, client, model, provider, run_seeds, registry=registry, semaphore=semaphore
+        )
+        for predicted_args in run_predictions:
             processed_calls = self._process_tool_calls(predicted_args, registry=registry)
             evaluation = case.evaluate(processed_calls)
 
@@ -1009,48 +1111,77 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
             "cases": [],
         }
 
+        # Limits concurrent model calls; each run of each case takes one slot.
         semaphore = asyncio.Semaphore(self.max_concurrent)
 
-        async def sem_task(case: EvalCase) -> dict[str, Any]:
-            async with semaphore:
-                # All tools are in internal registry (unified container)
-                if self._internal_registry is None or self._internal_registry.tool_count() == 0:
-                    raise ValueError(
-                        "No tools registered. Use add_* convenience methods or pass catalog=ToolCatalog."
-                    )
-
-                case_result = await self._run_case_with_stats(
-                    case,
-                    client,
-                    model,
-                    provider,
-                    num_runs=num_runs,
-                    seed=seed,
-                    pass_rule=multi_run_pass_rule,
+        async def run_case(case: EvalCase) -> dict[str, Any]:
+            # All tools are in internal registry (unified container)
+            if self._internal_registry is None or self._internal_registry.tool_count() == 0:
+                raise ValueError(
+                    "No tools registered. Use add_* convenience methods or pass catalog=ToolCatalog."
                 )
 
-                # Prepare the result
-                result = {
-                    "name": case.name,
-                    "input": case.user_message,
-                    "system_message": case.system_message,
-                    "additional_messages": case.additional_messages,
-                    "expected_tool_calls": [
-                        {"name": tc.name, "args": tc.args} for tc in case.expected_tool_calls
-                    ],
-                    "predicted_tool_calls": [
-                        {"name": name, "args": args}
-                        for name, args in case_result["predicted_tool_calls"]
-                    ],
-                    "evaluation": case_result["evaluation"],
-                }
-                if num_runs > 1:
-                    result["run_stats"] = case_result["run_stats"]
-                    if case_result["critic_stats"]:
-                        result["critic_stats"] = case_result["critic_stats"]
-                return result
-
-        tasks = [sem_task(case) for case in self.cases]
+            case_result = await self._run_case_with_stats(
+                case,
+                client,
+                model,
+                provider,
+                num_runs=num_runs,
+                seed=seed,
+                pass_rule=multi_run_pass_rule,
+                semaphore=semaphore,
+            )
+
+            # Prepare the result
+            result = {
+                "name": case.name,
+                "input": case.user_message,
+                "system_message": case.system_message,
+                "additional_messages": case.additional_messages,
+                "expected_tool_calls": [
+                    {"name": tc.name, "args": tc.args} for tc in case.expected_tool_calls
+                ],
+                "predicted_tool_calls": [
+                    {"name": name, "args": args}
+                    for name, args in case_result["predicted_tool_calls"]
+                ],
+                "evaluation": case_result["evaluation"],
+            }
+            if num_runs > 1:
+                result["run_stats"] = case_result["run_stats"]
+                if case_result["critic_stats"]:
+                    result["critic_stats"] = case_result["critic_stats"]
+            return result
+
+        async def case_task(case: EvalCase, occurrence: int) -> dict[str, Any]:
+            if self.journal is None:
+                return await run_case(case)
+            registry = self._internal_registry
+            key = self.journal.make_key(
+                self.name,
+                case.name,
+                provider=provider,
+                model=model,
+                occurrence=occurrence,
+                num_runs=num_runs,
+                seed=seed,
+                pass_rule=multi_run_pass_rule,
+                content=[case, registry.tools_hash(provider) if registry is not None else None],
+            )
+            return await self.journal.get_or_run(
+                key,
+                lambda: run_case(case),
+                suite_name=self.name,
+                provider=provider,
+                model=model,
+                rubric=self.rubric,
+            )
+
+        occurrences: Counter[str] = Counter()
+        tasks = []
+        for case in self.cases:
+            tasks.append(case_task(case, occurrences[case.name]))
+            occurrences[case.name] += 1
         case_results = await asyncio.gather(*tasks)
 
         results["cases"] = case_results
@@ -1063,6 +1194,7 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
         case: "EvalCase",
         registry: EvalSuiteToolRegistry | None = None,
         seed: int | None = None,
+        run_index: int = 0,
     ) -> list[tuple[str, dict[str, Any]]]:
         """Run evaluation using OpenAI client.
 
@@ -1071,6 +1203,8 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
             model: The model name.
             case: The evaluation case.
             registry: Optional registry to use. If None, uses _internal_registry.
+            seed: Optional seed for the request.
+            run_index: Index of the run within a multi-run case (response cache key).
 
         Returns:
             List of tool calls.
@@ -1084,23 +1218,31 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
         messages.extend(case.additional_messages)
         messages.append({"role": "user", "content": case.user_message})
 
-        tools = effective_registry.list_tools_for_model(tool_format="openai")
-
         # Get the model response
         request_params: dict[str, Any] = {
             "model": model,
             "messages": messages,
             "tool_choice": "auto",
-            "tools": tools,
             "user": "eval_user",
             "stream": False,
         }
         if seed is not None:
             request_params["seed"] = seed
 
-        response = await client.chat.completions.create(**request_params)
+        async def call() -> list[tuple[str, dict[str, Any]]]:
+            tools = effective_registry.list_tools_for_model(tool_format="openai")
+            response = await get_rate_limiter("openai", model).call(
+                lambda: client.chat.completions.create(**{**request_params, "tools": tools}),
+                usage=_openai_usage_tokens,
+            )
+            return get_tool_args(response, normalize_names=False)
 
-        return get_tool_args(response, normalize_names=False)
+        if self.response_cache is None:
+            return await call()
+        key = ResponseCache.make_key(
+            "openai", request_params, effective_registry.tools_hash("openai"), run_index
+        )
+        return await self.response_cache.get_or_call(key, call)
 
     async def _run_anthropic(
         self,
@@ -1108,6 +1250,7 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
         model: str,
         case: "EvalCase",
         registry: EvalSuiteToolRegistry | None = None,
+        run_index: int = 0,
     ) -> list[tuple[str, dict[str, Any]]]:
         """Run evaluation using Anthropic client.
 
@@ -1116,6 +1259,7 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
             model: The model name.
             case: The evaluation case.
             registry: Optional registry to use. If None, uses _internal_registry.
+            run_index: Index of the run within a multi-run case (response cache key).
 
         Returns:
             List of tool calls.
@@ -1128,24 +1272,48 @@ class EvalSuite(_EvalSuiteCaptureMixin, _EvalSuiteConvenienceMixin, _EvalSuiteCo
         anthropic_messages = convert_messages_to_anthropic(case.additional_messages)
         anthropic_messages.append({"role": "user", "content": case.user_message})
 
-        tools = effective_registry.list_tools_for_model(tool_format="anthropic")
-
         # Get the model response
-        response = await client.messages.create(
-            model=model,
-            max_tokens=4096,
-            system=case.system_message,
-            messages=anthropic_messages,
-            tools=tools,
+        request_params: dict[str, Any] = {
+            "model": model,
+            "max_tokens": 4096,
+            "system": case.system_message,
+            "messages": anthropic_messages,
+        }
+
+        async def call() -> list[tuple[str, dict[str, Any]]]:
+            tools = effective_registry.list_tools_for_model(tool_format="anthropic")
+            response = await get_rate_limiter("anthropic", model).call(
+                lambda: client.messages.create(**{**request_params, "tools": tools}),
+                usage=_anthropic_usage_tokens,
+            )
+
+            # Extract tool calls from Anthropic response
+            tool_calls: list[tuple[str, dict[str, Any]]] = []
+            for block in response.content:
+                if block.type == "tool_use":
+                    tool_calls.append((block.name, block.input))
+            return tool_calls
+
+        if self.response_cache is None:
+            return await call()
+        key = ResponseCache.make_key(
+            "anthropic", request_params, effective_registry.tools_hash("anthropic"), run_index
         )
+        return await self.response_cache.get_or_call(key, call)
+
 
-        # Extract tool calls from Anthropic response
-        tool_calls: list[tuple[str, dict[str, Any]]] = []
-        for block in response.content:
-            if block.type == "tool_use":
-                tool_calls.append((block.name, block.input))
+def _openai_usage_tokens(response: Any) -> int | None:
+    total = getattr(getattr(response, "usage", None), "total_tokens", None)
+    return total if isinstance(total, int) else None
 
-        return tool_calls
+
+def _anthropic_usage_tokens(response: Any) -> int | None:
+    usage = getattr(response, "usage", None)
+    input_tokens = getattr(usage, "input_tokens", None)
+    output_tokens = getattr(usage, "output_tokens", None)
+    if isinstance(input_tokens, int) and isinstance(output_tokens, int):
+        return input_tokens + output_tokens
+    return None
 
 
 def get_formatted_tools(catalog: "ToolCatalog", tool_format: str = "openai") -> OpenAIToolList:
@@ -1235,10 +1403,16 @@ def tool_eval() -> Callable[[Callable], Callable]:
             num_runs: int = 1,
             seed: str | int | None = "constant",
             multi_run_pass_rule: str = PASS_RULE_LAST,
+            response_cache: ResponseCache | None = None,
+            journal: EvalJournal | None = None,
         ) -> list[Any]:
             """
             Run evaluation or capture mode.
 
+            If response_cache is given, model responses are recorded/replayed through it.
+            If journal is given, completed cases are recorded in it and cases it already
+            holds are not run again (evaluation mode only).
+
             Returns:
                 In evaluation mode: list[dict[str, Any]] with evaluation results.
                 In capture mode: list[CaptureResult] with captured tool calls.
@@ -1260,6 +1434,10 @@ def tool_eval() -> Callable[[Callable], Callable]:
             if not isinstance(suite, EvalSuite):
                 raise TypeError("Eval function must return an EvalSuite")
             suite.max_concurrent = max_concurrency
+            if response_cache is not None:
+                suite.response_cache = response_cache
+            if journal is not None:
+                suite.journal = journal
 
             if capture_mode:
                 # Run in capture mode
@@ -1330,7 +1508,7 @@ async def _run_with_openai(
         For regular evaluations: A single result dict.
         For comparative evaluations: A list of result dicts (one per track).
     """
-    async with AsyncOpenAI(api_key=api_key) as client:
+    async with AsyncOpenAI(api_key=api_key, max_retries=0) as client:
         # Check if this suite has comparative cases
         if suite._comparative_case_builders:
             # Run comparative evaluation - returns dict[track_name, result]
@@ -1379,7 +1557,7 @@ async def _run_with_anthropic(
             "Install it with: pip install anthropic"
         ) from e
 
-    async with AsyncAnthropic(api_key=api_key) as client:
+    async with AsyncAnthropic(api_key=api_key, max_retries=0) as client:
         # Check if this suite has comparative cases
         if suite._comparative_case_builders:
             # Run comparative evaluation - returns dict[track_name, result]
@@ -0,0 +1,248 @@
+"""Append-only JSONL journal of completed eval cases.
+
+With an ``EvalJournal`` attached to an ``EvalSuite``, every case result is
+appended to the journal as one JSON line as soon as the case completes, so a
+crashed or interrupted run loses at most the cases that were in flight.
+Opening the journal with ``resume=True`` loads the cases already recorded
+and the suite returns them instead of running them again.
+
+Cases are keyed by suite, track, case name (and position among cases that
+share a name), provider, model, number of runs, seed policy, pass rule, and
+a hash of the case's content (messages, expected tool calls, critics,
+rubric) and of the tools offered to the model. Editing a case therefore runs
+it again on resume instead of reusing its stale result. A multi-run case is
+recorded once all of its runs have completed.
+
+Resuming indexes the journal by key and file offset; a recorded case is read
+back from disk only when the suite asks for it.
+
+``iter_journal_records`` and ``load_journal_results`` read a journal back in
+one streaming pass, e.g. to render reports for a run from its journal
+(``arcade evals --from-journal``).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Awaitable, Callable, Iterator
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from arcade_evals._evalsuite._types import EvalRubric
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "EvalJournal",
+    "iter_journal_records",
+    "load_journal_results",
+]
+
+
+class EvalJournal:
+    """JSONL journal that records completed case results and serves them on resume.
+
+    Args:
+        path: The journal file. Parent directories are created as needed.
+        resume: Load the cases already in ``path`` and append to it. Otherwise
+            the journal starts empty, replacing any existing file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, resume: bool = False):
+        self.path = Path(path)
+        self.resumed = 0
+        # Key -> byte offset of the case's (last) record in the file
+        self._completed: dict[str, int] = {}
+        if resume:
+            for offset, record in _scan_journal(self.path):
+                self._completed[record["key"]] = offset
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("", encoding="utf-8")
+
+    @staticmethod
+    def make_key(
+        suite_name: str,
+        case_name: str,
+        *,
+        provider: str,
+        model: str,
+        track: str | None = None,
+        occurrence: int = 0,
+        num_runs: int = 1,
+        seed: str | int | None = None,
+        pass_rule: str | None = None,
+        content: Any = None,
+    ) -> str:
+        """Build the key for a case.
+
+        Args:
+            suite_name: The suite name.
+            case_name: The case name.
+            provider: The provider name.
+            model: The model name.
+            track: The track, for comparative cases.
+            occurrence: Position of the case among the suite's cases with the same name.
+            num_runs: Number of runs per case.
+            seed: The seed policy.
+            pass_rule: The multi-run pass rule.
+            content: Whatever else determines the result, typically the
+                ``EvalCase`` and the hash of the tools sent to the model.
+                Dataclasses (cases, critics, expected tool calls) are hashed
+                field by field.
+        """
+        canonical = json.dumps(
+            [
+                suite_name,
+                track,
+                case_name,
+                occurrence,
+                provider,
+                model,
+                num_runs,
+                seed,
+                pass_rule,
+                content,
+            ],
+            separators=(",", ":"),
+            ensure_ascii=False,
+            sort_keys=True,
+            default=_describe,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    async def get_or_run(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[dict[str, Any]]],
+        *,
+        suite_name: str,
+        provider: str,
+        model: str,
+        rubric: EvalRubric,
+        track: str | None = None,
+    ) -> dict[str, Any]:
+        """Return the recorded result for ``key``, or run the case and record it."""
+        offset = self._completed.get(key)
+        if offset is not None:
+            with self.path.open("rb") as f:
+                f.seek(offset)
+                record = json.loads(f.readline())
+            self.resumed += 1
+            return _decode_case(record["case"])
+
+        case_result = await run()
+        record = {
+            "key": key,
+            "suite_name": suite_name,
+            "track_name": track,
+            "provider": provider,
+            "model": model,
+            "rubric": dataclasses.asdict(rubric),
+            "case": _encode_case(case_result),
+        }
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        # One complete line per write: a crash can only truncate the last line.
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        return case_result
+
+
+def iter_journal_records(path: str | os.PathLike[str]) -> Iterator[dict[str, Any]]:
+    """Yield the raw records of a journal, skipping lines that cannot be decoded.
+
+    A missing file yields nothing. Case results are left in their JSON form.
+    """
+    for _, record in _scan_journal(Path(path)):
+        yield record
+
+
+def _scan_journal(path: Path) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield each readable record with the byte offset of its line."""
+    if not path.exists():
+        return
+    with path.open("rb") as f:
+        offset = 0
+        for line_number, line in enumerate(f, start=1):
+            start, offset = offset, offset + len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Typically the last line of a run that crashed mid-write.
+                logger.warning("Skipping unreadable journal line %s:%d", path, line_number)
+                continue
+            if isinstance(record, dict) and "key" in record and "case" in record:
+                yield start, record
+
+
+def load_journal_results(path: str | os.PathLike[str]) -> list[list[dict[str, Any]]]:
+    """Rebuild the results of the runs recorded in a journal.
+
+    The result has the shape the CLI formatters take: one list per
+    (suite, provider, model), holding one result dict per track (a single
+    one for regular suites), with cases in completion order. A case recorded
+    more than once keeps its last result.
+    """
+    runs: dict[tuple[str, str, str], dict[str | None, dict[str, Any]]] = {}
+    cases: dict[tuple[str, str, str, str | None], dict[str, dict[str, Any]]] = {}
+    for record in iter_journal_records(path):
+        suite_name, provider, model = record["suite_name"], record["provider"], record["model"]
+        track = record.get("track_name")
+        tracks = runs.setdefault((suite_name, provider, model), {})
+        if track not in tracks:
+            result: dict[str, Any] = {
+                "model": model,
+                "suite_name": suite_name,
+                "rubric": EvalRubric(**record["rubric"]),
+                "cases": [],
+            }
+            if track is not None:
+                result["track_name"] = track
+            tracks[track] = result
+        track_cases = cases.setdefault((suite_name, provider, model, track), {})
+        track_cases[record["key"]] = _decode_case(record["case"])
+
+    results: list[list[dict[str, Any]]] = []
+    for (suite_name, provider, model), tracks in runs.items():
+        for track, result in tracks.items():
+            result["cases"] = list(cases[suite_name, provider, model, track].values())
+        results.append(list(tracks.values()))
+    return results
+
+
+def _describe(value: Any) -> Any:
+    """JSON stand-in for the non-JSON parts of a case when hashing its content."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+        return {"__type__": type(value).__qualname__, **fields}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if callable(value) and hasattr(value, "__qualname__"):
+        return f"{value.__module__}.{value.__qualname__}"
+    text = repr(value)
+    # A default repr embeds a memory address, which differs on every run
+    return type(value).__qualname__ if " at 0x" in text else text
+
+
+def _encode_case(case_result: dict[str, Any]) -> dict[str, Any]:
+    encoded = dict(case_result)
+    encoded["evaluation"] = dataclasses.asdict(case_result["evaluation"])
+    return encoded
+
+
+def _decode_case(data: dict[str, Any]) -> dict[str, Any]:
+    # Imported here: arcade_evals.eval imports this module.
+    from arcade_evals.eval import EvaluationResult
+
+    case_result = dict(data)
+    case_result["evaluation"] = EvaluationResult(**data["evaluation"])
+    return case_result
@@ -7,14 +7,25 @@ Public API (async-only):
 - `load_arcade_mcp_gateway_async`
 - `load_stdio_arcade_async`
 
+Tool lists are cached per process. `configure_tools_cache` adds an optional
+on-disk cache shared across runs, so repeated invocations skip spawning stdio
+servers and the MCP handshake until the entry expires or the source changes.
+
 Requires the MCP SDK: pip install mcp
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import json
 import logging
 import os
+import shutil
+import time
+import uuid
+from pathlib import Path
 from typing import Any
 from urllib.parse import urlsplit, urlunsplit
 
@@ -111,11 +122,140 @@ async def _acquire_lock_with_timeout(lock: asyncio.Lock, timeout: float | None =
 
 
 def clear_tools_cache() -> None:
-    """Clear the tools cache. Useful for testing or forcing fresh connections."""
+    """Clear the tools cache. Useful for testing or forcing fresh connections.
+
+    Only the in-process cache is cleared; entries on disk are kept.
+    """
     _tools_cache.clear()
     _cache_locks.clear()
 
 
+# =============================================================================
+# ON-DISK TOOL CACHE - Reuses tool lists across runs (opt-in)
+# Entries are keyed by source identity plus a fingerprint: the command, its
+# environment, and the mtimes of the files it references for stdio; the URL,
+# transport, and a hash of the headers for HTTP. Header and env values are
+# only stored hashed.
+# =============================================================================
+
+# Default lifetime of an on-disk entry (seconds)
+DEFAULT_TOOLS_CACHE_TTL = 3600.0
+
+
+class _ToolsDiskCache:
+    def __init__(self, directory: Path, ttl: float, refresh: bool) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        self.refresh = refresh
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def read(self, key: str) -> list[dict[str, Any]] | None:
+        if self.refresh:
+            return None
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+            if time.time() - data["created_at"] > self.ttl:
+                return None
+            tools = data["tools"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("Ignoring unreadable tools cache entry %s", key, exc_info=True)
+            return None
+        return tools if isinstance(tools, list) else None
+
+    def write(self, key: str, tools: list[dict[str, Any]]) -> None:
+        path = self._path(key)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps({"created_at": time.time(), "tools": tools}, default=str),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("Failed to write tools cache entry %s", key, exc_info=True)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+
+
+_disk_cache: _ToolsDiskCache | None = None
+
+
+def configure_tools_cache(
+    directory: str | os.PathLike[str] | None,
+    *,
+    ttl: float = DEFAULT_TOOLS_CACHE_TTL,
+    refresh: bool = False,
+) -> None:
+    """Enable (or with ``directory=None``, disable) the on-disk tools cache.
+
+    Args:
+        directory: Where cached tool lists are kept. Created on first write.
+        ttl: Seconds an entry stays valid.
+        refresh: Ignore existing entries and load every source again,
+            overwriting its entry.
+    """
+    global _disk_cache
+    if directory is None:
+        _disk_cache = None
+        return
+    if ttl <= 0:
+        raise ValueError("ttl must be > 0")
+    _disk_cache = _ToolsDiskCache(Path(directory), ttl, refresh)
+
+
+def _hash_items(items: dict[str, str] | None) -> str:
+    canonical = json.dumps(sorted((items or {}).items()), separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _file_fingerprint(arg: str) -> list[Any] | None:
+    """Return [path, mtime_ns, size] if ``arg`` names an existing file."""
+    path = arg if os.path.sep in arg or os.path.isfile(arg) else shutil.which(arg)
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [os.path.abspath(path), stat.st_mtime_ns, stat.st_size]
+
+
+def _stdio_disk_key(command: list[str], env: dict[str, str] | None) -> str:
+    # The executable is looked up on PATH; other arguments are fingerprinted
+    # when they name files (e.g. the server script). Relative paths depend on cwd.
+    files = [_file_fingerprint(command[0])]
+    files.extend(_file_fingerprint(arg) for arg in command[1:] if not arg.startswith("-"))
+    canonical = json.dumps(
+        ["stdio", command, os.getcwd(), _hash_items(env), files], separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _remote_disk_key(url: str, headers: dict[str, str] | None, use_sse: bool) -> str:
+    canonical = json.dumps(
+        ["sse" if use_sse else "http", url, _hash_items(headers)], separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+async def _read_disk_cache(key: str) -> list[dict[str, Any]] | None:
+    if _disk_cache is None:
+        return None
+    return await asyncio.to_thread(_disk_cache.read, key)
+
+
+async def _write_disk_cache(key: str, tools: list[dict[str, Any]]) -> None:
+    # An empty list is more likely a server hiccup than a real answer; keep it
+    # off disk so it does not stick for the whole TTL.
+    if _disk_cache is not None and tools:
+        await asyncio.to_thread(_disk_cache.write, key, tools)
+
+
 def _get_arcade_base_url() -> str:
     """Get the Arcade API base URL, checking env var at runtime."""
     return os.environ.get("ARCADE_API_BASE_URL", ARCADE_API_BASE_URL)
@@ -217,7 +357,9 @@ async def load_from_stdio_async(
 
     Results are cached by command to avoid starting multiple subprocesses
     for the same server. Concurrent requests for the same command will wait
-    for the first request to complete and share the result.
+    for the first request to complete and share the result. With the on-disk
+    cache enabled (`configure_tools_cache`), results are also reused across
+    runs while the command's files are unchanged.
 
     Args:
         command: Command to run the MCP server (e.g., ["python", "server.py"]).
@@ -250,6 +392,13 @@ async def load_from_stdio_async(
             logger.debug(f"Using cached tools for stdio: {command[0]}")
             return _tools_cache[cache_key].copy()
 
+        disk_key = _stdio_disk_key(command, env)
+        cached = await _read_disk_cache(disk_key)
+        if cached is not None:
+            logger.debug(f"Using tools cached on disk for stdio: {command[0]}")
+            _tools_cache[cache_key] = cached
+            return cached.copy()
+
         ClientSession, StdioServerParameters, stdio_client, _, _ = _require_mcp()
 
         process_env = os.environ.copy()
@@ -271,6 +420,7 @@ async def load_from_stdio_async(
 
         # Cache the result
         _tools_cache[cache_key] = tools.copy()
+        await _write_disk_cache(disk_key, tools)
         return tools
     finally:
         lock.release()
@@ -288,7 +438,9 @@ async def load_mcp_remote_async(
 
     Results are cached to avoid redundant connections when multiple models
     load the same MCP source. Concurrent requests for the same URL will wait
-    for the first request to complete and share the result.
+    for the first request to complete and share the result. With the on-disk
+    cache enabled (`configure_tools_cache`), results are also reused across
+    runs until the entry expires.
 
     Args:
         url: URL of the MCP server.
@@ -320,6 +472,13 @@ async def load_mcp_remote_async(
             logger.debug(f"Using cached tools for {url}")
             return _tools_cache[cache_key].copy()
 
+        disk_key = _remote_disk_key(url, headers, use_sse)
+        cached = await _read_disk_cache(disk_key)
+        if cached is not None:
+            logger.debug(f"Using tools cached on disk for {url}")
+            _tools_cache[cache_key] = cached
+            return cached.copy()
+
         # Load MCP SDK (deferred import)
         ClientSession, _, _, sse_client, streamablehttp_client = _require_mcp()
 
@@ -345,6 +504,7 @@ async def load_mcp_remote_async(
 
         # Cache the result
         _tools_cache[cache_key] = tools.copy()
+        await _write_disk_cache(disk_key, tools)
         return tools
     finally:
         lock.release()
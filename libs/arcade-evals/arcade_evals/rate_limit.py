@@ -0,0 +1,341 @@
+"""Process-wide adaptive rate limiting for eval model requests.
+
+Every model request made by an ``EvalSuite`` goes through the limiter for its
+(provider, model). Limiters are shared by all suites in the process, so
+running several suites at once does not multiply the request rate.
+
+A limiter enforces optional requests-per-minute and tokens-per-minute budgets
+with token buckets. Token usage is charged after the response arrives (the
+bucket may go into debt), using a running average as the up-front estimate.
+On a rate-limit error (HTTP 429), the limiter honors ``Retry-After`` by
+pausing every caller of that limiter, halves its effective rate, and retries
+the request with jittered exponential backoff. Successful requests restore the
+rate gradually. Other transient failures (timeouts, connection errors, 408,
+409, and 5xx responses) are retried with the same backoff but leave the rate
+alone.
+
+The limiter does the retrying, so the OpenAI and Anthropic clients that the
+eval runner creates are built with ``max_retries=0``; otherwise every limiter
+attempt would hide several SDK attempts and the 429s that drive adaptation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "RateLimiter",
+    "RateLimiterStats",
+    "get_rate_limiter",
+    "rate_limiter_stats",
+    "reset_rate_limiters",
+    "set_default_rate_limits",
+]
+
+T = TypeVar("T")
+
+# Buckets hold at most this many seconds' worth of budget, which bounds bursts.
+_BURST_SECONDS = 10.0
+# Multiplicative decrease on a 429 and additive increase per success.
+_DECREASE_FACTOR = 0.5
+_INCREASE_STEP = 0.05
+_MIN_RATE_FACTOR = 0.1
+
+
+@dataclass
+class RateLimiterStats:
+    """Throughput achieved by one limiter."""
+
+    provider: str
+    model: str
+    requests: int
+    tokens: int
+    rate_limited: int
+    elapsed: float
+
+    @property
+    def requests_per_minute(self) -> float:
+        return self.requests * 60 / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def tokens_per_minute(self) -> float:
+        return self.tokens * 60 / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: float) -> None:
+        self.per_minute = per_minute
+        self.capacity = max(1.0, per_minute * _BURST_SECONDS / 60)
+        self.level = self.capacity
+        self._updated = time.monotonic()
+
+    def refill(self, now: float, rate_factor: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self.level = min(self.capacity, self.level + elapsed * self.per_minute / 60 * rate_factor)
+
+    def wait_time(self, amount: float, rate_factor: float) -> float:
+        """Seconds until ``amount`` is available (requests larger than the bucket wait for a full one)."""
+        needed = min(amount, self.capacity) - self.level
+        if needed <= 0:
+            return 0.0
+        return needed / (self.per_minute / 60 * rate_factor)
+
+
+class RateLimiter:
+    """Token-bucket limiter for one (provider, model), adapting to 429 responses.
+
+    Args:
+        requests_per_minute: Request budget, or None for no request limit.
+        tokens_per_minute: Token budget, or None for no token limit.
+        max_retries: How many times a rate-limited request is retried.
+        base_backoff: First backoff delay in seconds when no Retry-After is given.
+        max_backoff: Upper bound on a single backoff delay.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        *,
+        max_retries: int = 6,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self._paused_until = 0.0
+        self._rate_factor = 1.0
+        self._avg_tokens = 0.0
+        self._requests_bucket: _TokenBucket | None = None
+        self._tokens_bucket: _TokenBucket | None = None
+        self.configure(requests_per_minute, tokens_per_minute)
+
+        self.requests = 0
+        self.tokens = 0
+        self.rate_limited = 0
+        self._first_request_at: float | None = None
+        self._last_done_at: float | None = None
+
+    def configure(
+        self, requests_per_minute: float | None = None, tokens_per_minute: float | None = None
+    ) -> None:
+        """Set the request and token budgets (None removes a limit)."""
+        self._requests_bucket = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens_bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    @property
+    def rate_factor(self) -> float:
+        """Fraction of the configured budgets currently in use (lowered after 429s)."""
+        return self._rate_factor
+
+    async def call(
+        self,
+        func: Callable[[], Awaitable[T]],
+        usage: Callable[[T], int | None] | None = None,
+    ) -> T:
+        """Run ``func`` within the budgets, retrying it when rate limited.
+
+        Args:
+            func: Makes the model request; called once per attempt.
+            usage: Returns the tokens a response consumed, if known.
+        """
+        attempt = 0
+        while True:
+            estimate = await self._acquire()
+            try:
+                result = await func()
+            except Exception as e:
+                rate_limited = is_rate_limit_error(e)
+                # A rejected attempt did not consume a request from the budget
+                self._settle(estimate, None, completed=not rate_limited)
+                if not is_retryable_error(e) or attempt >= self.max_retries:
+                    raise
+                if rate_limited:
+                    delay = self._on_rate_limited(e, attempt)
+                else:
+                    delay = self._backoff(e, attempt)
+                    await asyncio.sleep(delay)
+                attempt += 1
+                logger.debug(
+                    "%s (attempt %d/%d), retrying in %.2fs",
+                    "Rate limited" if rate_limited else f"Request failed: {type(e).__name__}",
+                    attempt,
+                    self.max_retries,
+                    delay,
+                )
+                continue
+            self._settle(estimate, usage(result) if usage else None)
+            self._rate_factor = min(1.0, self._rate_factor + _INCREASE_STEP)
+            return result
+
+    def stats(self, provider: str, model: str) -> RateLimiterStats:
+        elapsed = 0.0
+        if self._first_request_at is not None and self._last_done_at is not None:
+            elapsed = self._last_done_at - self._first_request_at
+        return RateLimiterStats(
+            provider=provider,
+            model=model,
+            requests=self.requests,
+            tokens=self.tokens,
+            rate_limited=self.rate_limited,
+            elapsed=elapsed,
+        )
+
+    async def _acquire(self) -> float:
+        estimate = self._avg_tokens
+        # The lock keeps waiters in FIFO order instead of racing for refills.
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                wait = self._paused_until - now
+                if self._requests_bucket is not None:
+                    self._requests_bucket.refill(now, self._rate_factor)
+                    wait = max(wait, self._requests_bucket.wait_time(1, self._rate_factor))
+                if self._tokens_bucket is not None and estimate > 0:
+                    self._tokens_bucket.refill(now, self._rate_factor)
+                    wait = max(wait, self._tokens_bucket.wait_time(estimate, self._rate_factor))
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            if self._requests_bucket is not None:
+                self._requests_bucket.level -= 1
+            if self._tokens_bucket is not None:
+                self._tokens_bucket.level -= estimate
+            if self._first_request_at is None:
+                self._first_request_at = time.monotonic()
+        return estimate
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Limiters outlive event loops (e.g. successive asyncio.run calls), locks do not.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _settle(self, estimate: float, used: int | None, completed: bool = True) -> None:
+        """Replace the up-front token estimate with the actual usage."""
+        if completed:
+            self.requests += 1
+        self._last_done_at = time.monotonic()
+        if used is None:
+            used = 0
+        else:
+            self.tokens += used
+            self._avg_tokens = (
+                used if self._avg_tokens == 0 else 0.8 * self._avg_tokens + 0.2 * used
+            )
+        if self._tokens_bucket is not None:
+            self._tokens_bucket.level += estimate - used
+
+    def _on_rate_limited(self, error: Exception, attempt: int) -> float:
+        self.rate_limited += 1
+        self._rate_factor = max(_MIN_RATE_FACTOR, self._rate_factor * _DECREASE_FACTOR)
+        delay = self._backoff(error, attempt)
+        # Pause every caller of this limiter, not only the one that hit the limit.
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        return delay
+
+    def _backoff(self, error: Exception, attempt: int) -> float:
+        delay = get_retry_after(error)
+        if delay is None:
+            # Full jitter: spreads out the retries of concurrent callers
+            delay = random.uniform(0, min(self.max_backoff, self.base_backoff * 2**attempt))  # noqa: S311
+        return min(delay, self.max_backoff)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an SDK exception is an HTTP 429 (OpenAI and Anthropic errors carry status_code)."""
+    return getattr(error, "status_code", None) == 429
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Whether a failed request is worth retrying (the same set the provider SDKs retry)."""
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return status in (408, 409, 429) or status >= 500
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    # openai/anthropic APIConnectionError (and its APITimeoutError subclass)
+    return any(cls.__name__ == "APIConnectionError" for cls in type(error).__mro__)
+
+
+def get_retry_after(error: BaseException) -> float | None:
+    """Return the server-requested delay in seconds from a rate-limit error, if any."""
+    response = getattr(error, "response", None)
+    headers: Any = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return max(0.0, float(retry_after_ms) / 1000)
+        retry_after = headers.get("retry-after")
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+_limiters: dict[tuple[str, str], RateLimiter] = {}
+_default_limits: tuple[float | None, float | None] = (None, None)
+
+
+def set_default_rate_limits(
+    requests_per_minute: float | None = None, tokens_per_minute: float | None = None
+) -> None:
+    """Set the budgets used by every (provider, model) limiter, including existing ones."""
+    global _default_limits
+    _default_limits = (requests_per_minute, tokens_per_minute)
+    for limiter in _limiters.values():
+        limiter.configure(requests_per_minute, tokens_per_minute)
+
+
+def get_rate_limiter(provider: str, model: str) -> RateLimiter:
+    """Return the process-wide limiter for a provider and model."""
+    limiter = _limiters.get((provider, model))
+    if limiter is None:
+        limiter = RateLimiter(*_default_limits)
+        _limiters[provider, model] = limiter
+    return limiter
+
+
+def rate_limiter_stats() -> list[RateLimiterStats]:
+    """Throughput of every limiter that has handled a request."""
+    return [
+        limiter.stats(provider, model)
+        for (provider, model), limiter in _limiters.items()
+        if limiter.requests
+    ]
+
+
+def reset_rate_limiters(*, keep_limits: bool = False) -> None:
+    """Drop all limiters, and with them their stats.
+
+    Args:
+        keep_limits: Keep the budgets set with ``set_default_rate_limits``
+            for the limiters created from now on.
+    """
+    global _default_limits
+    _limiters.clear()
+    if not keep_limits:
+        _default_limits = (None, None)
@@ -0,0 +1,140 @@
+"""Record/replay cache for eval model responses.
+
+Re-running a suite after changing only critics or rubric weights does not
+need to ask the model again. With a ``ResponseCache`` attached to an
+``EvalSuite``, every model request is content-addressed by provider, model,
+seed, run index, the request messages and parameters, and a hash of the tool
+schemas. The tool calls extracted from the response are stored as one JSON
+file per key, so scoring can be iterated offline.
+
+Modes:
+    record: Serve recorded responses and call the model (then record) on a miss.
+    replay: Serve recorded responses only; a miss raises ResponseCacheMissError.
+    refresh: Always call the model and overwrite the recording.
+
+Replay only finds recordings made with the same seeds, so use the "constant"
+seed policy or an integer seed rather than "random".
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import uuid
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, Literal, get_args
+
+from arcade_evals.errors import EvalError
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ResponseCache",
+    "ResponseCacheMissError",
+    "ResponseCacheMode",
+]
+
+ResponseCacheMode = Literal["record", "replay", "refresh"]
+
+_VALID_MODES: frozenset[str] = frozenset(get_args(ResponseCacheMode))
+
+ToolCalls = list[tuple[str, dict[str, Any]]]
+
+
+class ResponseCacheMissError(EvalError):
+    """Raised in replay mode when a model request has no recording."""
+
+
+class ResponseCache:
+    """Content-addressed store of model tool-call responses.
+
+    Args:
+        directory: Where recordings are kept. Created on first write.
+        mode: "record", "replay", or "refresh" (see module docstring).
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], mode: ResponseCacheMode = "record"):
+        if mode not in _VALID_MODES:
+            raise ValueError(
+                f"Invalid response cache mode '{mode}'. Valid values: {', '.join(sorted(_VALID_MODES))}"
+            )
+        self.directory = Path(directory)
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        request: dict[str, Any],
+        tools_hash: str,
+        run_index: int = 0,
+    ) -> str:
+        """Build the key for a model request.
+
+        Args:
+            provider: The provider name.
+            request: The request parameters (model, seed, messages, ...) without the tools.
+            tools_hash: Hash of the provider-formatted tool schemas.
+            run_index: Index of the run within a multi-run case, so runs that share
+                a seed still get separate recordings.
+        """
+        canonical = json.dumps(
+            [provider, request, tools_hash, run_index],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    async def get_or_call(self, key: str, call: Callable[[], Awaitable[ToolCalls]]) -> ToolCalls:
+        """Return the recorded tool calls for ``key``, calling the model as the mode allows."""
+        if self.mode != "refresh":
+            recorded = await asyncio.to_thread(self._read, key)
+            if recorded is not None:
+                self.hits += 1
+                return recorded
+            self.misses += 1
+            if self.mode == "replay":
+                raise ResponseCacheMissError(
+                    f"No recorded model response for request {key[:12]} in '{self.directory}'. "
+                    "Run with --record first."
+                )
+
+        tool_calls = await call()
+        await asyncio.to_thread(self._write, key, tool_calls)
+        return tool_calls
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> ToolCalls | None:
+        try:
+            data = json.loads(self._path(key).read_text(encoding="utf-8"))
+            return [(name, args) for name, args in data["tool_calls"]]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning("Ignoring unreadable recorded response %s", key, exc_info=True)
+            return None
+
+    def _write(self, key: str, tool_calls: ToolCalls) -> None:
+        path = self._path(key)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(
+                json.dumps({"tool_calls": tool_calls}, ensure_ascii=False, default=str),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("Failed to record model response %s", key, exc_info=True)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
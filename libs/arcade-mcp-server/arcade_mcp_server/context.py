@@ -378,7 +378,7 @@ class Context(ToolContext):
                 if "notifications/resources/list_changed" in self._notification_queue:
                     await nm.notify_resource_list_changed(client_ids)
                 if "notifications/prompts/list_changed" in self._notification_queue:
-                    pass
+                    await nm.notify_prompt_list_changed(client_ids)
 
                 self._notification_queue.clear()
             except Exception:
@@ -448,12 +448,33 @@ class Logs(_ContextComponent):
         await self.log("error", message, **kwargs)
 
 
+_NO_PARTIAL = object()
+
+
 class Progress(_ContextComponent):
     def __init__(self, ctx: Context) -> None:
         super().__init__(ctx)
 
     async def report(
         self, progress: float, total: float | None = None, message: str | None = None
+    ) -> None:
+        await self._send(progress, total=total, message=message)
+
+    async def partial(self, chunk: Any, progress: float) -> None:
+        """Send one chunk of a streaming tool's result.
+
+        The chunk travels in a progress notification's ``_meta.arcade.partial``
+        on the stream of the request that called the tool, and this returns
+        once the transport has accepted it.
+        """
+        await self._send(progress, partial=chunk)
+
+    async def _send(
+        self,
+        progress: float,
+        total: float | None = None,
+        message: str | None = None,
+        partial: Any = _NO_PARTIAL,
     ) -> None:
         session = self._ctx._session
         if session is None:
@@ -475,12 +496,23 @@ class Progress(_ContextComponent):
         if task_id is not None:
             _meta = {RELATED_TASK_META_KEY: {"taskId": task_id}}
 
+        delivery: dict[str, Any] = {}
+        if partial is not _NO_PARTIAL:
+            _meta = {**(_meta or {}), "arcade": {"partial": partial}}
+            # A task's request has already been answered, so its chunks go to
+            # the standalone stream like its other notifications.
+            delivery = {
+                "related_request_id": self._ctx._request_id if task_id is None else None,
+                "wait_for_delivery": True,
+            }
+
         await session.send_progress_notification(
             progress_token=progress_token,
             progress=progress,
             total=total,
             message=message,
             _meta=_meta,
+            **delivery,
         )
 
 
@@ -516,6 +548,10 @@ class Resources(_ContextComponent):
         templates = await self._ctx.server._resource_manager.list_resource_templates()
         return cast(builtins_list[Any], templates)
 
+    async def notify_updated(self, uri: str) -> None:
+        """Tell clients subscribed to ``uri`` that the resource has changed."""
+        await self._ctx.server._resource_manager.notify_resource_updated(uri)
+
 
 class Tools(_ContextComponent):
     def __init__(self, ctx: Context) -> None:
@@ -1,7 +1,7 @@
 import base64
 import json
 import logging
-from typing import Any
+from typing import Any, Literal, cast, get_args
 
 from arcade_core.catalog import MaterializedTool
 from arcade_core.schema import ToolDefinition
@@ -16,6 +16,27 @@ from arcade_mcp_server.types import (
 
 logger = logging.getLogger("arcade.mcp")
 
+ResultEncoding = Literal["both", "structured", "text"]
+"""How a successful tool result is split between ``content`` and ``structuredContent``.
+
+* ``both``: the full value as JSON text and as structuredContent.
+* ``structured``: the full value as structuredContent, with a short text summary.
+* ``text``: the full value as JSON text only. Tools that declare an
+  ``outputSchema`` still send structuredContent, as the spec requires, so the
+  server-wide setting only changes tools without one. A tool that sets the
+  ``result_encoding`` extra to ``text`` stops advertising its ``outputSchema``
+  (see :func:`has_output_schema`) and is sent as text only.
+"""
+
+RESULT_ENCODING_EXTRA = "result_encoding"
+"""ToolMetadata.extras key overriding the server's result encoding for one tool."""
+
+RESULT_OFFLOAD_EXTRA = "result_offload"
+"""ToolMetadata.extras key; ``True`` lets a tool with a return type offload large results."""
+
+_SUMMARY_MAX_KEYS = 10
+_SUMMARY_MAX_CHARS = 200
+
 
 def _build_arcade_meta(definition: ToolDefinition) -> dict[str, Any] | None:
     """Build the _meta.arcade structure from a tool definition.
@@ -62,12 +83,10 @@ def create_mcp_tool(materialized_tool: MaterializedTool) -> MCPTool:
     # Build the tool's output schema
     # MCP spec requires outputSchema.type to be "object"
     output_schema = None
-    if hasattr(definition, "output") and definition.output:
-        output_def = definition.output
-        if getattr(output_def, "value_schema", None):
-            # _build_value_schema_json always returns {"type": "object", ...}
-            # (it wraps non-object types in a result property internally)
-            output_schema = _build_value_schema_json(output_def.value_schema)
+    if has_output_schema(definition):
+        # _build_value_schema_json always returns {"type": "object", ...}
+        # (it wraps non-object types in a result property internally)
+        output_schema = _build_value_schema_json(definition.output.value_schema)
 
     # Build MCP tool annotations from metadata behavior fields
     title = getattr(materialized_tool.tool, "__tool_name__", definition.name)
@@ -164,6 +183,84 @@ def convert_content_to_structured_content(value: Any) -> dict[str, Any] | None:
         return {"result": str(value)}
 
 
+def get_result_encoding(definition: ToolDefinition, default: ResultEncoding) -> ResultEncoding:
+    """Return the tool's result encoding, or ``default`` if it does not override it."""
+    metadata = definition.metadata
+    if metadata is None or not metadata.extras:
+        return default
+    encoding = metadata.extras.get(RESULT_ENCODING_EXTRA)
+    if encoding not in get_args(ResultEncoding):
+        return default
+    return cast(ResultEncoding, encoding)
+
+
+def has_output_schema(definition: ToolDefinition) -> bool:
+    """Whether the tool declares an ``outputSchema`` (see :func:`create_mcp_tool`).
+
+    Every tool with a return type has one, unless its ``result_encoding``
+    extra is ``text`` or its ``result_offload`` extra is ``True``. Both ask
+    for results without structuredContent (text only, or a resource link),
+    which the spec does not allow alongside an ``outputSchema``.
+    """
+    output = getattr(definition, "output", None)
+    if not (output and getattr(output, "value_schema", None)):
+        return False
+    extras = definition.metadata.extras if definition.metadata else None
+    if extras and extras.get(RESULT_OFFLOAD_EXTRA) is True:
+        return False
+    return get_result_encoding(definition, "both") != "text"
+
+
+def encode_tool_result(
+    value: Any,
+    encoding: ResultEncoding,
+    requires_structured: bool = False,
+    serialized: str | None = None,
+) -> tuple[list[MCPContent], dict[str, Any] | None]:
+    """Build the ``content`` and ``structuredContent`` of a successful tool result.
+
+    Args:
+        value: The tool's return value.
+        encoding: The result encoding policy.
+        requires_structured: Whether structuredContent must be sent because the
+            tool declares an ``outputSchema``.
+        serialized: The value's text content, if the caller already has it.
+
+    Returns:
+        The content blocks and the structured content (or None).
+    """
+    structured_content = None
+    if encoding != "text" or requires_structured:
+        structured_content = convert_content_to_structured_content(value)
+        if encoding == "structured" and structured_content is not None:
+            summary = _summarize_result(value)
+            if summary is not None:
+                return [TextContent(type="text", text=summary)], structured_content
+
+    if serialized is not None:
+        return [TextContent(type="text", text=serialized)], structured_content
+    return convert_to_mcp_content(value), structured_content
+
+
+def _summarize_result(value: Any) -> str | None:
+    """Describe a result sent as structuredContent, or None to send it in full."""
+    if isinstance(value, dict):
+        keys = [str(key) for key in value]
+        shown = ", ".join(keys[:_SUMMARY_MAX_KEYS])
+        if len(keys) > _SUMMARY_MAX_KEYS:
+            shown += f", ... ({len(keys) - _SUMMARY_MAX_KEYS} more)"
+        return f"Object with keys: {shown}. Full result in structuredContent."
+    if isinstance(value, list):
+        noun = "item" if len(value) == 1 else "items"
+        return f"List of {len(value)} {noun}. Full result in structuredContent."
+    if isinstance(value, str) and len(value) > _SUMMARY_MAX_CHARS:
+        preview = value[:_SUMMARY_MAX_CHARS]
+        return f"{preview}... ({len(value)} characters; full result in structuredContent)"
+    # Short strings and numbers cost as little as any summary would; bytes are
+    # base64-encoded in the text but not in structuredContent, so keep both.
+    return None
+
+
 def _map_type_to_json_schema_type(val_type: str | None) -> str:
     """
     Map Arcade value types to JSON schema types.
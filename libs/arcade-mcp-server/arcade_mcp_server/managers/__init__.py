@@ -2,7 +2,18 @@
 
 from arcade_mcp_server.managers.prompt import PromptManager
 from arcade_mcp_server.managers.resource import ResourceManager
+from arcade_mcp_server.managers.result_cache import ResultCache
+from arcade_mcp_server.managers.single_flight import SingleFlight
 from arcade_mcp_server.managers.task_manager import TaskManager
+from arcade_mcp_server.managers.task_scheduler import TaskScheduler
 from arcade_mcp_server.managers.tool import ToolManager
 
-__all__ = ["PromptManager", "ResourceManager", "TaskManager", "ToolManager"]
+__all__ = [
+    "PromptManager",
+    "ResourceManager",
+    "ResultCache",
+    "SingleFlight",
+    "TaskManager",
+    "TaskScheduler",
+    "ToolManager",
+]
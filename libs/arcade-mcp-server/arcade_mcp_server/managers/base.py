@@ -7,7 +7,8 @@ Provides async-safe registries with RW locking, versioning, and subscriptions.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from types import TracebackType
 from typing import Any, Generic, TypeVar, cast
 
@@ -69,10 +70,37 @@ class AsyncRegistry(Generic[K, V]):
         self._lock = AsyncRWLock()
         self._version = 0
         self._subscribers: list[Callable[[str, K | None, V | None, V | None, int], None]] = []
+        self._batch_depth = 0
+        self._batch_changed = False
 
     def subscribe(self, fn: Callable[[str, K | None, V | None, V | None, int], None]) -> None:
         self._subscribers.append(fn)
 
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Group mutations so subscribers hear about them once.
+
+        Inside the block, changes are applied as usual but subscribers are
+        not called; when the outermost block exits, they receive a single
+        ``"batch"`` event if anything changed. Changes made by other tasks
+        while a batch is open are folded into it too.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_changed:
+                self._batch_changed = False
+                self._emit("batch", None, None, None)
+
+    def _emit(self, event: str, key: K | None, old: V | None, new: V | None) -> None:
+        if self._batch_depth:
+            self._batch_changed = True
+            return
+        for fn in self._subscribers:
+            fn(event, key, old, new, self._version)
+
     async def get(self, key: K) -> V:
         async with await self._lock.read():
             if key not in self._items:
@@ -92,9 +120,7 @@ class AsyncRegistry(Generic[K, V]):
             old = self._items.get(key)
             self._items[key] = value
             self._version += 1
-            version = self._version
-        for fn in self._subscribers:
-            fn("upsert", key, old, value, version)
+        self._emit("upsert", key, old, value)
 
     async def remove(self, key: K) -> V:
         async with await self._lock.write():
@@ -102,9 +128,7 @@ class AsyncRegistry(Generic[K, V]):
                 raise KeyError(f"{self.component.title()} '{key}' not found")
             old = self._items.pop(key)
             self._version += 1
-            version = self._version
-        for fn in self._subscribers:
-            fn("remove", key, old, None, version)
+        self._emit("remove", key, old, None)
         return old
 
     async def bulk_load(self, items: Iterable[tuple[K, V]]) -> None:
@@ -112,9 +136,7 @@ class AsyncRegistry(Generic[K, V]):
             for k, v in items:
                 self._items[k] = v
             self._version += 1
-            version = self._version
-        for fn in self._subscribers:
-            fn("bulk_load", cast(K, None), None, None, version)
+        self._emit("bulk_load", cast(K, None), None, None)
 
     @property
     def version(self) -> int:
@@ -141,6 +163,17 @@ class ComponentManager(Generic[K, V]):
     def subscribe(self, fn: Callable[[str, K | None, V | None, V | None, int], None]) -> None:
         self.registry.subscribe(fn)
 
+    def batch(self) -> AbstractAsyncContextManager[None]:
+        """Group changes so they produce one list-changed notification.
+
+        Example::
+
+            async with server.tools.batch():
+                for tool in toolkit_tools:
+                    await server.tools.add_tool(tool)
+        """
+        return self.registry.batch()
+
     @property
     def version(self) -> int:
         return self.registry.version
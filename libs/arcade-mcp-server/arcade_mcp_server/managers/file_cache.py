@@ -0,0 +1,147 @@
+"""Cached, non-blocking reads for file-backed resources.
+
+File resources are read in a worker thread so a large file never stalls the
+event loop. What a read produces is cached keyed by the file's path,
+modification time, and size, so repeated ``resources/read`` calls for an
+unchanged file skip the disk and the decode entirely; editing the file
+changes its key and the next read picks up the new contents.
+
+Whether a file is text or binary is decided from a prefix: a NUL byte or a
+prefix that is not valid UTF-8 means binary. Files at or above the mmap
+threshold are mapped rather than read, and are decoded (text) or
+base64-encoded (binary) straight from the mapping without first copying
+them into a bytes object.
+"""
+
+from __future__ import annotations
+
+import base64
+import codecs
+import mmap
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from arcade_mcp_server.exceptions import NotFoundError
+
+SNIFF_BYTES = 8192
+DEFAULT_MMAP_THRESHOLD = 1024 * 1024  # 1 MiB
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MiB
+
+FileContents = str | bytes | dict[str, str]
+"""Text, raw bytes, or ``{"blob": <base64>}`` for a large binary file."""
+
+_CacheKey = tuple[str, int, int]
+
+
+def looks_like_text(prefix: bytes) -> bool:
+    """Guess whether a file is UTF-8 text from its first bytes.
+
+    The prefix may end in the middle of a multi-byte character, so it is
+    decoded incrementally rather than as a complete string.
+    """
+    if b"\x00" in prefix:
+        return False
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(prefix, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+class FileContentCache:
+    """Byte-bounded LRU of decoded file contents.
+
+    Args:
+        max_bytes: Maximum total size of the cached files. A file larger
+            than this is read on every request and never cached.
+        mmap_threshold: Files of at least this many bytes are memory-mapped.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        mmap_threshold: int = DEFAULT_MMAP_THRESHOLD,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.mmap_threshold = mmap_threshold
+        self._entries: OrderedDict[_CacheKey, tuple[FileContents, int]] = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def read(self, path: Path) -> FileContents:
+        """Return a file's contents, from the cache when it is unchanged.
+
+        Does blocking file I/O; call it from a worker thread.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise NotFoundError(f"File not found: {path}") from None
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached[0]
+
+        try:
+            contents = self._load(path, stat.st_size)
+        except FileNotFoundError:
+            raise NotFoundError(f"File not found: {path}") from None
+
+        size = stat.st_size
+        if size <= self.max_bytes:
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = (contents, size)
+                    self._total += size
+                # Older versions of the same file can never be hit again
+                for stale in [k for k in self._entries if k[0] == key[0] and k != key]:
+                    self._total -= self._entries.pop(stale)[1]
+                while self._total > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self._total -= evicted
+        return contents
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+
+    def _load(self, path: Path, size: int) -> FileContents:
+        with open(path, "rb") as f:
+            if size < self.mmap_threshold or size == 0:
+                data = f.read()
+                if looks_like_text(data[:SNIFF_BYTES]):
+                    try:
+                        return data.decode("utf-8")
+                    except UnicodeDecodeError:
+                        pass
+                return data
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _decode_mapped(mapped)
+
+
+def _decode_mapped(mapped: mmap.mmap) -> FileContents:
+    view = memoryview(mapped)
+    try:
+        if looks_like_text(view[:SNIFF_BYTES].tobytes()):
+            try:
+                return str(view, "utf-8")
+            except UnicodeDecodeError:
+                pass
+        return {"blob": base64.b64encode(view).decode("ascii")}
+    finally:
+        view.release()
+
+
+_default_cache = FileContentCache()
+
+
+def default_file_cache() -> FileContentCache:
+    """Return the process-wide cache shared by file resources."""
+    return _default_cache
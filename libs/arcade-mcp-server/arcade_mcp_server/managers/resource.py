@@ -6,15 +6,23 @@ Async-safe resources with registry-based storage and deterministic listing.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import contextlib
 import logging
 import re
+import time
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from arcade_mcp_server.exceptions import NotFoundError, ResourceError
 from arcade_mcp_server.managers.base import ComponentManager
+from arcade_mcp_server.managers.file_cache import (
+    FileContentCache,
+    FileContents,
+    default_file_cache,
+)
+from arcade_mcp_server.managers.resource_subscriptions import ResourceSubscriptions
 from arcade_mcp_server.types import (
     BlobResourceContents,
     Resource,
@@ -23,6 +31,9 @@ from arcade_mcp_server.types import (
     TextResourceContents,
 )
 
+if TYPE_CHECKING:
+    from arcade_mcp_server.session import ServerSession
+
 logger = logging.getLogger("arcade.mcp.managers.resource")
 
 DuplicatePolicy = Literal["warn", "error", "replace", "ignore"]
@@ -69,6 +80,94 @@ def _template_to_sample_uri(template: str) -> str:
     return result
 
 
+class _TemplateIndexNode:
+    __slots__ = ("children", "templates")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TemplateIndexNode] = {}
+        self.templates: list[str] = []
+
+
+class _TemplateIndex:
+    """Trie over the literal leading segments of URI templates.
+
+    A template is stored under the ``/``-separated segments that precede its
+    first variable (the segment holding the variable is left out). Any URI
+    a template's regex matches starts with those segments, so walking a
+    URI's segments down the trie visits every template that could match it,
+    and only those need their regex run.
+    """
+
+    def __init__(self) -> None:
+        self._root = _TemplateIndexNode()
+        self._order: dict[str, int] = {}
+        self._next = 0
+
+    @staticmethod
+    def _path(template: str) -> list[str]:
+        literal = re.split(r"\{", template, maxsplit=1)[0]
+        return literal.split("/")[:-1]
+
+    def add(self, template: str) -> None:
+        if template in self._order:
+            return
+        node = self._root
+        for segment in self._path(template):
+            node = node.children.setdefault(segment, _TemplateIndexNode())
+        node.templates.append(template)
+        self._order[template] = self._next
+        self._next += 1
+
+    def remove(self, template: str) -> None:
+        if self._order.pop(template, None) is None:
+            return
+        path = self._path(template)
+        nodes = [self._root]
+        for segment in path:
+            nodes.append(nodes[-1].children[segment])
+        nodes[-1].templates.remove(template)
+        # Prune branches left empty
+        for depth in range(len(path), 0, -1):
+            node = nodes[depth]
+            if node.templates or node.children:
+                break
+            del nodes[depth - 1].children[path[depth - 1]]
+
+    def candidates(self, uri: str) -> list[str]:
+        """Templates that may match ``uri``, in registration order."""
+        node: _TemplateIndexNode | None = self._root
+        found: list[str] = []
+        for segment in uri.split("/"):
+            if node is None:
+                break
+            found.extend(node.templates)
+            node = node.children.get(segment)
+        if node is not None:
+            found.extend(node.templates)
+        return sorted(found, key=self._order.__getitem__)
+
+    def related(self, template: str) -> list[str]:
+        """Templates that may overlap ``template``, in registration order.
+
+        Two templates can only match a common URI when one's literal
+        segments are a prefix of the other's: these are the templates on
+        the path to ``template``'s node and in the subtree below it.
+        """
+        node: _TemplateIndexNode | None = self._root
+        found: list[str] = []
+        for segment in self._path(template):
+            if node is None:
+                break
+            found.extend(node.templates)
+            node = node.children.get(segment)
+        stack = [node] if node is not None else []
+        while stack:
+            current = stack.pop()
+            found.extend(current.templates)
+            stack.extend(current.children.values())
+        return sorted(found, key=self._order.__getitem__)
+
+
 def make_text_handler(text: str) -> Callable[[str], str]:
     """Create a handler that returns static text."""
 
@@ -78,19 +177,26 @@ def make_text_handler(text: str) -> Callable[[str], str]:
     return handler
 
 
-def make_file_handler(path: str | Path) -> Callable[[str], str | bytes]:
-    """Create a handler that reads a file, returning text or bytes."""
-    file_path = Path(path)
+class FileResourceHandler:
+    """Resource handler that reads a file, returning text or bytes.
 
-    def _read_file(_uri: str) -> str | bytes:
-        if not file_path.exists():
-            raise NotFoundError(f"File not found: {file_path}")
-        try:
-            return file_path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            return file_path.read_bytes()
+    The file is read in a worker thread, and its contents are cached until
+    the file changes (see :mod:`arcade_mcp_server.managers.file_cache`).
+    """
 
-    return _read_file
+    def __init__(self, path: str | Path, cache: FileContentCache | None = None) -> None:
+        self.file_path = Path(path)
+        self._cache = cache or default_file_cache()
+
+    async def __call__(self, _uri: str) -> FileContents:
+        return await asyncio.to_thread(self._cache.read, self.file_path)
+
+
+def make_file_handler(
+    path: str | Path, cache: FileContentCache | None = None
+) -> FileResourceHandler:
+    """Create a handler that reads a file, returning text or bytes."""
+    return FileResourceHandler(path, cache)
 
 
 class ResourceManager(ComponentManager[str, Resource]):
@@ -102,14 +208,24 @@ class ResourceManager(ComponentManager[str, Resource]):
         self,
         duplicate_policy: DuplicatePolicy = "warn",
         multiple_match_policy: MultipleMatchPolicy = "warn",
+        update_debounce: float = 0.1,
+        watch_files: bool = True,
     ) -> None:
         super().__init__("resource")
         self._templates: dict[str, ResourceTemplate] = {}
         self._resource_handlers: dict[str, Callable[[str], Any]] = {}
         self._template_handlers: dict[str, Callable[..., Any]] = {}
         self._template_patterns: dict[str, re.Pattern[str]] = {}
+        self._template_index = _TemplateIndex()
+        # Ephemeral resources: readable until they expire, but never listed
+        self._ephemeral: dict[str, tuple[Resource, Callable[[str], Any], float]] = {}
         self.duplicate_policy: DuplicatePolicy = duplicate_policy
         self.multiple_match_policy: MultipleMatchPolicy = multiple_match_policy
+        self._subscriptions = ResourceSubscriptions(update_debounce, watch_files)
+
+    async def stop(self) -> None:
+        await self._subscriptions.close()
+        await super().stop()
 
     async def list_resources(self) -> list[Resource]:
         return await self.registry.list()
@@ -118,6 +234,19 @@ class ResourceManager(ComponentManager[str, Resource]):
         return [self._templates[k] for k in sorted(self._templates.keys())]
 
     async def read_resource(self, uri: str) -> list[ResourceContents]:
+        # Ephemeral resources are matched without their query string, so
+        # handlers can take parameters such as a read offset.
+        ephemeral = self._ephemeral.get(uri.partition("?")[0])
+        if ephemeral is not None:
+            resource, ephemeral_handler, expires_at = ephemeral
+            if expires_at <= time.monotonic():
+                self._ephemeral.pop(resource.uri, None)
+                raise NotFoundError(f"Resource '{uri}' not found")
+            result = ephemeral_handler(uri)
+            if hasattr(result, "__await__"):
+                result = await result
+            return self._coerce_result(uri, resource.mimeType, result)
+
         handler = self._resource_handlers.get(uri)
         if handler:
             # Look up the registered resource's mimeType so we can propagate it
@@ -133,10 +262,11 @@ class ResourceManager(ComponentManager[str, Resource]):
                 result = await result
             return self._coerce_result(uri, mime_type, result)
 
-        # Try template matching before giving up — collect all matches
+        # Try template matching before giving up — collect all matches among
+        # the templates whose literal prefix the URI starts with
         matches: list[tuple[str, re.Match[str]]] = []
-        for tmpl_str, pattern in self._template_patterns.items():
-            match = pattern.match(uri)
+        for tmpl_str in self._template_index.candidates(uri):
+            match = self._template_patterns[tmpl_str].match(uri)
             if match:
                 matches.append((tmpl_str, match))
 
@@ -216,6 +346,7 @@ class ResourceManager(ComponentManager[str, Resource]):
         except KeyError as _e:
             raise NotFoundError(f"Resource '{uri}' not found")
         self._resource_handlers.pop(uri, None)
+        self._subscriptions.remove_uri(uri)
         return removed
 
     async def update_resource(
@@ -229,8 +360,70 @@ class ResourceManager(ComponentManager[str, Resource]):
         await self.registry.upsert(resource.uri, resource)
         if handler:
             self._resource_handlers[resource.uri] = handler
+        if resource.uri != uri:
+            # The old URI no longer names a resource
+            self._subscriptions.remove_uri(uri)
+            return resource
+        path = handler.file_path if isinstance(handler, FileResourceHandler) else None
+        self._subscriptions.set_path(uri, path)
+        await self.notify_resource_updated(uri)
         return resource
 
+    async def subscribe_resource(self, uri: str, session: ServerSession) -> None:
+        """Send ``session`` a resources/updated notification when ``uri`` changes.
+
+        Raises:
+            NotFoundError: No resource or resource template matches ``uri``.
+        """
+        handler = self._resource_handlers.get(uri)
+        if handler is None and not await self._resource_exists(uri):
+            raise NotFoundError(f"Resource '{uri}' not found")
+        path = handler.file_path if isinstance(handler, FileResourceHandler) else None
+        self._subscriptions.subscribe(uri, session, path)
+
+    async def unsubscribe_resource(self, uri: str, session: ServerSession) -> None:
+        self._subscriptions.unsubscribe(uri, session)
+
+    async def remove_session_subscriptions(self, session: ServerSession) -> None:
+        """Drop every subscription held by a session that has ended."""
+        self._subscriptions.remove_session(session)
+
+    async def notify_resource_updated(self, uri: str) -> None:
+        """Tell the sessions subscribed to ``uri`` that it changed.
+
+        Notifications are debounced, so a burst of updates to one resource
+        reaches each subscriber as a single notification.
+        """
+        self._subscriptions.notify_updated(uri)
+
+    async def _resource_exists(self, uri: str) -> bool:
+        if uri.partition("?")[0] in self._ephemeral:
+            return True
+        try:
+            await self.registry.get(uri)
+        except KeyError:
+            return any(
+                self._template_patterns[t].match(uri) for t in self._template_index.candidates(uri)
+            )
+        return True
+
+    async def add_ephemeral_resource(
+        self, resource: Resource, handler: Callable[[str], Any], ttl: float
+    ) -> None:
+        """Register a resource that can be read for ``ttl`` seconds.
+
+        Ephemeral resources are not part of ``resources/list`` and adding or
+        expiring one sends no list-changed notification. The handler receives
+        the full URI, including any query string.
+        """
+        now = time.monotonic()
+        for uri in [uri for uri, entry in self._ephemeral.items() if entry[2] <= now]:
+            del self._ephemeral[uri]
+        self._ephemeral[resource.uri] = (resource, handler, now + ttl)
+
+    async def remove_ephemeral_resource(self, uri: str) -> None:
+        self._ephemeral.pop(uri, None)
+
     async def add_template(self, template: ResourceTemplate) -> None:
         self._templates[template.uriTemplate] = template
 
@@ -246,7 +439,8 @@ class ResourceManager(ComponentManager[str, Resource]):
         new_pattern = _template_to_regex(template.uriTemplate)
         new_sample = _template_to_sample_uri(template.uriTemplate)
 
-        for existing_tmpl_str, existing_pattern in self._template_patterns.items():
+        for existing_tmpl_str in self._template_index.related(template.uriTemplate):
+            existing_pattern = self._template_patterns[existing_tmpl_str]
             existing_sample = _template_to_sample_uri(existing_tmpl_str)
             # Check both directions: does the new pattern match an existing
             # template's sample URI, or does an existing pattern match the
@@ -264,12 +458,14 @@ class ResourceManager(ComponentManager[str, Resource]):
         self._templates[template.uriTemplate] = template
         self._template_handlers[template.uriTemplate] = handler
         self._template_patterns[template.uriTemplate] = new_pattern
+        self._template_index.add(template.uriTemplate)
 
     async def remove_template(self, uri_template: str) -> ResourceTemplate:
         if uri_template not in self._templates:
             raise NotFoundError(f"Resource template '{uri_template}' not found")
         self._template_handlers.pop(uri_template, None)
         self._template_patterns.pop(uri_template, None)
+        self._template_index.remove(uri_template)
         return self._templates.pop(uri_template)
 
     async def add_text_resource(
@@ -0,0 +1,200 @@
+"""Per-session resource subscriptions and ``notifications/resources/updated``.
+
+A client subscribes to a resource URI with ``resources/subscribe`` and is
+then sent ``notifications/resources/updated`` when the resource changes,
+instead of polling ``resources/read``. Changes are reported in two ways:
+
+- Code that knows a resource changed calls
+  ``ResourceManager.notify_resource_updated(uri)`` (or
+  ``context.resources.notify_updated(uri)`` from a tool).
+- File-backed resources are watched: one shared watcher covers the
+  directories of every subscribed file, and a change to the file marks its
+  resource updated.
+
+Updates are debounced. A burst of changes to a URI within the debounce
+window produces one notification per subscribed session; a resource that
+keeps changing is still reported at least every ``max_windows`` windows.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from watchfiles import awatch
+
+from arcade_mcp_server.types import ResourceUpdatedNotification, ResourceUpdatedNotificationParams
+
+if TYPE_CHECKING:
+    from arcade_mcp_server.session import ServerSession
+
+logger = logging.getLogger("arcade.mcp.managers.resource_subscriptions")
+
+
+class ResourceSubscriptions:
+    """Tracks which sessions subscribe to which resource URIs.
+
+    Sessions are held weakly, so a session that goes away without
+    unsubscribing is dropped rather than kept alive.
+
+    Args:
+        debounce: Seconds to wait after a change before notifying, so that
+            further changes in that window are folded into one notification.
+        watch_files: Watch subscribed file resources for changes.
+        max_windows: Flush after this many debounce windows even if changes
+            are still arriving.
+    """
+
+    def __init__(
+        self, debounce: float = 0.1, watch_files: bool = True, max_windows: int = 10
+    ) -> None:
+        self.debounce = debounce
+        self.max_windows = max_windows
+        self.watch_files = watch_files
+        self._subscribers: dict[str, weakref.WeakSet[ServerSession]] = {}
+        self._pending: set[str] = set()
+        self._changes = 0
+        self._flush_task: asyncio.Task[None] | None = None
+        # File watching: resolved file path -> URIs of the resources it backs
+        self._watched: dict[Path, set[str]] = {}
+        self._watch_task: asyncio.Task[None] | None = None
+        self._watch_stop: asyncio.Event | None = None
+
+    def subscribe(self, uri: str, session: ServerSession, path: Path | None = None) -> None:
+        """Subscribe ``session`` to ``uri``; ``path`` is the file backing it, if any."""
+        self._subscribers.setdefault(uri, weakref.WeakSet()).add(session)
+        if path is not None and self.watch_files:
+            self._watch_uri(uri, path)
+
+    def unsubscribe(self, uri: str, session: ServerSession) -> None:
+        sessions = self._subscribers.get(uri)
+        if sessions is None:
+            return
+        sessions.discard(session)
+        if not sessions:
+            self._drop_uri(uri)
+
+    def remove_uri(self, uri: str) -> None:
+        """Drop every subscription to ``uri`` and stop watching its file."""
+        self._drop_uri(uri)
+
+    def set_path(self, uri: str, path: Path | None) -> None:
+        """Watch ``path`` instead of the file that backed ``uri`` until now.
+
+        Does nothing for a URI nobody subscribes to.
+        """
+        if not self._subscribers.get(uri):
+            return
+        self._unwatch_uri(uri)
+        if path is not None and self.watch_files:
+            self._watch_uri(uri, path)
+
+    def remove_session(self, session: ServerSession) -> None:
+        """Drop every subscription held by ``session``."""
+        for uri in list(self._subscribers):
+            self.unsubscribe(uri, session)
+
+    def subscribers(self, uri: str) -> list[ServerSession]:
+        sessions = self._subscribers.get(uri)
+        return list(sessions) if sessions else []
+
+    def notify_updated(self, uri: str) -> None:
+        """Mark ``uri`` updated; subscribers are notified once the burst settles.
+
+        Must be called from the event loop. Does nothing for a URI nobody
+        subscribes to.
+        """
+        if not self._subscribers.get(uri):
+            return
+        self._pending.add(uri)
+        self._changes += 1
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    async def close(self) -> None:
+        """Stop the file watcher and any pending notification flush."""
+        self._pending.clear()
+        for task in (self._flush_task, self._watch_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._flush_task = None
+        self._watch_task = None
+        self._watch_stop = None
+
+    def _drop_uri(self, uri: str) -> None:
+        self._subscribers.pop(uri, None)
+        self._pending.discard(uri)
+        self._unwatch_uri(uri)
+
+    def _watch_uri(self, uri: str, path: Path) -> None:
+        uris = self._watched.setdefault(path.resolve(), set())
+        if uri not in uris:
+            uris.add(uri)
+            self._restart_watcher()
+
+    def _unwatch_uri(self, uri: str) -> None:
+        for path in [path for path, uris in self._watched.items() if uri in uris]:
+            uris = self._watched[path]
+            uris.discard(uri)
+            if not uris:
+                del self._watched[path]
+                self._restart_watcher()
+
+    async def _flush(self) -> None:
+        # Changes marked while notifying are picked up by the next round
+        while self._pending:
+            # Wait until no new change has arrived for a full debounce window,
+            # or until max_windows have passed
+            seen, windows = -1, 0
+            while seen != self._changes and windows < self.max_windows:
+                seen = self._changes
+                windows += 1
+                await asyncio.sleep(self.debounce)
+            uris, self._pending = self._pending, set()
+            for uri in sorted(uris):
+                notification = ResourceUpdatedNotification(
+                    params=ResourceUpdatedNotificationParams(uri=uri)
+                )
+                for session in self.subscribers(uri):
+                    try:
+                        await session.send_notification(notification)
+                    except Exception:
+                        logger.debug("Failed to notify a session of %s", uri, exc_info=True)
+
+    # File watching
+
+    def _restart_watcher(self) -> None:
+        if self._watch_stop is not None:
+            self._watch_stop.set()
+            self._watch_stop = None
+            self._watch_task = None
+        if not self._watched:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._watch_stop = asyncio.Event()
+        self._watch_task = loop.create_task(self._watch(dict(self._watched), self._watch_stop))
+
+    async def _watch(self, watched: dict[Path, set[str]], stop: asyncio.Event) -> None:
+        directories = sorted({str(path.parent) for path in watched})
+        try:
+            async for changes in awatch(
+                *directories,
+                stop_event=stop,
+                recursive=False,
+                debounce=max(int(self.debounce * 1000), 1),
+                step=min(max(int(self.debounce * 500), 1), 50),
+            ):
+                for _, changed in changes:
+                    for uri in watched.get(Path(changed).resolve(), ()):
+                        self.notify_updated(uri)
+        except Exception:
+            logger.warning("Resource file watcher stopped", exc_info=True)
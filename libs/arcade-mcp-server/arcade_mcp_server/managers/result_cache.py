@@ -0,0 +1,303 @@
+"""Opt-in result cache for read-only and idempotent tools.
+
+Agents frequently repeat the same lookup with identical arguments within a
+few seconds. A tool opts in by declaring read-only or idempotent behavior and
+a TTL in its metadata extras::
+
+    @tool(
+        metadata=ToolMetadata(
+            behavior=Behavior(read_only=True),
+            extras={"result_cache_ttl": 30},
+        )
+    )
+
+Results are keyed by tool FQN, toolkit version, user ID, and the canonical
+JSON form of the arguments. Typed, non-retryable errors (e.g. upstream 404s)
+are cached too, for at most the negative TTL. Storage is pluggable: the
+in-memory backend is a byte-bounded LRU, and the disk backend keeps entries
+in a directory so worker processes on one host share them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import struct
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from arcade_core.errors import ErrorKind
+from arcade_core.schema import ToolCallError, ToolCallOutput, ToolDefinition
+from pydantic import ValidationError
+
+logger = logging.getLogger("arcade.mcp.result_cache")
+
+RESULT_CACHE_TTL_EXTRA = "result_cache_ttl"
+"""ToolMetadata.extras key holding a tool's result cache TTL in seconds."""
+
+# Typed error kinds that are a deterministic answer for the given arguments,
+# as opposed to transient, auth-dependent, or untyped failures.
+_NEGATIVE_CACHEABLE_KINDS = frozenset({
+    ErrorKind.TOOL_RUNTIME_BAD_INPUT_VALUE,
+    ErrorKind.TOOL_RUNTIME_FATAL,
+    ErrorKind.UPSTREAM_RUNTIME_BAD_REQUEST,
+    ErrorKind.UPSTREAM_RUNTIME_NOT_FOUND,
+    ErrorKind.UPSTREAM_RUNTIME_VALIDATION_ERROR,
+})
+
+
+def get_result_cache_ttl(definition: ToolDefinition) -> float | None:
+    """Return the tool's result cache TTL, or None if it has not opted in.
+
+    A TTL is only honored for tools whose behavior is read-only or idempotent.
+    """
+    metadata = definition.metadata
+    if metadata is None or not metadata.extras:
+        return None
+    ttl = metadata.extras.get(RESULT_CACHE_TTL_EXTRA)
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0:
+        return None
+    behavior = metadata.behavior
+    if behavior is None or not (behavior.read_only or behavior.idempotent):
+        return None
+    return float(ttl)
+
+
+def is_negative_cacheable(error: ToolCallError) -> bool:
+    """Whether an error result may be served from the cache."""
+    return not error.can_retry and error.kind in _NEGATIVE_CACHEABLE_KINDS
+
+
+class ResultCacheBackend(ABC):
+    """Storage for serialized tool results."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the stored value, or None if absent or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value that expires after ``ttl`` seconds."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryResultCacheBackend(ResultCacheBackend):
+    """In-process LRU bounded by the total size of the stored values."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Total bytes currently stored."""
+        return self._size
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self._max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._size += len(value)
+        while self._size > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+class DiskResultCacheBackend(ResultCacheBackend):
+    """Directory-backed store shared by the worker processes on a host.
+
+    Each entry is one file: an 8-byte wall-clock expiry followed by the
+    value. Writes go through a temporary file and ``os.replace`` so readers
+    in other processes never see a partial entry. Reads refresh the file's
+    mtime, and once roughly a quarter of ``max_bytes`` has been written the
+    directory is pruned: expired entries first, then least recently used,
+    until it fits in ``max_bytes``.
+    """
+
+    _HEADER = struct.Struct(">d")
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int) -> None:
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._written_since_prune = 0
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self._max_bytes:
+            return
+        await asyncio.to_thread(self._write, key, value, ttl)
+        self._written_since_prune += len(value)
+        if self._written_since_prune >= self._max_bytes // 4:
+            self._written_since_prune = 0
+            await asyncio.to_thread(self._prune)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    def _path(self, key: str) -> Path:
+        return self._directory / key[:2] / key
+
+    def _read(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if len(data) < self._HEADER.size:
+            return None
+        (expires_at,) = self._HEADER.unpack_from(data)
+        if expires_at <= time.time():
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return data[self._HEADER.size :]
+
+    def _write(self, key: str, value: bytes, ttl: float) -> None:
+        path = self._path(key)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(self._HEADER.pack(time.time() + ttl) + value)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("Failed to write tool result cache entry %s", path, exc_info=True)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self._directory.glob("*/*"):
+            if path.name.startswith("."):
+                continue
+            with contextlib.suppress(OSError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _prune(self) -> None:
+        now = time.time()
+        live: list[tuple[float, int, Path]] = []
+        for mtime, size, path in self._entries():
+            try:
+                with path.open("rb") as f:
+                    header = f.read(self._HEADER.size)
+            except OSError:
+                continue
+            if len(header) < self._HEADER.size or self._HEADER.unpack(header)[0] <= now:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+            else:
+                live.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in live)
+        for _, size, path in sorted(live, key=lambda entry: entry[0]):
+            if total <= self._max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+            total -= size
+
+    def _clear(self) -> None:
+        for _, _, path in self._entries():
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+
+class ResultCache:
+    """Caches ``ToolCallOutput`` values for tools that opted in.
+
+    Args:
+        backend: Where serialized results are stored.
+        negative_ttl: Upper bound, in seconds, on how long a cacheable error
+            result is served from the cache.
+    """
+
+    def __init__(self, backend: ResultCacheBackend, negative_ttl: float = 5.0) -> None:
+        self._backend = backend
+        self._negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self) -> ResultCacheBackend:
+        return self._backend
+
+    @staticmethod
+    def make_key(
+        tool_fqn: str,
+        toolkit_version: str | None,
+        user_id: str | None,
+        arguments: dict[str, Any],
+    ) -> str:
+        """Build the cache key from the call's identity and canonicalized arguments."""
+        canonical = json.dumps(
+            [tool_fqn, toolkit_version, user_id, arguments],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    async def get(self, key: str) -> ToolCallOutput | None:
+        """Return the cached output for ``key``, if any."""
+        data = await self._backend.get(key)
+        if data is not None:
+            try:
+                output = ToolCallOutput.model_validate_json(data)
+            except ValidationError:
+                logger.warning("Discarding unreadable tool result cache entry")
+            else:
+                self.hits += 1
+                return output
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, output: ToolCallOutput, ttl: float) -> None:
+        """Store ``output`` if it is cacheable: a value, or a negative-cacheable error."""
+        if output.requires_authorization is not None:
+            return
+        if output.error is not None:
+            if not is_negative_cacheable(output.error):
+                return
+            ttl = min(ttl, self._negative_ttl)
+        if ttl <= 0:
+            return
+        await self._backend.set(key, output.model_dump_json().encode(), ttl)
@@ -0,0 +1,225 @@
+"""Offload large tool results to ephemeral resources.
+
+A tool result whose serialized form is larger than the configured threshold
+is not inlined into the ``tools/call`` response. It is written to a spill
+directory instead, and the response carries a truncated preview and a
+``resource_link`` to it. The client reads the result in chunks with
+``resources/read``: the link's URI returns the first chunk, and appending
+``?offset=<n>`` returns the chunk starting there. Each chunk's
+``_meta.arcade.next_offset`` is the offset of the next one, or null after the
+last.
+
+The spill directory is bounded: once it holds ``max_bytes``, the oldest
+results are evicted to make room. Results also expire after their TTL. A
+result identical to one still stored (e.g. a result-cache hit) reuses it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from arcade_mcp_server.exceptions import NotFoundError, ResourceError
+
+logger = logging.getLogger("arcade.mcp.result_offload")
+
+RESULT_URI_PREFIX = "arcade://results/"
+OFFSET_QUERY = "offset="
+
+
+@dataclass
+class SpilledResult:
+    """A tool result stored in the spill directory."""
+
+    uri: str
+    path: Path
+    size: int
+    mime_type: str
+    expires_at: float
+    digest: str
+
+
+class ResultSpillStore:
+    """Bounded, TTL-expiring local store for offloaded tool results.
+
+    Writes and reads do blocking file I/O; call them from a worker thread.
+
+    Args:
+        directory: Spill directory. Defaults to a private temporary directory
+            that is removed by :meth:`clear`.
+        max_bytes: Maximum total size of stored results.
+        ttl: Seconds a result stays readable.
+        chunk_size: Maximum bytes returned by one chunked read.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None,
+        max_bytes: int,
+        ttl: float,
+        chunk_size: int,
+    ) -> None:
+        self._configured_directory = Path(directory) if directory else None
+        self._directory: Path | None = None
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.chunk_size = chunk_size
+        self._entries: OrderedDict[str, SpilledResult] = OrderedDict()
+        # URI of the stored result for each content digest
+        self._by_digest: dict[str, str] = {}
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    def _ensure_directory(self) -> Path:
+        if self._directory is None:
+            if self._configured_directory is not None:
+                self._configured_directory.mkdir(parents=True, exist_ok=True)
+                self._directory = self._configured_directory
+            else:
+                self._directory = Path(tempfile.mkdtemp(prefix="arcade-results-"))
+        return self._directory
+
+    def spill(self, text: str, mime_type: str) -> SpilledResult | None:
+        """Store ``text``, returning None if it alone exceeds ``max_bytes``.
+
+        If the same text is still stored, its entry is returned with a fresh TTL
+        instead of writing it again.
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        with self._lock:
+            self._purge_expired()
+            uri = self._by_digest.get(digest)
+            if uri is not None:
+                existing = self._entries[uri]
+                existing.expires_at = time.monotonic() + self.ttl
+                self._entries.move_to_end(uri)
+                return existing
+
+        result_id = uuid.uuid4().hex
+        path = self._ensure_directory() / result_id
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        size = path.stat().st_size
+        if size > self.max_bytes:
+            path.unlink(missing_ok=True)
+            logger.warning(
+                "Tool result of %d bytes exceeds the spill limit of %d bytes; sending it inline",
+                size,
+                self.max_bytes,
+            )
+            return None
+
+        entry = SpilledResult(
+            uri=RESULT_URI_PREFIX + result_id,
+            path=path,
+            size=size,
+            mime_type=mime_type,
+            expires_at=time.monotonic() + self.ttl,
+            digest=digest,
+        )
+        with self._lock:
+            self._purge_expired()
+            while self._entries and self._total + size > self.max_bytes:
+                _, oldest = self._entries.popitem(last=False)
+                self._discard(oldest)
+            self._entries[entry.uri] = entry
+            self._by_digest[digest] = entry.uri
+            self._total += size
+        return entry
+
+    def read(self, uri: str) -> tuple[str, int, int | None]:
+        """Read one chunk of a stored result, from the URI's offset or the start.
+
+        A whole result is never decoded at once, so a read costs at most
+        ``chunk_size`` bytes however large the result is.
+
+        Returns:
+            The text, the byte offset it starts at, and the offset of the
+            next chunk (None when the text runs to the end of the result).
+        """
+        base, _, query = uri.partition("?")
+        with self._lock:
+            entry = self._entries.get(base)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[base]
+                self._discard(entry)
+                entry = None
+        if entry is None:
+            raise NotFoundError(f"Resource '{base}' not found or expired")
+
+        offset = 0
+        if query:
+            if not query.startswith(OFFSET_QUERY):
+                raise ResourceError(f"Unsupported query for '{base}': {query}")
+            try:
+                offset = int(query[len(OFFSET_QUERY) :])
+            except ValueError:
+                raise ResourceError(f"Invalid offset for '{base}': {query}") from None
+            if not 0 <= offset <= entry.size:
+                raise ResourceError(f"Offset {offset} is outside '{base}' ({entry.size} bytes)")
+
+        try:
+            with open(entry.path, "rb") as f:
+                f.seek(offset)
+                # Read a few bytes past the chunk so it can end on a character boundary
+                data = f.read(self.chunk_size + 3)
+        except FileNotFoundError:
+            raise NotFoundError(f"Resource '{base}' not found or expired") from None
+
+        if data and _is_continuation(data[0]):
+            raise ResourceError(f"Offset {offset} is not on a character boundary")
+        end = len(data)
+        if end > self.chunk_size:
+            end = self.chunk_size
+            while end > 0 and _is_continuation(data[end]):
+                end -= 1
+        next_offset = offset + end if offset + end < entry.size else None
+        return data[:end].decode("utf-8"), offset, next_offset
+
+    def remove(self, uri: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(uri, None)
+            if entry is not None:
+                self._discard(entry)
+
+    def clear(self) -> None:
+        """Remove every stored result (and the directory, if it is a private one)."""
+        with self._lock:
+            for entry in self._entries.values():
+                entry.path.unlink(missing_ok=True)
+            self._entries.clear()
+            self._by_digest.clear()
+            self._total = 0
+            if self._directory is not None and self._configured_directory is None:
+                shutil.rmtree(self._directory, ignore_errors=True)
+                self._directory = None
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        for uri in [uri for uri, entry in self._entries.items() if entry.expires_at <= now]:
+            self._discard(self._entries.pop(uri))
+
+    def _discard(self, entry: SpilledResult) -> None:
+        self._total -= entry.size
+        if self._by_digest.get(entry.digest) == entry.uri:
+            del self._by_digest[entry.digest]
+        with contextlib.suppress(OSError):
+            entry.path.unlink(missing_ok=True)
+
+
+def _is_continuation(byte: int) -> bool:
+    """Whether a byte is a UTF-8 continuation byte (not the start of a character)."""
+    return byte & 0xC0 == 0x80
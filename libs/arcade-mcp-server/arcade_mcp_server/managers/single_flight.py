@@ -0,0 +1,114 @@
+"""Single-flight coalescing of identical concurrent tool calls.
+
+When several agents fire the same ``tools/call`` (same tool, user, and
+arguments) at nearly the same moment, only the first one executes. The
+others attach to its in-flight execution and receive the same result. A
+tool opts in by declaring read-only or idempotent behavior and setting the
+``coalesce_calls`` flag in its metadata extras::
+
+    @tool(
+        metadata=ToolMetadata(
+            behavior=Behavior(read_only=True),
+            extras={"coalesce_calls": True},
+        )
+    )
+
+Tools that take a ``Context`` or stream their result are never coalesced.
+Progress, logs, elicitation, and streamed chunks go through the calling
+session's context, so callers that joined another's execution would see
+none of them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+from arcade_core.schema import ToolDefinition
+
+T = TypeVar("T")
+
+COALESCE_CALLS_EXTRA = "coalesce_calls"
+"""ToolMetadata.extras key that opts a tool into single-flight coalescing."""
+
+
+def is_coalescing_enabled(definition: ToolDefinition) -> bool:
+    """Whether concurrent identical calls to this tool may share one execution."""
+    if definition.input.tool_context_parameter_name is not None:
+        return False
+    metadata = definition.metadata
+    if metadata is None or not metadata.extras:
+        return False
+    if metadata.extras.get(COALESCE_CALLS_EXTRA) is not True:
+        return False
+    behavior = metadata.behavior
+    return behavior is not None and bool(behavior.read_only or behavior.idempotent)
+
+
+class _Flight(Generic[T]):
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[T]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Runs at most one execution per key at a time and shares its result.
+
+    The execution runs on its own ``asyncio.Task`` (created in the first
+    caller's context), so cancelling any one waiter, the first included,
+    does not cancel it while others still wait. It is cancelled only when
+    every waiter has gone away.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, _Flight[T]] = {}
+        self._coalesced_count = 0
+
+    @property
+    def coalesced_count(self) -> int:
+        """Number of calls that attached to an in-flight execution instead of running."""
+        return self._coalesced_count
+
+    @property
+    def in_flight_count(self) -> int:
+        """Number of distinct executions currently running."""
+        return len(self._flights)
+
+    async def run(self, key: str, execute: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Return the result for ``key``, starting ``execute`` only if none is in flight.
+
+        Returns the result and whether this call was coalesced onto an
+        execution started by another caller. Exceptions raised by the
+        execution propagate to every waiter.
+        """
+        flight = self._flights.get(key)
+        coalesced = flight is not None
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(execute()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(functools.partial(self._on_done, key, flight))
+        else:
+            self._coalesced_count += 1
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Nobody is waiting any more: stop the execution, and let the
+                # next caller start a fresh one instead of joining it.
+                flight.task.cancel()
+                self._forget(key, flight)
+        return result, coalesced
+
+    def _on_done(self, key: str, flight: _Flight[T], _task: asyncio.Task[T]) -> None:
+        self._forget(key, flight)
+
+    def _forget(self, key: str, flight: _Flight[T]) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
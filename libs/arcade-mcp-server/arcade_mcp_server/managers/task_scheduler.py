@@ -0,0 +1,179 @@
+"""Admission control for background task execution.
+
+Task-augmented ``tools/call`` requests run the tool body on a background
+``asyncio.Task`` that shares the event loop with synchronous traffic. The
+TaskScheduler sits in front of that background execution: it caps how many
+background tasks run at once (globally and per authorization context), holds
+the overflow in a bounded priority queue while the tasks stay in the
+``working`` status, and rejects new work once the queue is full.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+
+
+class TaskQueueFullError(Exception):
+    """The pending queue is at capacity; the task was not admitted."""
+
+
+class TaskSlot:
+    """Admission ticket for a single background task.
+
+    Obtained from :meth:`TaskScheduler.reserve`. The background coroutine
+    awaits :meth:`acquire` before running the tool body, and
+    :meth:`release` must be called exactly once the work is done (it is
+    idempotent, so wiring it to the ``asyncio.Task`` done-callback is safe
+    even when the coroutine never got to run).
+    """
+
+    __slots__ = ("_future", "_granted", "_released", "_scheduler", "context_key", "priority")
+
+    def __init__(self, scheduler: TaskScheduler, context_key: str, priority: int) -> None:
+        self._scheduler = scheduler
+        self.context_key = context_key
+        self.priority = priority
+        self._future: asyncio.Future[None] | None = None
+        self._granted = False
+        self._released = False
+
+    @property
+    def granted(self) -> bool:
+        """Whether this slot currently holds an execution permit."""
+        return self._granted
+
+    async def acquire(self) -> None:
+        """Wait until the scheduler grants this slot an execution permit.
+
+        Returns immediately if the slot was admitted straight away. If the
+        waiter is cancelled while still queued, the slot is withdrawn from
+        the queue before ``CancelledError`` propagates.
+        """
+        if self._granted or self._future is None:
+            return
+        try:
+            await self._future
+        except asyncio.CancelledError:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Give the permit back (or leave the queue) and admit waiting work."""
+        if self._released:
+            return
+        self._released = True
+        self._scheduler._release(self)
+
+
+class TaskScheduler:
+    """Concurrency limiter and bounded priority queue for background tasks.
+
+    Args:
+        max_concurrent: Maximum background tasks executing at once across
+            all authorization contexts.
+        max_concurrent_per_context: Maximum background tasks executing at
+            once for a single authorization context, so one client cannot
+            occupy every permit.
+        max_pending: Maximum tasks waiting for a permit. ``reserve`` raises
+            :class:`TaskQueueFullError` once this many are queued.
+
+    Queued tasks are admitted highest ``priority`` first, FIFO within a
+    priority. A task whose context is at its per-context limit does not
+    block queued tasks from other contexts.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 32,
+        max_concurrent_per_context: int = 8,
+        max_pending: int = 1000,
+    ) -> None:
+        self._max_concurrent = max_concurrent
+        self._max_per_context = max_concurrent_per_context
+        self._max_pending = max_pending
+
+        self._running = 0
+        self._running_by_context: dict[str, int] = {}
+
+        # Min-heap of (-priority, sequence, slot); sequence keeps FIFO order
+        # within a priority and makes entries totally ordered.
+        self._pending: list[tuple[int, int, TaskSlot]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def running_count(self) -> int:
+        """Number of background tasks currently holding a permit."""
+        return self._running
+
+    @property
+    def pending_count(self) -> int:
+        """Number of background tasks waiting for a permit."""
+        return len(self._pending)
+
+    def reserve(self, context_key: str, priority: int = 0) -> TaskSlot:
+        """Admit a task, either with an immediate permit or into the queue.
+
+        Must be called from within the running event loop.
+
+        Raises:
+            TaskQueueFullError: No permit is free and the queue is full.
+        """
+        slot = TaskSlot(self, context_key, priority)
+        if self._can_run(context_key):
+            self._grant(slot)
+            return slot
+
+        if len(self._pending) >= self._max_pending:
+            raise TaskQueueFullError(f"Background task queue is full ({self._max_pending} pending)")
+
+        slot._future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._pending, (-priority, next(self._sequence), slot))
+        return slot
+
+    def _can_run(self, context_key: str) -> bool:
+        return (
+            self._running < self._max_concurrent
+            and self._running_by_context.get(context_key, 0) < self._max_per_context
+        )
+
+    def _grant(self, slot: TaskSlot) -> None:
+        slot._granted = True
+        self._running += 1
+        self._running_by_context[slot.context_key] = (
+            self._running_by_context.get(slot.context_key, 0) + 1
+        )
+        if slot._future is not None and not slot._future.done():
+            slot._future.set_result(None)
+
+    def _release(self, slot: TaskSlot) -> None:
+        if slot._granted:
+            slot._granted = False
+            self._running -= 1
+            remaining = self._running_by_context.get(slot.context_key, 1) - 1
+            if remaining > 0:
+                self._running_by_context[slot.context_key] = remaining
+            else:
+                self._running_by_context.pop(slot.context_key, None)
+        else:
+            # Withdrawn while still queued (cancelled or never started).
+            self._pending = [entry for entry in self._pending if entry[2] is not slot]
+            heapq.heapify(self._pending)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Hand free permits to the highest-priority eligible queued tasks."""
+        blocked: list[tuple[int, int, TaskSlot]] = []
+        while self._pending and self._running < self._max_concurrent:
+            entry = heapq.heappop(self._pending)
+            slot = entry[2]
+            if slot._future is not None and slot._future.done():
+                # Waiter was cancelled before its release() ran; drop it.
+                continue
+            if self._can_run(slot.context_key):
+                self._grant(slot)
+            else:
+                blocked.append(entry)
+        for entry in blocked:
+            heapq.heappush(self._pending, entry)
@@ -7,13 +7,18 @@ Async-safe tool management with pre-converted MCPTool DTOs and executable materi
 from __future__ import annotations
 
 import logging
+import os
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any, TypedDict
 
 from arcade_core.catalog import MaterializedTool, ToolCatalog
+from arcade_core.schema import ToolSecretItem
 
 from arcade_mcp_server.convert import create_mcp_tool
 from arcade_mcp_server.exceptions import NotFoundError
 from arcade_mcp_server.managers.base import ComponentManager
+from arcade_mcp_server.settings import is_reserved_tool_secret_key
 from arcade_mcp_server.types import MCPTool
 
 logger = logging.getLogger("arcade.mcp.managers.tool")
@@ -26,13 +31,60 @@ class ManagedTool(TypedDict):
 
 Key = str  # fully qualified tool name
 
+_NO_SECRETS: Mapping[str, Any] = MappingProxyType({})
+
+
+def resolve_secret_bindings(
+    tool: MaterializedTool, tool_secrets: Mapping[str, Any]
+) -> Mapping[str, str]:
+    """Resolve the secrets a tool declares into an immutable ``key -> value`` mapping.
+
+    Values come from ``tool_secrets`` (the tool environment pool), falling back
+    to the process environment. Undeclared secrets are never included, nor are
+    reserved framework credentials, which are withheld from tool code.
+    """
+    requirements = tool.definition.requirements
+    if not requirements or not requirements.secrets:
+        return _NO_SECRETS
+
+    bindings: dict[str, str] = {}
+    for secret in requirements.secrets:
+        if is_reserved_tool_secret_key(secret.key):
+            # Framework control-plane credentials authenticate the
+            # server/worker to Arcade and must never be handed to tool
+            # code, regardless of whether they live in the tool
+            # environment pool or the raw process environment.
+            logger.warning(
+                f"Tool '{tool.definition.name}' requested reserved secret "
+                f"'{secret.key}'; refusing to expose it to tool code."
+            )
+            continue
+        if secret.key in tool_secrets:
+            bindings[secret.key] = tool_secrets[secret.key]
+        elif secret.key in os.environ:
+            bindings[secret.key] = os.environ[secret.key]
+    return MappingProxyType(bindings)
+
 
 class ToolManager(ComponentManager[Key, ManagedTool]):
-    """Tool manager storing both DTO and materialized artifacts."""
+    """Tool manager storing both DTO and materialized artifacts.
+
+    Each tool's secret bindings are resolved once, when the tool is loaded,
+    against the pool returned by ``secret_source``. They are re-resolved only
+    when ``secret_source`` starts returning a different mapping object (e.g.
+    the server's settings were replaced) or ``refresh_secret_bindings`` is
+    called after an in-place change.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, secret_source: Callable[[], Mapping[str, Any]] | None = None) -> None:
         super().__init__("tool")
         self._sanitized_to_key: dict[str, str] = {}
+        self._secret_source = secret_source
+        self._bound_secret_pool: Mapping[str, Any] | None = None
+        # fully qualified name -> (tool the bindings were resolved for, bindings)
+        self._secret_bindings: dict[Key, tuple[MaterializedTool, Mapping[str, str]]] = {}
+        # fully qualified name -> ToolSecretItems built from the bindings
+        self._secret_items: dict[Key, tuple[ToolSecretItem, ...]] = {}
 
     @staticmethod
     def _sanitize_name(name: str) -> str:
@@ -46,12 +98,69 @@ class ToolManager(ComponentManager[Key, ManagedTool]):
         """
         return create_mcp_tool(materialized_tool)
 
+    def _secret_pool(self) -> Mapping[str, Any]:
+        """Return the current secret pool, re-resolving all bindings if it changed."""
+        pool = self._secret_source() if self._secret_source is not None else _NO_SECRETS
+        if pool is not self._bound_secret_pool:
+            self._bound_secret_pool = pool
+            for key, (tool, _bindings) in list(self._secret_bindings.items()):
+                self._store_bindings(key, tool, resolve_secret_bindings(tool, pool))
+        return pool
+
+    def _store_bindings(
+        self, key: Key, tool: MaterializedTool, bindings: Mapping[str, str]
+    ) -> None:
+        self._secret_bindings[key] = (tool, bindings)
+        self._secret_items[key] = tuple(
+            ToolSecretItem(key=name, value=value) for name, value in bindings.items()
+        )
+
+    def _bind_secrets(self, key: Key, tool: MaterializedTool) -> None:
+        self._store_bindings(key, tool, resolve_secret_bindings(tool, self._secret_pool()))
+
+    def refresh_secret_bindings(self) -> None:
+        """Re-resolve every tool's secret bindings.
+
+        Only needed after mutating the secret pool in place; replacing it is
+        picked up automatically.
+        """
+        self._bound_secret_pool = None
+        self._secret_pool()
+
+    def get_secret_bindings(self, tool: MaterializedTool) -> Mapping[str, str]:
+        """Return the pre-resolved secret bindings for ``tool``.
+
+        Tools that were not loaded through this manager are resolved on demand.
+        """
+        pool = self._secret_pool()
+        entry = self._secret_bindings.get(tool.definition.fully_qualified_name)
+        if entry is not None and entry[0] is tool:
+            return entry[1]
+        return resolve_secret_bindings(tool, pool)
+
+    def get_secret_items(self, tool: MaterializedTool) -> tuple[ToolSecretItem, ...]:
+        """Return ``tool``'s secret bindings as ``ToolSecretItem`` objects.
+
+        The items are shared across calls and must be treated as read-only;
+        ``ToolContext.set_secret`` replaces items rather than mutating them.
+        """
+        pool = self._secret_pool()
+        key = tool.definition.fully_qualified_name
+        entry = self._secret_bindings.get(key)
+        if entry is not None and entry[0] is tool:
+            return self._secret_items[key]
+        return tuple(
+            ToolSecretItem(key=name, value=value)
+            for name, value in resolve_secret_bindings(tool, pool).items()
+        )
+
     async def load_from_catalog(self, catalog: ToolCatalog) -> None:
         pairs: list[tuple[Key, ManagedTool]] = []
         for t in catalog:
             fq = t.definition.fully_qualified_name
             pairs.append((fq, {"dto": self._to_dto(t), "materialized": t}))
             self._sanitized_to_key[self._sanitize_name(fq)] = fq
+            self._bind_secrets(fq, t)
         await self.registry.bulk_load(pairs)
 
     async def list_tools(self) -> list[MCPTool]:
@@ -75,11 +184,13 @@ class ToolManager(ComponentManager[Key, ManagedTool]):
         key = tool.definition.fully_qualified_name
         await self.registry.upsert(key, {"dto": self._to_dto(tool), "materialized": tool})
         self._sanitized_to_key[self._sanitize_name(key)] = key
+        self._bind_secrets(key, tool)
 
     async def update_tool(self, tool: MaterializedTool) -> None:
         key = tool.definition.fully_qualified_name
         await self.registry.upsert(key, {"dto": self._to_dto(tool), "materialized": tool})
         self._sanitized_to_key[self._sanitize_name(key)] = key
+        self._bind_secrets(key, tool)
 
     async def remove_tool(self, name: str) -> MaterializedTool:
         # Accept either exact or sanitized name
@@ -94,6 +205,8 @@ class ToolManager(ComponentManager[Key, ManagedTool]):
         sanitized = self._sanitize_name(key)
         if sanitized in self._sanitized_to_key:
             del self._sanitized_to_key[sanitized]
+        self._secret_bindings.pop(key, None)
+        self._secret_items.pop(key, None)
         return rec["materialized"]
 
     async def apply_meta_extensions(self, extensions: dict[str, dict[str, Any]]) -> None:
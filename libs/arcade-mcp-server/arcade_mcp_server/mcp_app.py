@@ -11,6 +11,7 @@ import os
 import re
 import subprocess
 import sys
+from contextlib import AbstractAsyncContextManager
 from pathlib import Path
 from types import ModuleType
 from typing import Any, Callable, Literal, ParamSpec, TypeVar, cast
@@ -168,7 +169,7 @@ class MCPApp:
         # Public handle to the MCPServer (set by caller for runtime ops)
         self.server: MCPServer | None = None
 
-        server_settings_kwargs = {
+        server_settings_kwargs: dict[str, Any] = {
             "name": self._name,
             "version": self._version,
             "title": self.title,
@@ -766,6 +767,12 @@ class _ToolsAPI:
             raise ServerError("No server bound to app. Set app.server to use runtime tools API.")
         return await self._app.server.tools.list_tools()
 
+    def batch(self) -> AbstractAsyncContextManager[None]:
+        """Group tool changes so clients get one ``tools/list_changed``."""
+        if self._app.server is None:
+            raise ServerError("No server bound to app. Set app.server to use runtime tools API.")
+        return self._app.server.tools.batch()
+
 
 class _PromptsAPI:
     """Unified prompts API for MCPApp (runtime)."""
@@ -788,6 +795,12 @@ class _PromptsAPI:
             raise ServerError("No server bound to app. Set app.server to use runtime prompts API.")
         return await self._app.server.prompts.list_prompts()
 
+    def batch(self) -> AbstractAsyncContextManager[None]:
+        """Group prompt changes so clients get one ``prompts/list_changed``."""
+        if self._app.server is None:
+            raise ServerError("No server bound to app. Set app.server to use runtime prompts API.")
+        return self._app.server.prompts.batch()
+
 
 class _ResourcesAPI:
     """Unified resources API for MCPApp (runtime)."""
@@ -815,3 +828,11 @@ class _ResourcesAPI:
                 "No server bound to app. Set app.server to use runtime resources API."
             )
         return await self._app.server.resources.list_resources()
+
+    def batch(self) -> AbstractAsyncContextManager[None]:
+        """Group resource changes so clients get one ``resources/list_changed``."""
+        if self._app.server is None:
+            raise ServerError(
+                "No server bound to app. Set app.server to use runtime resources API."
+            )
+        return self._app.server.resources.batch()
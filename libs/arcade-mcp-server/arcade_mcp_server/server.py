@@ -16,6 +16,8 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import inspect
+import json
 import logging
 import os
 from typing import Any, Callable, ClassVar, cast
@@ -23,13 +25,20 @@ from urllib.parse import quote, urlparse, urlunparse
 
 from arcade_core.auth_tokens import get_valid_access_token
 from arcade_core.catalog import MaterializedTool, ToolCatalog
-from arcade_core.constants import PROD_COORDINATOR_HOST, PROD_ENGINE_HOST
+from arcade_core.constants import ARCADE_CONFIG_PATH, PROD_COORDINATOR_HOST, PROD_ENGINE_HOST
 from arcade_core.errors import ErrorKind, ToolInputError
 from arcade_core.executor import ToolExecutor
 from arcade_core.log_extras import build_tool_error_log_extra, build_tool_error_span_attributes
 from arcade_core.network.org_transport import build_org_scoped_async_http_client
-from arcade_core.schema import ToolAuthorizationContext, ToolCallError, ToolContext
+from arcade_core.schema import (
+    ToolAuthorizationContext,
+    ToolCallError,
+    ToolCallOutput,
+    ToolContext,
+    ToolDefinition,
+)
 from arcade_core.schema import ToolAuthRequirement as CoreToolAuthRequirement
+from arcade_core.streaming import ChunkCallback
 from arcadepy import ArcadeError, AsyncArcade
 from arcadepy.types.auth_authorize_params import AuthRequirement, AuthRequirementOauth2
 from opentelemetry import trace
@@ -37,14 +46,35 @@ from pydantic import ValidationError
 
 from arcade_mcp_server._debug_exposure import augment_error_message_for_debug
 from arcade_mcp_server.context import Context, get_current_model_context, set_current_model_context
-from arcade_mcp_server.convert import convert_content_to_structured_content, convert_to_mcp_content
+from arcade_mcp_server.convert import (
+    ResultEncoding,
+    convert_to_mcp_content,
+    encode_tool_result,
+    get_result_encoding,
+    has_output_schema,
+)
 from arcade_mcp_server.exceptions import (
     IncompleteAuthContextError,
     NotFoundError,
     ToolRuntimeError,
 )
 from arcade_mcp_server.lifespan import LifespanManager
-from arcade_mcp_server.managers import PromptManager, ResourceManager, TaskManager, ToolManager
+from arcade_mcp_server.managers import (
+    PromptManager,
+    ResourceManager,
+    TaskManager,
+    TaskScheduler,
+    ToolManager,
+)
+from arcade_mcp_server.managers.result_cache import (
+    DiskResultCacheBackend,
+    MemoryResultCacheBackend,
+    ResultCache,
+    ResultCacheBackend,
+    get_result_cache_ttl,
+)
+from arcade_mcp_server.managers.result_offload import ResultSpillStore
+from arcade_mcp_server.managers.single_flight import SingleFlight, is_coalescing_enabled
 from arcade_mcp_server.managers.task_manager import (
     InvalidCursorError,
     InvalidTaskStateError,
@@ -52,6 +82,7 @@ from arcade_mcp_server.managers.task_manager import (
 from arcade_mcp_server.managers.task_manager import (
     NotFoundError as TaskNotFoundError,
 )
+from arcade_mcp_server.managers.task_scheduler import TaskQueueFullError, TaskSlot
 from arcade_mcp_server.middleware import (
     CallNext,
     ErrorHandlingMiddleware,
@@ -68,7 +99,12 @@ from arcade_mcp_server.resource_server.base import ResourceOwner
 from arcade_mcp_server.resource_server.headers import (
     build_insufficient_scope_www_authenticate,
 )
-from arcade_mcp_server.session import InitializationState, NotificationManager, ServerSession
+from arcade_mcp_server.session import (
+    InitializationState,
+    ListChangedKind,
+    NotificationManager,
+    ServerSession,
+)
 from arcade_mcp_server.settings import (
     MCPSettings,
     ServerSettings,
@@ -106,6 +142,7 @@ from arcade_mcp_server.types import (
     ListTasksResult,
     ListToolsRequest,
     ListToolsResult,
+    MCPContent,
     MCPMessage,
     MCPTool,
     PingRequest,
@@ -113,6 +150,7 @@ from arcade_mcp_server.types import (
     ReadResourceRequest,
     ReadResourceResult,
     Resource,
+    ResourceLink,
     ResourceTemplate,
     ServerCapabilities,
     SetLevelRequest,
@@ -133,6 +171,10 @@ logger = logging.getLogger("arcade.mcp")
 # The HTTP transport inspects this code to convert the response to HTTP 403.
 INSUFFICIENT_SCOPE_ERROR_CODE = -32043
 
+# Server-defined JSON-RPC error code for a task-augmented tools/call that was
+# rejected because the background task queue is full.
+TASK_QUEUE_FULL_ERROR_CODE = -32044
+
 
 def _build_arcade_error_meta(error: ToolCallError) -> dict[str, Any]:
     """Build the ``_meta.arcade`` payload that accompanies a tool error
@@ -268,6 +310,11 @@ class MCPServer:
         """Access the PromptManager for runtime prompt operations."""
         return self._prompt_manager
 
+    @property
+    def coalesced_tool_calls(self) -> int:
+        """Number of tool calls that joined an identical in-flight call instead of running."""
+        return self._single_flight.coalesced_count
+
     def __init__(
         self,
         catalog: ToolCatalog,
@@ -357,10 +404,21 @@ class MCPServer:
         )
 
         # Component managers (passive)
-        self._tool_manager = ToolManager()
-        self._resource_manager = ResourceManager()
+        self._tool_manager = ToolManager(secret_source=lambda: self.settings.tool_secrets())
+        self._resource_manager = ResourceManager(
+            update_debounce=self.settings.notification.default_debounce_ms / 1000,
+            watch_files=self.settings.notification.watch_resource_files,
+        )
         self._prompt_manager = PromptManager()
         self._task_manager = TaskManager()
+        self._task_scheduler = TaskScheduler(
+            max_concurrent=self.settings.task.max_concurrent,
+            max_concurrent_per_context=self.settings.task.max_concurrent_per_context,
+            max_pending=self.settings.task.max_pending,
+        )
+        self._result_cache = self._create_result_cache()
+        self._result_spill = self._create_result_spill()
+        self._single_flight: SingleFlight[ToolCallOutput] = SingleFlight()
 
         # Build-time resources to load on start
         self._initial_resources = initial_resources or []
@@ -368,25 +426,15 @@ class MCPServer:
         self._tool_meta_extensions = tool_meta_extensions or {}
 
         # Centralized notifications
-        self.notification_manager = NotificationManager(self)
-
-        # Subscribe to changes -> broadcast
-        self._tool_manager.subscribe(
-            lambda *_: asyncio.get_event_loop().create_task(  # type: ignore[arg-type]
-                self.notification_manager.notify_tool_list_changed()
-            )
-        )
-        self._resource_manager.subscribe(
-            lambda *_: asyncio.get_event_loop().create_task(  # type: ignore[arg-type]
-                self.notification_manager.notify_resource_list_changed()
-            )
-        )
-        self._prompt_manager.subscribe(
-            lambda *_: asyncio.get_event_loop().create_task(  # type: ignore[arg-type]
-                self.notification_manager.notify_prompt_list_changed()
-            )
+        self.notification_manager = NotificationManager(
+            self, debounce=self.settings.notification.default_debounce_ms / 1000
         )
 
+        # Subscribe to changes -> broadcast (debounced by the notification manager)
+        self._tool_manager.subscribe(lambda *_: self._list_changed("tools"))
+        self._resource_manager.subscribe(lambda *_: self._list_changed("resources"))
+        self._prompt_manager.subscribe(lambda *_: self._list_changed("prompts"))
+
         # Defer loading tools from catalog to server start to ensure readiness
         self._initial_catalog = catalog
 
@@ -558,6 +606,11 @@ class MCPServer:
         for mw in self.middleware:
             self._extra_capabilities.update(mw.get_capabilities())
 
+    def _list_changed(self, kind: ListChangedKind) -> None:
+        """Registry subscriber: queue a list_changed notification."""
+        with contextlib.suppress(RuntimeError):  # no running event loop
+            self.notification_manager.list_changed(kind)
+
     def _register_handlers(self) -> dict[str, Callable]:
         """Register method handlers."""
         return {
@@ -568,6 +621,8 @@ class MCPServer:
             "resources/list": self._handle_list_resources,
             "resources/templates/list": self._handle_list_resource_templates,
             "resources/read": self._handle_read_resource,
+            "resources/subscribe": self._handle_subscribe_resource,
+            "resources/unsubscribe": self._handle_unsubscribe_resource,
             "prompts/list": self._handle_list_prompts,
             "prompts/get": self._handle_get_prompt,
             "logging/setLevel": self._handle_set_log_level,
@@ -623,10 +678,13 @@ class MCPServer:
             # Sessions should handle their own cleanup
             pass
 
+        await self.notification_manager.close()
         await self._task_manager.stop()
         await self._prompt_manager.stop()
         await self._resource_manager.stop()
         await self._tool_manager.stop()
+        if self._result_spill is not None:
+            await asyncio.to_thread(self._result_spill.clear)
 
         # Stop lifespan
         await self.lifespan_manager.shutdown()
@@ -840,6 +898,9 @@ class MCPServer:
                 )
             )
 
+            if session and msg_id is not None:
+                context.set_request_id(str(msg_id))
+
             # Set as current model context
             token = set_current_model_context(context)
 
@@ -1137,23 +1198,12 @@ class MCPServer:
         """Create a tool context from a tool definition and session"""
         tool_context = ToolContext()
 
-        # secrets
-        if tool.definition.requirements and tool.definition.requirements.secrets:
-            for secret in tool.definition.requirements.secrets:
-                if is_reserved_tool_secret_key(secret.key):
-                    # Framework control-plane credentials authenticate the
-                    # server/worker to Arcade and must never be handed to tool
-                    # code, regardless of whether they live in the tool
-                    # environment pool or the raw process environment.
-                    logger.warning(
-                        f"Tool '{tool.definition.name}' requested reserved secret "
-                        f"'{secret.key}'; refusing to expose it to tool code."
-                    )
-                    continue
-                if secret.key in self.settings.tool_secrets():
-                    tool_context.set_secret(secret.key, self.settings.tool_secrets()[secret.key])
-                elif secret.key in os.environ:
-                    tool_context.set_secret(secret.key, os.environ[secret.key])
+        # secrets: resolved once per tool by the ToolManager (reserved
+        # framework credentials are already filtered out there). The list is
+        # fresh per call; the items themselves are shared and read-only.
+        secret_items = self._tool_manager.get_secret_items(tool)
+        if secret_items:
+            tool_context.secrets = list(secret_items)
 
         tool_context.user_id = self._select_user_id(session)
 
@@ -1236,6 +1286,170 @@ class MCPServer:
                         f"Tool '{tool_name}' declares secret(s) '{secret_list}' which is/are not set. It will return an error if called."
                     )
 
+    def _create_result_cache(self) -> ResultCache | None:
+        """Build the tool result cache from settings, or None when disabled."""
+        cache_settings = self.settings.result_cache
+        if not cache_settings.enabled:
+            return None
+        backend: ResultCacheBackend
+        if cache_settings.backend == "disk":
+            directory = cache_settings.directory or os.path.join(
+                ARCADE_CONFIG_PATH, "cache", "tool_results"
+            )
+            backend = DiskResultCacheBackend(directory, cache_settings.max_bytes)
+        else:
+            backend = MemoryResultCacheBackend(cache_settings.max_bytes)
+        return ResultCache(backend, negative_ttl=cache_settings.negative_ttl)
+
+    def _create_result_spill(self) -> ResultSpillStore | None:
+        """Build the spill store for offloaded results, or None when disabled."""
+        offload_settings = self.settings.result_offload
+        if not offload_settings.enabled:
+            return None
+        return ResultSpillStore(
+            offload_settings.directory,
+            max_bytes=offload_settings.max_bytes,
+            ttl=offload_settings.ttl,
+            chunk_size=offload_settings.chunk_size,
+        )
+
+    async def _encode_tool_result(
+        self,
+        tool: MaterializedTool,
+        value: Any,
+    ) -> tuple[list[MCPContent], dict[str, Any] | None]:
+        """Split a tool's return value into ``content`` and ``structuredContent``.
+
+        The tool's ``result_encoding`` extra overrides the server setting.
+        Every supported protocol version has structuredContent, so the
+        encoding does not depend on the session. Results over the offload threshold are
+        replaced by a preview and a resource link, except for tools that
+        declare an ``outputSchema``: the spec requires those to send
+        structuredContent. A tool with a return type opts in to offloading
+        with the ``result_offload`` extra, which drops its ``outputSchema``.
+        """
+        definition = tool.definition
+        requires_structured = has_output_schema(definition)
+        serialized: str | None = None
+        if self._result_spill is not None and not requires_structured:
+            if isinstance(value, str):
+                serialized = value
+            elif isinstance(value, (dict, list)):
+                with contextlib.suppress(TypeError, ValueError):
+                    serialized = json.dumps(value, ensure_ascii=False)
+            if serialized is not None and len(serialized) > self.settings.result_offload.threshold:
+                mime_type = "text/plain" if isinstance(value, str) else "application/json"
+                offloaded = await self._offload_tool_result(definition, serialized, mime_type)
+                if offloaded is not None:
+                    return offloaded, None
+
+        encoding: ResultEncoding = get_result_encoding(
+            definition, self.settings.server.result_encoding
+        )
+        return encode_tool_result(
+            value, encoding, requires_structured=requires_structured, serialized=serialized
+        )
+
+    async def _offload_tool_result(
+        self, definition: ToolDefinition, text: str, mime_type: str
+    ) -> list[MCPContent] | None:
+        """Spill a large result and return its preview and resource link content."""
+        spill = cast(ResultSpillStore, self._result_spill)
+        entry = await asyncio.to_thread(spill.spill, text, mime_type)
+        if entry is None:
+            return None
+
+        async def read(uri: str) -> list[TextResourceContents]:
+            chunk, offset, next_offset = await asyncio.to_thread(spill.read, uri)
+            meta = {"arcade": {"offset": offset, "next_offset": next_offset, "size": entry.size}}
+            return [TextResourceContents(uri=uri, mimeType=mime_type, text=chunk, _meta=meta)]
+
+        name = f"{definition.fully_qualified_name} result"
+        await self._resource_manager.add_ephemeral_resource(
+            Resource(uri=entry.uri, name=name, mimeType=mime_type, size=entry.size),
+            read,
+            spill.ttl,
+        )
+        preview_chars = self.settings.result_offload.preview_chars
+        preview = (
+            f"{text[:preview_chars]}...\n\n"
+            f"[Result truncated: {entry.size} bytes. Read {entry.uri} with resources/read "
+            "for the first chunk, then append ?offset=<_meta.arcade.next_offset> for each "
+            "next one.]"
+        )
+        return [
+            TextContent(type="text", text=preview),
+            ResourceLink(
+                uri=entry.uri,
+                name=name,
+                mimeType=mime_type,
+                size=entry.size,
+                _meta={"arcade": {"chunk_size": spill.chunk_size, "ttl": spill.ttl}},
+            ),
+        ]
+
+    async def _run_tool(
+        self,
+        tool: MaterializedTool,
+        context: ToolContext,
+        tool_context: ToolContext,
+        arguments: dict[str, Any],
+    ) -> tuple[ToolCallOutput, bool]:
+        """Run a tool via ToolExecutor, applying the optimizations it opted into.
+
+        Tools can opt into the result cache (the returned flag says whether
+        the output came from it) and into single-flight coalescing, where an
+        identical call already in flight is joined instead of re-executed.
+        Callers run this only after scope, transport, and requirement checks
+        pass, so neither path bypasses authorization.
+        """
+        definition = tool.definition
+        ttl = get_result_cache_ttl(definition) if self._result_cache is not None else None
+        streaming = inspect.isasyncgenfunction(tool.tool)
+        coalesce = is_coalescing_enabled(definition) and not streaming
+
+        call_key = ""
+        if ttl is not None or coalesce:
+            call_key = ResultCache.make_key(
+                str(definition.get_fully_qualified_name()),
+                definition.toolkit.version,
+                tool_context.user_id,
+                arguments,
+            )
+        if self._result_cache is not None and ttl is not None:
+            cached = await self._result_cache.get(call_key)
+            if cached is not None:
+                return cached, True
+
+        on_chunk: ChunkCallback | None = None
+        if isinstance(context, Context) and streaming:
+            progress = context.progress
+            sent = 0
+
+            async def on_chunk(chunk: Any) -> None:
+                nonlocal sent
+                sent += 1
+                await progress.partial(chunk, sent)
+
+        async def execute() -> ToolCallOutput:
+            result = await ToolExecutor.run(
+                func=tool.tool,
+                definition=definition,
+                input_model=tool.input_model,
+                output_model=tool.output_model,
+                context=context,
+                _on_chunk=on_chunk,
+                **arguments,
+            )
+            if self._result_cache is not None and ttl is not None:
+                await self._result_cache.put(call_key, result, ttl)
+            return result
+
+        if coalesce:
+            result, _ = await self._single_flight.run(call_key, execute)
+            return result, False
+        return await execute(), False
+
     async def _handle_call_tool(
         self,
         message: CallToolRequest,
@@ -1502,7 +1716,34 @@ class MCPServer:
                 ttl_input = task_metadata.get("ttl")
 
                 context_key = self._get_task_context_key(session, resource_owner)
-                task = await self._task_manager.create_task(context_key=context_key, ttl=ttl_input)
+
+                # Admission control: reserve an execution slot before the
+                # task record exists so a full queue is a clean rejection
+                # rather than a task that never leaves ``working``. The
+                # optional ``priority`` hint is advisory; anything other
+                # than an integer is ignored.
+                priority = task_metadata.get("priority", 0)
+                if not isinstance(priority, int) or isinstance(priority, bool):
+                    priority = 0
+                try:
+                    slot = self._task_scheduler.reserve(context_key, priority=priority)
+                except TaskQueueFullError:
+                    self._tracker.track_tool_call(False, "task queue full")
+                    return JSONRPCError(
+                        id=message.id,
+                        error={
+                            "code": TASK_QUEUE_FULL_ERROR_CODE,
+                            "message": "Task queue is full; retry later",
+                        },
+                    )
+
+                try:
+                    task = await self._task_manager.create_task(
+                        context_key=context_key, ttl=ttl_input
+                    )
+                except BaseException:
+                    slot.release()
+                    raise
 
                 # Preserve the client-provided progressToken so background
                 # task notifications remain correlated with the initiating call.
@@ -1522,8 +1763,12 @@ class MCPServer:
                         session,
                         resource_owner,
                         tool_context,
+                        slot=slot,
                     )
                 )
+                # Release on completion rather than inside the coroutine so the
+                # slot is returned even if the task is cancelled before it runs.
+                bg.add_done_callback(lambda _bg: slot.release())
                 self._task_manager.track_background_task(task.taskId, bg)
 
                 # Build result with _meta.io.modelcontextprotocol/related-task
@@ -1560,13 +1805,11 @@ class MCPServer:
 
             try:
                 # Execute tool
-                result = await ToolExecutor.run(
-                    func=tool.tool,
-                    definition=tool.definition,
-                    input_model=tool.input_model,
-                    output_model=tool.output_model,
-                    context=mctx if mctx is not None else tool_context,
-                    **input_params,
+                result, from_cache = await self._run_tool(
+                    tool,
+                    mctx if mctx is not None else tool_context,
+                    tool_context,
+                    input_params,
                 )
             finally:
                 # Restore the original tool context to prevent context leakage to parent tools in the case of tool chaining.
@@ -1575,10 +1818,7 @@ class MCPServer:
 
             # Convert result
             if result.value is not None:
-                content = convert_to_mcp_content(result.value)
-
-                # structuredContent should be the raw result value as a JSON object
-                structured_content = convert_content_to_structured_content(result.value)
+                content, structured_content = await self._encode_tool_result(tool, result.value)
 
                 self._tracker.track_tool_call(True)
                 return JSONRPCResponse(
@@ -1587,6 +1827,7 @@ class MCPServer:
                         content=content,
                         structuredContent=structured_content,
                         isError=False,
+                        **({"_meta": {"arcade": {"cached": True}}} if from_cache else {}),
                     ),
                 )
             else:
@@ -1635,6 +1876,8 @@ class MCPServer:
                 error_meta: dict[str, Any] | None = (
                     {"arcade": _build_arcade_error_meta(error)} if error is not None else None
                 )
+                if error_meta is not None and from_cache:
+                    error_meta["arcade"]["cached"] = True
                 call_tool_result = (
                     CallToolResult(
                         content=content,
@@ -2131,6 +2374,42 @@ class MCPServer:
                 },
             )
 
+    async def _handle_subscribe_resource(
+        self,
+        message: SubscribeRequest,
+        session: ServerSession | None = None,
+    ) -> JSONRPCResponse[Any] | JSONRPCError:
+        """Handle resources/subscribe request."""
+        if session is None:
+            return JSONRPCError(
+                id=message.id,
+                error={
+                    "code": INVALID_REQUEST,
+                    "message": "resources/subscribe requires a session",
+                },
+            )
+        try:
+            await self._resource_manager.subscribe_resource(message.params.uri, session)
+        except NotFoundError:
+            return JSONRPCError(
+                id=message.id,
+                error={
+                    "code": -32002,
+                    "message": f"✗ Resource not found: {message.params.uri}",
+                },
+            )
+        return JSONRPCResponse(id=message.id, result={})
+
+    async def _handle_unsubscribe_resource(
+        self,
+        message: UnsubscribeRequest,
+        session: ServerSession | None = None,
+    ) -> JSONRPCResponse[Any] | JSONRPCError:
+        """Handle resources/unsubscribe request."""
+        if session is not None:
+            await self._resource_manager.unsubscribe_resource(message.params.uri, session)
+        return JSONRPCResponse(id=message.id, result={})
+
     async def _handle_list_prompts(
         self,
         message: ListPromptsRequest,
@@ -2540,6 +2819,7 @@ class MCPServer:
         session: ServerSession,
         resource_owner: ResourceOwner | None,
         tool_context: ToolContext,
+        slot: TaskSlot | None = None,
     ) -> None:
         """Execute a tool in the background for task-augmented tools/call.
 
@@ -2548,6 +2828,10 @@ class MCPServer:
         against the *caller's* credentials before the task record is created.
         The background path MUST use this context directly — creating a fresh
         one here would silently skip scope/requirement validation.
+
+        When ``slot`` is given, the tool body waits for the scheduler to grant
+        it an execution permit; the task stays ``working`` while queued. The
+        caller owns releasing the slot.
         """
         bg_context = Context(
             server=self,
@@ -2575,6 +2859,8 @@ class MCPServer:
         # ``CancelledError`` branch ``NotFoundError`` would replace the
         # cancellation and skip the ``raise`` below.
         try:
+            if slot is not None:
+                await slot.acquire()
             result = await self._execute_tool(tool, arguments, session, tool_context)
             await self._task_manager.set_result(task_id, result)
             is_error = getattr(result, "isError", False) or (
@@ -2636,22 +2922,21 @@ class MCPServer:
         if mctx is not None:
             mctx.set_tool_context(tool_context)
 
-        result = await ToolExecutor.run(
-            func=tool.tool,
-            definition=tool.definition,
-            input_model=tool.input_model,
-            output_model=tool.output_model,
-            context=mctx if mctx is not None else tool_context,
-            **arguments,
+        result, from_cache = await self._run_tool(
+            tool,
+            mctx if mctx is not None else tool_context,
+            tool_context,
+            arguments,
         )
+        cache_meta = {"_meta": {"arcade": {"cached": True}}} if from_cache else {}
 
         if result.value is not None:
-            content = convert_to_mcp_content(result.value)
-            structured_content = convert_content_to_structured_content(result.value)
+            content, structured_content = await self._encode_tool_result(tool, result.value)
             return CallToolResult(
                 content=content,
                 structuredContent=structured_content,
                 isError=False,
+                **cache_meta,
             )
         else:
             # Mirror the synchronous _handle_call_tool error formatting so the
@@ -2677,6 +2962,7 @@ class MCPServer:
                 content=content,
                 structuredContent=None,
                 isError=True,
+                **cache_meta,
             )
 
     async def _notify_task_status_change(
@@ -7,11 +7,13 @@ Manages per-session state and provides session-level operations.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import uuid
+from collections.abc import Callable
 from enum import Enum
-from typing import Any, cast
+from typing import Any, Literal, cast
 
 import anyio
 
@@ -23,6 +25,7 @@ from arcade_mcp_server.exceptions import (
     SessionError,
     SessionNotInitializedError,
 )
+from arcade_mcp_server.managers.resource import ResourceManager
 from arcade_mcp_server.resource_server.base import ResourceOwner
 from arcade_mcp_server.types import (
     INTERNAL_ERROR,
@@ -42,9 +45,11 @@ from arcade_mcp_server.types import (
     LoggingLevel,
     LoggingMessageNotification,
     LoggingMessageParams,
+    OutboundMessage,
     ProgressNotification,
     ProgressNotificationParams,
     PromptListChangedNotification,
+    RequestId,
     ResourceListChangedNotification,
     SessionMessage,
     ToolListChangedNotification,
@@ -121,7 +126,7 @@ class RequestManager:
 
         try:
             # Send request
-            message = request.model_dump_json(exclude_none=True) + "\n"
+            message = OutboundMessage.from_message(request)
             logger.debug(f"Sending server->client request method={method} id={request_id}")
             await self._write_stream.send(message)
 
@@ -192,8 +197,7 @@ class RequestManager:
 
         try:
             for note in notifications:
-                message = note.model_dump_json(exclude_none=True, by_alias=True) + "\n"
-                await self._write_stream.send(message)
+                await self._write_stream.send(OutboundMessage.from_message(note))
         except Exception:
             # Swallow transport errors during shutdown; proceed to cancel futures
             logging.debug(
@@ -206,11 +210,74 @@ class RequestManager:
                 future.set_exception(SessionError("Session closed"))
 
 
+ListChangedKind = Literal["tools", "resources", "prompts"]
+
+_LIST_CHANGED_NOTIFICATIONS: dict[str, Callable[[], JSONRPCMessage]] = {
+    "tools": ToolListChangedNotification,
+    "resources": ResourceListChangedNotification,
+    "prompts": PromptListChangedNotification,
+}
+
+
 class NotificationManager:
-    """Broadcasts server-initiated listChanged notifications to sessions."""
+    """Broadcasts server-initiated listChanged notifications to sessions.
+
+    Notifications are debounced per server: changes are collected until none
+    has arrived for ``debounce`` seconds, then each changed list is announced
+    once. Loading a toolkit of many tools therefore sends one
+    ``notifications/tools/list_changed`` rather than one per tool. A steady
+    stream of changes is flushed after at most ``max_windows`` debounce
+    windows, so clients are never kept waiting indefinitely.
+    """
 
-    def __init__(self, server: Any):
+    def __init__(self, server: Any, debounce: float = 0.1, max_windows: int = 10):
         self._server = server
+        self.debounce = debounce
+        self.max_windows = max_windows
+        # kind -> session IDs to notify, or None for every session
+        self._pending: dict[str, set[str] | None] = {}
+        self._changes = 0
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def list_changed(self, kind: ListChangedKind, session_ids: list[str] | None = None) -> None:
+        """Queue a list_changed notification for the next settle window.
+
+        Must be called from the event loop.
+        """
+        if kind in self._pending:
+            targets = self._pending[kind]
+            if targets is not None:
+                if session_ids is None:
+                    self._pending[kind] = None
+                else:
+                    targets.update(session_ids)
+        else:
+            self._pending[kind] = None if session_ids is None else set(session_ids)
+        self._changes += 1
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    async def close(self) -> None:
+        """Drop queued notifications and stop the pending flush."""
+        self._pending.clear()
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _flush(self) -> None:
+        # Changes queued while broadcasting are picked up by the next round
+        while self._pending:
+            seen, windows = -1, 0
+            while seen != self._changes and windows < self.max_windows:
+                seen = self._changes
+                windows += 1
+                await asyncio.sleep(self.debounce)
+            pending, self._pending = self._pending, {}
+            for kind, session_ids in pending.items():
+                targets = None if session_ids is None else sorted(session_ids)
+                await self._broadcast(_LIST_CHANGED_NOTIFICATIONS[kind](), targets)
 
     async def _broadcast(
         self, notification: JSONRPCMessage, session_ids: list[str] | None = None
@@ -236,13 +303,13 @@ class NotificationManager:
                 logger.debug("Failed to notify a session", exc_info=True)
 
     async def notify_tool_list_changed(self, session_ids: list[str] | None = None) -> None:
-        await self._broadcast(ToolListChangedNotification(), session_ids)
+        self.list_changed("tools", session_ids)
 
     async def notify_resource_list_changed(self, session_ids: list[str] | None = None) -> None:
-        await self._broadcast(ResourceListChangedNotification(), session_ids)
+        self.list_changed("resources", session_ids)
 
     async def notify_prompt_list_changed(self, session_ids: list[str] | None = None) -> None:
-        await self._broadcast(PromptListChangedNotification(), session_ids)
+        self.list_changed("prompts", session_ids)
 
 
 class ServerSession:
@@ -415,6 +482,10 @@ class ServerSession:
                 if self._request_manager:
                     # Cancel any pending requests
                     await self._cleanup_pending_requests()
+                # Resource subscriptions end with the session, whichever transport ran it
+                resources = getattr(self.server, "resources", None)
+                if isinstance(resources, ResourceManager):
+                    await resources.remove_session_subscriptions(self)
 
     async def _process_message(self, message: str | Any) -> None:
         """Process a single message.
@@ -449,19 +520,11 @@ class ServerSession:
 
             # Send response if any
             if response and self.write_stream:
-                if hasattr(response, "model_dump_json"):
-                    if isinstance(response, JSONRPCError):
-                        # JSON-RPC error responses MUST include "id" even when null.
-                        response_data = response.model_dump_json(by_alias=True)
-                    else:
-                        response_data = response.model_dump_json(exclude_none=True, by_alias=True)
+                # Encoded once here; the transport routes and writes this text as is
+                if isinstance(response, JSONRPCMessage):
+                    await self.write_stream.send(OutboundMessage.from_message(response))
                 else:
-                    response_data = json.dumps(response)
-
-                if not response_data.endswith("\n"):
-                    response_data += "\n"
-
-                await self.write_stream.send(response_data)
+                    await self.write_stream.send(json.dumps(response) + "\n")
 
         except json.JSONDecodeError:
             await self._send_error_response(
@@ -499,9 +562,7 @@ class ServerSession:
             error={"code": code, "message": message},
         )
 
-        # JSON-RPC error responses MUST include "id" even when null.
-        response_data = error_response.model_dump_json(by_alias=True) + "\n"
-        await self.write_stream.send(response_data)
+        await self.write_stream.send(OutboundMessage.from_message(error_response))
 
     async def _cleanup_pending_requests(self) -> None:
         """Clean up any pending requests."""
@@ -510,15 +571,32 @@ class ServerSession:
             await self._request_manager.cancel_all(reason="Session closed")
 
     # Notification methods
-    async def send_notification(self, notification: JSONRPCMessage) -> None:
-        """Send a notification to the client."""
+    async def send_notification(
+        self,
+        notification: JSONRPCMessage,
+        related_request_id: RequestId | None = None,
+        wait_for_delivery: bool = False,
+    ) -> None:
+        """Send a notification to the client.
+
+        Args:
+            notification: The notification to send.
+            related_request_id: The request the notification belongs to. HTTP
+                sends it on that request's stream instead of the standalone one.
+            wait_for_delivery: Return only once the transport has handed the
+                notification on, so a fast producer is held back by a slow client.
+                Only write streams that set ``supports_delivery_ack`` report
+                delivery; for any other stream a completed ``send()`` counts.
+        """
         if not self.write_stream:
             return
 
-        # by_alias=True ensures Pydantic Field aliases (e.g. meta -> _meta) are
-        # serialized using the wire-format keys required by the MCP spec.
-        message = notification.model_dump_json(exclude_none=True, by_alias=True) + "\n"
-        await self.write_stream.send(message)
+        outbound = OutboundMessage.from_message(notification, related_request_id)
+        if wait_for_delivery and getattr(self.write_stream, "supports_delivery_ack", False):
+            outbound.delivered = anyio.Event()
+        await self.write_stream.send(outbound)
+        if outbound.delivered is not None:
+            await outbound.delivered.wait()
 
     async def send_progress_notification(
         self,
@@ -527,6 +605,8 @@ class ServerSession:
         total: float | None = None,
         message: str | None = None,
         _meta: dict[str, Any] | None = None,
+        related_request_id: RequestId | None = None,
+        wait_for_delivery: bool = False,
     ) -> None:
         """Send a progress notification."""
         notification = ProgressNotification(
@@ -538,7 +618,7 @@ class ServerSession:
                 _meta=_meta,
             )
         )
-        await self.send_notification(notification)
+        await self.send_notification(notification, related_request_id, wait_for_delivery)
 
     async def send_log_message(
         self,
@@ -6,7 +6,7 @@ Provides Pydantic-based settings with validation and environment variable suppor
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
@@ -109,6 +109,10 @@ class NotificationSettings(BaseSettings):
         ge=0,
         le=10000,
     )
+    watch_resource_files: bool = Field(
+        default=True,
+        description="Watch subscribed file resources and notify subscribers when they change",
+    )
     max_queued_notifications: int = Field(
         default=1000,
         description="Maximum queued notifications per client",
@@ -146,6 +150,16 @@ class TransportSettings(BaseSettings):
         ge=10,
         le=10000,
     )
+    max_buffered_events: int = Field(
+        default=100,
+        description="Maximum outbound messages buffered per HTTP request stream",
+        ge=1,
+        le=10000,
+    )
+    overflow_policy: Literal["drop", "fail"] = Field(
+        default="drop",
+        description="When a request stream's buffer is full: 'drop' the notification, or 'fail' the stream",
+    )
     allowed_origins: list[str] | None = Field(
         default=None,
         description="Allowed Origin headers (comma-separated). None = reject any Origin. ['*'] = allow all.",
@@ -166,6 +180,126 @@ class TransportSettings(BaseSettings):
     model_config = {"env_prefix": "MCP_TRANSPORT_"}
 
 
+class TaskSettings(BaseSettings):
+    """Background task execution settings (task-augmented tools/call)."""
+
+    max_concurrent: int = Field(
+        default=32,
+        description="Maximum background tasks executing at once",
+        ge=1,
+        le=10000,
+    )
+    max_concurrent_per_context: int = Field(
+        default=8,
+        description="Maximum background tasks executing at once per authorization context",
+        ge=1,
+        le=10000,
+    )
+    max_pending: int = Field(
+        default=1000,
+        description="Maximum background tasks queued for execution before new tasks are rejected",
+        ge=0,
+        le=100000,
+    )
+
+    model_config = {"env_prefix": "MCP_TASK_"}
+
+
+class ResultCacheSettings(BaseSettings):
+    """Result cache settings for tools that opt in via ``result_cache_ttl``."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Serve repeated calls to opted-in read-only/idempotent tools from the cache",
+    )
+    backend: Literal["memory", "disk"] = Field(
+        default="memory",
+        description="Cache storage: per-process memory, or a local directory shared by workers",
+    )
+    max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum total size of cached results in bytes",
+        ge=1,
+    )
+    negative_ttl: float = Field(
+        default=5.0,
+        description="Maximum seconds a non-retryable typed error result is cached",
+        ge=0,
+    )
+    directory: str | None = Field(
+        default=None,
+        description="Directory for the disk backend (defaults to ~/.arcade/cache/tool_results)",
+    )
+
+    model_config = {"env_prefix": "MCP_RESULT_CACHE_"}
+
+
+class ResultOffloadSettings(BaseSettings):
+    """Settings for offloading large tool results to ephemeral resources."""
+
+    enabled: bool = Field(
+        default=True,
+        description=(
+            "Return large tool results as a preview and a resource link. Applies to tools "
+            "without an outputSchema; a tool with a return type opts in by setting the "
+            "result_offload extra to true, which drops its outputSchema"
+        ),
+    )
+    threshold: int = Field(
+        default=1024 * 1024,
+        description="Results whose serialized text is longer than this many characters are offloaded",
+        ge=1,
+    )
+    preview_chars: int = Field(
+        default=2000,
+        description="Characters of an offloaded result included inline as a preview",
+        ge=0,
+    )
+    ttl: float = Field(
+        default=600.0,
+        description="Seconds an offloaded result stays readable",
+        gt=0,
+    )
+    chunk_size: int = Field(
+        default=256 * 1024,
+        description="Maximum bytes returned by one chunked read of an offloaded result",
+        ge=1024,
+    )
+    max_bytes: int = Field(
+        default=1024 * 1024 * 1024,
+        description="Maximum total size of the spill directory; the oldest results are evicted",
+        ge=1,
+    )
+    directory: str | None = Field(
+        default=None,
+        description="Spill directory (defaults to a private temporary directory)",
+    )
+
+    model_config = {"env_prefix": "MCP_RESULT_OFFLOAD_"}
+
+
+class CompressionSettings(BaseSettings):
+    """HTTP response compression settings (gzip, and br/zstd when installed)."""
+
+    enabled: bool = Field(
+        default=True,
+        description="Compress HTTP responses for clients that accept it",
+    )
+    minimum_size: int = Field(
+        default=1024,
+        description="Complete responses smaller than this many bytes are not compressed",
+        ge=0,
+    )
+    level: int = Field(
+        default=5,
+        description="Compression level, capped at each encoding's maximum (gzip 9, br 11, zstd 22)",
+        ge=1,
+        le=22,
+    )
+
+    model_config = {"env_prefix": "MCP_COMPRESSION_"}
+
+
 class ServerSettings(BaseSettings):
     """Server-related settings."""
 
@@ -188,6 +322,20 @@ class ServerSettings(BaseSettings):
         ),
         description="Server instructions for clients",
     )
+    result_encoding: Literal["both", "structured", "text"] = Field(
+        default="both",
+        description=(
+            "How tool results are returned: as JSON text and structuredContent (both), "
+            "as structuredContent with a short text summary (structured), or as JSON "
+            "text only (text). Tools can override this with the result_encoding extra. "
+            "Tools that declare an outputSchema (every tool with a return type) always "
+            "send structuredContent, so 'text' only changes them when set as their own "
+            "result_encoding extra, which also drops their outputSchema. "
+            "'structured' departs from the 2025-06-18 spec, which says tools SHOULD also "
+            "return the serialized JSON as text; clients that ignore structuredContent "
+            "only see the summary."
+        ),
+    )
 
     @field_validator("version")
     @classmethod
@@ -476,6 +624,22 @@ class MCPSettings(BaseSettings):
         default_factory=ServerSettings,
         description="Server settings",
     )
+    task: TaskSettings = Field(
+        default_factory=TaskSettings,
+        description="Background task execution settings",
+    )
+    result_cache: ResultCacheSettings = Field(
+        default_factory=ResultCacheSettings,
+        description="Tool result cache settings",
+    )
+    result_offload: ResultOffloadSettings = Field(
+        default_factory=ResultOffloadSettings,
+        description="Large tool result offloading settings",
+    )
+    compression: CompressionSettings = Field(
+        default_factory=CompressionSettings,
+        description="HTTP response compression settings",
+    )
     resource_server: ResourceServerSettings = Field(
         default_factory=ResourceServerSettings,
         description="Server authentication settings",
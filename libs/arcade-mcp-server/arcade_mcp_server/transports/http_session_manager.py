@@ -20,10 +20,12 @@ from starlette.types import Receive, Scope, Send
 from arcade_mcp_server.server import MCPServer
 from arcade_mcp_server.session import InitializationState, ServerSession
 from arcade_mcp_server.transports.http_streamable import (
+    DEFAULT_MAX_BUFFERED_EVENTS,
     MCP_PROTOCOL_VERSION_HEADER,
     MCP_SESSION_ID_HEADER,
     EventStore,
     HTTPStreamableTransport,
+    OverflowPolicy,
 )
 from arcade_mcp_server.types import INVALID_REQUEST, SUPPORTED_PROTOCOL_VERSIONS
 
@@ -218,6 +220,8 @@ class HTTPSessionManager:
         event_store: Optional[EventStore] = None,
         json_response: bool = False,
         stateless: bool = False,
+        max_buffered_events: int = DEFAULT_MAX_BUFFERED_EVENTS,
+        overflow_policy: OverflowPolicy = "drop",
     ):
         """Initialize HTTP session manager.
 
@@ -226,11 +230,15 @@ class HTTPSessionManager:
             event_store: Optional event store for resumability
             json_response: Whether to use JSON responses instead of SSE
             stateless: If True, creates fresh transport for each request
+            max_buffered_events: Outbound messages buffered per request stream
+            overflow_policy: "drop" notifications for a full stream, or "fail" the stream
         """
         self.server = server
         self.event_store = event_store
         self.json_response = json_response
         self.stateless = stateless
+        self.max_buffered_events = max_buffered_events
+        self.overflow_policy: OverflowPolicy = overflow_policy
 
         # Session tracking (only used if not stateless)
         self._session_creation_lock = anyio.Lock()
@@ -394,6 +402,8 @@ class HTTPSessionManager:
             mcp_session_id=None,
             is_json_response_enabled=self.json_response,
             event_store=None,  # No event store in stateless mode
+            max_buffered_events=self.max_buffered_events,
+            overflow_policy=self.overflow_policy,
         )
 
         # Start server in a new task
@@ -512,6 +522,8 @@ class HTTPSessionManager:
                     mcp_session_id=new_session_id,
                     is_json_response_enabled=self.json_response,
                     event_store=self.event_store,
+                    max_buffered_events=self.max_buffered_events,
+                    overflow_policy=self.overflow_policy,
                 )
 
                 if http_transport.mcp_session_id is None:
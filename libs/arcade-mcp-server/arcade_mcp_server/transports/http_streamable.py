@@ -19,6 +19,8 @@ Design overview
 - The session writes outbound server messages to `_write_stream`; the transport's
   `message_router` task consumes them from `_write_stream_reader` and fans them out
   to the correct per-request stream maintained in `_request_streams[request_id]`.
+  The session sends each message as an `OutboundMessage`, encoded once: the router
+  routes it by the attached model and the HTTP body reuses the encoded text.
 
 - Response modes:
   - JSON response mode: a single HTTP JSON response is returned by awaiting the
@@ -39,9 +41,10 @@ from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from http import HTTPStatus
-from typing import cast
+from typing import Literal, cast
 
 import anyio
+from anyio.abc import TaskGroup
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from pydantic import BaseModel, TypeAdapter
 from sse_starlette import EventSourceResponse
@@ -61,6 +64,8 @@ from arcade_mcp_server.types import (
     JSONRPCRequest,
     JSONRPCResponse,
     MCPMessage,
+    Notification,
+    OutboundMessage,
     RequestId,
     SessionMessage,
 )
@@ -86,6 +91,13 @@ SESSION_ID_PATTERN = re.compile(r"^[\x21-\x7E]+$")
 StreamId = str
 EventId = str
 
+# What to do with a message for a request stream whose buffer is full:
+# "drop" the notification, or "fail" the stream by closing it.
+OverflowPolicy = Literal["drop", "fail"]
+
+# Outbound messages buffered per request stream before the overflow policy applies
+DEFAULT_MAX_BUFFERED_EVENTS = 100
+
 
 @dataclass
 class EventMessage:
@@ -93,6 +105,8 @@ class EventMessage:
 
     message: MCPMessage
     event_id: str | None = None
+    # The message as encoded by the session, reused as the body when present
+    data: str | None = None
 
 
 EventCallback = Callable[[EventMessage], Awaitable[None]]
@@ -130,6 +144,14 @@ class HTTPStreamableTransport:
       - SSE mode: stream each outbound `SessionMessage` as an SSE event with
         appropriate headers and close on terminal response.
 
+    Per-request streams are bounded, and the router never waits on them: one
+    slow reader (e.g. a client reading a large result over a bad link) must not
+    hold up routing for the other requests in the session. When a stream is
+    full, `overflow_policy` decides whether a notification is dropped or the
+    stream is failed. Responses and server-to-client requests (sampling,
+    elicitation, ping) are never dropped; one that does not fit is delivered in
+    the background.
+
     Streams created in `connect()`
     - `_read_stream_writer` / `_read_stream`: transport→session channel for inbound
       client messages.
@@ -146,6 +168,8 @@ class HTTPStreamableTransport:
         session: ServerSession | None = None,
         is_json_response_enabled: bool = False,
         event_store: EventStore | None = None,
+        max_buffered_events: int = DEFAULT_MAX_BUFFERED_EVENTS,
+        overflow_policy: OverflowPolicy = "drop",
     ):
         """Initialize HTTP streamable transport.
 
@@ -154,7 +178,11 @@ class HTTPStreamableTransport:
             session: Server session for handling requests
             is_json_response_enabled: If True, return JSON responses instead of SSE
             event_store: Optional event store for resumability
+            max_buffered_events: Outbound messages buffered per request stream
+            overflow_policy: "drop" notifications for a full stream, or "fail" the stream
         """
+        if max_buffered_events < 1:
+            raise ValueError("max_buffered_events must be at least 1")
         if mcp_session_id and not SESSION_ID_PATTERN.fullmatch(mcp_session_id):
             raise ValueError("Session ID must only contain visible ASCII characters")
 
@@ -162,6 +190,8 @@ class HTTPStreamableTransport:
         self.session = session
         self.is_json_response_enabled = is_json_response_enabled
         self._event_store = event_store
+        self._max_buffered_events = max_buffered_events
+        self._overflow_policy = overflow_policy
         self._request_streams: dict[
             RequestId,
             tuple[MemoryObjectSendStream[EventMessage], MemoryObjectReceiveStream[EventMessage]],
@@ -249,9 +279,13 @@ class HTTPStreamableTransport:
         response_message: JSONRPCMessage | None,
         status_code: HTTPStatus = HTTPStatus.OK,
         headers: dict[str, str] | None = None,
+        encoded: str | None = None,
     ) -> Response:
         """Create a JSON response.
 
+        ``encoded`` is the message as already encoded by the session; it is
+        used as the body instead of encoding the message again.
+
         Inspects JSONRPCError responses for ``_transport`` metadata.
         When the error code is ``INSUFFICIENT_SCOPE_ERROR_CODE`` and
         ``error.data._transport`` is present the helper:
@@ -281,6 +315,8 @@ class HTTPStreamableTransport:
 
             # JSON-RPC error responses MUST include "id" even when null.
             body = response_message.model_dump_json(by_alias=True)
+        elif encoded is not None:
+            body = encoded
         else:
             body = response_message.model_dump_json(by_alias=True, exclude_none=True)
 
@@ -335,6 +371,8 @@ class HTTPStreamableTransport:
             self._extract_and_strip_transport_metadata(msg)
             # JSON-RPC error responses MUST include "id" even when null.
             data = msg.model_dump_json(by_alias=True)
+        elif event_message.data is not None:
+            data = event_message.data
         else:
             data = msg.model_dump_json(by_alias=True, exclude_none=True)
         event_data = {
@@ -347,6 +385,69 @@ class HTTPStreamableTransport:
 
         return event_data
 
+    def _create_request_stream(
+        self,
+    ) -> tuple[MemoryObjectSendStream[EventMessage], MemoryObjectReceiveStream[EventMessage]]:
+        """Create a bounded stream for the events of one request."""
+        return anyio.create_memory_object_stream[EventMessage](self._max_buffered_events)
+
+    def _dispatch(
+        self,
+        stream_id: RequestId,
+        event_message: EventMessage,
+        tg: TaskGroup,
+        delivered: anyio.Event | None = None,
+    ) -> None:
+        """Queue an event on a request stream without waiting for its reader.
+
+        ``delivered`` is set once the event is queued, or once it never will be.
+        """
+        streams = self._request_streams.get(stream_id)
+        if streams is None:
+            if delivered is not None:
+                delivered.set()
+            return
+        send_stream = streams[0]
+        try:
+            send_stream.send_nowait(event_message)
+        except anyio.WouldBlock:
+            if not isinstance(event_message.message, Notification) or delivered is not None:
+                # The overflow policy only sheds notifications: a request or
+                # response has a peer waiting on it, and a sender waiting for
+                # delivery sends nothing more until then.
+                tg.start_soon(
+                    self._send_when_ready, stream_id, send_stream, event_message, delivered
+                )
+                return
+            if self._overflow_policy == "fail":
+                logger.warning(
+                    f"Closing stream {stream_id}: more than {self._max_buffered_events} "
+                    "unread messages"
+                )
+                send_stream.close()
+                self._request_streams.pop(stream_id, None)
+            else:
+                logger.warning(f"Dropping message for stream {stream_id}: its buffer is full")
+        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+            self._request_streams.pop(stream_id, None)
+        if delivered is not None:
+            delivered.set()
+
+    async def _send_when_ready(
+        self,
+        stream_id: RequestId,
+        send_stream: MemoryObjectSendStream[EventMessage],
+        event_message: EventMessage,
+        delivered: anyio.Event | None = None,
+    ) -> None:
+        try:
+            await send_stream.send(event_message)
+        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+            self._request_streams.pop(stream_id, None)
+        finally:
+            if delivered is not None:
+                delivered.set()
+
     async def _clean_up_memory_streams(self, request_id: RequestId) -> None:
         """Clean up memory streams for a request."""
         if request_id in self._request_streams:
@@ -496,7 +597,7 @@ class HTTPStreamableTransport:
 
             # Handle requests
             request_id = str(message.id)
-            self._request_streams[request_id] = anyio.create_memory_object_stream[EventMessage](0)
+            self._request_streams[request_id] = self._create_request_stream()
             request_stream_reader = self._request_streams[request_id][1]
 
             if self.is_json_response_enabled:
@@ -507,14 +608,16 @@ class HTTPStreamableTransport:
                 await writer.send(session_message)
 
                 try:
-                    response_message = None
+                    response_event = None
                     async for event_message in request_stream_reader:
                         if isinstance(event_message.message, (JSONRPCResponse, JSONRPCError)):
-                            response_message = event_message.message
+                            response_event = event_message
                             break
 
-                    if response_message:
-                        response = self._create_json_response(response_message)
+                    if response_event:
+                        response = self._create_json_response(
+                            response_event.message, encoded=response_event.data
+                        )
                         await response(scope, receive, send)
                     else:
                         logger.error("No response received before stream closed")
@@ -681,9 +784,7 @@ class HTTPStreamableTransport:
 
         async def standalone_sse_writer() -> None:
             try:
-                self._request_streams[GET_STREAM_KEY] = anyio.create_memory_object_stream[
-                    EventMessage
-                ](0)
+                self._request_streams[GET_STREAM_KEY] = self._create_request_stream()
                 standalone_stream_reader = self._request_streams[GET_STREAM_KEY][1]
 
                 async with sse_stream_writer, standalone_stream_reader:
@@ -827,9 +928,7 @@ class HTTPStreamableTransport:
                         stream_id = await event_store.replay_events_after(last_event_id, send_event)
 
                         if stream_id and stream_id not in self._request_streams:
-                            self._request_streams[stream_id] = anyio.create_memory_object_stream[
-                                EventMessage
-                            ](0)
+                            self._request_streams[stream_id] = self._create_request_stream()
                             msg_reader = self._request_streams[stream_id][1]
 
                             async with msg_reader:
@@ -885,6 +984,9 @@ class HTTPStreamableTransport:
         write_stream, write_stream_reader = anyio.create_memory_object_stream[str | SessionMessage](
             100
         )
+        # The message router marks each OutboundMessage delivered once it is
+        # queued on its request stream, so senders can wait for it.
+        write_stream.supports_delivery_ack = True  # type: ignore[attr-defined]
 
         # Store the streams
         self._read_stream_writer = read_stream_writer
@@ -898,9 +1000,22 @@ class HTTPStreamableTransport:
             async def message_router() -> None:
                 try:
                     async for session_message in write_stream_reader:
-                        # Accept either a SessionMessage wrapper or a raw JSON string
+                        # Accept either a SessionMessage wrapper or a raw JSON string.
+                        # Messages the session encoded carry their model, so they
+                        # are routed without parsing the text back.
+                        encoded: str | None = None
+                        target_request_id: str | None = None
+                        delivered: anyio.Event | None = None
                         try:
-                            if isinstance(session_message, SessionMessage):
+                            if (
+                                isinstance(session_message, OutboundMessage)
+                                and session_message.message is not None
+                            ):
+                                message = session_message.message
+                                encoded = session_message
+                                target_request_id = session_message.target_id
+                                delivered = session_message.delivered
+                            elif isinstance(session_message, SessionMessage):
                                 message = session_message.message
                             elif isinstance(session_message, str):
                                 message = self._parse_mcp_message(session_message)
@@ -914,10 +1029,8 @@ class HTTPStreamableTransport:
                         except Exception:
                             logger.exception("Failed to parse outbound message from session")
                             continue
-                        target_request_id = None
-
                         # Check if this is a response
-                        if isinstance(message, (JSONRPCResponse, JSONRPCError)):
+                        if encoded is None and isinstance(message, (JSONRPCResponse, JSONRPCError)):
                             target_request_id = str(message.id)
 
                         request_stream_id = (
@@ -933,13 +1046,12 @@ class HTTPStreamableTransport:
                             )
                             logger.debug(f"Stored {event_id} from {request_stream_id}")
 
-                        if request_stream_id in self._request_streams:
-                            try:
-                                await self._request_streams[request_stream_id][0].send(
-                                    EventMessage(message, event_id)  # type: ignore[arg-type]
-                                )
-                            except (anyio.BrokenResourceError, anyio.ClosedResourceError):
-                                self._request_streams.pop(request_stream_id, None)
+                        self._dispatch(
+                            request_stream_id,
+                            EventMessage(message, event_id, encoded),  # type: ignore[arg-type]
+                            tg,
+                            delivered,
+                        )
                 except Exception:
                     logger.exception("Error in message router")
 
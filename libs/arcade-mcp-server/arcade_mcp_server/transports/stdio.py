@@ -17,6 +17,7 @@ from typing import Any
 
 from arcade_mcp_server.exceptions import TransportError
 from arcade_mcp_server.session import ServerSession
+from arcade_mcp_server.types import OutboundMessage
 
 logger = logging.getLogger("arcade.mcp.transports.stdio")
 
@@ -24,14 +25,18 @@ logger = logging.getLogger("arcade.mcp.transports.stdio")
 class StdioWriteStream:
     """Write stream implementation for stdio."""
 
+    # send() marks each OutboundMessage delivered once it is queued for stdout
+    supports_delivery_ack = True
+
     def __init__(self, write_queue: queue.Queue[str | None]):
         self.write_queue = write_queue
 
     async def send(self, data: str) -> None:
         """Send data to stdout."""
-        if not data.endswith("\n"):
-            data += "\n"
-        await asyncio.to_thread(self.write_queue.put, data)
+        line = data if data.endswith("\n") else data + "\n"
+        await asyncio.to_thread(self.write_queue.put, line)
+        if isinstance(data, OutboundMessage):
+            data.mark_delivered()
 
 
 class StdioReadStream:
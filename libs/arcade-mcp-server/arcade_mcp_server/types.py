@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Generic, Literal, TypeAlias, TypeVar
 
+import anyio
 from pydantic import BaseModel, ConfigDict, Field
 
 from arcade_mcp_server.resource_server.base import ResourceOwner
@@ -27,7 +28,14 @@ RELATED_TASK_META_KEY: str = "io.modelcontextprotocol/related-task"
 # Non-date identifiers like "DRAFT-2025-v3" exist in spec artifacts and would break
 # lexical comparison. This is also how we add future versions cleanly — just add an entry.
 VERSION_FEATURES: dict[str, set[str]] = {
-    "2025-06-18": {"base", "sampling", "elicitation_form", "resources", "prompts", "tools"},
+    "2025-06-18": {
+        "base",
+        "sampling",
+        "elicitation_form",
+        "resources",
+        "prompts",
+        "tools",
+    },
     "2025-11-25": {
         "base",
         "sampling",
@@ -152,6 +160,59 @@ class SessionMessage:
     resource_owner: ResourceOwner | None = None
 
 
+class OutboundMessage(str):
+    """A message from the session to its transport, encoded once.
+
+    The string itself is the JSON wire encoding, so transports that only write
+    text (stdio) use it as is. Transports that route messages (HTTP) read the
+    model and the id of the request it answers instead of parsing the text
+    again, and reuse the text as the response body.
+
+    A message with ``delivered`` set is waited on by its sender: the transport
+    sets the event once the message has been handed on (written, or queued
+    on its stream), which lets the sender apply backpressure. Senders only set
+    it for write streams whose ``supports_delivery_ack`` attribute is true.
+    """
+
+    message: JSONRPCMessage | None
+    target_id: str | None
+    delivered: anyio.Event | None
+
+    def __new__(
+        cls,
+        data: str,
+        message: JSONRPCMessage | None = None,
+        related_request_id: RequestId | None = None,
+    ) -> "OutboundMessage":
+        self = super().__new__(cls, data)
+        self.message = message
+        # Responses and errors go to the stream of the request they answer;
+        # notifications go there too when they belong to a request.
+        if isinstance(message, (JSONRPCResponse, JSONRPCError)):
+            self.target_id = str(message.id)
+        else:
+            self.target_id = str(related_request_id) if related_request_id is not None else None
+        self.delivered = None
+        return self
+
+    @classmethod
+    def from_message(
+        cls, message: JSONRPCMessage, related_request_id: RequestId | None = None
+    ) -> "OutboundMessage":
+        """Encode a message with the wire-format keys required by the MCP spec."""
+        if isinstance(message, JSONRPCError):
+            # JSON-RPC error responses MUST include "id" even when null.
+            return cls(message.model_dump_json(by_alias=True), message)
+        return cls(
+            message.model_dump_json(exclude_none=True, by_alias=True), message, related_request_id
+        )
+
+    def mark_delivered(self) -> None:
+        """Tell a waiting sender that the transport has handed this message on."""
+        if self.delivered is not None:
+            self.delivered.set()
+
+
 # -----------------------------------------------------------------------------
 # Initialization
 # -----------------------------------------------------------------------------
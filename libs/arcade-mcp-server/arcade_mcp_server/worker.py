@@ -17,7 +17,7 @@ import uvicorn
 from arcade_core.catalog import ToolCatalog
 from arcade_core.discovery import discover_tools
 from arcade_core.toolkit import ToolkitLoadError
-from arcade_serve.fastapi import FastAPIWorker, TaskTrackerMiddleware
+from arcade_serve.fastapi import CompressionMiddleware, FastAPIWorker, TaskTrackerMiddleware
 from arcade_serve.fastapi import _arcade_telemetry as _arcade_telemetry_bridge
 from arcade_serve.fastapi.telemetry import OTELHandler
 from fastapi import FastAPI
@@ -116,6 +116,8 @@ async def create_lifespan(
     session_manager = HTTPSessionManager(
         server=mcp_server,
         json_response=True,
+        max_buffered_events=mcp_settings.transport.max_buffered_events,
+        overflow_policy=mcp_settings.transport.overflow_policy,
     )
 
     await mcp_server.start()
@@ -211,6 +213,14 @@ def create_arcade_mcp(
 
     app.add_middleware(AddTrailingSlashToPathMiddleware)
 
+    # Compresses both the MCP endpoint (JSON and SSE) and the worker routes
+    if mcp_settings.compression.enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=mcp_settings.compression.minimum_size,
+            level=mcp_settings.compression.level,
+        )
+
     # Register CorrelationMiddleware last so it lands outermost in the
     # Starlette stack — `add_middleware` order is innermost-first, so the
     # final call wraps everything else. This ensures every other middleware
@@ -1,4 +1,5 @@
+from .compression import CompressionMiddleware
 from .task_tracker import TaskTrackerMiddleware
 from .worker import FastAPIWorker
 
-__all__ = ["FastAPIWorker", "TaskTrackerMiddleware"]
+__all__ = ["CompressionMiddleware", "FastAPIWorker", "TaskTrackerMiddleware"]
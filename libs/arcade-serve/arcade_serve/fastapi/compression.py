@@ -0,0 +1,291 @@
+"""
+Response compression for HTTP endpoints.
+
+CompressionMiddleware compresses responses with the best encoding the client
+accepts. Complete responses are compressed only above a size threshold;
+Server-Sent Event streams are compressed as they are sent, with a flush after
+every event so the client can decode each one as it arrives. Responses that
+already carry a Content-Encoding, or whose content type does not compress
+well (images, archives, ...), are passed through untouched.
+
+gzip is always available. br needs the optional ``brotli`` package and zstd
+the optional ``zstandard`` package; encodings whose package is not installed
+are not offered.
+"""
+
+import importlib
+import zlib
+from typing import Any, cast
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _optional_module(name: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+_brotli = _optional_module("brotli")
+_zstandard = _optional_module("zstandard")
+
+# Preferred first when the client accepts several equally
+ENCODING_PREFERENCE = ("zstd", "br", "gzip")
+DEFAULT_MINIMUM_SIZE = 1024
+DEFAULT_LEVEL = 5
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+)
+COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+SSE_CONTENT_TYPE = "text/event-stream"
+
+
+def available_encodings() -> list[str]:
+    """Return the encodings this process can produce, most preferred first."""
+    available = {"gzip": True, "br": _brotli is not None, "zstd": _zstandard is not None}
+    return [encoding for encoding in ENCODING_PREFERENCE if available[encoding]]
+
+
+def negotiate_encoding(accept_encoding: str, encodings: list[str]) -> str | None:
+    """Pick the encoding to use for an ``Accept-Encoding`` header.
+
+    Args:
+        accept_encoding: The request's Accept-Encoding header value.
+        encodings: The encodings on offer, most preferred first.
+
+    Returns:
+        The offered encoding with the highest q-value (ties go to the more
+        preferred one), or None if the client accepts none of them.
+    """
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best: str | None = None
+    best_weight = 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, wildcard)
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """Check whether a content type is worth compressing."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith(COMPRESSIBLE_CONTENT_TYPES) or media_type.endswith(
+        COMPRESSIBLE_SUFFIXES
+    )
+
+
+class _Compressor:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str, level: int):
+        self._encoding = encoding
+        if encoding == "br":
+            self._brotli = _brotli.Compressor(quality=min(level, 11))
+        elif encoding == "zstd":
+            self._zstd = _zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            self._zlib = zlib.compressobj(min(level, 9), zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """Compress a chunk; with ``flush``, everything so far becomes decodable."""
+        if self._encoding == "br":
+            out = self._brotli.process(data)
+            if flush:
+                out += self._brotli.flush()
+        elif self._encoding == "zstd":
+            out = self._zstd.compress(data)
+            if flush:
+                out += self._zstd.flush(_zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        else:
+            out = self._zlib.compress(data)
+            if flush:
+                out += self._zlib.flush(zlib.Z_SYNC_FLUSH)
+        return cast(bytes, out)
+
+    def finish(self) -> bytes:
+        if self._encoding == "br":
+            return cast(bytes, self._brotli.finish())
+        if self._encoding == "zstd":
+            return cast(bytes, self._zstd.flush())
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """ASGI middleware that compresses responses with gzip, br, or zstd.
+
+    Args:
+        app: The ASGI app to wrap.
+        minimum_size: Complete bodies smaller than this many bytes are sent as is.
+        level: Compression level, capped at each encoding's maximum (gzip 9, br 11).
+        encodings: Encodings to offer, most preferred first. Defaults to every
+            encoding available in this process.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        level: int = DEFAULT_LEVEL,
+        encodings: list[str] | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        available = available_encodings()
+        self.encodings = (
+            available if encodings is None else [e for e in encodings if e in available]
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), self.encodings
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(send, encoding, self.minimum_size, self.level)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Compresses the messages of one response on their way to ``send``."""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int, level: int):
+        self._send = send
+        self._encoding = encoding
+        self._minimum_size = minimum_size
+        self._level = level
+        self._start: Message | None = None
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._compressor: _Compressor | None = None
+        # Flush after every chunk (SSE) so each event is decodable on arrival
+        self._flush_chunks = False
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+        elif message["type"] == "http.response.start":
+            await self._on_start(message)
+        elif message["type"] == "http.response.body":
+            await self._on_body(message)
+        else:
+            await self._pass_through()
+            await self._send(message)
+
+    async def _on_start(self, message: Message) -> None:
+        headers = Headers(raw=message.get("headers", []))
+        status = message.get("status", 200)
+        if (
+            status < 200
+            or status in (204, 304)
+            or "content-encoding" in headers
+            or not is_compressible(headers.get("content-type", ""))
+        ):
+            self._passthrough = True
+            await self._send(message)
+            return
+        self._start = message
+        if headers.get("content-type", "").lower().startswith(SSE_CONTENT_TYPE):
+            # Event streams are compressed from the first byte; their headers
+            # go out right away so the client sees the stream open.
+            self._flush_chunks = True
+            self._compressor = _Compressor(self._encoding, self._level)
+            await self._send_start()
+
+    async def _on_body(self, message: Message) -> None:
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self._compressor is not None:
+            out = self._compressor.compress(body, flush=self._flush_chunks) if body else b""
+            if not more_body:
+                out += self._compressor.finish()
+            if out or not more_body:
+                await self._send({
+                    "type": "http.response.body",
+                    "body": out,
+                    "more_body": more_body,
+                })
+            return
+
+        self._buffer.append(body)
+        self._buffered += len(body)
+        if self._buffered < self._minimum_size:
+            if not more_body:
+                # Too small to be worth it: send it as it came
+                self._passthrough = True
+                await self._send(cast(Message, self._start))
+                await self._send({"type": "http.response.body", "body": b"".join(self._buffer)})
+            return
+
+        data = b"".join(self._buffer)
+        self._buffer = []
+        if not more_body:
+            compressor = _Compressor(self._encoding, self._level)
+            compressed = compressor.compress(data) + compressor.finish()
+            await self._send_start(content_length=len(compressed))
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+        # Larger than the threshold and still streaming: compress as it comes
+        self._compressor = _Compressor(self._encoding, self._level)
+        await self._send_start()
+        await self._send({
+            "type": "http.response.body",
+            "body": self._compressor.compress(data),
+            "more_body": True,
+        })
+
+    async def _send_start(self, content_length: int | None = None) -> None:
+        """Send the start message with compression headers."""
+        start = cast(Message, self._start)
+        headers = MutableHeaders(raw=list(start.get("headers", [])))
+        headers["Content-Encoding"] = self._encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        await self._send({**start, "headers": headers.raw})
+        self._start = None
+
+    async def _pass_through(self) -> None:
+        """Send the response uncompressed from here on."""
+        self._passthrough = True
+        if self._start is not None:
+            await self._send(self._start)
+            self._start = None
+        if self._buffer:
+            await self._send({
+                "type": "http.response.body",
+                "body": b"".join(self._buffer),
+                "more_body": True,
+            })
+            self._buffer = []
@@ -6,11 +6,13 @@ from arcade_core.schema import (
     ToolMetadataKey,
     ToolSecretItem,
 )
+from arcade_core.streaming import StreamSummary
 from arcade_core.toolkit import Toolkit
 
 from arcade_tdk.tool import tool
 
 __all__ = [
+    "StreamSummary",
     "ToolAuthorizationContext",
     "ToolCatalog",
     "ToolContext",
@@ -153,6 +153,21 @@ def tool(
 
         adapter_chain = _build_adapter_chain(adapters, requires_auth)
 
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def stream_with_error_handling(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    async for chunk in func(*args, **kwargs):
+                        yield chunk
+                except ToolRuntimeError:
+                    # re-raise as-is if it is already an Arcade Error
+                    raise
+                except Exception as e:
+                    _raise_as_arcade_error(e, adapter_chain, tool_name, func_name)
+
+            return stream_with_error_handling
+
         if inspect.iscoroutinefunction(func):
 
             @functools.wraps(func)
@@ -1,5 +1,6 @@
 """Tests for async MCP convenience methods in EvalSuite."""
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -291,3 +292,67 @@ class TestAsyncConvenienceMethodChaining:
 
             # Verify final result is still the suite
             assert result is suite
+
+
+class TestConcurrentMcpSources:
+    """Tests for loading several MCP sources at once."""
+
+    @pytest.mark.asyncio
+    async def test_sources_load_concurrently_and_register_in_call_order(self) -> None:
+        """Sources added with asyncio.gather overlap but register in the order added."""
+        suite = EvalSuite(name="test", system_message="test")
+        in_flight = 0
+        max_in_flight = 0
+
+        def loader(name: str, delay: float):
+            async def load(*args, **kwargs):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(delay)
+                in_flight -= 1
+                return [{"name": name, "description": name, "inputSchema": {}}]
+
+            return load
+
+        with (
+            patch(
+                "arcade_evals._evalsuite._convenience.load_mcp_remote_async",
+                side_effect=loader("slow_http", 0.05),
+            ),
+            patch(
+                "arcade_evals._evalsuite._convenience.load_from_stdio_async",
+                side_effect=loader("fast_stdio", 0),
+            ),
+        ):
+            await asyncio.gather(
+                suite.add_mcp_server("http://localhost:8000"),
+                suite.add_mcp_stdio_server(["python", "server.py"]),
+            )
+
+        assert max_in_flight == 2
+        assert suite.list_tool_names() == ["slow_http", "fast_stdio"]
+
+    @pytest.mark.asyncio
+    async def test_failed_source_does_not_block_later_sources(self) -> None:
+        """A source that fails to load still lets the sources after it register."""
+        suite = EvalSuite(name="test", system_message="test")
+
+        with (
+            patch(
+                "arcade_evals._evalsuite._convenience.load_mcp_remote_async",
+                side_effect=ConnectionError("down"),
+            ),
+            patch(
+                "arcade_evals._evalsuite._convenience.load_from_stdio_async",
+                return_value=[{"name": "stdio_tool", "description": "", "inputSchema": {}}],
+            ),
+        ):
+            results = await asyncio.gather(
+                suite.add_mcp_server("http://localhost:8000"),
+                suite.add_mcp_stdio_server(["python", "server.py"]),
+                return_exceptions=True,
+            )
+
+        assert isinstance(results[0], ConnectionError)
+        assert suite.list_tool_names() == ["stdio_tool"]
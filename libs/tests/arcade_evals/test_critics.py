@@ -277,6 +277,65 @@ class TestSimilarityCritic:
                 critic.evaluate("test", "test2")
 
 
+BLOCK_EXPECTED = [
+    "search for cats",
+    ["python", "security"],
+    12345,
+    "",
+    "a",
+    "hello world",
+]
+BLOCK_ACTUAL = [
+    "search for cat",
+    "weather in Paris",
+    ["python", "security", "best-practices"],
+    12345,
+    "  ",
+    "b",
+    "Hello, World!",
+]
+
+
+class TestSimilarityCriticBlock:
+    """Tests for SimilarityCritic.evaluate_block (batched scoring)."""
+
+    def test_block_matches_pairwise_evaluate(self) -> None:
+        """Test that every block entry equals the per-pair result."""
+        critic = SimilarityCritic(critic_field="query", weight=0.7, similarity_threshold=0.5)
+
+        block = critic.evaluate_block(BLOCK_EXPECTED, BLOCK_ACTUAL)
+
+        assert len(block) == len(BLOCK_EXPECTED)
+        for expected, row in zip(BLOCK_EXPECTED, block):
+            assert len(row) == len(BLOCK_ACTUAL)
+            for actual, result in zip(BLOCK_ACTUAL, row):
+                pairwise = critic.evaluate(expected, actual)
+                assert result["match"] == pairwise["match"]
+                assert result["score"] == pytest.approx(pairwise["score"])
+
+    def test_block_fits_one_vectorizer(self) -> None:
+        """Test that the block is computed without a TF-IDF fit per pair."""
+        from unittest.mock import patch
+
+        critic = SimilarityCritic(critic_field="query", weight=1.0)
+        with patch(
+            "sklearn.feature_extraction.text.TfidfVectorizer.fit_transform",
+            side_effect=AssertionError("per-pair fit"),
+        ):
+            block = critic.evaluate_block(["search for cats", "hello"], ["search cats"])
+
+        assert block[0][0]["score"] > block[1][0]["score"]
+
+    def test_block_with_no_tokens_falls_back_to_exact_match(self) -> None:
+        """Test that strings without any vocabulary are compared exactly."""
+        critic = SimilarityCritic(critic_field="query", weight=1.0)
+
+        block = critic.evaluate_block(["1", "!"], ["1"])
+
+        assert block[0][0] == {"match": True, "score": 1.0}
+        assert block[1][0] == {"match": False, "score": 0.0}
+
+
 class TestCriticWeights:
     """Tests for critic weight validation and FuzzyWeight support."""
 
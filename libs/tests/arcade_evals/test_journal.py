@@ -0,0 +1,196 @@
+"""Tests for the eval case journal (incremental results and resume)."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from arcade_evals import (
+    EvalJournal,
+    EvalRubric,
+    EvalSuite,
+    ExpectedMCPToolCall,
+    iter_journal_records,
+    load_journal_results,
+)
+from arcade_evals._evalsuite._types import PASS_RULE_MEAN
+from arcade_evals.eval import EvaluationResult
+
+# Mark all tests in this module as requiring evals dependencies
+pytestmark = pytest.mark.evals
+
+SEARCH_TOOL = {
+    "name": "search",
+    "description": "Search",
+    "inputSchema": {
+        "type": "object",
+        "properties": {"query": {"type": "string"}},
+        "required": ["query"],
+    },
+}
+
+
+def _openai_response(name: str, args: dict) -> MagicMock:
+    tool_call = MagicMock()
+    tool_call.function.name = name
+    tool_call.function.arguments = json.dumps(args)
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.tool_calls = [tool_call]
+    return response
+
+
+def _openai_client() -> AsyncMock:
+    client = AsyncMock()
+    client.chat.completions.create.return_value = _openai_response("search", {"query": "cats"})
+    return client
+
+
+def _make_suite(journal: EvalJournal | None, case_names: list[str]) -> EvalSuite:
+    suite = EvalSuite(name="journaled", system_message="sys", journal=journal)
+    suite.add_tool_definitions([SEARCH_TOOL])
+    for name in case_names:
+        suite.add_case(
+            name=name,
+            user_message=f"search for {name}",
+            expected_tool_calls=[ExpectedMCPToolCall("search", {"query": "cats"})],
+        )
+    return suite
+
+
+class TestEvalJournal:
+    """Tests for EvalJournal with EvalSuite.run."""
+
+    @pytest.mark.asyncio
+    async def test_each_completed_case_is_appended(self, tmp_path) -> None:
+        path = tmp_path / "run.jsonl"
+        suite = _make_suite(EvalJournal(path), ["a", "b"])
+
+        await suite.run(_openai_client(), "gpt-4o")
+
+        records = list(iter_journal_records(path))
+        assert sorted(r["case"]["name"] for r in records) == ["a", "b"]
+        assert {r["model"] for r in records} == {"gpt-4o"}
+        assert all(r["case"]["evaluation"]["passed"] for r in records)
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_recorded_cases(self, tmp_path) -> None:
+        path = tmp_path / "run.jsonl"
+        await _make_suite(EvalJournal(path), ["a"]).run(_openai_client(), "gpt-4o")
+
+        journal = EvalJournal(path, resume=True)
+        client = _openai_client()
+        results = await _make_suite(journal, ["a", "b"]).run(client, "gpt-4o")
+
+        assert client.chat.completions.create.await_count == 1
+        assert journal.resumed == 1
+        assert [c["name"] for c in results["cases"]] == ["a", "b"]
+        assert isinstance(results["cases"][0]["evaluation"], EvaluationResult)
+        assert results["cases"][0]["evaluation"].passed
+        assert len(list(iter_journal_records(path))) == 2
+
+    @pytest.mark.asyncio
+    async def test_resume_does_not_reuse_other_models_or_run_counts(self, tmp_path) -> None:
+        path = tmp_path / "run.jsonl"
+        await _make_suite(EvalJournal(path), ["a"]).run(_openai_client(), "gpt-4o")
+
+        client = _openai_client()
+        suite = _make_suite(EvalJournal(path, resume=True), ["a"])
+        await suite.run(client, "gpt-4o-mini")
+        await suite.run(client, "gpt-4o", num_runs=2)
+
+        assert client.chat.completions.create.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_edited_cases_and_changed_settings_run_again(self, tmp_path) -> None:
+        path = tmp_path / "run.jsonl"
+        await _make_suite(EvalJournal(path), ["a"]).run(_openai_client(), "gpt-4o")
+
+        client = _openai_client()
+        edited = _make_suite(EvalJournal(path, resume=True), ["a"])
+        edited.cases[0].user_message = "search for dogs"
+        await edited.run(client, "gpt-4o")
+        await _make_suite(EvalJournal(path, resume=True), ["a"]).run(client, "gpt-4o", seed=7)
+        await _make_suite(EvalJournal(path, resume=True), ["a"]).run(
+            client, "gpt-4o", multi_run_pass_rule=PASS_RULE_MEAN
+        )
+
+        assert client.chat.completions.create.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicate_case_names_are_journaled_separately(self, tmp_path) -> None:
+        path = tmp_path / "run.jsonl"
+        await _make_suite(EvalJournal(path), ["same", "same"]).run(_openai_client(), "gpt-4o")
+
+        assert len({r["key"] for r in iter_journal_records(path)}) == 2
+
+    def test_new_journal_replaces_existing_file(self, tmp_path) -> None:
+        path = tmp_path / "nested" / "run.jsonl"
+        path.parent.mkdir()
+        path.write_text('{"key": "old", "case": {}}\n')
+
+        EvalJournal(path)
+
+        assert path.read_text() == ""
+
+    @pytest.mark.asyncio
+    async def test_truncated_last_line_is_skipped(self, tmp_path) -> None:
+        path = tmp_path / "run.jsonl"
+        await _make_suite(EvalJournal(path), ["a"]).run(_openai_client(), "gpt-4o")
+        with path.open("a") as f:
+            f.write('{"key": "partial", "ca')
+
+        journal = EvalJournal(path, resume=True)
+        client = _openai_client()
+        await _make_suite(journal, ["a"]).run(client, "gpt-4o")
+
+        assert journal.resumed == 1
+        client.chat.completions.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_comparative_cases_are_journaled_per_track(self, tmp_path) -> None:
+        path = tmp_path / "run.jsonl"
+
+        def make_suite(journal: EvalJournal) -> EvalSuite:
+            suite = EvalSuite(name="compare", system_message="sys", journal=journal)
+            suite.add_tool_definitions([SEARCH_TOOL], track="A")
+            suite.add_tool_definitions([SEARCH_TOOL], track="B")
+            suite.add_comparative_case(name="c", user_message="search for cats").for_track(
+                "A", expected_tool_calls=[ExpectedMCPToolCall("search", {"query": "cats"})]
+            ).for_track("B", expected_tool_calls=[ExpectedMCPToolCall("search", {"query": "dogs"})])
+            return suite
+
+        await make_suite(EvalJournal(path)).run_comparative(_openai_client(), "gpt-4o")
+
+        client = _openai_client()
+        results = await make_suite(EvalJournal(path, resume=True)).run_comparative(client, "gpt-4o")
+
+        client.chat.completions.create.assert_not_awaited()
+        assert results["A"]["cases"][0]["expected_tool_calls"][0]["args"] == {"query": "cats"}
+        assert results["B"]["cases"][0]["expected_tool_calls"][0]["args"] == {"query": "dogs"}
+        assert {r["track_name"] for r in iter_journal_records(path)} == {"A", "B"}
+
+
+class TestLoadJournalResults:
+    """Tests for rebuilding formatter input from a journal."""
+
+    @pytest.mark.asyncio
+    async def test_groups_by_suite_and_model(self, tmp_path) -> None:
+        path = tmp_path / "run.jsonl"
+        journal = EvalJournal(path)
+        suite = _make_suite(journal, ["a", "b"])
+        suite.rubric = EvalRubric(fail_threshold=0.5)
+        await suite.run(_openai_client(), "gpt-4o")
+        await suite.run(_openai_client(), "gpt-4o-mini")
+
+        results = load_journal_results(path)
+
+        assert [[r["model"] for r in group] for group in results] == [["gpt-4o"], ["gpt-4o-mini"]]
+        first = results[0][0]
+        assert first["suite_name"] == "journaled"
+        assert first["rubric"].fail_threshold == 0.5
+        assert "track_name" not in first
+        assert sorted(c["name"] for c in first["cases"]) == ["a", "b"]
+        assert all(isinstance(c["evaluation"], EvaluationResult) for c in first["cases"])
+
+    def test_missing_journal_is_empty(self, tmp_path) -> None:
+        assert load_journal_results(tmp_path / "missing.jsonl") == []
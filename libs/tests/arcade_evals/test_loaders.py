@@ -779,3 +779,168 @@ class TestMCPLoggingFilter:
 
         # Should pass through (return True)
         assert log_filter.filter(record) is True
+
+
+def _mock_mcp_with_tools(*names: str) -> tuple[tuple, MagicMock]:
+    """Return a `_require_mcp` result whose clients list the given tools, and the session class."""
+    tools = []
+    for name in names:
+        tool = MagicMock()
+        tool.name = name
+        tool.description = ""
+        tool.inputSchema = {"type": "object", "properties": {}}
+        tools.append(tool)
+
+    mock_session = AsyncMock()
+    mock_session.list_tools = AsyncMock(return_value=MagicMock(tools=tools))
+    mock_client_session_cls = MagicMock()
+    mock_client_session_cls.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_client_session_cls.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    mock_stdio_client = MagicMock()
+    mock_stdio_client.return_value.__aenter__ = AsyncMock(return_value=("read", "write"))
+    mock_stdio_client.return_value.__aexit__ = AsyncMock(return_value=None)
+    mock_http_client = MagicMock()
+    mock_http_client.return_value.__aenter__ = AsyncMock(return_value=("read", "write", None))
+    mock_http_client.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    return (
+        mock_client_session_cls,
+        MagicMock(),
+        mock_stdio_client,
+        MagicMock(),
+        mock_http_client,
+    ), mock_client_session_cls
+
+
+class TestToolsDiskCache:
+    """Tests for the on-disk tools cache shared across runs."""
+
+    def setup_method(self):
+        loaders.clear_tools_cache()
+
+    def teardown_method(self):
+        loaders.clear_tools_cache()
+        loaders.configure_tools_cache(None)
+
+    async def _load_in_new_process(self, load):
+        """Run a loader as a later run would: with an empty in-process cache."""
+        loaders.clear_tools_cache()
+        return await load()
+
+    @pytest.mark.asyncio
+    async def test_http_tools_are_reused_across_runs(self, tmp_path):
+        loaders.configure_tools_cache(tmp_path)
+        mcp, session_cls = _mock_mcp_with_tools("search")
+
+        def load():
+            return loaders.load_mcp_remote_async(
+                "http://localhost:8000", headers={"Authorization": "Bearer secret"}
+            )
+
+        with patch.object(loaders, "_require_mcp", return_value=mcp):
+            first = await load()
+            second = await self._load_in_new_process(load)
+
+        assert session_cls.call_count == 1
+        assert first == second
+        assert [t["name"] for t in second] == ["search"]
+        assert "secret" not in "".join(p.read_text() for p in tmp_path.iterdir())
+
+    @pytest.mark.asyncio
+    async def test_different_headers_are_cached_separately(self, tmp_path):
+        loaders.configure_tools_cache(tmp_path)
+        mcp, session_cls = _mock_mcp_with_tools("search")
+
+        with patch.object(loaders, "_require_mcp", return_value=mcp):
+            await loaders.load_mcp_remote_async("http://localhost:8000", headers={"A": "1"})
+            loaders.clear_tools_cache()
+            await loaders.load_mcp_remote_async("http://localhost:8000", headers={"A": "2"})
+
+        assert session_cls.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stdio_entry_is_invalidated_when_server_file_changes(self, tmp_path):
+        loaders.configure_tools_cache(tmp_path / "cache")
+        server = tmp_path / "server.py"
+        server.write_text("v1")
+        mcp, session_cls = _mock_mcp_with_tools("echo")
+
+        def load():
+            return loaders.load_from_stdio_async(["python", str(server)])
+
+        with patch.object(loaders, "_require_mcp", return_value=mcp):
+            await load()
+            await self._load_in_new_process(load)
+            assert session_cls.call_count == 1
+
+            server.write_text("v2 - longer")
+            await self._load_in_new_process(load)
+
+        assert session_cls.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_tool_lists_are_not_written(self, tmp_path):
+        loaders.configure_tools_cache(tmp_path)
+        mcp, _ = _mock_mcp_with_tools()
+
+        with patch.object(loaders, "_require_mcp", return_value=mcp):
+            await loaders.load_mcp_remote_async("http://localhost:8000")
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_reloaded(self, tmp_path):
+        loaders.configure_tools_cache(tmp_path, ttl=60)
+        mcp, session_cls = _mock_mcp_with_tools("search")
+
+        def load():
+            return loaders.load_mcp_remote_async("http://localhost:8000")
+
+        with patch.object(loaders, "_require_mcp", return_value=mcp):
+            await load()
+            with patch.object(loaders.time, "time", return_value=loaders.time.time() + 61):
+                await self._load_in_new_process(load)
+
+        assert session_cls.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_ignores_and_rewrites_entries(self, tmp_path):
+        loaders.configure_tools_cache(tmp_path)
+        old_mcp, _ = _mock_mcp_with_tools("old")
+        new_mcp, _ = _mock_mcp_with_tools("new")
+
+        def load():
+            return loaders.load_mcp_remote_async("http://localhost:8000")
+
+        with patch.object(loaders, "_require_mcp", return_value=old_mcp):
+            await load()
+        loaders.configure_tools_cache(tmp_path, refresh=True)
+        with patch.object(loaders, "_require_mcp", return_value=new_mcp):
+            refreshed = await self._load_in_new_process(load)
+        loaders.configure_tools_cache(tmp_path)
+        with patch.object(loaders, "_require_mcp", side_effect=AssertionError("not cached")):
+            cached = await self._load_in_new_process(load)
+
+        assert [t["name"] for t in refreshed] == ["new"]
+        assert cached == refreshed
+
+    @pytest.mark.asyncio
+    async def test_unreadable_entry_is_reloaded(self, tmp_path):
+        loaders.configure_tools_cache(tmp_path)
+        mcp, session_cls = _mock_mcp_with_tools("search")
+
+        with patch.object(loaders, "_require_mcp", return_value=mcp):
+            await loaders.load_mcp_remote_async("http://localhost:8000")
+            for entry in tmp_path.iterdir():
+                entry.write_text("{not json")
+            tools = await self._load_in_new_process(
+                lambda: loaders.load_mcp_remote_async("http://localhost:8000")
+            )
+
+        assert session_cls.call_count == 2
+        assert [t["name"] for t in tools] == ["search"]
+
+    def test_rejects_non_positive_ttl(self, tmp_path):
+        with pytest.raises(ValueError, match="ttl"):
+            loaders.configure_tools_cache(tmp_path, ttl=0)
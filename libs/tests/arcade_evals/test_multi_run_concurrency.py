@@ -0,0 +1,128 @@
+"""Tests that the runs of a multi-run case are scheduled under the suite-wide limit."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from arcade_evals import BinaryCritic, EvalSuite, ExpectedMCPToolCall
+
+# Mark all tests in this module as requiring evals dependencies
+pytestmark = pytest.mark.evals
+
+
+class OverlapRecordingClient:
+    """Fake OpenAI client that records how many calls are in flight at once.
+
+    Earlier calls take longer, so completion order is the reverse of start
+    order. Each response echoes the request seed back as the "query" argument.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self.chat = MagicMock()
+        self.chat.completions.create = self._create
+
+    async def _create(self, **params):
+        self.calls += 1
+        delay = 0.05 / self.calls
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.in_flight -= 1
+        tool_call = MagicMock()
+        tool_call.function.name = "search"
+        tool_call.function.arguments = json.dumps({"query": str(params.get("seed"))})
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.tool_calls = [tool_call]
+        return response
+
+
+def _make_suite(max_concurrent: int, *, track: str | None = None) -> EvalSuite:
+    suite = EvalSuite(name="parallel", system_message="sys", max_concurrent=max_concurrent)
+    suite.add_tool_definitions(
+        [
+            {
+                "name": "search",
+                "description": "Search",
+                "inputSchema": {"type": "object", "properties": {"query": {"type": "string"}}},
+            }
+        ],
+        track=track,
+    )
+    return suite
+
+
+def _run_actual_queries(case_result: dict) -> list[str]:
+    return [
+        next(d["actual"] for d in run["details"] if d["field"] == "query")
+        for run in case_result["run_stats"]["runs"]
+    ]
+
+
+class TestParallelMultiRun:
+    @pytest.mark.asyncio
+    async def test_runs_of_one_case_overlap(self) -> None:
+        suite = _make_suite(max_concurrent=4)
+        suite.add_case(
+            name="case",
+            user_message="search",
+            expected_tool_calls=[ExpectedMCPToolCall("search", {"query": "x"})],
+            critics=[BinaryCritic(critic_field="query", weight=1.0)],
+        )
+        client = OverlapRecordingClient()
+
+        results = await suite.run(client, "gpt-4o", num_runs=4, seed="random")
+
+        assert client.calls == 4
+        assert client.max_in_flight == 4
+        # Runs are reported in seed order even though they completed in reverse
+        case_result = results["cases"][0]
+        seeds = case_result["run_stats"]["run_seeds"]
+        assert _run_actual_queries(case_result) == [str(s) for s in seeds]
+
+    @pytest.mark.asyncio
+    async def test_runs_respect_suite_wide_limit(self) -> None:
+        suite = _make_suite(max_concurrent=2)
+        for i in range(3):
+            suite.add_case(
+                name=f"case {i}",
+                user_message="search",
+                expected_tool_calls=[ExpectedMCPToolCall("search", {"query": "x"})],
+            )
+        client = OverlapRecordingClient()
+
+        await suite.run(client, "gpt-4o", num_runs=3)
+
+        assert client.calls == 9
+        assert client.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_capture_runs_overlap_in_order(self) -> None:
+        suite = _make_suite(max_concurrent=3)
+        suite.add_case(name="case", user_message="search", expected_tool_calls=[])
+        client = OverlapRecordingClient()
+
+        result = await suite.capture(client, "gpt-4o", num_runs=3, seed=7)
+
+        assert client.max_in_flight == 3
+        runs = result.captured_cases[0].runs
+        assert [run.tool_calls[0].args["query"] for run in runs] == ["7", "7", "7"]
+
+    @pytest.mark.asyncio
+    async def test_comparative_runs_overlap(self) -> None:
+        suite = _make_suite(max_concurrent=3, track="t1")
+        suite.add_comparative_case(name="case", user_message="search").for_track(
+            "t1", expected_tool_calls=[ExpectedMCPToolCall("search", {"query": "x"})]
+        )
+        client = OverlapRecordingClient()
+
+        results = await suite.run_comparative(client, "gpt-4o", num_runs=3)
+
+        assert client.max_in_flight == 3
+        assert results["t1"]["cases"][0]["run_stats"]["num_runs"] == 3
@@ -0,0 +1,212 @@
+"""Tests for the process-wide eval rate limiter."""
+
+import email.utils
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from arcade_evals import EvalSuite, rate_limit
+from arcade_evals.rate_limit import (
+    RateLimiter,
+    get_rate_limiter,
+    get_retry_after,
+    rate_limiter_stats,
+    reset_rate_limiters,
+    set_default_rate_limits,
+)
+
+# Mark all tests in this module as requiring evals dependencies
+pytestmark = pytest.mark.evals
+
+
+class FakeRateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, headers: dict[str, str] | None = None) -> None:
+        super().__init__("rate limited")
+        self.response = MagicMock(headers=headers or {})
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+class TestRetryAfter:
+    def test_milliseconds_header_wins(self) -> None:
+        error = FakeRateLimitError({"retry-after-ms": "250", "retry-after": "9"})
+        assert get_retry_after(error) == pytest.approx(0.25)
+
+    def test_seconds(self) -> None:
+        assert get_retry_after(FakeRateLimitError({"retry-after": "2"})) == 2.0
+
+    def test_http_date(self) -> None:
+        when = email.utils.formatdate(time.time() + 30, usegmt=True)
+        assert 25 < get_retry_after(FakeRateLimitError({"retry-after": when})) <= 30
+
+    def test_missing_or_unparseable(self) -> None:
+        assert get_retry_after(FakeRateLimitError()) is None
+        assert get_retry_after(FakeRateLimitError({"retry-after": "soon"})) is None
+        assert get_retry_after(ValueError()) is None
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_requests_per_minute_spaces_requests(self, monkeypatch) -> None:
+        # One-request bucket refilled at 10 requests/second
+        monkeypatch.setattr(rate_limit, "_BURST_SECONDS", 0.1)
+        limiter = RateLimiter(requests_per_minute=600)
+        func = AsyncMock(return_value="ok")
+
+        start = time.monotonic()
+        for _ in range(4):
+            await limiter.call(func)
+
+        assert time.monotonic() - start >= 0.25
+        assert limiter.requests == 4
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_request_honoring_retry_after(self) -> None:
+        limiter = RateLimiter()
+        func = AsyncMock(
+            side_effect=[
+                FakeRateLimitError({"retry-after": "0.05"}),
+                FakeRateLimitError({"retry-after": "0.05"}),
+                "ok",
+            ]
+        )
+
+        start = time.monotonic()
+        result = await limiter.call(func)
+
+        assert result == "ok"
+        assert time.monotonic() - start >= 0.1
+        assert limiter.rate_limited == 2
+        assert limiter.rate_factor < 1.0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self) -> None:
+        limiter = RateLimiter(max_retries=2, base_backoff=0.001)
+        func = AsyncMock(side_effect=FakeRateLimitError())
+
+        with pytest.raises(FakeRateLimitError):
+            await limiter.call(func)
+        assert func.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self) -> None:
+        limiter = RateLimiter()
+        func = AsyncMock(side_effect=ValueError("bad request"))
+
+        with pytest.raises(ValueError):
+            await limiter.call(func)
+        assert func.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried_without_slowing_down(self) -> None:
+        limiter = RateLimiter(base_backoff=0.001)
+        server_error = FakeRateLimitError()
+        server_error.status_code = 503
+        func = AsyncMock(side_effect=[server_error, ConnectionError(), "ok"])
+
+        assert await limiter.call(func) == "ok"
+        assert func.await_count == 3
+        assert limiter.rate_factor == 1.0
+        assert limiter.rate_limited == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_attempts_are_not_counted_as_requests(self) -> None:
+        limiter = RateLimiter(base_backoff=0.001)
+
+        await limiter.call(AsyncMock(side_effect=[FakeRateLimitError(), "ok"]))
+
+        stats = limiter.stats("openai", "gpt-4o")
+        assert stats.requests == 1
+        assert stats.rate_limited == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_recovers_after_successes(self) -> None:
+        limiter = RateLimiter(base_backoff=0.001)
+        await limiter.call(AsyncMock(side_effect=[FakeRateLimitError(), "ok"]))
+        lowered = limiter.rate_factor
+
+        for _ in range(3):
+            await limiter.call(AsyncMock(return_value="ok"))
+
+        assert lowered < limiter.rate_factor <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_token_usage_is_tracked(self) -> None:
+        limiter = RateLimiter(tokens_per_minute=1_000_000)
+
+        await limiter.call(AsyncMock(return_value=120), usage=lambda tokens: tokens)
+        await limiter.call(AsyncMock(return_value=80), usage=lambda tokens: tokens)
+
+        stats = limiter.stats("openai", "gpt-4o")
+        assert stats.requests == 2
+        assert stats.tokens == 200
+
+
+class TestSharedLimiters:
+    def test_one_limiter_per_provider_model(self) -> None:
+        assert get_rate_limiter("openai", "gpt-4o") is get_rate_limiter("openai", "gpt-4o")
+        assert get_rate_limiter("openai", "gpt-4o") is not get_rate_limiter("openai", "o3")
+
+    @pytest.mark.asyncio
+    async def test_default_limits_apply_to_existing_limiters(self, monkeypatch) -> None:
+        monkeypatch.setattr(rate_limit, "_BURST_SECONDS", 0.1)
+        limiter = get_rate_limiter("openai", "gpt-4o")
+        set_default_rate_limits(requests_per_minute=600)
+        func = AsyncMock(return_value="ok")
+
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.call(func)
+
+        assert time.monotonic() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_reset_can_keep_the_default_limits(self) -> None:
+        set_default_rate_limits(requests_per_minute=600)
+        await get_rate_limiter("openai", "gpt-4o").call(AsyncMock(return_value="ok"))
+
+        reset_rate_limiters(keep_limits=True)
+
+        assert rate_limiter_stats() == []
+        limiter = get_rate_limiter("openai", "gpt-4o")
+        assert limiter._requests_bucket is not None
+        assert limiter._requests_bucket.per_minute == 600
+
+    @pytest.mark.asyncio
+    async def test_suites_share_the_limiter_and_report_throughput(self) -> None:
+        def make_suite(name: str) -> EvalSuite:
+            suite = EvalSuite(name=name, system_message="sys")
+            suite.add_tool_definitions([{"name": "search"}])
+            suite.add_case(name="case", user_message="search", expected_tool_calls=[])
+            return suite
+
+        tool_call = MagicMock()
+        tool_call.function.name = "search"
+        tool_call.function.arguments = json.dumps({})
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.tool_calls = [tool_call]
+        response.usage.total_tokens = 50
+        client = AsyncMock()
+        client.chat.completions.create.side_effect = [
+            FakeRateLimitError({"retry-after": "0.01"}),
+            response,
+            response,
+        ]
+
+        await make_suite("one").run(client, "gpt-4o")
+        await make_suite("two").run(client, "gpt-4o")
+
+        [stats] = rate_limiter_stats()
+        assert (stats.provider, stats.model) == ("openai", "gpt-4o")
+        assert stats.requests == 2
+        assert stats.tokens == 100
+        assert stats.rate_limited == 1
@@ -0,0 +1,190 @@
+"""Tests for the eval model response record/replay cache."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from arcade_evals import (
+    EvalSuite,
+    ExpectedMCPToolCall,
+    ResponseCache,
+    ResponseCacheMissError,
+)
+
+# Mark all tests in this module as requiring evals dependencies
+pytestmark = pytest.mark.evals
+
+
+def _openai_response(name: str, args: dict) -> MagicMock:
+    tool_call = MagicMock()
+    tool_call.function.name = name
+    tool_call.function.arguments = json.dumps(args)
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.tool_calls = [tool_call]
+    return response
+
+
+def _openai_client(*responses: MagicMock) -> AsyncMock:
+    client = AsyncMock()
+    client.chat.completions.create.side_effect = list(responses)
+    return client
+
+
+def _make_suite(cache: ResponseCache | None) -> EvalSuite:
+    suite = EvalSuite(name="cached", system_message="sys", response_cache=cache)
+    suite.add_tool_definitions([
+        {
+            "name": "search",
+            "description": "Search",
+            "inputSchema": {
+                "type": "object",
+                "properties": {"query": {"type": "string"}},
+                "required": ["query"],
+            },
+        }
+    ])
+    suite.add_case(
+        name="case",
+        user_message="search for cats",
+        expected_tool_calls=[ExpectedMCPToolCall("search", {"query": "cats"})],
+    )
+    return suite
+
+
+class TestResponseCache:
+    """Tests for ResponseCache itself."""
+
+    def test_invalid_mode_rejected(self, tmp_path) -> None:
+        with pytest.raises(ValueError, match="Invalid response cache mode"):
+            ResponseCache(tmp_path, mode="bogus")  # type: ignore[arg-type]
+
+    def test_key_depends_on_request_tools_and_run_index(self) -> None:
+        request = {"model": "gpt-4o", "seed": 1, "messages": [{"role": "user", "content": "hi"}]}
+        key = ResponseCache.make_key("openai", request, "tools-a")
+
+        assert key == ResponseCache.make_key("openai", dict(request), "tools-a")
+        assert key != ResponseCache.make_key("anthropic", request, "tools-a")
+        assert key != ResponseCache.make_key("openai", {**request, "seed": 2}, "tools-a")
+        assert key != ResponseCache.make_key("openai", request, "tools-b")
+        assert key != ResponseCache.make_key("openai", request, "tools-a", run_index=1)
+
+    @pytest.mark.asyncio
+    async def test_record_calls_once_then_serves_recording(self, tmp_path) -> None:
+        cache = ResponseCache(tmp_path, mode="record")
+        call = AsyncMock(return_value=[("search", {"query": "cats"})])
+
+        first = await cache.get_or_call("k" * 64, call)
+        second = await cache.get_or_call("k" * 64, call)
+
+        assert first == second == [("search", {"query": "cats"})]
+        call.assert_awaited_once()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_replay_miss_raises_without_calling(self, tmp_path) -> None:
+        cache = ResponseCache(tmp_path, mode="replay")
+        call = AsyncMock()
+
+        with pytest.raises(ResponseCacheMissError):
+            await cache.get_or_call("k" * 64, call)
+        call.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refresh_always_calls_and_overwrites(self, tmp_path) -> None:
+        await ResponseCache(tmp_path).get_or_call("k" * 64, AsyncMock(return_value=[("old", {})]))
+        refresh = ResponseCache(tmp_path, mode="refresh")
+
+        result = await refresh.get_or_call("k" * 64, AsyncMock(return_value=[("new", {})]))
+
+        assert result == [("new", {})]
+        replayed = await ResponseCache(tmp_path, mode="replay").get_or_call("k" * 64, AsyncMock())
+        assert replayed == [("new", {})]
+
+    @pytest.mark.asyncio
+    async def test_unreadable_recording_is_a_miss(self, tmp_path) -> None:
+        key = "ab" + "c" * 62
+        (tmp_path / key[:2]).mkdir()
+        (tmp_path / key[:2] / f"{key}.json").write_text("not json")
+
+        result = await ResponseCache(tmp_path).get_or_call(key, AsyncMock(return_value=[]))
+
+        assert result == []
+
+
+class TestEvalSuiteResponseCache:
+    """Tests for record/replay through EvalSuite."""
+
+    @pytest.mark.asyncio
+    async def test_replay_scores_without_calling_model(self, tmp_path) -> None:
+        recording_client = _openai_client(_openai_response("search", {"query": "cats"}))
+        await _make_suite(ResponseCache(tmp_path)).run(recording_client, "gpt-4o")
+        recording_client.chat.completions.create.assert_awaited_once()
+
+        replay_client = _openai_client()
+        results = await _make_suite(ResponseCache(tmp_path, mode="replay")).run(
+            replay_client, "gpt-4o"
+        )
+
+        replay_client.chat.completions.create.assert_not_awaited()
+        case = results["cases"][0]
+        assert case["predicted_tool_calls"] == [{"name": "search", "args": {"query": "cats"}}]
+        assert case["evaluation"].passed
+
+    @pytest.mark.asyncio
+    async def test_multi_run_records_each_run_separately(self, tmp_path) -> None:
+        client = _openai_client(
+            _openai_response("search", {"query": "cats"}),
+            _openai_response("search", {"query": "dogs"}),
+        )
+        await _make_suite(ResponseCache(tmp_path)).run(client, "gpt-4o", num_runs=2)
+
+        results = await _make_suite(ResponseCache(tmp_path, mode="replay")).run(
+            _openai_client(), "gpt-4o", num_runs=2
+        )
+
+        # The last run's calls are reported, and they come from the second recording
+        assert results["cases"][0]["predicted_tool_calls"] == [
+            {"name": "search", "args": {"query": "dogs"}}
+        ]
+        assert len(list(tmp_path.glob("*/*.json"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_tools_miss_the_recording(self, tmp_path) -> None:
+        client = _openai_client(_openai_response("search", {"query": "cats"}))
+        await _make_suite(ResponseCache(tmp_path)).run(client, "gpt-4o")
+
+        suite = _make_suite(ResponseCache(tmp_path, mode="replay"))
+        suite.add_tool_definitions([{"name": "other"}])
+
+        with pytest.raises(ResponseCacheMissError):
+            await suite.run(_openai_client(), "gpt-4o")
+
+    @pytest.mark.asyncio
+    async def test_capture_uses_recording(self, tmp_path) -> None:
+        client = _openai_client(_openai_response("search", {"query": "cats"}))
+        await _make_suite(ResponseCache(tmp_path)).run(client, "gpt-4o")
+
+        result = await _make_suite(ResponseCache(tmp_path, mode="replay")).capture(
+            _openai_client(), "gpt-4o"
+        )
+
+        assert result.captured_cases[0].tool_calls[0].args == {"query": "cats"}
+
+    @pytest.mark.asyncio
+    async def test_anthropic_replay(self, tmp_path) -> None:
+        block = MagicMock()
+        block.type = "tool_use"
+        block.name = "search"
+        block.input = {"query": "cats"}
+        client = AsyncMock()
+        client.messages.create.return_value = MagicMock(content=[block])
+        await _make_suite(ResponseCache(tmp_path)).run(client, "claude", provider="anthropic")
+
+        replay_client = AsyncMock()
+        results = await _make_suite(ResponseCache(tmp_path, mode="replay")).run(
+            replay_client, "claude", provider="anthropic"
+        )
+
+        replay_client.messages.create.assert_not_awaited()
+        assert results["cases"][0]["evaluation"].passed
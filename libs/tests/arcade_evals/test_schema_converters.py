@@ -1026,3 +1026,86 @@ class TestToolNameCollisions:
 
         # Anthropic format should have normalized name
         assert tools[0]["name"] == "Google_Search"
+
+
+class TestToolRegistryFormatCache:
+    """Tests for caching converted provider tool lists."""
+
+    def test_openai_conversion_runs_once(self, monkeypatch):
+        from arcade_evals._evalsuite import _tool_registry
+
+        calls = []
+        original = _tool_registry.convert_to_strict_mode_schema
+
+        def counting(schema):
+            calls.append(schema)
+            return original(schema)
+
+        monkeypatch.setattr(_tool_registry, "convert_to_strict_mode_schema", counting)
+        registry = EvalSuiteToolRegistry()
+        registry.add_tool({"name": "a", "inputSchema": {"type": "object", "properties": {}}})
+        registry.add_tool({"name": "b", "inputSchema": {"type": "object", "properties": {}}})
+
+        first = registry.list_tools_for_model("openai")
+        second = registry.list_tools_for_model("openai")
+
+        assert first == second
+        assert len(calls) == 2
+
+    def test_add_tool_invalidates_cache(self):
+        registry = EvalSuiteToolRegistry()
+        registry.add_tool({"name": "a"})
+        assert len(registry.list_tools_for_model("openai")) == 1
+        assert len(registry.list_tools_for_model("anthropic")) == 1
+
+        registry.add_tool({"name": "b"})
+
+        assert [t["function"]["name"] for t in registry.list_tools_for_model("openai")] == [
+            "a",
+            "b",
+        ]
+        assert [t["name"] for t in registry.list_tools_for_model("anthropic")] == ["a", "b"]
+
+    def test_strict_mode_change_is_reflected(self):
+        registry = EvalSuiteToolRegistry(strict_mode=True)
+        registry.add_tool({"name": "a", "inputSchema": {"type": "object", "properties": {}}})
+        assert registry.list_tools_for_model("openai")[0]["function"]["strict"] is True
+
+        registry.strict_mode = False
+
+        assert "strict" not in registry.list_tools_for_model("openai")[0]["function"]
+
+    def test_tools_are_shared_but_the_list_is_fresh(self):
+        registry = EvalSuiteToolRegistry()
+        registry.add_tool({"name": "a"})
+
+        tools = registry.list_tools_for_model("openai")
+        tools.append({"name": "extra"})
+        again = registry.list_tools_for_model("openai")
+
+        assert len(again) == 1
+        assert again[0] is tools[0]
+
+    def test_cache_is_detached_from_registered_definitions(self):
+        registry = EvalSuiteToolRegistry(strict_mode=False)
+        schema = {"type": "object", "properties": {}}
+        registry.add_tool({"name": "a", "inputSchema": schema})
+        digest = registry.tools_hash("openai")
+
+        schema["properties"]["injected"] = {"type": "string"}
+
+        assert registry.list_tools_for_model("openai")[0]["function"]["parameters"] == {
+            "type": "object",
+            "properties": {},
+        }
+        assert registry.tools_hash("openai") == digest
+
+    def test_unserializable_schema_values_raise_when_hashed(self):
+        registry = EvalSuiteToolRegistry(strict_mode=False)
+        registry.add_tool({
+            "name": "a",
+            "inputSchema": {"type": "object", "properties": {}, "x": object()},
+        })
+
+        with pytest.raises(TypeError):
+            registry.tools_hash("openai")
@@ -429,6 +429,7 @@ class TestContext:
         nm = Mock()
         nm.notify_tool_list_changed = AsyncMock()
         nm.notify_resource_list_changed = AsyncMock()
+        nm.notify_prompt_list_changed = AsyncMock()
         mcp_server.notification_manager = nm
 
         # Add session_id to session
@@ -443,6 +444,7 @@ class TestContext:
         # Verify notifications were sent with the session_id
         nm.notify_tool_list_changed.assert_called_once_with(["test-session-123"])
         nm.notify_resource_list_changed.assert_called_once_with(["test-session-123"])
+        nm.notify_prompt_list_changed.assert_called_once_with(["test-session-123"])
 
     def test_parse_model_preferences(self, mcp_server):
         """Test model preferences parsing."""
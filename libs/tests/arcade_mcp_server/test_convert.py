@@ -6,6 +6,7 @@ from typing import Annotated
 
 import pytest
 from arcade_core.catalog import MaterializedTool, ToolCatalog, ToolMeta, create_func_models
+from arcade_core.metadata import ToolMetadata
 from arcade_core.schema import (
     InputParameter,
     ToolDefinition,
@@ -20,6 +21,8 @@ from arcade_mcp_server.convert import (
     convert_content_to_structured_content,
     convert_to_mcp_content,
     create_mcp_tool,
+    encode_tool_result,
+    get_result_encoding,
 )
 from arcade_mcp_server.types import ToolExecution
 
@@ -776,6 +779,71 @@ class TestConvertContentToStructuredContent:
         assert result == {"result": "custom-str"}
 
 
+class TestEncodeToolResult:
+    """Test encode_tool_result and the result encoding policies."""
+
+    def test_both_duplicates_value(self):
+        value = {"items": [1, 2]}
+        content, structured = encode_tool_result(value, "both")
+        assert json.loads(content[0].text) == value
+        assert structured == value
+
+    def test_structured_summarizes_objects_and_lists(self):
+        value = {f"k{i}": i for i in range(12)}
+        content, structured = encode_tool_result(value, "structured")
+        assert structured == value
+        assert content[0].text == (
+            "Object with keys: k0, k1, k2, k3, k4, k5, k6, k7, k8, k9, ... (2 more). "
+            "Full result in structuredContent."
+        )
+
+        content, structured = encode_tool_result([1, 2, 3], "structured")
+        assert structured == {"result": [1, 2, 3]}
+        assert content[0].text == "List of 3 items. Full result in structuredContent."
+
+    def test_structured_truncates_long_strings_only(self):
+        content, _ = encode_tool_result("x" * 500, "structured")
+        assert content[0].text.startswith("x" * 200 + "...")
+        assert "500 characters" in content[0].text
+
+        content, structured = encode_tool_result("short", "structured")
+        assert content[0].text == "short"
+        assert structured == {"result": "short"}
+
+    def test_structured_keeps_bytes_as_base64_text(self):
+        content, _ = encode_tool_result(b"abc", "structured")
+        assert base64.b64decode(content[0].text) == b"abc"
+
+    def test_text_omits_structured_content_unless_required(self):
+        content, structured = encode_tool_result({"a": 1}, "text")
+        assert structured is None
+        assert json.loads(content[0].text) == {"a": 1}
+
+        _, structured = encode_tool_result({"a": 1}, "text", requires_structured=True)
+        assert structured == {"a": 1}
+
+    @pytest.mark.parametrize(
+        "extras, expected",
+        [
+            (None, "both"),
+            ({"result_encoding": "structured"}, "structured"),
+            ({"result_encoding": "bogus"}, "both"),
+        ],
+    )
+    def test_get_result_encoding(self, extras, expected):
+        definition = ToolDefinition(
+            name="t",
+            fully_qualified_name="Toolkit.t",
+            description="d",
+            toolkit=ToolkitDefinition(name="Toolkit"),
+            input=ToolInput(parameters=[]),
+            output=ToolOutput(),
+            requirements=ToolRequirements(),
+            metadata=ToolMetadata(extras=extras) if extras else None,
+        )
+        assert get_result_encoding(definition, "both") == expected
+
+
 class TestConvertToolExecution:
     """MCP conversion reads ``__tool_execution__`` off the tool function.
 
@@ -0,0 +1,165 @@
+"""Tests for batched registry changes and debounced list_changed notifications."""
+
+import asyncio
+import json
+from typing import Annotated
+
+import pytest
+from arcade_core.catalog import MaterializedTool, ToolMeta, create_func_models
+from arcade_core.schema import (
+    ToolDefinition,
+    ToolInput,
+    ToolkitDefinition,
+    ToolOutput,
+    ToolRequirements,
+)
+from arcade_mcp_server import tool
+from arcade_mcp_server.managers.base import AsyncRegistry
+
+
+def _recording_registry() -> tuple[AsyncRegistry[str, int], list[str]]:
+    registry: AsyncRegistry[str, int] = AsyncRegistry("item")
+    events: list[str] = []
+    registry.subscribe(lambda event, *_: events.append(event))
+    return registry, events
+
+
+def _make_tool(name: str) -> MaterializedTool:
+    @tool
+    def generated() -> Annotated[str, "Result"]:
+        """Generated tool"""
+        return name
+
+    input_model, output_model = create_func_models(generated)
+    return MaterializedTool(
+        tool=generated,
+        definition=ToolDefinition(
+            name=name,
+            fully_qualified_name=f"Bulk.{name}",
+            description="Generated tool",
+            toolkit=ToolkitDefinition(name="Bulk", version="1.0.0"),
+            input=ToolInput(parameters=[]),
+            output=ToolOutput(),
+            requirements=ToolRequirements(),
+        ),
+        meta=ToolMeta(module=generated.__module__, toolkit="Bulk"),
+        input_model=input_model,
+        output_model=output_model,
+    )
+
+
+class TestRegistryBatch:
+    @pytest.mark.asyncio
+    async def test_subscribers_hear_one_event_per_batch(self):
+        registry, events = _recording_registry()
+
+        async with registry.batch():
+            for i in range(10):
+                await registry.upsert(f"item{i}", i)
+            await registry.remove("item0")
+            assert events == []
+
+        assert events == ["batch"]
+        assert len(await registry.keys()) == 9
+
+    @pytest.mark.asyncio
+    async def test_nested_batches_emit_when_the_outermost_exits(self):
+        registry, events = _recording_registry()
+
+        async with registry.batch():
+            async with registry.batch():
+                await registry.upsert("a", 1)
+            assert events == []
+            await registry.upsert("b", 2)
+
+        assert events == ["batch"]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_silent(self):
+        registry, events = _recording_registry()
+
+        async with registry.batch():
+            pass
+        await registry.upsert("a", 1)
+
+        assert events == ["upsert"]
+
+    @pytest.mark.asyncio
+    async def test_changes_before_an_error_are_still_announced(self):
+        registry, events = _recording_registry()
+
+        with pytest.raises(RuntimeError):
+            async with registry.batch():
+                await registry.upsert("a", 1)
+                raise RuntimeError("load failed")
+
+        assert events == ["batch"]
+
+
+class TestDebouncedListChanged:
+    @staticmethod
+    async def _capture(mcp_server, session, debounce: float) -> list[str]:
+        # Drop the notification queued while the server loaded its catalog
+        await mcp_server.notification_manager.close()
+        mcp_server.notification_manager.debounce = debounce
+        mcp_server._sessions[session.session_id] = session
+        methods: list[str] = []
+
+        async def fake_send(message) -> None:
+            methods.append(json.loads(message)["method"])
+
+        session.write_stream = type("W", (), {"send": staticmethod(fake_send)})()
+        return methods
+
+    @pytest.mark.asyncio
+    async def test_bulk_load_sends_one_notification(self, mcp_server, server_session):
+        methods = await self._capture(mcp_server, server_session, 0.02)
+
+        for i in range(50):
+            await mcp_server.tools.add_tool(_make_tool(f"tool_{i}"))
+        await mcp_server.resources.add_text_resource("config://app", "{}")
+        await asyncio.sleep(0.1)
+
+        assert sorted(methods) == [
+            "notifications/resources/list_changed",
+            "notifications/tools/list_changed",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_outlasting_the_window_sends_one_notification(
+        self, mcp_server, server_session
+    ):
+        methods = await self._capture(mcp_server, server_session, 0.01)
+
+        async with mcp_server.tools.batch():
+            for i in range(5):
+                await mcp_server.tools.add_tool(_make_tool(f"tool_{i}"))
+                await asyncio.sleep(0.02)
+        await asyncio.sleep(0.05)
+
+        assert methods == ["notifications/tools/list_changed"]
+
+    @pytest.mark.asyncio
+    async def test_steady_changes_are_flushed_after_max_windows(self, mcp_server, server_session):
+        methods = await self._capture(mcp_server, server_session, 0.01)
+        manager = mcp_server.notification_manager
+        manager.max_windows = 3
+
+        for _ in range(40):
+            manager.list_changed("tools")
+            await asyncio.sleep(0.005)
+
+        assert "notifications/tools/list_changed" in methods
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_targeted_and_broadcast_requests_are_merged(self, mcp_server, server_session):
+        methods = await self._capture(mcp_server, server_session, 0.01)
+        manager = mcp_server.notification_manager
+
+        await manager.notify_prompt_list_changed(["other-session"])
+        await manager.notify_prompt_list_changed(None)
+        await manager.notify_prompt_list_changed([server_session.session_id])
+        await asyncio.sleep(0.05)
+
+        assert methods == ["notifications/prompts/list_changed"]
@@ -358,6 +358,12 @@ class TestMCPApp:
         # Test updating a tool at runtime
         await mcp_app.tools.update(materialized_tool)
 
+        # Test batching tool changes at runtime
+        async with mcp_app.tools.batch():
+            await mcp_app.tools.remove(materialized_tool.definition.fully_qualified_name)
+            await mcp_app.tools.add(materialized_tool)
+        assert len(await mcp_app.tools.list()) == num_tools_before_add + 1
+
     @pytest.mark.asyncio
     async def test_prompts_api(self, mcp_app: MCPApp, mcp_server):
         """Test the prompts API."""
@@ -386,8 +392,9 @@ class TestMCPApp:
                 )
             ]
 
-        # Test adding a prompt at runtime
-        await mcp_app.prompts.add(sample_prompt, test_handler)
+        # Test adding a prompt at runtime, inside a batch
+        async with mcp_app.prompts.batch():
+            await mcp_app.prompts.add(sample_prompt, test_handler)
 
         # Test listing prompts at runtime
         prompts = await mcp_app.prompts.list()
@@ -422,8 +429,9 @@ class TestMCPApp:
         def test_handler(uri: str):
             return {"content": f"Content for {uri}", "mimeType": "text/plain"}
 
-        # Test adding a resource at runtime
-        await mcp_app.resources.add(sample_resource, test_handler)
+        # Test adding a resource at runtime, inside a batch
+        async with mcp_app.resources.batch():
+            await mcp_app.resources.add(sample_resource, test_handler)
 
         # Test listing resources at runtime
         resources = await mcp_app.resources.list()
@@ -1172,7 +1180,8 @@ class TestMCPAppResourceAnnotationsMetaTemplates:
         assert isinstance(item, Resource)
         assert handler is not None
 
-    def test_mcp_app_add_file_resource(self, tmp_path):
+    @pytest.mark.asyncio
+    async def test_mcp_app_add_file_resource(self, tmp_path):
         from arcade_mcp_server.types import Resource
 
         f = tmp_path / "test.txt"
@@ -1192,9 +1201,10 @@ class TestMCPAppResourceAnnotationsMetaTemplates:
         assert item.name == "Test File"
         assert handler is not None
         # Handler should return the file content
-        assert handler("file:///test.txt") == "file content"
+        assert await handler("file:///test.txt") == "file content"
 
-    def test_mcp_app_add_file_resource_binary(self, tmp_path):
+    @pytest.mark.asyncio
+    async def test_mcp_app_add_file_resource_binary(self, tmp_path):
         f = tmp_path / "image.bin"
         f.write_bytes(b"\x89PNG\r\n")
 
@@ -1202,10 +1212,11 @@ class TestMCPAppResourceAnnotationsMetaTemplates:
         app.add_file_resource("file:///image.bin", path=str(f))
 
         _, handler = app._initial_resources[0]
-        result = handler("file:///image.bin")
+        result = await handler("file:///image.bin")
         assert isinstance(result, bytes)
 
-    def test_mcp_app_add_file_resource_missing_raises(self, tmp_path):
+    @pytest.mark.asyncio
+    async def test_mcp_app_add_file_resource_missing_raises(self, tmp_path):
         from arcade_mcp_server.exceptions import NotFoundError
 
         app = MCPApp(name="TestApp", version="1.0.0")
@@ -1213,7 +1224,7 @@ class TestMCPAppResourceAnnotationsMetaTemplates:
 
         _, handler = app._initial_resources[0]
         with pytest.raises(NotFoundError, match="File not found"):
-            handler("file:///missing.txt")
+            await handler("file:///missing.txt")
 
 
 class TestMCPAppMetadata:
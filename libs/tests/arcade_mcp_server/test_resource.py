@@ -3,15 +3,20 @@
 import asyncio
 import base64
 import logging
+import threading
 
 import pytest
 from arcade_mcp_server.exceptions import NotFoundError, ResourceError
+from arcade_mcp_server.managers import file_cache
+from arcade_mcp_server.managers.file_cache import FileContentCache, looks_like_text
 from arcade_mcp_server.managers.resource import (
     MultipleMatchPolicy,
     ResourceManager,
+    _TemplateIndex,
     _is_template_uri,
     _template_to_regex,
     _template_to_sample_uri,
+    make_file_handler,
 )
 from arcade_mcp_server.types import (
     BlobResourceContents,
@@ -436,6 +441,118 @@ class TestStaticResources:
             await manager.read_resource("file:///missing.txt")
 
 
+class TestFileContentCache:
+    """Test cached, thread-offloaded file resource reads."""
+
+    @pytest.fixture
+    def loads(self, monkeypatch) -> list:
+        loads = []
+        load = FileContentCache._load
+
+        def counting_load(self, path, size):
+            loads.append(path)
+            return load(self, path, size)
+
+        monkeypatch.setattr(FileContentCache, "_load", counting_load)
+        return loads
+
+    def test_text_and_binary_are_sniffed_from_a_prefix(self, tmp_path):
+        cache = FileContentCache()
+        text = tmp_path / "notes.txt"
+        text.write_text("héllo")
+        nul = tmp_path / "data.bin"
+        nul.write_bytes(b"abc\x00def")
+        latin1 = tmp_path / "latin1.txt"
+        latin1.write_bytes("caf\xe9".encode("latin-1"))
+
+        assert cache.read(text) == "héllo"
+        assert cache.read(nul) == b"abc\x00def"
+        assert cache.read(latin1) == b"caf\xe9"
+
+    def test_prefix_may_end_inside_a_character(self):
+        assert looks_like_text("aé".encode()[:2])
+        assert not looks_like_text(b"\xff\xfe")
+
+    def test_unchanged_file_is_served_from_cache(self, tmp_path, loads):
+        cache = FileContentCache()
+        f = tmp_path / "notes.txt"
+        f.write_text("v1")
+
+        assert cache.read(f) == "v1"
+        assert cache.read(f) == "v1"
+        assert len(loads) == 1
+
+        f.write_text("version 2")
+        assert cache.read(f) == "version 2"
+        assert len(loads) == 2
+        assert len(cache) == 1
+
+    def test_cache_is_bounded(self, tmp_path, loads):
+        cache = FileContentCache(max_bytes=10)
+        files = []
+        for name in ("a", "b", "c"):
+            f = tmp_path / name
+            f.write_text(name * 4)
+            files.append(f)
+            cache.read(f)
+
+        assert len(cache) == 2
+        cache.read(files[0])
+        assert len(loads) == 4
+
+    def test_large_files_are_memory_mapped(self, tmp_path, monkeypatch):
+        cache = FileContentCache(mmap_threshold=16)
+        text = tmp_path / "big.txt"
+        text.write_text("ü" * 100)
+        binary = tmp_path / "big.bin"
+        binary.write_bytes(bytes(range(256)))
+        mapped = []
+        real_mmap = file_cache.mmap.mmap
+
+        def recording_mmap(*args, **kwargs):
+            mapped.append(args)
+            return real_mmap(*args, **kwargs)
+
+        monkeypatch.setattr(file_cache.mmap, "mmap", recording_mmap)
+
+        assert cache.read(text) == "ü" * 100
+        assert cache.read(binary) == {"blob": base64.b64encode(bytes(range(256))).decode()}
+        assert len(mapped) == 2
+
+    @pytest.mark.asyncio
+    async def test_large_binary_resource_is_a_blob(self, tmp_path):
+        manager = ResourceManager()
+        f = tmp_path / "big.bin"
+        f.write_bytes(bytes(range(256)) * 4)
+        await manager.add_resource(
+            Resource(uri="file:///big.bin", name="big"),
+            handler=make_file_handler(f, cache=FileContentCache(mmap_threshold=16)),
+        )
+
+        result = await manager.read_resource("file:///big.bin")
+
+        assert isinstance(result[0], BlobResourceContents)
+        assert base64.b64decode(result[0].blob) == bytes(range(256)) * 4
+
+    @pytest.mark.asyncio
+    async def test_file_is_read_off_the_event_loop(self, tmp_path, monkeypatch):
+        f = tmp_path / "notes.txt"
+        f.write_text("content")
+        threads = []
+        read = FileContentCache.read
+
+        def recording_read(self, path):
+            threads.append(threading.current_thread())
+            return read(self, path)
+
+        monkeypatch.setattr(FileContentCache, "read", recording_read)
+
+        assert await make_file_handler(f, cache=FileContentCache())("file:///notes.txt") == (
+            "content"
+        )
+        assert threads[0] is not threading.main_thread()
+
+
 class TestDuplicateHandlingPolicy:
     """Test duplicate resource handling policies."""
 
@@ -705,3 +822,96 @@ class TestMultipleMatchPolicy:
 
         assert result[0].text == "weather-london"
         assert "matched" not in caplog.text
+
+
+class TestTemplateIndex:
+    """Test the trie that narrows template candidates before regex matching."""
+
+    TEMPLATES = [
+        "kb://docs/{path*}",
+        "kb://docs/{category}/articles/{slug}",
+        "kb://docs/guides/{slug}",
+        "kb://{space}/index",
+        "kb://docs/v{version}/{page}",
+        "weather://{city}/current",
+        "users://{id}",
+        "file:///{path*}",
+        "file:///etc/{name}",
+        "static://about",
+    ]
+
+    def test_candidates_only_include_templates_sharing_the_prefix(self):
+        index = _TemplateIndex()
+        for template in self.TEMPLATES:
+            index.add(template)
+
+        assert index.candidates("weather://london/current") == ["weather://{city}/current"]
+        assert index.candidates("kb://docs/guides/setup") == [
+            "kb://docs/{path*}",
+            "kb://docs/{category}/articles/{slug}",
+            "kb://docs/guides/{slug}",
+            "kb://{space}/index",
+            "kb://docs/v{version}/{page}",
+        ]
+        assert index.candidates("news://today") == []
+
+    def test_candidates_find_every_regex_match(self):
+        index = _TemplateIndex()
+        patterns = {template: _template_to_regex(template) for template in self.TEMPLATES}
+        for template in self.TEMPLATES:
+            index.add(template)
+        uris = [
+            "kb://docs/a/articles/b",
+            "kb://docs/guides/x",
+            "kb://docs/v2/intro",
+            "kb://team/index",
+            "kb://docs/index",
+            "file:///etc/hosts",
+            "file:///home/me/notes.txt",
+            "users://42",
+            "static://about",
+            "weather://paris/current",
+            "weather://paris",
+        ]
+
+        for uri in uris:
+            expected = [t for t, pattern in patterns.items() if pattern.match(uri)]
+            found = [t for t in index.candidates(uri) if patterns[t].match(uri)]
+            assert found == expected, uri
+
+    def test_related_covers_ancestors_and_descendants(self):
+        index = _TemplateIndex()
+        for template in self.TEMPLATES:
+            index.add(template)
+
+        related = index.related("kb://docs/{category}/articles/{slug}")
+
+        assert "kb://{space}/index" in related
+        assert "kb://docs/guides/{slug}" in related
+        assert "weather://{city}/current" not in related
+
+    def test_remove_prunes_the_branch(self):
+        index = _TemplateIndex()
+        index.add("a://b/c/{x}")
+        index.add("a://{y}")
+
+        index.remove("a://b/c/{x}")
+
+        assert index.candidates("a://b/c/d") == ["a://{y}"]
+        assert index._root.children["a:"].children[""].children == {}
+
+    @pytest.mark.asyncio
+    async def test_first_registered_match_wins_regardless_of_depth(self):
+        manager = ResourceManager(multiple_match_policy="ignore")
+        await manager.add_template_with_handler(
+            ResourceTemplate(uriTemplate="kb://docs/guides/{slug}", name="Guides"),
+            lambda uri, slug: "guides",
+        )
+        await manager.add_template_with_handler(
+            ResourceTemplate(uriTemplate="kb://{path*}", name="Everything"),
+            lambda uri, path: "everything",
+        )
+
+        result = await manager.read_resource("kb://docs/guides/setup")
+
+        assert result[0].text == "guides"
@@ -0,0 +1,250 @@
+"""Tests for resources/subscribe and resources/updated notifications."""
+
+import asyncio
+import gc
+from unittest.mock import AsyncMock, Mock
+
+import anyio
+import pytest
+import pytest_asyncio
+from arcade_mcp_server.exceptions import NotFoundError
+from arcade_mcp_server.managers.resource import ResourceManager, make_file_handler
+from arcade_mcp_server.session import ServerSession
+from arcade_mcp_server.types import (
+    JSONRPCError,
+    Resource,
+    ResourceTemplate,
+    ResourceUpdatedNotification,
+)
+
+
+def _session() -> Mock:
+    session = Mock()
+    session.send_notification = AsyncMock()
+    return session
+
+
+def _updated_uris(session: Mock) -> list[str]:
+    return [
+        call.args[0].params.uri
+        for call in session.send_notification.call_args_list
+        if isinstance(call.args[0], ResourceUpdatedNotification)
+    ]
+
+
+@pytest_asyncio.fixture
+async def manager():
+    manager = ResourceManager(update_debounce=0.02, watch_files=False)
+    await manager.start()
+    await manager.add_resource(
+        Resource(uri="config://app", name="config"), handler=lambda _uri: "{}"
+    )
+    await manager.add_template_with_handler(
+        ResourceTemplate(uriTemplate="users://{user_id}", name="user"),
+        lambda _uri, user_id: user_id,
+    )
+    yield manager
+    await manager.stop()
+
+
+class TestResourceSubscriptions:
+    @pytest.mark.asyncio
+    async def test_subscribers_are_notified_once_per_burst(self, manager):
+        subscribed, other = _session(), _session()
+        await manager.subscribe_resource("config://app", subscribed)
+
+        for _ in range(5):
+            await manager.notify_resource_updated("config://app")
+            await asyncio.sleep(0.005)
+        await manager.notify_resource_updated("users://1")
+        await asyncio.sleep(0.1)
+
+        assert _updated_uris(subscribed) == ["config://app"]
+        assert _updated_uris(other) == []
+
+    @pytest.mark.asyncio
+    async def test_steady_updates_are_notified_after_max_windows(self, manager):
+        session = _session()
+        await manager.subscribe_resource("config://app", session)
+        manager._subscriptions.max_windows = 3
+
+        for _ in range(40):
+            await manager.notify_resource_updated("config://app")
+            await asyncio.sleep(0.005)
+
+        assert _updated_uris(session)
+
+    @pytest.mark.asyncio
+    async def test_template_uris_can_be_subscribed(self, manager):
+        session = _session()
+        await manager.subscribe_resource("users://42", session)
+
+        await manager.notify_resource_updated("users://42")
+        await asyncio.sleep(0.1)
+
+        assert _updated_uris(session) == ["users://42"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_uri_cannot_be_subscribed(self, manager):
+        with pytest.raises(NotFoundError):
+            await manager.subscribe_resource("missing://x", _session())
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_and_ended_sessions_are_not_notified(self, manager):
+        unsubscribed, ended = _session(), _session()
+        await manager.subscribe_resource("config://app", unsubscribed)
+        await manager.subscribe_resource("config://app", ended)
+
+        await manager.unsubscribe_resource("config://app", unsubscribed)
+        await manager.remove_session_subscriptions(ended)
+        await manager.notify_resource_updated("config://app")
+        await asyncio.sleep(0.1)
+
+        assert _updated_uris(unsubscribed) == []
+        assert _updated_uris(ended) == []
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_not_kept_alive(self, manager):
+        await manager.subscribe_resource("config://app", _session())
+        gc.collect()
+
+        assert manager._subscriptions.subscribers("config://app") == []
+
+    @pytest.mark.asyncio
+    async def test_update_resource_notifies(self, manager):
+        session = _session()
+        await manager.subscribe_resource("config://app", session)
+
+        await manager.update_resource(
+            "config://app", Resource(uri="config://app", name="config"), lambda _uri: "[]"
+        )
+        await asyncio.sleep(0.1)
+
+        assert _updated_uris(session) == ["config://app"]
+
+    @pytest.mark.asyncio
+    async def test_removed_resource_drops_its_subscribers(self, manager):
+        session = _session()
+        await manager.subscribe_resource("config://app", session)
+
+        await manager.remove_resource("config://app")
+        await manager.notify_resource_updated("config://app")
+        await asyncio.sleep(0.1)
+
+        assert manager._subscriptions.subscribers("config://app") == []
+        assert _updated_uris(session) == []
+
+    @pytest.mark.asyncio
+    async def test_watch_follows_the_resource_file(self, tmp_path):
+        manager = ResourceManager(update_debounce=0.02)
+        await manager.start()
+        old, new = tmp_path / "old.txt", tmp_path / "new.txt"
+        old.write_text("v1")
+        new.write_text("v2")
+        await manager.add_file_resource("file:///notes.txt", path=old)
+        try:
+            await manager.subscribe_resource("file:///notes.txt", _session())
+            await manager.update_resource(
+                "file:///notes.txt",
+                Resource(uri="file:///notes.txt", name="notes"),
+                make_file_handler(new),
+            )
+            watched_after_update = {p: set(u) for p, u in manager._subscriptions._watched.items()}
+
+            await manager.remove_resource("file:///notes.txt")
+            watched_after_remove = manager._subscriptions._watched
+        finally:
+            await manager.stop()
+
+        assert watched_after_update == {new.resolve(): {"file:///notes.txt"}}
+        assert watched_after_remove == {}
+
+    @pytest.mark.asyncio
+    async def test_file_changes_are_detected(self, tmp_path):
+        manager = ResourceManager(update_debounce=0.02)
+        await manager.start()
+        f = tmp_path / "notes.txt"
+        f.write_text("v1")
+        (tmp_path / "other.txt").write_text("x")
+        await manager.add_file_resource("file:///notes.txt", path=f)
+        session = _session()
+        try:
+            await manager.subscribe_resource("file:///notes.txt", session)
+            await asyncio.sleep(0.3)  # let the watcher start
+
+            (tmp_path / "other.txt").write_text("y")
+            f.write_text("v2")
+            for _ in range(50):
+                if session.send_notification.called:
+                    break
+                await asyncio.sleep(0.1)
+        finally:
+            await manager.stop()
+
+        assert _updated_uris(session) == ["file:///notes.txt"]
+
+
+class TestSubscribeHandlers:
+    @pytest.mark.asyncio
+    async def test_subscribe_and_unsubscribe(self, mcp_server, initialized_server_session):
+        await mcp_server._resource_manager.add_resource(
+            Resource(uri="config://app", name="config"), handler=lambda _uri: "{}"
+        )
+
+        subscribed = await mcp_server.handle_message(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "resources/subscribe",
+                "params": {"uri": "config://app"},
+            },
+            initialized_server_session,
+        )
+        subscribers = mcp_server._resource_manager._subscriptions.subscribers("config://app")
+        unsubscribed = await mcp_server.handle_message(
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "resources/unsubscribe",
+                "params": {"uri": "config://app"},
+            },
+            initialized_server_session,
+        )
+
+        assert subscribed.result == {}
+        assert subscribers == [initialized_server_session]
+        assert unsubscribed.result == {}
+        assert mcp_server._resource_manager._subscriptions.subscribers("config://app") == []
+
+    @pytest.mark.asyncio
+    async def test_subscribe_to_unknown_resource(self, mcp_server, initialized_server_session):
+        response = await mcp_server.handle_message(
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "resources/subscribe",
+                "params": {"uri": "missing://x"},
+            },
+            initialized_server_session,
+        )
+
+        assert isinstance(response, JSONRPCError)
+        assert response.error["code"] == -32002
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_end_with_the_session(self, mcp_server):
+        await mcp_server._resource_manager.add_resource(
+            Resource(uri="config://app", name="config"), handler=lambda _uri: "{}"
+        )
+        read_writer, read_stream = anyio.create_memory_object_stream(1)
+        write_stream, _ = anyio.create_memory_object_stream(1)
+        session = ServerSession(
+            server=mcp_server, read_stream=read_stream, write_stream=write_stream
+        )
+        await mcp_server._resource_manager.subscribe_resource("config://app", session)
+
+        # Sessions run by the HTTP session manager never pass through run_connection
+        read_writer.close()
+        await session.run()
+
+        assert mcp_server._resource_manager._subscriptions.subscribers("config://app") == []
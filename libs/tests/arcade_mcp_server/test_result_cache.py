@@ -0,0 +1,187 @@
+"""Tests for the opt-in tool result cache."""
+
+import asyncio
+import os
+import time
+
+import pytest
+from arcade_core.errors import ErrorKind
+from arcade_core.metadata import Behavior, ToolMetadata
+from arcade_core.schema import (
+    ToolCallError,
+    ToolCallOutput,
+    ToolDefinition,
+    ToolInput,
+    ToolkitDefinition,
+    ToolOutput,
+    ToolRequirements,
+    ValueSchema,
+)
+from arcade_mcp_server.managers.result_cache import (
+    DiskResultCacheBackend,
+    MemoryResultCacheBackend,
+    ResultCache,
+    get_result_cache_ttl,
+)
+
+
+def _definition(metadata: ToolMetadata | None) -> ToolDefinition:
+    return ToolDefinition(
+        name="lookup",
+        fully_qualified_name="TestToolkit.lookup",
+        description="A test tool",
+        toolkit=ToolkitDefinition(name="TestToolkit", version="1.0.0"),
+        input=ToolInput(parameters=[]),
+        output=ToolOutput(value_schema=ValueSchema(val_type="string")),
+        requirements=ToolRequirements(),
+        metadata=metadata,
+    )
+
+
+def _error(kind: ErrorKind, can_retry: bool = False) -> ToolCallOutput:
+    return ToolCallOutput(error=ToolCallError(message="boom", kind=kind, can_retry=can_retry))
+
+
+class TestResultCacheTTL:
+    def test_read_only_tool_with_ttl_opts_in(self):
+        metadata = ToolMetadata(behavior=Behavior(read_only=True), extras={"result_cache_ttl": 30})
+        assert get_result_cache_ttl(_definition(metadata)) == 30.0
+
+    def test_idempotent_tool_with_ttl_opts_in(self):
+        metadata = ToolMetadata(
+            behavior=Behavior(idempotent=True), extras={"result_cache_ttl": 1.5}
+        )
+        assert get_result_cache_ttl(_definition(metadata)) == 1.5
+
+    @pytest.mark.parametrize(
+        "metadata",
+        [
+            None,
+            ToolMetadata(behavior=Behavior(read_only=True)),
+            ToolMetadata(extras={"result_cache_ttl": 30}),
+            ToolMetadata(behavior=Behavior(read_only=False), extras={"result_cache_ttl": 30}),
+            ToolMetadata(behavior=Behavior(read_only=True), extras={"result_cache_ttl": 0}),
+            ToolMetadata(behavior=Behavior(read_only=True), extras={"result_cache_ttl": True}),
+            ToolMetadata(behavior=Behavior(read_only=True), extras={"result_cache_ttl": "30"}),
+        ],
+    )
+    def test_not_opted_in(self, metadata):
+        assert get_result_cache_ttl(_definition(metadata)) is None
+
+
+class TestResultCacheKey:
+    def test_argument_order_does_not_matter(self):
+        a = ResultCache.make_key("T.lookup", "1.0.0", "user", {"a": 1, "b": {"x": 1, "y": 2}})
+        b = ResultCache.make_key("T.lookup", "1.0.0", "user", {"b": {"y": 2, "x": 1}, "a": 1})
+        assert a == b
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            ("T.other", "1.0.0", "user", {"a": 1}),
+            ("T.lookup", "2.0.0", "user", {"a": 1}),
+            ("T.lookup", "1.0.0", "someone-else", {"a": 1}),
+            ("T.lookup", "1.0.0", "user", {"a": 2}),
+        ],
+    )
+    def test_identity_components_change_the_key(self, other):
+        assert ResultCache.make_key("T.lookup", "1.0.0", "user", {"a": 1}) != (
+            ResultCache.make_key(*other)
+        )
+
+
+class TestMemoryBackend:
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_not_returned(self):
+        backend = MemoryResultCacheBackend(max_bytes=1024)
+        await backend.set("k", b"value", ttl=0.01)
+        assert await backend.get("k") == b"value"
+        await asyncio.sleep(0.02)
+        assert await backend.get("k") is None
+        assert backend.size == 0
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_to_stay_within_bytes(self):
+        backend = MemoryResultCacheBackend(max_bytes=10)
+        await backend.set("a", b"aaaa", ttl=60)
+        await backend.set("b", b"bbbb", ttl=60)
+        await backend.get("a")
+        await backend.set("c", b"cccc", ttl=60)
+        assert await backend.get("a") == b"aaaa"
+        assert await backend.get("b") is None
+        assert await backend.get("c") == b"cccc"
+        assert backend.size == 8
+
+    @pytest.mark.asyncio
+    async def test_oversized_value_is_not_stored(self):
+        backend = MemoryResultCacheBackend(max_bytes=4)
+        await backend.set("k", b"too large", ttl=60)
+        assert await backend.get("k") is None
+
+
+class TestDiskBackend:
+    @pytest.mark.asyncio
+    async def test_shared_between_backend_instances(self, tmp_path):
+        writer = DiskResultCacheBackend(tmp_path, max_bytes=1024)
+        reader = DiskResultCacheBackend(tmp_path, max_bytes=1024)
+        await writer.set("ab" * 32, b"value", ttl=60)
+        assert await reader.get("ab" * 32) == b"value"
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_removed(self, tmp_path):
+        backend = DiskResultCacheBackend(tmp_path, max_bytes=1024)
+        await backend.set("cd" * 32, b"value", ttl=0.01)
+        await asyncio.sleep(0.02)
+        assert await backend.get("cd" * 32) is None
+        assert not (tmp_path / "cd" / ("cd" * 32)).exists()
+
+    @pytest.mark.asyncio
+    async def test_prune_keeps_directory_within_bytes(self, tmp_path):
+        backend = DiskResultCacheBackend(tmp_path, max_bytes=100)
+        keys = [f"{i:02x}" * 32 for i in range(5)]
+        for i, key in enumerate(keys):
+            await backend.set(key, b"x" * 30, ttl=60)
+            path = tmp_path / key[:2] / key
+            os.utime(path, (time.time() - 100 + i, time.time() - 100 + i))
+
+        remaining = [key for key in keys if (tmp_path / key[:2] / key).exists()]
+        assert sum((tmp_path / k[:2] / k).stat().st_size for k in remaining) <= 100
+        assert keys[-1] in remaining
+        assert keys[0] not in remaining
+
+
+class TestResultCache:
+    @pytest.mark.asyncio
+    async def test_round_trips_values_and_counts_hits(self):
+        cache = ResultCache(MemoryResultCacheBackend(max_bytes=1024))
+        assert await cache.get("k") is None
+        await cache.put("k", ToolCallOutput(value={"a": [1, 2]}), ttl=60)
+        cached = await cache.get("k")
+        assert cached is not None
+        assert cached.value == {"a": [1, 2]}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_typed_error_is_cached_for_negative_ttl(self):
+        cache = ResultCache(MemoryResultCacheBackend(max_bytes=4096), negative_ttl=0.01)
+        await cache.put("k", _error(ErrorKind.UPSTREAM_RUNTIME_NOT_FOUND), ttl=60)
+        cached = await cache.get("k")
+        assert cached is not None
+        assert cached.error.kind == ErrorKind.UPSTREAM_RUNTIME_NOT_FOUND
+        await asyncio.sleep(0.02)
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "output",
+        [
+            _error(ErrorKind.UPSTREAM_RUNTIME_NOT_FOUND, can_retry=True),
+            _error(ErrorKind.UPSTREAM_RUNTIME_RATE_LIMIT),
+            _error(ErrorKind.UPSTREAM_RUNTIME_AUTH_ERROR),
+            _error(ErrorKind.UNKNOWN),
+        ],
+    )
+    async def test_transient_or_untyped_errors_are_not_cached(self, output):
+        cache = ResultCache(MemoryResultCacheBackend(max_bytes=4096))
+        await cache.put("k", output, ttl=60)
+        assert await cache.get("k") is None
@@ -0,0 +1,286 @@
+"""Tests for offloading large tool results to ephemeral resources."""
+
+import json
+import time
+from typing import Annotated
+
+import pytest
+from arcade_core.catalog import MaterializedTool, ToolCatalog, ToolMeta, create_func_models
+from arcade_core.metadata import ToolMetadata
+from arcade_core.schema import (
+    ToolDefinition,
+    ToolInput,
+    ToolkitDefinition,
+    ToolOutput,
+    ToolRequirements,
+    ValueSchema,
+)
+from arcade_mcp_server import tool
+from arcade_mcp_server.exceptions import NotFoundError, ResourceError
+from arcade_mcp_server.managers.resource import ResourceManager
+from arcade_mcp_server.managers.result_offload import ResultSpillStore
+from arcade_mcp_server.types import (
+    CallToolRequest,
+    ListToolsRequest,
+    ReadResourceRequest,
+    Resource,
+    ResourceLink,
+    TextContent,
+)
+
+
+@pytest.fixture
+def store(tmp_path) -> ResultSpillStore:
+    return ResultSpillStore(tmp_path, max_bytes=1000, ttl=60, chunk_size=16)
+
+
+def _read_in_chunks(store: ResultSpillStore, uri: str) -> list[str]:
+    chunks = []
+    offset: int | None = 0
+    while offset is not None:
+        text, _, offset = store.read(f"{uri}?offset={offset}")
+        chunks.append(text)
+    return chunks
+
+
+class TestResultSpillStore:
+    def test_spill_and_read_back(self, store, tmp_path):
+        entry = store.spill("hello world", "text/plain")
+
+        assert entry.uri.startswith("arcade://results/")
+        assert entry.path.parent == tmp_path
+        assert entry.size == 11
+        assert store.read(entry.uri) == ("hello world", 0, None)
+
+    def test_read_without_offset_returns_the_first_chunk(self, store):
+        entry = store.spill("a" * 40, "text/plain")
+
+        assert store.read(entry.uri) == ("a" * 16, 0, 16)
+
+    def test_identical_results_share_one_spill(self, store, tmp_path, monkeypatch):
+        first = store.spill("same result", "text/plain")
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 30)
+
+        second = store.spill("same result", "text/plain")
+
+        assert second is first
+        assert first.expires_at == now + 30 + 60
+        assert list(tmp_path.iterdir()) == [first.path]
+        assert store.total_bytes == 11
+
+    def test_chunks_end_on_character_boundaries(self, store):
+        text = "héllo wörld ✓ " * 10
+        entry = store.spill(text, "text/plain")
+
+        chunks = _read_in_chunks(store, entry.uri)
+
+        assert "".join(chunks) == text
+        assert len(chunks) > 1
+        assert all(len(chunk.encode()) <= 16 for chunk in chunks)
+
+    def test_invalid_offsets_are_rejected(self, store):
+        entry = store.spill("✓✓✓", "text/plain")
+
+        with pytest.raises(ResourceError):
+            store.read(f"{entry.uri}?offset=1")
+        with pytest.raises(ResourceError):
+            store.read(f"{entry.uri}?offset=100")
+        with pytest.raises(ResourceError):
+            store.read(f"{entry.uri}?page=2")
+
+    def test_oldest_results_are_evicted_to_stay_bounded(self, store):
+        first = store.spill("a" * 400, "text/plain")
+        second = store.spill("b" * 400, "text/plain")
+        third = store.spill("c" * 400, "text/plain")
+
+        assert store.total_bytes == 800
+        assert not first.path.exists()
+        with pytest.raises(NotFoundError):
+            store.read(first.uri)
+        assert "".join(_read_in_chunks(store, second.uri)) == "b" * 400
+        assert "".join(_read_in_chunks(store, third.uri)) == "c" * 400
+
+    def test_result_larger_than_the_store_is_not_spilled(self, store, tmp_path):
+        assert store.spill("x" * 1001, "text/plain") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_expired_results_are_removed(self, store, monkeypatch):
+        entry = store.spill("soon gone", "text/plain")
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+
+        with pytest.raises(NotFoundError):
+            store.read(entry.uri)
+        assert not entry.path.exists()
+        assert store.total_bytes == 0
+
+    def test_clear_removes_private_directory(self):
+        store = ResultSpillStore(None, max_bytes=1000, ttl=60, chunk_size=16)
+        entry = store.spill("temp", "text/plain")
+
+        store.clear()
+
+        assert not entry.path.parent.exists()
+
+
+class TestEphemeralResources:
+    @pytest.mark.asyncio
+    async def test_readable_with_query_but_not_listed(self):
+        manager = ResourceManager()
+        seen = []
+
+        def handler(uri: str) -> str:
+            seen.append(uri)
+            return "body"
+
+        await manager.add_ephemeral_resource(
+            Resource(uri="arcade://results/1", name="r", mimeType="text/plain"), handler, ttl=60
+        )
+
+        contents = await manager.read_resource("arcade://results/1?offset=0")
+
+        assert contents[0].text == "body"
+        assert contents[0].mimeType == "text/plain"
+        assert seen == ["arcade://results/1?offset=0"]
+        assert await manager.list_resources() == []
+
+    @pytest.mark.asyncio
+    async def test_expired_resource_is_not_found(self, monkeypatch):
+        manager = ResourceManager()
+        await manager.add_ephemeral_resource(
+            Resource(uri="arcade://results/1", name="r"), lambda _uri: "body", ttl=1
+        )
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 2)
+
+        with pytest.raises(NotFoundError):
+            await manager.read_resource("arcade://results/1")
+
+
+class TestServerOffload:
+    @staticmethod
+    async def _add_export_tool(mcp_server, output_schema: bool = False) -> None:
+        @tool
+        def export() -> Annotated[list, "Rows"]:
+            """Export every row"""
+            return [{"id": i, "name": f"row {i}"} for i in range(200)]
+
+        input_model, output_model = create_func_models(export)
+        await mcp_server._tool_manager.add_tool(
+            MaterializedTool(
+                tool=export,
+                definition=ToolDefinition(
+                    name="export",
+                    fully_qualified_name="TestToolkit.export",
+                    description="Export tool",
+                    toolkit=ToolkitDefinition(name="TestToolkit", version="1.0.0"),
+                    input=ToolInput(parameters=[]),
+                    output=ToolOutput(
+                        value_schema=ValueSchema(val_type="array") if output_schema else None
+                    ),
+                    requirements=ToolRequirements(),
+                ),
+                meta=ToolMeta(module=export.__module__, toolkit="TestToolkit"),
+                input_model=input_model,
+                output_model=output_model,
+            )
+        )
+
+    @staticmethod
+    async def _add_catalog_export_tool(mcp_server, metadata: ToolMetadata | None = None) -> str:
+        @tool(name="export", metadata=metadata)
+        def export() -> Annotated[list[dict], "Rows"]:
+            """Export every row"""
+            return [{"id": i, "name": f"row {i}"} for i in range(200)]
+
+        catalog = ToolCatalog()
+        catalog.add_tool(export, "TestToolkit")
+        materialized = next(iter(catalog))
+        await mcp_server._tool_manager.add_tool(materialized)
+        return materialized.definition.fully_qualified_name
+
+    @staticmethod
+    def _call(name: str = "TestToolkit.export") -> CallToolRequest:
+        return CallToolRequest(
+            jsonrpc="2.0",
+            id=1,
+            method="tools/call",
+            params={"name": name, "arguments": {}},
+        )
+
+    @pytest.mark.asyncio
+    async def test_large_result_is_returned_as_resource_link(self, mcp_server):
+        mcp_server.settings.result_offload.threshold = 1000
+        mcp_server.settings.result_offload.preview_chars = 50
+        await self._add_export_tool(mcp_server)
+
+        response = await mcp_server._handle_call_tool(self._call())
+
+        preview, link = response.result.content
+        assert isinstance(preview, TextContent)
+        assert isinstance(link, ResourceLink)
+        assert response.result.structuredContent is None
+        assert preview.text.startswith('[{"id": 0, "name": "row 0"}')
+        assert link.uri in preview.text
+        assert link.mimeType == "application/json"
+
+        chunks = []
+        uri = link.uri
+        while True:
+            read = await mcp_server._handle_read_resource(
+                ReadResourceRequest(jsonrpc="2.0", id=2, params={"uri": uri})
+            )
+            contents = read.result.contents[0]
+            assert contents.meta["arcade"]["size"] == link.size
+            chunks.append(contents.text)
+            next_offset = contents.meta["arcade"]["next_offset"]
+            if next_offset is None:
+                break
+            uri = f"{link.uri}?offset={next_offset}"
+        assert len(json.loads("".join(chunks))) == 200
+        assert link.size == len("".join(chunks).encode())
+
+    @pytest.mark.asyncio
+    async def test_small_result_is_inlined(self, mcp_server):
+        await self._add_export_tool(mcp_server)
+
+        response = await mcp_server._handle_call_tool(self._call())
+
+        assert len(json.loads(response.result.content[0].text)) == 200
+
+    @pytest.mark.asyncio
+    async def test_tool_with_output_schema_is_not_offloaded(self, mcp_server):
+        mcp_server.settings.result_offload.threshold = 1000
+        await self._add_export_tool(mcp_server, output_schema=True)
+
+        response = await mcp_server._handle_call_tool(self._call())
+
+        assert len(response.result.structuredContent["result"]) == 200
+
+    @pytest.mark.asyncio
+    async def test_catalog_tool_is_offloaded_when_it_opts_in(self, mcp_server):
+        mcp_server.settings.result_offload.threshold = 1000
+        name = await self._add_catalog_export_tool(
+            mcp_server, ToolMetadata(extras={"result_offload": True})
+        )
+
+        listed = await mcp_server._handle_list_tools(
+            ListToolsRequest(jsonrpc="2.0", id=2, method="tools/list", params={})
+        )
+        response = await mcp_server._handle_call_tool(self._call(name))
+
+        [listed_tool] = [t for t in listed.result.tools if t.name == name.replace(".", "_")]
+        assert listed_tool.outputSchema is None
+        assert isinstance(response.result.content[1], ResourceLink)
+        assert response.result.structuredContent is None
+
+    @pytest.mark.asyncio
+    async def test_catalog_tool_without_opt_in_is_inlined(self, mcp_server):
+        mcp_server.settings.result_offload.threshold = 1000
+        name = await self._add_catalog_export_tool(mcp_server)
+
+        response = await mcp_server._handle_call_tool(self._call(name))
+
+        assert len(response.result.content) == 1
+        assert len(response.result.structuredContent["result"]) == 200
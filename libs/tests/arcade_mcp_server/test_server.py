@@ -3,13 +3,16 @@
 import asyncio
 import contextlib
 import json
+from collections.abc import AsyncIterator
 from typing import Annotated
 from unittest.mock import AsyncMock, Mock, patch
 
+import anyio
 import pytest
 from arcade_core.auth import OAuth2
-from arcade_core.catalog import MaterializedTool, ToolMeta, create_func_models
+from arcade_core.catalog import MaterializedTool, ToolCatalog, ToolMeta, create_func_models
 from arcade_core.errors import ErrorKind, ToolRuntimeError
+from arcade_core.metadata import Behavior, ToolMetadata
 from arcade_core.schema import (
     InputParameter,
     OAuth2Requirement,
@@ -27,9 +30,10 @@ from arcade_core.schema import (
 )
 from arcade_mcp_server import tool
 from arcade_mcp_server.exceptions import IncompleteAuthContextError
+from arcade_mcp_server.managers.task_scheduler import TaskScheduler
 from arcade_mcp_server.middleware import Middleware
 from arcade_mcp_server.resource_server.base import ResourceOwner
-from arcade_mcp_server.server import MCPServer
+from arcade_mcp_server.server import TASK_QUEUE_FULL_ERROR_CODE, MCPServer
 from arcade_mcp_server.session import InitializationState
 from arcade_mcp_server.types import (
     CallToolRequest,
@@ -3239,6 +3243,548 @@ class TestTaskAugmentedToolCall:
         )
 
 
+class TestTaskAdmissionControl:
+    """Tests for the background task scheduler in front of task-augmented tools/call."""
+
+    @staticmethod
+    def _slow_task_call(request_id: int, **task_fields) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {
+                "name": "TestToolkit.slow_tool",
+                "arguments": {},
+                "task": {"ttl": 60000, **task_fields},
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_queued_task_stays_working_until_slot_frees(
+        self, mcp_server, initialized_server_session
+    ):
+        _enable_tasks(initialized_server_session)
+        mcp_server._task_scheduler = TaskScheduler(
+            max_concurrent=1, max_concurrent_per_context=1, max_pending=5
+        )
+        sid = initialized_server_session.session_id
+
+        first = await mcp_server.handle_message(self._slow_task_call(1), initialized_server_session)
+        second = await mcp_server.handle_message(
+            self._slow_task_call(2), initialized_server_session
+        )
+        await asyncio.sleep(0)
+
+        assert mcp_server._task_scheduler.running_count == 1
+        assert mcp_server._task_scheduler.pending_count == 1
+        queued = await mcp_server._task_manager.get_task(
+            second.result.task.taskId, context_key=f"session:{sid}"
+        )
+        assert queued.status == TaskStatus.WORKING
+
+        await mcp_server._task_manager.cancel_task(
+            first.result.task.taskId, context_key=f"session:{sid}"
+        )
+        await asyncio.sleep(0.05)
+        assert mcp_server._task_scheduler.running_count == 1
+        assert mcp_server._task_scheduler.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_task_without_creating_it(
+        self, mcp_server, initialized_server_session
+    ):
+        _enable_tasks(initialized_server_session)
+        mcp_server._task_scheduler = TaskScheduler(
+            max_concurrent=1, max_concurrent_per_context=1, max_pending=1
+        )
+        sid = initialized_server_session.session_id
+
+        await mcp_server.handle_message(self._slow_task_call(1), initialized_server_session)
+        await mcp_server.handle_message(self._slow_task_call(2), initialized_server_session)
+        rejected = await mcp_server.handle_message(
+            self._slow_task_call(3), initialized_server_session
+        )
+
+        assert isinstance(rejected, JSONRPCError)
+        assert rejected.error["code"] == TASK_QUEUE_FULL_ERROR_CODE
+        tasks, _ = await mcp_server._task_manager.list_tasks(context_key=f"session:{sid}")
+        assert len(tasks) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelling_queued_task_frees_queue_entry(
+        self, mcp_server, initialized_server_session
+    ):
+        _enable_tasks(initialized_server_session)
+        mcp_server._task_scheduler = TaskScheduler(
+            max_concurrent=1, max_concurrent_per_context=1, max_pending=1
+        )
+        sid = initialized_server_session.session_id
+
+        await mcp_server.handle_message(self._slow_task_call(1), initialized_server_session)
+        queued = await mcp_server.handle_message(
+            self._slow_task_call(2), initialized_server_session
+        )
+        await asyncio.sleep(0)
+
+        task = await mcp_server._task_manager.cancel_task(
+            queued.result.task.taskId, context_key=f"session:{sid}"
+        )
+        assert task.status == TaskStatus.CANCELLED
+        await asyncio.sleep(0.05)
+        assert mcp_server._task_scheduler.pending_count == 0
+
+        accepted = await mcp_server.handle_message(
+            self._slow_task_call(3), initialized_server_session
+        )
+        assert not isinstance(accepted, JSONRPCError)
+
+    @pytest.mark.asyncio
+    async def test_priority_hint_orders_queued_tasks(self, mcp_server, initialized_server_session):
+        _enable_tasks(initialized_server_session)
+        mcp_server._task_scheduler = TaskScheduler(
+            max_concurrent=1, max_concurrent_per_context=1, max_pending=5
+        )
+        sid = initialized_server_session.session_id
+
+        first = await mcp_server.handle_message(self._slow_task_call(1), initialized_server_session)
+        low = await mcp_server.handle_message(
+            self._slow_task_call(2, priority="urgent"), initialized_server_session
+        )
+        high = await mcp_server.handle_message(
+            self._slow_task_call(3, priority=5), initialized_server_session
+        )
+        await asyncio.sleep(0)
+
+        await mcp_server._task_manager.cancel_task(
+            first.result.task.taskId, context_key=f"session:{sid}"
+        )
+        await asyncio.sleep(0.05)
+
+        pending = [entry[2] for entry in mcp_server._task_scheduler._pending]
+        assert len(pending) == 1
+        # The non-integer hint is ignored, so the low-priority task is still queued.
+        assert pending[0].priority == 0
+        assert not isinstance(low, JSONRPCError)
+        assert not isinstance(high, JSONRPCError)
+
+
+class TestToolResultCache:
+    """Tests for serving opted-in tools from the result cache."""
+
+    @staticmethod
+    async def _add_counting_tool(mcp_server, metadata: ToolMetadata | None) -> list[str]:
+        calls: list[str] = []
+
+        @tool(metadata=metadata)
+        def lookup(key: Annotated[str, "Lookup key"]) -> Annotated[str, "Value"]:
+            """Lookup tool that records each execution"""
+            calls.append(key)
+            return f"value-{key}"
+
+        input_model, output_model = create_func_models(lookup)
+        tool_def = ToolDefinition(
+            name="lookup",
+            fully_qualified_name="TestToolkit.lookup",
+            description="Lookup tool",
+            toolkit=ToolkitDefinition(name="TestToolkit", version="1.0.0"),
+            input=ToolInput(
+                parameters=[
+                    InputParameter(
+                        name="key",
+                        required=True,
+                        description="Lookup key",
+                        value_schema=ValueSchema(val_type="string"),
+                    )
+                ]
+            ),
+            output=ToolOutput(value_schema=ValueSchema(val_type="string")),
+            requirements=ToolRequirements(),
+            metadata=metadata,
+        )
+        await mcp_server._tool_manager.add_tool(
+            MaterializedTool(
+                tool=lookup,
+                definition=tool_def,
+                meta=ToolMeta(module=lookup.__module__, toolkit="TestToolkit"),
+                input_model=input_model,
+                output_model=output_model,
+            )
+        )
+        return calls
+
+    @staticmethod
+    def _call(request_id: int, key: str) -> CallToolRequest:
+        return CallToolRequest(
+            jsonrpc="2.0",
+            id=request_id,
+            method="tools/call",
+            params={"name": "TestToolkit.lookup", "arguments": {"key": key}},
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_is_served_from_cache(self, mcp_server):
+        calls = await self._add_counting_tool(
+            mcp_server,
+            ToolMetadata(behavior=Behavior(read_only=True), extras={"result_cache_ttl": 60}),
+        )
+
+        first = await mcp_server._handle_call_tool(self._call(1, "a"))
+        second = await mcp_server._handle_call_tool(self._call(2, "a"))
+        other = await mcp_server._handle_call_tool(self._call(3, "b"))
+
+        assert calls == ["a", "b"]
+        assert first.result.meta is None
+        assert second.result.meta == {"arcade": {"cached": True}}
+        assert second.result.structuredContent == first.result.structuredContent
+        assert other.result.meta is None
+
+    @pytest.mark.asyncio
+    async def test_tool_without_opt_in_always_runs(self, mcp_server):
+        calls = await self._add_counting_tool(
+            mcp_server, ToolMetadata(behavior=Behavior(read_only=True))
+        )
+
+        await mcp_server._handle_call_tool(self._call(1, "a"))
+        await mcp_server._handle_call_tool(self._call(2, "a"))
+
+        assert calls == ["a", "a"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_runs(self, tool_catalog):
+        from arcade_mcp_server.settings import MCPSettings
+
+        settings = MCPSettings()
+        settings.result_cache.enabled = False
+        server = MCPServer(catalog=tool_catalog, settings=settings)
+        await server.start()
+        try:
+            calls = await self._add_counting_tool(
+                server,
+                ToolMetadata(behavior=Behavior(read_only=True), extras={"result_cache_ttl": 60}),
+            )
+            await server._handle_call_tool(self._call(1, "a"))
+            await server._handle_call_tool(self._call(2, "a"))
+        finally:
+            await server.stop()
+
+        assert calls == ["a", "a"]
+
+
+class TestToolCallCoalescing:
+    """Tests for single-flight coalescing of identical concurrent tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_execute_once(self, mcp_server):
+        started: list[str] = []
+        release = asyncio.Event()
+        metadata = ToolMetadata(behavior=Behavior(read_only=True), extras={"coalesce_calls": True})
+
+        @tool(metadata=metadata)
+        async def search(query: Annotated[str, "Query"]) -> Annotated[str, "Result"]:
+            """Search tool that blocks until released"""
+            started.append(query)
+            await release.wait()
+            return f"found-{query}"
+
+        input_model, output_model = create_func_models(search)
+        await mcp_server._tool_manager.add_tool(
+            MaterializedTool(
+                tool=search,
+                definition=ToolDefinition(
+                    name="search",
+                    fully_qualified_name="TestToolkit.search",
+                    description="Search tool",
+                    toolkit=ToolkitDefinition(name="TestToolkit", version="1.0.0"),
+                    input=ToolInput(
+                        parameters=[
+                            InputParameter(
+                                name="query",
+                                required=True,
+                                description="Query",
+                                value_schema=ValueSchema(val_type="string"),
+                            )
+                        ]
+                    ),
+                    output=ToolOutput(value_schema=ValueSchema(val_type="string")),
+                    requirements=ToolRequirements(),
+                    metadata=metadata,
+                ),
+                meta=ToolMeta(module=search.__module__, toolkit="TestToolkit"),
+                input_model=input_model,
+                output_model=output_model,
+            )
+        )
+
+        def call(request_id: int, query: str) -> CallToolRequest:
+            return CallToolRequest(
+                jsonrpc="2.0",
+                id=request_id,
+                method="tools/call",
+                params={"name": "TestToolkit.search", "arguments": {"query": query}},
+            )
+
+        calls = [
+            asyncio.create_task(mcp_server._handle_call_tool(call(i, "q"))) for i in range(3)
+        ]
+        other = asyncio.create_task(mcp_server._handle_call_tool(call(3, "other")))
+        await asyncio.sleep(0.05)
+        release.set()
+        responses = await asyncio.gather(*calls, other)
+
+        assert sorted(started) == ["other", "q"]
+        assert mcp_server.coalesced_tool_calls == 2
+        assert [r.result.structuredContent for r in responses[:3]] == [
+            {"result": "found-q"}
+        ] * 3
+        assert responses[3].result.structuredContent == {"result": "found-other"}
+
+
+class TestToolResultEncoding:
+    """Tests for the server-level and per-tool result encoding policy."""
+
+    @staticmethod
+    async def _add_report_tool(
+        mcp_server, metadata: ToolMetadata | None = None, output_schema: bool = True
+    ) -> None:
+        @tool(metadata=metadata)
+        def report() -> Annotated[dict, "Report"]:
+            """Report tool"""
+            return {"rows": [{"id": i} for i in range(3)], "total": 3}
+
+        input_model, output_model = create_func_models(report)
+        await mcp_server._tool_manager.add_tool(
+            MaterializedTool(
+                tool=report,
+                definition=ToolDefinition(
+                    name="report",
+                    fully_qualified_name="TestToolkit.report",
+                    description="Report tool",
+                    toolkit=ToolkitDefinition(name="TestToolkit", version="1.0.0"),
+                    input=ToolInput(parameters=[]),
+                    output=ToolOutput(
+                        value_schema=ValueSchema(val_type="json") if output_schema else None
+                    ),
+                    requirements=ToolRequirements(),
+                    metadata=metadata,
+                ),
+                meta=ToolMeta(module=report.__module__, toolkit="TestToolkit"),
+                input_model=input_model,
+                output_model=output_model,
+            )
+        )
+
+    @staticmethod
+    def _call() -> CallToolRequest:
+        return CallToolRequest(
+            jsonrpc="2.0",
+            id=1,
+            method="tools/call",
+            params={"name": "TestToolkit.report", "arguments": {}},
+        )
+
+    @pytest.mark.asyncio
+    async def test_default_sends_text_and_structured_content(self, mcp_server):
+        await self._add_report_tool(mcp_server)
+
+        response = await mcp_server._handle_call_tool(self._call())
+
+        result = response.result
+        assert json.loads(result.content[0].text) == result.structuredContent
+        assert result.structuredContent["total"] == 3
+
+    @pytest.mark.asyncio
+    async def test_structured_setting_sends_text_summary(self, mcp_server):
+        mcp_server.settings.server.result_encoding = "structured"
+        await self._add_report_tool(mcp_server)
+
+        response = await mcp_server._handle_call_tool(self._call())
+
+        result = response.result
+        assert result.structuredContent["total"] == 3
+        assert result.content[0].text == (
+            "Object with keys: rows, total. Full result in structuredContent."
+        )
+
+    @pytest.mark.asyncio
+    async def test_tool_extra_overrides_server_setting(self, mcp_server):
+        mcp_server.settings.server.result_encoding = "structured"
+        await self._add_report_tool(
+            mcp_server,
+            ToolMetadata(extras={"result_encoding": "text"}),
+            output_schema=False,
+        )
+
+        response = await mcp_server._handle_call_tool(self._call())
+
+        assert response.result.structuredContent is None
+        assert json.loads(response.result.content[0].text)["total"] == 3
+
+    @pytest.mark.asyncio
+    async def test_text_keeps_structured_content_when_output_schema_declared(self, mcp_server):
+        mcp_server.settings.server.result_encoding = "text"
+        await self._add_report_tool(mcp_server)
+
+        response = await mcp_server._handle_call_tool(self._call())
+
+        assert response.result.structuredContent["total"] == 3
+
+    @pytest.mark.asyncio
+    async def test_text_extra_drops_output_schema_of_catalog_tool(self, mcp_server):
+        @tool(metadata=ToolMetadata(extras={"result_encoding": "text"}))
+        def report() -> Annotated[dict, "Report"]:
+            """Report tool"""
+            return {"total": 3}
+
+        catalog = ToolCatalog()
+        catalog.add_tool(report, "TestToolkit")
+        materialized = next(iter(catalog))
+        await mcp_server._tool_manager.add_tool(materialized)
+        name = materialized.definition.fully_qualified_name
+
+        listed = await mcp_server._handle_list_tools(
+            ListToolsRequest(jsonrpc="2.0", id=2, method="tools/list", params={})
+        )
+        response = await mcp_server._handle_call_tool(
+            CallToolRequest(
+                jsonrpc="2.0", id=1, method="tools/call", params={"name": name, "arguments": {}}
+            )
+        )
+
+        [listed_tool] = [t for t in listed.result.tools if t.name == name.replace(".", "_")]
+        assert listed_tool.outputSchema is None
+        assert response.result.structuredContent is None
+        assert json.loads(response.result.content[0].text) == {"total": 3}
+
+
+class TestStreamingTools:
+    """Tests for async-generator tools streaming partial results."""
+
+    @staticmethod
+    async def _add_stream_tool(mcp_server, metadata: ToolMetadata | None = None) -> None:
+        @tool(metadata=metadata)
+        async def countdown(
+            start: Annotated[int, "Number to count down from"],
+        ) -> Annotated[AsyncIterator[str], "Countdown"]:
+            """Count down to zero"""
+            for i in range(start, -1, -1):
+                yield f"{i} "
+
+        input_model, output_model = create_func_models(countdown)
+        await mcp_server._tool_manager.add_tool(
+            MaterializedTool(
+                tool=countdown,
+                definition=ToolDefinition(
+                    name="countdown",
+                    fully_qualified_name="TestToolkit.countdown",
+                    description="Countdown tool",
+                    toolkit=ToolkitDefinition(name="TestToolkit", version="1.0.0"),
+                    input=ToolInput(
+                        parameters=[
+                            InputParameter(
+                                name="start",
+                                required=True,
+                                value_schema=ValueSchema(val_type="integer"),
+                            )
+                        ]
+                    ),
+                    output=ToolOutput(value_schema=ValueSchema(val_type="string")),
+                    requirements=ToolRequirements(),
+                    metadata=metadata,
+                ),
+                meta=ToolMeta(module=countdown.__module__, toolkit="TestToolkit"),
+                input_model=input_model,
+                output_model=output_model,
+            )
+        )
+
+    @staticmethod
+    def _call(meta: dict | None = None) -> dict:
+        params: dict = {"name": "TestToolkit.countdown", "arguments": {"start": 2}}
+        if meta is not None:
+            params["_meta"] = meta
+        return {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": params}
+
+    @staticmethod
+    def _capture(session) -> list:
+        sent = []
+
+        async def fake_send(message) -> None:
+            sent.append(message)
+            message.mark_delivered()
+
+        session.write_stream = type(
+            "W", (), {"send": staticmethod(fake_send), "supports_delivery_ack": True}
+        )()
+        return sent
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_sent_on_the_request_stream(
+        self, mcp_server, initialized_server_session
+    ):
+        await self._add_stream_tool(mcp_server)
+        sent = self._capture(initialized_server_session)
+
+        response = await mcp_server.handle_message(
+            self._call({"progressToken": "p-1"}), initialized_server_session
+        )
+
+        assert response.result.content[0].text == "2 1 0 "
+        assert [m.target_id for m in sent] == ["7", "7", "7"]
+        assert all(m.delivered.is_set() for m in sent)
+        params = [json.loads(m)["params"] for m in sent]
+        assert [p["_meta"]["arcade"]["partial"] for p in params] == ["2 ", "1 ", "0 "]
+        assert [p["progress"] for p in params] == [1, 2, 3]
+        assert {p["progressToken"] for p in params} == {"p-1"}
+
+    @pytest.mark.asyncio
+    async def test_streams_without_delivery_ack_are_not_waited_on(
+        self, mcp_server, initialized_server_session
+    ):
+        await self._add_stream_tool(mcp_server)
+        send_stream, receive_stream = anyio.create_memory_object_stream(10)
+        initialized_server_session.write_stream = send_stream
+
+        with anyio.fail_after(1):
+            response = await mcp_server.handle_message(
+                self._call({"progressToken": "p-1"}), initialized_server_session
+            )
+
+        assert response.result.content[0].text == "2 1 0 "
+        sent = [receive_stream.receive_nowait() for _ in range(3)]
+        assert all(m.delivered is None for m in sent)
+        assert [json.loads(m)["params"]["progressToken"] for m in sent] == ["p-1"] * 3
+
+    @pytest.mark.asyncio
+    async def test_no_chunks_without_progress_token(self, mcp_server, initialized_server_session):
+        await self._add_stream_tool(mcp_server)
+        sent = self._capture(initialized_server_session)
+
+        response = await mcp_server.handle_message(self._call(), initialized_server_session)
+
+        assert response.result.content[0].text == "2 1 0 "
+        assert sent == []
+
+    @pytest.mark.asyncio
+    async def test_streaming_tools_are_not_coalesced(self, mcp_server, initialized_server_session):
+        metadata = ToolMetadata(behavior=Behavior(read_only=True), extras={"coalesce_calls": True})
+        await self._add_stream_tool(mcp_server, metadata)
+        sent = self._capture(initialized_server_session)
+
+        responses = await asyncio.gather(
+            mcp_server.handle_message(
+                self._call({"progressToken": "a"}), initialized_server_session
+            ),
+            mcp_server.handle_message(
+                self._call({"progressToken": "b"}), initialized_server_session
+            ),
+        )
+
+        assert [r.result.content[0].text for r in responses] == ["2 1 0 "] * 2
+        assert mcp_server.coalesced_tool_calls == 0
+        tokens = [json.loads(m)["params"]["progressToken"] for m in sent]
+        assert sorted(tokens) == ["a"] * 3 + ["b"] * 3
+
+
 class TestTaskTtlValidation:
     """Pin: ``task.ttl`` is rejected with -32602 for null, zero, and
     negative values at the ``tools/call`` entry point.
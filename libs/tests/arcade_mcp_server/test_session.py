@@ -19,6 +19,7 @@ from arcade_mcp_server.types import (
     InitializeParams,
     JSONRPCResponse,
     LoggingLevel,
+    OutboundMessage,
 )
 
 
@@ -77,6 +78,20 @@ class TestServerSession:
         # Verify response was sent
         server_session.write_stream.send.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_response_is_sent_encoded_with_its_model(self, server_session):
+        """Responses carry their model and target id so transports need not parse them."""
+        response = JSONRPCResponse(jsonrpc="2.0", id=1, result={"status": "ok"})
+        server_session.server.handle_message = AsyncMock(return_value=response)
+
+        await server_session._process_message('{"jsonrpc":"2.0","id":1,"method":"ping"}')
+
+        sent = server_session.write_stream.send.call_args[0][0]
+        assert isinstance(sent, OutboundMessage)
+        assert sent.message is response
+        assert sent.target_id == "1"
+        assert json.loads(sent) == {"jsonrpc": "2.0", "id": 1, "result": {"status": "ok"}}
+
     @pytest.mark.asyncio
     async def test_notification_sending(self, server_session):
         """Test sending notifications."""
@@ -0,0 +1,154 @@
+"""Tests for SingleFlight (coalescing of identical concurrent tool calls)."""
+
+import asyncio
+
+import pytest
+from arcade_core.metadata import Behavior, ToolMetadata
+from arcade_core.schema import (
+    ToolDefinition,
+    ToolInput,
+    ToolkitDefinition,
+    ToolOutput,
+    ToolRequirements,
+    ValueSchema,
+)
+from arcade_mcp_server.managers.single_flight import SingleFlight, is_coalescing_enabled
+
+
+class _Execution:
+    """Controllable execution that counts how many times it was started."""
+
+    def __init__(self) -> None:
+        self.started = 0
+        self.cancelled = False
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.started += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return "result"
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight: SingleFlight[str] = SingleFlight()
+        execution = _Execution()
+
+        first = asyncio.create_task(flight.run("key", execution))
+        second = asyncio.create_task(flight.run("key", execution))
+        await asyncio.sleep(0)
+        execution.release.set()
+
+        assert await first == ("result", False)
+        assert await second == ("result", True)
+        assert execution.started == 1
+        assert flight.coalesced_count == 1
+        assert flight.in_flight_count == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_independently(self):
+        flight: SingleFlight[str] = SingleFlight()
+        execution = _Execution()
+        execution.release.set()
+
+        await asyncio.gather(flight.run("a", execution), flight.run("b", execution))
+
+        assert execution.started == 2
+        assert flight.coalesced_count == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_do_not_coalesce(self):
+        flight: SingleFlight[str] = SingleFlight()
+        execution = _Execution()
+        execution.release.set()
+
+        await flight.run("key", execution)
+        await flight.run("key", execution)
+
+        assert execution.started == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelling_first_waiter_keeps_execution_for_others(self):
+        flight: SingleFlight[str] = SingleFlight()
+        execution = _Execution()
+
+        first = asyncio.create_task(flight.run("key", execution))
+        second = asyncio.create_task(flight.run("key", execution))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        execution.release.set()
+        assert await second == ("result", True)
+        assert not execution.cancelled
+
+    @pytest.mark.asyncio
+    async def test_execution_cancelled_when_all_waiters_leave(self):
+        flight: SingleFlight[str] = SingleFlight()
+        execution = _Execution()
+
+        waiters = [asyncio.create_task(flight.run("key", execution)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert execution.cancelled
+        assert flight.in_flight_count == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_every_waiter(self):
+        flight: SingleFlight[str] = SingleFlight()
+        gate = asyncio.Event()
+
+        async def failing() -> str:
+            await gate.wait()
+            raise ValueError("boom")
+
+        waiters = [asyncio.create_task(flight.run("key", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+def _definition(metadata: ToolMetadata | None, context_param: str | None = None) -> ToolDefinition:
+    return ToolDefinition(
+        name="lookup",
+        fully_qualified_name="TestToolkit.lookup",
+        description="A test tool",
+        toolkit=ToolkitDefinition(name="TestToolkit", version="1.0.0"),
+        input=ToolInput(parameters=[], tool_context_parameter_name=context_param),
+        output=ToolOutput(value_schema=ValueSchema(val_type="string")),
+        requirements=ToolRequirements(),
+        metadata=metadata,
+    )
+
+
+@pytest.mark.parametrize(
+    "metadata, expected",
+    [
+        (ToolMetadata(behavior=Behavior(read_only=True), extras={"coalesce_calls": True}), True),
+        (ToolMetadata(behavior=Behavior(idempotent=True), extras={"coalesce_calls": True}), True),
+        (ToolMetadata(behavior=Behavior(read_only=True)), False),
+        (ToolMetadata(extras={"coalesce_calls": True}), False),
+        (ToolMetadata(behavior=Behavior(read_only=True), extras={"coalesce_calls": 1}), False),
+        (None, False),
+    ],
+)
+def test_is_coalescing_enabled(metadata, expected):
+    assert is_coalescing_enabled(_definition(metadata)) is expected
+
+
+def test_tools_taking_a_context_are_not_coalesced():
+    metadata = ToolMetadata(behavior=Behavior(read_only=True), extras={"coalesce_calls": True})
+
+    assert is_coalescing_enabled(_definition(metadata, context_param="context")) is False
@@ -0,0 +1,111 @@
+"""Tests for TaskScheduler (admission control for background tasks)."""
+
+import asyncio
+
+import pytest
+from arcade_mcp_server.managers.task_scheduler import TaskQueueFullError, TaskScheduler
+
+CONTEXT_A = "session:a"
+CONTEXT_B = "session:b"
+
+
+class TestTaskScheduler:
+    @pytest.mark.asyncio
+    async def test_admits_immediately_under_limit(self):
+        scheduler = TaskScheduler(max_concurrent=2, max_concurrent_per_context=2, max_pending=1)
+        slot = scheduler.reserve(CONTEXT_A)
+        assert slot.granted
+        await slot.acquire()
+        assert scheduler.running_count == 1
+        slot.release()
+        assert scheduler.running_count == 0
+
+    @pytest.mark.asyncio
+    async def test_queues_over_global_limit_and_admits_on_release(self):
+        scheduler = TaskScheduler(max_concurrent=1, max_concurrent_per_context=5, max_pending=5)
+        first = scheduler.reserve(CONTEXT_A)
+        second = scheduler.reserve(CONTEXT_B)
+        assert first.granted
+        assert not second.granted
+        assert scheduler.pending_count == 1
+
+        waiter = asyncio.create_task(second.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        first.release()
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert second.granted
+        assert scheduler.pending_count == 0
+        assert scheduler.running_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        scheduler = TaskScheduler(max_concurrent=1, max_concurrent_per_context=1, max_pending=1)
+        scheduler.reserve(CONTEXT_A)
+        scheduler.reserve(CONTEXT_A)
+        with pytest.raises(TaskQueueFullError):
+            scheduler.reserve(CONTEXT_B)
+
+    @pytest.mark.asyncio
+    async def test_zero_pending_rejects_as_soon_as_saturated(self):
+        scheduler = TaskScheduler(max_concurrent=1, max_concurrent_per_context=1, max_pending=0)
+        scheduler.reserve(CONTEXT_A)
+        with pytest.raises(TaskQueueFullError):
+            scheduler.reserve(CONTEXT_A)
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_admitted_first(self):
+        scheduler = TaskScheduler(max_concurrent=1, max_concurrent_per_context=5, max_pending=5)
+        running = scheduler.reserve(CONTEXT_A)
+        low = scheduler.reserve(CONTEXT_A, priority=0)
+        high = scheduler.reserve(CONTEXT_A, priority=10)
+        low_again = scheduler.reserve(CONTEXT_A, priority=0)
+
+        running.release()
+        assert high.granted
+        assert not low.granted
+
+        high.release()
+        assert low.granted
+        assert not low_again.granted
+
+    @pytest.mark.asyncio
+    async def test_per_context_limit_does_not_block_other_contexts(self):
+        scheduler = TaskScheduler(max_concurrent=3, max_concurrent_per_context=1, max_pending=5)
+        a1 = scheduler.reserve(CONTEXT_A)
+        a2 = scheduler.reserve(CONTEXT_A, priority=100)
+        b1 = scheduler.reserve(CONTEXT_B)
+        assert a1.granted
+        assert not a2.granted
+        assert b1.granted
+
+        a1.release()
+        assert a2.granted
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        scheduler = TaskScheduler(max_concurrent=1, max_concurrent_per_context=1, max_pending=5)
+        running = scheduler.reserve(CONTEXT_A)
+        queued = scheduler.reserve(CONTEXT_A)
+        behind = scheduler.reserve(CONTEXT_A)
+
+        waiter = asyncio.create_task(queued.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler.pending_count == 1
+
+        running.release()
+        assert behind.granted
+        assert not queued.granted
+
+    @pytest.mark.asyncio
+    async def test_release_is_idempotent(self):
+        scheduler = TaskScheduler(max_concurrent=1, max_concurrent_per_context=1, max_pending=5)
+        slot = scheduler.reserve(CONTEXT_A)
+        slot.release()
+        slot.release()
+        assert scheduler.running_count == 0
+        assert scheduler.reserve(CONTEXT_A).granted
@@ -2,6 +2,8 @@
 
 import pytest
 import pytest_asyncio
+from arcade_core.catalog import MaterializedTool
+from arcade_core.schema import ToolContext, ToolRequirements, ToolSecretRequirement
 from arcade_mcp_server.exceptions import NotFoundError
 from arcade_mcp_server.managers.tool import ToolManager
 from arcade_mcp_server.types import MCPTool
@@ -82,3 +84,106 @@ class TestToolManager:
         schema = tool.inputSchema
         assert schema["type"] == "object"
         assert "properties" in schema
+
+
+class TestToolManagerSecretBindings:
+    """Secret bindings are resolved at load time and reused per call."""
+
+    @staticmethod
+    def _with_secrets(tool: MaterializedTool, *keys: str) -> MaterializedTool:
+        definition = tool.definition.model_copy(
+            update={
+                "requirements": ToolRequirements(
+                    secrets=[ToolSecretRequirement(key=key) for key in keys]
+                )
+            }
+        )
+        return tool.model_copy(update={"definition": definition})
+
+    @pytest.mark.asyncio
+    async def test_bindings_resolved_once_at_load(self, materialized_tool):
+        pool = {"API_KEY": "k", "UNUSED": "x"}
+        calls = 0
+
+        def source():
+            nonlocal calls
+            calls += 1
+            return pool
+
+        tool = self._with_secrets(materialized_tool, "API_KEY")
+        manager = ToolManager(secret_source=source)
+        await manager.add_tool(tool)
+
+        first = manager.get_secret_bindings(tool)
+        second = manager.get_secret_bindings(tool)
+
+        assert dict(first) == {"API_KEY": "k"}
+        assert first is second
+        with pytest.raises(TypeError):
+            first["API_KEY"] = "changed"  # type: ignore[index]
+        # One read per lookup to detect a replaced pool, never one per secret.
+        assert calls == 3
+
+    @pytest.mark.asyncio
+    async def test_bindings_refresh_when_pool_replaced(self, materialized_tool):
+        pools = [{"API_KEY": "old"}]
+        tool = self._with_secrets(materialized_tool, "API_KEY")
+        manager = ToolManager(secret_source=lambda: pools[-1])
+        await manager.add_tool(tool)
+        assert manager.get_secret_bindings(tool)["API_KEY"] == "old"
+
+        pools.append({"API_KEY": "new"})
+        assert manager.get_secret_bindings(tool)["API_KEY"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_in_place_change_needs_explicit_refresh(self, materialized_tool):
+        pool = {"API_KEY": "old"}
+        tool = self._with_secrets(materialized_tool, "API_KEY")
+        manager = ToolManager(secret_source=lambda: pool)
+        await manager.add_tool(tool)
+
+        pool["API_KEY"] = "new"
+        assert manager.get_secret_bindings(tool)["API_KEY"] == "old"
+        manager.refresh_secret_bindings()
+        assert manager.get_secret_bindings(tool)["API_KEY"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_reserved_and_undeclared_secrets_excluded(self, materialized_tool, monkeypatch):
+        monkeypatch.setenv("FROM_ENV", "env-value")
+        pool = {"ARCADE_API_KEY": "reserved", "OTHER": "undeclared"}
+        tool = self._with_secrets(materialized_tool, "ARCADE_API_KEY", "FROM_ENV")
+        manager = ToolManager(secret_source=lambda: pool)
+        await manager.add_tool(tool)
+
+        assert dict(manager.get_secret_bindings(tool)) == {"FROM_ENV": "env-value"}
+
+    @pytest.mark.asyncio
+    async def test_secret_items_shared_and_context_copy_on_write(self, materialized_tool):
+        pool = {"API_KEY": "k"}
+        tool = self._with_secrets(materialized_tool, "API_KEY")
+        manager = ToolManager(secret_source=lambda: pool)
+        await manager.add_tool(tool)
+
+        items = manager.get_secret_items(tool)
+        assert items is manager.get_secret_items(tool)
+
+        context = ToolContext(secrets=list(items))
+        context.set_secret("API_KEY", "overridden")
+        assert context.get_secret("api_key") == "overridden"
+        assert items[0].value == "k"
+
+    @pytest.mark.asyncio
+    async def test_unregistered_tool_resolved_on_demand(self, materialized_tool):
+        tool = self._with_secrets(materialized_tool, "API_KEY")
+        manager = ToolManager(secret_source=lambda: {"API_KEY": "k"})
+
+        assert dict(manager.get_secret_bindings(tool)) == {"API_KEY": "k"}
+
+    @pytest.mark.asyncio
+    async def test_remove_tool_drops_bindings(self, materialized_tool):
+        tool = self._with_secrets(materialized_tool, "API_KEY")
+        manager = ToolManager(secret_source=lambda: {"API_KEY": "k"})
+        await manager.add_tool(tool)
+
+        await manager.remove_tool(tool.definition.fully_qualified_name)
+        assert tool.definition.fully_qualified_name not in manager._secret_bindings
@@ -1,10 +1,21 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import pytest
+from arcade_mcp_server.server import INSUFFICIENT_SCOPE_ERROR_CODE
 from arcade_mcp_server.transports.http_streamable import (
+    GET_STREAM_KEY,
     MCP_SESSION_ID_HEADER,
+    EventMessage,
     HTTPStreamableTransport,
 )
+from arcade_mcp_server.types import (
+    JSONRPCError,
+    JSONRPCResponse,
+    OutboundMessage,
+    PingRequest,
+    ToolListChangedNotification,
+)
 
 
 class TestHTTPStreamableTransport:
@@ -319,3 +330,182 @@ class TestHTTPStreamableTransportDelete:
         message = first_call[0][0]  # First argument of first call
         if message.get("type") == "http.response.start":
             assert message["status"] == 405
+
+
+class TestHTTPStreamableTransportOutbound:
+    """Test routing of messages the session has already encoded."""
+
+    @pytest.mark.asyncio
+    async def test_encoded_response_is_routed_without_parsing(self):
+        transport = HTTPStreamableTransport(mcp_session_id="test-session")
+        response = JSONRPCResponse(id=7, result={"content": [{"type": "text", "text": "x"}]})
+        outbound = OutboundMessage.from_message(response)
+
+        async with transport.connect() as (_, write_stream):
+            transport._request_streams["7"] = anyio.create_memory_object_stream[EventMessage](1)
+            with patch.object(transport, "_parse_mcp_message") as parse:
+                await write_stream.send(outbound)
+                event = await transport._request_streams["7"][1].receive()
+            parse.assert_not_called()
+
+        assert event.message is response
+        assert event.data is outbound
+        assert transport._create_event_data(event)["data"] is outbound
+        assert transport._create_json_response(response, encoded=event.data).body == (
+            outbound.encode()
+        )
+
+    @pytest.mark.asyncio
+    async def test_plain_string_messages_are_still_parsed(self):
+        transport = HTTPStreamableTransport(mcp_session_id="test-session")
+        text = JSONRPCResponse(id=7, result={}).model_dump_json() + "\n"
+
+        async with transport.connect() as (_, write_stream):
+            transport._request_streams["7"] = anyio.create_memory_object_stream[EventMessage](1)
+            await write_stream.send(text)
+            event = await transport._request_streams["7"][1].receive()
+
+        assert isinstance(event.message, JSONRPCResponse)
+        assert event.data is None
+
+    def test_errors_are_encoded_again_without_transport_metadata(self):
+        transport = HTTPStreamableTransport(mcp_session_id="test-session")
+        error = JSONRPCError(
+            id=1,
+            error={
+                "code": INSUFFICIENT_SCOPE_ERROR_CODE,
+                "message": "Insufficient scope",
+                "data": {"_transport": {"http_status": 403}},
+            },
+        )
+        outbound = OutboundMessage.from_message(error)
+        assert "_transport" in outbound
+
+        event_data = transport._create_event_data(EventMessage(error, data=outbound))
+
+        assert "_transport" not in event_data["data"]
+
+
+class TestHTTPStreamableTransportFanOut:
+    """Test that slow readers do not block routing for the rest of the session."""
+
+    @pytest.mark.asyncio
+    async def test_stalled_reader_does_not_delay_other_responses(self):
+        transport = HTTPStreamableTransport(mcp_session_id="test-session", max_buffered_events=2)
+
+        async with transport.connect() as (_, write_stream):
+            # Nobody reads the standalone stream or request 1's stream
+            transport._request_streams[GET_STREAM_KEY] = transport._create_request_stream()
+            transport._request_streams["1"] = transport._create_request_stream()
+            transport._request_streams["2"] = transport._create_request_stream()
+
+            for _ in range(5):
+                await write_stream.send(OutboundMessage.from_message(ToolListChangedNotification()))
+            await write_stream.send(OutboundMessage.from_message(JSONRPCResponse(id=1, result={})))
+            await write_stream.send(OutboundMessage.from_message(JSONRPCResponse(id=2, result={})))
+
+            with anyio.fail_after(1):
+                event = await transport._request_streams["2"][1].receive()
+
+            assert event.message.id == 2
+            # The stalled standalone stream kept what fit and dropped the rest
+            get_reader = transport._request_streams[GET_STREAM_KEY][1]
+            assert get_reader.statistics().current_buffer_used == 2
+
+    @pytest.mark.asyncio
+    async def test_fail_policy_closes_the_full_stream(self):
+        transport = HTTPStreamableTransport(
+            mcp_session_id="test-session", max_buffered_events=1, overflow_policy="fail"
+        )
+
+        async with transport.connect() as (_, write_stream):
+            send_stream, reader = transport._create_request_stream()
+            transport._request_streams[GET_STREAM_KEY] = (send_stream, reader)
+
+            for _ in range(2):
+                await write_stream.send(OutboundMessage.from_message(ToolListChangedNotification()))
+
+            with anyio.fail_after(1):
+                received = [event async for event in reader]
+
+            assert len(received) == 1
+            assert GET_STREAM_KEY not in transport._request_streams
+
+    @pytest.mark.asyncio
+    async def test_response_is_delivered_when_its_stream_is_full(self):
+        transport = HTTPStreamableTransport(
+            mcp_session_id="test-session", max_buffered_events=1, overflow_policy="fail"
+        )
+
+        async with transport.connect() as (_, write_stream):
+            transport._request_streams["1"] = transport._create_request_stream()
+            transport._request_streams["1"][0].send_nowait(
+                EventMessage(ToolListChangedNotification())
+            )
+            await write_stream.send(OutboundMessage.from_message(JSONRPCResponse(id=1, result={})))
+
+            reader = transport._request_streams["1"][1]
+            with anyio.fail_after(1):
+                first = await reader.receive()
+                second = await reader.receive()
+
+            assert isinstance(first.message, ToolListChangedNotification)
+            assert second.message.id == 1
+
+    @pytest.mark.asyncio
+    async def test_server_request_is_delivered_when_the_get_stream_is_full(self):
+        transport = HTTPStreamableTransport(
+            mcp_session_id="test-session", max_buffered_events=1, overflow_policy="fail"
+        )
+
+        async with transport.connect() as (_, write_stream):
+            send_stream, reader = transport._create_request_stream()
+            transport._request_streams[GET_STREAM_KEY] = (send_stream, reader)
+            send_stream.send_nowait(EventMessage(ToolListChangedNotification()))
+            await write_stream.send(OutboundMessage.from_message(PingRequest(id="server-1")))
+
+            with anyio.fail_after(1):
+                first = await reader.receive()
+                second = await reader.receive()
+
+            assert isinstance(first.message, ToolListChangedNotification)
+            assert isinstance(second.message, PingRequest)
+            assert GET_STREAM_KEY in transport._request_streams
+
+    @pytest.mark.asyncio
+    async def test_waiting_notification_is_held_until_its_stream_has_room(self):
+        transport = HTTPStreamableTransport(mcp_session_id="test-session", max_buffered_events=1)
+
+        async with transport.connect() as (_, write_stream):
+            transport._request_streams["1"] = transport._create_request_stream()
+            first = OutboundMessage.from_message(
+                ToolListChangedNotification(), related_request_id=1
+            )
+            second = OutboundMessage.from_message(
+                ToolListChangedNotification(), related_request_id=1
+            )
+            first.delivered, second.delivered = anyio.Event(), anyio.Event()
+
+            await write_stream.send(first)
+            await write_stream.send(second)
+            with anyio.fail_after(1):
+                await first.delivered.wait()
+            await anyio.sleep(0.01)
+            assert not second.delivered.is_set()
+
+            reader = transport._request_streams["1"][1]
+            with anyio.fail_after(1):
+                await reader.receive()
+                await second.delivered.wait()
+                assert (await reader.receive()).data is second
+
+    @pytest.mark.asyncio
+    async def test_write_stream_acknowledges_delivery(self):
+        transport = HTTPStreamableTransport(mcp_session_id="test-session")
+
+        async with transport.connect() as (_, write_stream):
+            assert write_stream.supports_delivery_ack is True
+
+    def test_buffer_must_hold_at_least_one_event(self):
+        with pytest.raises(ValueError, match="max_buffered_events"):
+            HTTPStreamableTransport(mcp_session_id="test-session", max_buffered_events=0)
@@ -1,21 +1,37 @@
 """Tests for evals_runner error handling."""
 
+import io
+import os
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from arcade_cli import evals_runner
 from arcade_cli.evals_runner import (
     ALL_FORMATS,
     CaptureTaskResult,
     EvalTaskResult,
+    EvalWorkerSettings,
+    _EvalWorkUnit,
+    _init_eval_worker,
+    _merge_rate_limiter_stats,
+    _print_throughput_summary,
     _run_capture_task,
     _run_eval_task,
+    _run_eval_unit,
     parse_output_formats,
     run_capture,
     run_evaluations,
 )
-from arcade_cli.utils import ModelSpec, Provider
-from arcade_evals import CaptureResult
+from arcade_cli.utils import ModelSpec, Provider, load_eval_suites
+from arcade_evals import CaptureResult, EvalJournal, RateLimiterStats, configure_tools_cache
+from arcade_evals.rate_limit import (
+    get_rate_limiter,
+    rate_limiter_stats,
+    reset_rate_limiters,
+    set_default_rate_limits,
+)
+from rich.console import Console
 
 RUN_RULE_LAST = "last"
 
@@ -176,6 +192,8 @@ class TestRunEvalTask:
             num_runs=1,
             seed="constant",
             multi_run_pass_rule=RUN_RULE_LAST,
+            response_cache=None,
+            journal=None,
         )
 
 
@@ -248,6 +266,7 @@ class TestRunCaptureTask:
             include_context=True,
             num_runs=1,
             seed="constant",
+            response_cache=None,
         )
 
 
@@ -599,3 +618,194 @@ class TestParseOutputFormats:
         console = MagicMock()
         result = parse_output_formats("md,html,json", console)
         assert result == ["md", "html", "json"]
+
+
+class TestThroughputSummary:
+    """Test the provider throughput summary."""
+
+    @pytest.mark.asyncio
+    async def test_prints_requests_tokens_and_rate_limits(self) -> None:
+        reset_rate_limiters()
+        try:
+            limiter = get_rate_limiter("openai", "gpt-4o")
+            await limiter.call(AsyncMock(return_value=500), usage=lambda tokens: tokens)
+            limiter.rate_limited = 2
+            console = MagicMock()
+
+            _print_throughput_summary(console)
+
+            output = " ".join(str(c) for c in console.print.call_args_list)
+            assert "openai/gpt-4o: 1 requests" in output
+            assert "500 tokens" in output
+            assert "2 rate limited" in output
+        finally:
+            reset_rate_limiters()
+
+    def test_prints_nothing_without_requests(self) -> None:
+        reset_rate_limiters()
+        console = MagicMock()
+
+        _print_throughput_summary(console)
+
+        console.print.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_each_run_starts_with_fresh_stats(self) -> None:
+        reset_rate_limiters()
+        try:
+            set_default_rate_limits(requests_per_minute=600)
+            await get_rate_limiter("openai", "gpt-4o").call(AsyncMock(return_value="ok"))
+
+            with patch("arcade_cli.evals_runner.display_eval_results"):
+                await run_evaluations(
+                    eval_suites=[],
+                    model_specs=[],
+                    max_concurrent=1,
+                    show_details=False,
+                    output_file=None,
+                    output_format="txt",
+                    failed_only=False,
+                    console=Console(file=io.StringIO()),
+                    num_runs=1,
+                    seed="constant",
+                    multi_run_pass_rule=RUN_RULE_LAST,
+                )
+
+            assert rate_limiter_stats() == []
+            bucket = get_rate_limiter("openai", "gpt-4o")._requests_bucket
+            assert bucket is not None
+            assert bucket.per_minute == 600
+        finally:
+            reset_rate_limiters()
+
+
+# An eval file whose suite reports the process it ran in, without calling a model
+EVAL_FILE_SOURCE = """
+import os
+
+
+async def eval_where(**kwargs):
+    return {
+        "model": kwargs["model"],
+        "suite_name": "where",
+        "cases": [],
+        "pid": os.getpid(),
+        "journal": id(kwargs["journal"]),
+    }
+
+
+eval_where.__tool_eval__ = True
+"""
+
+
+class TestProcessPool:
+    """Test running (suite, model) pairs in worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_results_come_back_from_workers(self, tmp_path) -> None:
+        eval_file = tmp_path / "eval_where.py"
+        eval_file.write_text(EVAL_FILE_SOURCE)
+        model_specs = [
+            ModelSpec(provider=Provider.OPENAI, model=model, api_key="test")
+            for model in ("gpt-4o", "gpt-4o-mini")
+        ]
+
+        with patch("arcade_cli.evals_runner.display_eval_results") as mock_display:
+            await run_evaluations(
+                eval_suites=load_eval_suites([eval_file]),
+                model_specs=model_specs,
+                max_concurrent=1,
+                show_details=False,
+                output_file=None,
+                output_format="txt",
+                failed_only=False,
+                console=Console(file=io.StringIO()),
+                num_runs=1,
+                seed="constant",
+                multi_run_pass_rule=RUN_RULE_LAST,
+                processes=2,
+            )
+
+        all_evaluations = mock_display.call_args[0][0]
+        results = [group[0] for group in all_evaluations]
+        assert sorted(r["model"] for r in results) == ["gpt-4o", "gpt-4o-mini"]
+        assert all(r["pid"] != os.getpid() for r in results)
+
+    def test_unknown_suite_is_reported_as_failure(self, tmp_path) -> None:
+        eval_file = tmp_path / "eval_where.py"
+        eval_file.write_text(EVAL_FILE_SOURCE)
+        unit = _EvalWorkUnit(
+            eval_file=str(eval_file),
+            suite_name="eval_missing",
+            model_spec=ModelSpec(provider=Provider.OPENAI, model="gpt-4o", api_key="test"),
+            max_concurrent=1,
+            num_runs=1,
+            seed="constant",
+            multi_run_pass_rule=RUN_RULE_LAST,
+            include_context=False,
+            response_cache=None,
+        )
+
+        outcome = _run_eval_unit(unit)
+
+        assert not outcome.result.success
+        assert outcome.result.error_type == "LookupError"
+
+    def test_worker_reads_the_journal_once_for_all_its_units(self, tmp_path) -> None:
+        eval_file = tmp_path / "eval_where.py"
+        eval_file.write_text(EVAL_FILE_SOURCE)
+        journal_path = tmp_path / "run.jsonl"
+        journal_path.touch()
+        units = [
+            _EvalWorkUnit(
+                eval_file=str(eval_file),
+                suite_name="eval_where",
+                model_spec=ModelSpec(provider=Provider.OPENAI, model=model, api_key="test"),
+                max_concurrent=1,
+                num_runs=1,
+                seed="constant",
+                multi_run_pass_rule=RUN_RULE_LAST,
+                include_context=False,
+                response_cache=None,
+            )
+            for model in ("gpt-4o", "gpt-4o-mini")
+        ]
+
+        try:
+            with patch("arcade_evals.EvalJournal", wraps=EvalJournal) as journal_cls:
+                _init_eval_worker(EvalWorkerSettings(journal_path=str(journal_path)))
+                outcomes = [_run_eval_unit(unit) for unit in units]
+            journal = evals_runner._worker_journal
+        finally:
+            evals_runner._worker_journal = None
+            reset_rate_limiters()
+
+        journal_cls.assert_called_once_with(str(journal_path), resume=True)
+        assert [outcome.result.result["journal"] for outcome in outcomes] == [id(journal)] * 2
+
+    def test_worker_settings_split_rate_limits(self, tmp_path) -> None:
+        reset_rate_limiters()
+        try:
+            EvalWorkerSettings(
+                requests_per_minute=100, tools_cache_dir=str(tmp_path), processes=4
+            ).apply()
+
+            limiter = get_rate_limiter("openai", "gpt-4o")
+            assert limiter._requests_bucket is not None
+            assert limiter._requests_bucket.per_minute == 25
+            assert limiter._tokens_bucket is None
+        finally:
+            reset_rate_limiters()
+            configure_tools_cache(None)
+
+    def test_merge_rate_limiter_stats(self) -> None:
+        merged = _merge_rate_limiter_stats([
+            RateLimiterStats("openai", "gpt-4o", 3, 300, 1, 10.0),
+            RateLimiterStats("openai", "gpt-4o", 2, 200, 0, 20.0),
+            RateLimiterStats("anthropic", "claude", 1, 0, 0, 5.0),
+        ])
+
+        assert merged == [
+            RateLimiterStats("openai", "gpt-4o", 5, 500, 1, 20.0),
+            RateLimiterStats("anthropic", "claude", 1, 0, 0, 5.0),
+        ]
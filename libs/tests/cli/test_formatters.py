@@ -1,6 +1,9 @@
 """Tests for evaluation result formatters."""
 
+import io
 import json
+import re
+from unittest.mock import MagicMock
 
 import pytest
 from arcade_cli.formatters import (
@@ -12,6 +15,7 @@ from arcade_cli.formatters import (
     TextFormatter,
     get_formatter,
 )
+from arcade_cli.formatters.base import ReportFragments, write_lines
 
 
 class MockEvaluation:
@@ -3774,3 +3778,117 @@ class TestMarkdownFormatterCoverageGaps:
         output = formatter._format_evaluation_details(evaluation)
         assert "—" in output  # un-criticized uses em-dash
         assert "optional" in output
+
+
+# =============================================================================
+# STREAMING WRITE TESTS
+# =============================================================================
+
+
+def _without_timestamp(output: str) -> str:
+    return re.sub(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}[^\"<\n]*", "<timestamp>", output)
+
+
+class TestStreamingWrite:
+    """Tests for EvalResultFormatter.write (incremental output to a sink)."""
+
+    @pytest.mark.parametrize("fmt", ["txt", "md", "html", "json"])
+    @pytest.mark.parametrize(
+        "make_results",
+        [
+            make_mock_results,
+            make_multi_model_results,
+            make_comparative_results,
+            make_multi_model_comparative_results,
+            make_results_with_context,
+        ],
+    )
+    def test_write_matches_format(self, fmt: str, make_results) -> None:
+        """write() should produce exactly what format() returns."""
+        results = make_results()
+        options = {"show_details": True, "include_context": True}
+        sink = io.StringIO()
+
+        get_formatter(fmt).write(results, sink, **options)
+
+        expected = get_formatter(fmt).format(results, **options)
+        assert _without_timestamp(sink.getvalue()) == _without_timestamp(expected)
+
+    def test_write_streams_lines(self) -> None:
+        """The report should reach the sink in many small writes, not one string."""
+        sink = MagicMock()
+
+        HtmlFormatter().write(make_multi_model_results(), sink, show_details=True)
+
+        assert sink.write.call_count > 100
+
+    def test_write_lines_matches_join(self) -> None:
+        sink = io.StringIO()
+        write_lines(sink, iter(["a", "", "b"]))
+        assert sink.getvalue() == "a\n\nb"
+
+    @pytest.mark.parametrize(
+        ("formatter", "extension", "link"),
+        [
+            (HtmlFormatter(), "html", '<iframe class="conversation-fragment"'),
+            (MarkdownFormatter(), "md", "[Open conversation (4 messages)]"),
+        ],
+    )
+    def test_large_conversations_become_fragments(
+        self, tmp_path, formatter, extension: str, link: str
+    ) -> None:
+        """Conversations over the size limit should be written to separate files."""
+        report = tmp_path / f"report.{extension}"
+        fragments = ReportFragments.for_report(report, min_size=10)
+        sink = io.StringIO()
+
+        formatter.write(
+            make_results_with_context(),
+            sink,
+            show_details=True,
+            include_context=True,
+            fragments=fragments,
+        )
+
+        fragment = tmp_path / "report_files" / f"conversation-00001.{extension}"
+        assert fragments.count == 1
+        assert "get_weather" in fragment.read_text()
+        assert link in sink.getvalue()
+        assert f"report_files/conversation-00001.{extension}" in sink.getvalue()
+        assert "Hi! How can I help?" not in sink.getvalue()
+
+    def test_stale_fragments_of_an_earlier_run_are_removed(self, tmp_path) -> None:
+        report = tmp_path / "report.html"
+        fragments = ReportFragments.for_report(report, min_size=10)
+        fragments.directory.mkdir()
+        (fragments.directory / "conversation-00007.html").write_text("old")
+        (fragments.directory / "conversation-00001.md").write_text("markdown report")
+
+        HtmlFormatter().write(
+            make_results_with_context(),
+            io.StringIO(),
+            show_details=True,
+            include_context=True,
+            fragments=fragments,
+        )
+
+        assert sorted(p.name for p in fragments.directory.iterdir()) == [
+            "conversation-00001.html",
+            "conversation-00001.md",
+        ]
+
+    def test_small_conversations_stay_inline(self, tmp_path) -> None:
+        fragments = ReportFragments.for_report(tmp_path / "report.html")
+        sink = io.StringIO()
+
+        HtmlFormatter().write(
+            make_results_with_context(),
+            sink,
+            show_details=True,
+            include_context=True,
+            fragments=fragments,
+        )
+
+        assert fragments.count == 0
+        assert not fragments.directory.exists()
+        assert "Hi! How can I help?" in sink.getvalue()
@@ -420,3 +420,118 @@ def test_evals_rejects_invalid_pass_rule() -> None:
     result = runner.invoke(cli, ["evals", "--multi-run-pass-rule", "bogus", "."])
     output = _strip_ansi(result.output)
     assert "invalid" in output.lower() and "pass-rule" in output.lower().replace("_", "-")
+
+
+def test_evals_help_shows_response_cache_flags() -> None:
+    """Test that the record/replay flags are documented in help."""
+    result = runner.invoke(cli, ["evals", "--help"])
+    assert result.exit_code == 0
+    output = _strip_ansi(result.output)
+    for flag in ("--record", "--replay", "--refresh", "--cache-dir"):
+        assert flag in output
+
+
+def test_evals_rejects_multiple_response_cache_modes() -> None:
+    """--record and --replay together should produce a CLI error."""
+    result = runner.invoke(cli, ["evals", "--record", "--replay", "."])
+    output = _strip_ansi(result.output)
+    assert "only one of --record, --replay, or --refresh" in output
+
+
+def test_evals_help_shows_rate_limit_flags() -> None:
+    """Test that the rate limit flags are documented in help."""
+    result = runner.invoke(cli, ["evals", "--help"])
+    assert result.exit_code == 0
+    output = _strip_ansi(result.output)
+    assert "--requests-per-minute" in output
+    assert "--tokens-per-minute" in output
+
+
+def test_evals_rejects_non_positive_rate_limit() -> None:
+    """--requests-per-minute 0 should produce a CLI error."""
+    result = runner.invoke(cli, ["evals", "--requests-per-minute", "0", "."])
+    output = _strip_ansi(result.output)
+    assert "--requests-per-minute must be > 0" in output
+
+
+def test_evals_help_shows_tools_cache_flags() -> None:
+    """Test that the tools cache flags are documented in help."""
+    result = runner.invoke(cli, ["evals", "--help"])
+    assert result.exit_code == 0
+    output = _strip_ansi(result.output)
+    for flag in ("--cache-tools", "--tools-cache-ttl", "--refresh-tools"):
+        assert flag in output
+
+
+def test_evals_rejects_non_positive_tools_cache_ttl() -> None:
+    """--tools-cache-ttl 0 should produce a CLI error."""
+    result = runner.invoke(cli, ["evals", "--cache-tools", "--tools-cache-ttl", "0", "."])
+    output = _strip_ansi(result.output)
+    assert "--tools-cache-ttl must be > 0" in output
+
+
+def test_evals_help_shows_journal_flags() -> None:
+    """Test that the journal flags are documented in help."""
+    result = runner.invoke(cli, ["evals", "--help"])
+    assert result.exit_code == 0
+    output = _strip_ansi(result.output)
+    assert "--journal" in output
+    assert "--resume" in output
+
+
+def test_evals_rejects_journal_with_resume(tmp_path) -> None:
+    """--journal and --resume together should produce a CLI error."""
+    path = str(tmp_path / "run.jsonl")
+    result = runner.invoke(cli, ["evals", "--journal", path, "--resume", path, "."])
+    output = _strip_ansi(result.output)
+    assert "either --journal or --resume" in output
+
+
+def test_evals_rejects_missing_resume_journal(tmp_path) -> None:
+    """--resume with a journal that does not exist should produce a CLI error."""
+    result = runner.invoke(cli, ["evals", "--resume", str(tmp_path / "missing.jsonl"), "."])
+    output = _strip_ansi(result.output)
+    assert "Journal not found" in output
+
+
+def test_evals_renders_a_journal_without_running(tmp_path) -> None:
+    """--from-journal writes the recorded results without loading any eval file."""
+    import asyncio
+    import json
+    from unittest.mock import AsyncMock, MagicMock
+
+    from arcade_evals import EvalJournal, EvalSuite, ExpectedMCPToolCall
+
+    journal_path = tmp_path / "run.jsonl"
+    suite = EvalSuite(name="journaled", system_message="sys", journal=EvalJournal(journal_path))
+    suite.add_tool_definitions([{"name": "search"}])
+    suite.add_case(
+        name="find cats",
+        user_message="search",
+        expected_tool_calls=[ExpectedMCPToolCall("search", {})],
+    )
+    tool_call = MagicMock()
+    tool_call.function.name = "search"
+    tool_call.function.arguments = json.dumps({})
+    client = AsyncMock()
+    client.chat.completions.create.return_value.choices = [MagicMock()]
+    client.chat.completions.create.return_value.choices[0].message.tool_calls = [tool_call]
+    asyncio.run(suite.run(client, "gpt-4o"))
+    report = tmp_path / "report.md"
+
+    result = runner.invoke(
+        cli,
+        ["evals", "--from-journal", str(journal_path), "-o", str(report), str(tmp_path / "none")],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "find cats" in report.read_text()
+
+
+def test_evals_rejects_from_journal_with_journal(tmp_path) -> None:
+    """--from-journal only renders, so it cannot be combined with a run."""
+    path = str(tmp_path / "run.jsonl")
+    new_path = str(tmp_path / "new.jsonl")
+    result = runner.invoke(cli, ["evals", "--from-journal", path, "--journal", new_path, "."])
+    output = _strip_ansi(result.output)
+    assert "--from-journal cannot be combined" in output
@@ -49,12 +49,14 @@ def isolate_environment():
     other mechanism during tests don't leak into subsequent tests.
 
     This also disables CLI usage tracking to prevent test runs from sending
-    analytics events to PostHog.
+    analytics events to PostHog, and the tool discovery manifest so tests do
+    not write to ~/.arcade/cache.
     """
     original_env = os.environ.copy()
 
     # Disable tracking
     os.environ["ARCADE_USAGE_TRACKING"] = "0"
+    os.environ["ARCADE_DISCOVERY_CACHE"] = "0"
 
     yield
 
@@ -1,21 +1,26 @@
-from typing import Annotated
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Annotated, Any, Literal
 
 import pytest
 from arcade_core.catalog import ToolCatalog
 from arcade_core.errors import (
     ContextRequiredToolError,
     ErrorKind,
+    ToolDefinitionError,
     ToolRuntimeError,
     UpstreamError,
     UpstreamRateLimitError,
 )
-from arcade_core.executor import ToolExecutor
+from arcade_core.executor import ToolExecutor, _is_passthrough
 from arcade_core.schema import ToolCallError, ToolCallLog, ToolCallOutput, ToolContext
+from arcade_core.streaming import StreamSummary
 from arcade_tdk import tool
 from arcade_tdk.errors import (
     RetryableToolError,
     ToolExecutionError,
 )
+from pydantic import BaseModel
 from typing_extensions import TypedDict
 
 
@@ -435,3 +440,225 @@ async def test_input_validation_error_does_not_leak_input_values():
     # The integer wrong-type value also must not appear.
     assert "12345" not in output.error.message
     assert "12345" not in output.error.developer_message
+
+
+class Address(TypedDict, total=False):
+    street: str
+    city: str
+
+
+class Profile(BaseModel):
+    name: str
+    tags: list[str] = []
+
+
+@tool
+def nested_args_tool(
+    names: Annotated[list[str], "names"],
+    address: Annotated[Address, "an address"],
+    profile: Annotated[Profile, "a profile"],
+    limit: Annotated[int, "a limit"] = 10,
+) -> Annotated[dict, "echo of the received arguments"]:
+    """Tool that echoes the arguments it received"""
+    return {"names": names, "address": address, "profile": profile, "limit": limit}
+
+
+catalog.add_tool(nested_args_tool, "NestedArgsToolkit")
+
+
+@pytest.mark.asyncio
+async def test_nested_args_match_model_dump():
+    """The executor hands the tool the same values ``model_dump()`` would,
+    including plain dicts (without unset keys) for nested models."""
+    tool_definition = catalog.find_tool_by_func(nested_args_tool)
+    full_tool = catalog.get_tool(tool_definition.get_fully_qualified_name())
+    inputs = {
+        "names": ["a", "b"],
+        "address": {"city": "Paris"},
+        "profile": {"name": "x"},
+    }
+
+    output = await ToolExecutor.run(
+        func=nested_args_tool,
+        definition=tool_definition,
+        input_model=full_tool.input_model,
+        output_model=full_tool.output_model,
+        context=ToolContext(),
+        **inputs,
+    )
+
+    assert output.error is None
+    assert output.value == full_tool.input_model(**inputs).model_dump()
+    assert output.value == {
+        "names": ["a", "b"],
+        "address": {"city": "Paris"},
+        "profile": {"name": "x", "tags": []},
+        "limit": 10,
+    }
+    assert type(output.value["address"]) is dict
+    assert type(output.value["profile"]) is dict
+
+
+@pytest.mark.parametrize(
+    "annotation, expected",
+    [
+        (str, True),
+        (int | None, True),
+        (list[str], True),
+        (dict[str, list[int]], True),
+        (Literal["a", "b"], True),
+        (ErrorKind, True),
+        (Profile, False),
+        (Profile | None, False),
+        (list[Profile], False),
+        (dict, False),
+        (Any, False),
+    ],
+)
+def test_is_passthrough(annotation, expected):
+    assert _is_passthrough(annotation) is expected
+
+
+@tool
+async def stream_text_tool(
+    parts: Annotated[list[str], "parts to stream"],
+) -> Annotated[AsyncIterator[str], "the joined text"]:
+    """Tool that streams text"""
+    for part in parts:
+        yield part
+
+
+@tool
+async def stream_rows_tool(
+    count: Annotated[int, "rows to stream"],
+    summarize: Annotated[bool, "yield a summary instead of keeping the rows"] = False,
+) -> Annotated[AsyncIterator[dict], "the rows"]:
+    """Tool that streams rows"""
+    for i in range(count):
+        if i == 2 and count == 2:
+            raise ToolExecutionError("stream failed")
+        yield {"id": i}
+    if summarize:
+        yield StreamSummary([{"rows": count}])
+
+
+@tool
+async def failing_stream_tool() -> Annotated[AsyncIterator[str], "never finishes"]:
+    """Tool that fails mid-stream"""
+    yield "first"
+    raise RuntimeError("connection lost")
+
+
+@tool
+async def stream_input_named_on_chunk_tool(
+    on_chunk: Annotated[str, "shares its name with the executor's old callback parameter"],
+) -> Annotated[AsyncIterator[str], "the input"]:
+    """Tool with an input named like the chunk callback"""
+    yield on_chunk
+
+
+for _stream_tool in (
+    stream_text_tool,
+    stream_rows_tool,
+    failing_stream_tool,
+    stream_input_named_on_chunk_tool,
+):
+    catalog.add_tool(_stream_tool, "StreamToolkit")
+
+
+async def _run_stream(func, callback=None, **inputs) -> ToolCallOutput:
+    tool_definition = catalog.find_tool_by_func(func)
+    full_tool = catalog.get_tool(tool_definition.get_fully_qualified_name())
+    return await ToolExecutor.run(
+        func=func,
+        definition=tool_definition,
+        input_model=full_tool.input_model,
+        output_model=full_tool.output_model,
+        context=ToolContext(),
+        _on_chunk=callback,
+        **inputs,
+    )
+
+
+class TestStreamingTools:
+    def test_output_schema_describes_assembled_result(self):
+        text_output = catalog.find_tool_by_func(stream_text_tool).output
+        rows_output = catalog.find_tool_by_func(stream_rows_tool).output
+
+        assert text_output.value_schema.val_type == "string"
+        assert text_output.description == "the joined text"
+        assert rows_output.value_schema.val_type == "array"
+        assert rows_output.value_schema.inner_val_type == "json"
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_passed_on_and_assembled(self):
+        received = []
+
+        async def on_chunk(chunk):
+            received.append(chunk)
+
+        text = await _run_stream(stream_text_tool, on_chunk, parts=["a", "b", "c"])
+        rows = await _run_stream(stream_rows_tool, count=3)
+
+        assert received == ["a", "b", "c"]
+        assert text.value == "abc"
+        assert rows.value == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_next_chunk_waits_for_the_previous_to_be_accepted(self):
+        events = []
+        release = asyncio.Event()
+
+        async def on_chunk(chunk):
+            events.append(f"sent {chunk['id']}")
+            if chunk["id"] == 0:
+                await release.wait()
+
+        task = asyncio.create_task(_run_stream(stream_rows_tool, on_chunk, count=3))
+        await asyncio.sleep(0.01)
+        assert events == ["sent 0"]
+
+        release.set()
+        output = await task
+        assert events == ["sent 0", "sent 1", "sent 2"]
+        assert len(output.value) == 3
+
+    @pytest.mark.asyncio
+    async def test_summary_replaces_the_chunks(self):
+        output = await _run_stream(stream_rows_tool, count=3, summarize=True)
+
+        assert output.value == [{"rows": 3}]
+
+    @pytest.mark.asyncio
+    async def test_error_mid_stream_fails_the_call(self):
+        received = []
+
+        async def on_chunk(chunk):
+            received.append(chunk)
+
+        output = await _run_stream(failing_stream_tool, on_chunk)
+
+        assert received == ["first"]
+        assert output.error is not None
+        assert "RuntimeError" in output.error.message
+
+    @pytest.mark.asyncio
+    async def test_input_named_on_chunk_is_passed_to_the_tool(self):
+        received = []
+
+        async def callback(chunk):
+            received.append(chunk)
+
+        output = await _run_stream(stream_input_named_on_chunk_tool, callback, on_chunk="hello")
+
+        assert output.value == "hello"
+        assert received == ["hello"]
+
+    def test_streaming_tool_needs_async_iterator_return_type(self):
+        @tool
+        async def untyped_stream() -> Annotated[str, "not a stream"]:
+            """Streams without saying so"""
+            yield "x"
+
+        with pytest.raises(ToolDefinitionError, match="AsyncIterator"):
+            ToolCatalog().add_tool(untyped_stream, "StreamToolkit")
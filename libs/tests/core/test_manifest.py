@@ -0,0 +1,186 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from arcade_core import manifest as manifest_module
+from arcade_core.discovery import analyze_files_for_tools
+from arcade_core.manifest import DiscoveryManifest, scan_files_for_tools
+from arcade_core.toolkit import Toolkit
+
+TOOL_SOURCE = '''
+from arcade_tdk import tool
+
+@tool
+def {name}():
+    """A tool."""
+'''
+
+
+def write_tool(path: Path, name: str) -> Path:
+    path.write_text(TOOL_SOURCE.format(name=name), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def files(tmp_path) -> list[Path]:
+    return [write_tool(tmp_path / f"tools_{i}.py", f"tool_{i}") for i in range(3)]
+
+
+class TestScanFilesForTools:
+    def test_finds_tools_in_order(self, files):
+        results = scan_files_for_tools(files)
+
+        assert results == [(f, [f"tool_{i}"]) for i, f in enumerate(files)]
+
+    def test_reports_unparseable_files(self, tmp_path):
+        bad = tmp_path / "bad.py"
+        bad.write_text("def broken(:\n", encoding="utf-8")
+
+        [(path, result)] = scan_files_for_tools([bad])
+
+        assert path == bad
+        assert isinstance(result, SyntaxError)
+
+    def test_validate_reports_compile_errors(self, tmp_path):
+        # Parses fine, but is not valid Python
+        bad = tmp_path / "bad.py"
+        bad.write_text("return 1\n", encoding="utf-8")
+
+        assert scan_files_for_tools([bad]) == [(bad, [])]
+        [(_, result)] = scan_files_for_tools([bad], validate=True)
+        assert isinstance(result, SyntaxError)
+
+
+class TestDiscoveryManifest:
+    def test_unchanged_files_are_not_read_again(self, tmp_path, files):
+        manifest_path = tmp_path / "cache" / "manifest.json"
+        scan_files_for_tools(files, manifest=DiscoveryManifest(manifest_path))
+
+        manifest = DiscoveryManifest(manifest_path)
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("file was read")):
+            results = scan_files_for_tools(files, manifest=manifest)
+
+        assert [names for _, names in results] == [["tool_0"], ["tool_1"], ["tool_2"]]
+        assert (manifest.hits, manifest.misses) == (3, 0)
+
+    def test_changed_files_are_parsed_again(self, tmp_path, files):
+        manifest_path = tmp_path / "manifest.json"
+        scan_files_for_tools(files, manifest=DiscoveryManifest(manifest_path))
+        write_tool(files[1], "renamed_tool")
+
+        manifest = DiscoveryManifest(manifest_path)
+        results = scan_files_for_tools(files, manifest=manifest)
+
+        assert results[1] == (files[1], ["renamed_tool"])
+        assert (manifest.hits, manifest.misses) == (2, 1)
+
+    def test_touched_files_are_matched_by_content(self, tmp_path, files):
+        manifest_path = tmp_path / "manifest.json"
+        scan_files_for_tools(files, manifest=DiscoveryManifest(manifest_path))
+        stat = files[0].stat()
+        os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch.object(manifest_module.ast, "parse", side_effect=AssertionError("parsed")):
+            results = scan_files_for_tools(files, manifest=DiscoveryManifest(manifest_path))
+
+        assert results[0] == (files[0], ["tool_0"])
+        # The new mtime was recorded, so the next scan does not even read the file
+        assert (DiscoveryManifest(manifest_path).lookup(files[0], files[0].stat(), False)) == [
+            "tool_0"
+        ]
+
+    def test_touched_files_stay_validated(self, tmp_path, files):
+        manifest_path = tmp_path / "manifest.json"
+        scan_files_for_tools(files, manifest=DiscoveryManifest(manifest_path), validate=True)
+        stat = files[0].stat()
+        os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        scan_files_for_tools(files, manifest=DiscoveryManifest(manifest_path))
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("file was read")):
+            results = scan_files_for_tools(
+                files, manifest=DiscoveryManifest(manifest_path), validate=True
+            )
+
+        assert results[0] == (files[0], ["tool_0"])
+
+    def test_unvalidated_entries_are_validated_on_demand(self, tmp_path):
+        bad = tmp_path / "bad.py"
+        bad.write_text("return 1\n", encoding="utf-8")
+        manifest_path = tmp_path / "manifest.json"
+        scan_files_for_tools([bad], manifest=DiscoveryManifest(manifest_path))
+
+        [(_, result)] = scan_files_for_tools(
+            [bad], manifest=DiscoveryManifest(manifest_path), validate=True
+        )
+
+        assert isinstance(result, SyntaxError)
+
+    def test_other_manifest_versions_are_ignored(self, tmp_path, files):
+        manifest_path = tmp_path / "manifest.json"
+        scan_files_for_tools(files, manifest=DiscoveryManifest(manifest_path))
+
+        with patch.object(
+            manifest_module, "MANIFEST_VERSION", manifest_module.MANIFEST_VERSION + 1
+        ):
+            manifest = DiscoveryManifest(manifest_path)
+            scan_files_for_tools(files, manifest=manifest)
+
+        assert (manifest.hits, manifest.misses) == (0, 3)
+
+    def test_unreadable_manifest_starts_empty(self, tmp_path, files):
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text("{not json", encoding="utf-8")
+
+        manifest = DiscoveryManifest(manifest_path)
+        results = scan_files_for_tools(files, manifest=manifest)
+
+        assert [names for _, names in results] == [["tool_0"], ["tool_1"], ["tool_2"]]
+        assert manifest.misses == 3
+
+    def test_for_directory_respects_env(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(manifest_module, "MANIFEST_DIR", str(tmp_path / "manifests"))
+
+        monkeypatch.setenv("ARCADE_DISCOVERY_CACHE", "0")
+        assert DiscoveryManifest.for_directory(tmp_path) is None
+
+        monkeypatch.setenv("ARCADE_DISCOVERY_CACHE", "1")
+        manifest = DiscoveryManifest.for_directory(tmp_path)
+        assert manifest is not None
+        assert manifest.path.parent == tmp_path / "manifests"
+        assert DiscoveryManifest.for_directory(tmp_path / ".").path == manifest.path
+
+
+class TestDiscoveryCallers:
+    @pytest.fixture(autouse=True)
+    def enable_manifest(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(manifest_module, "MANIFEST_DIR", str(tmp_path / "manifests"))
+        monkeypatch.setenv("ARCADE_DISCOVERY_CACHE", "1")
+
+    def test_tools_from_directory_reuses_manifest(self, tmp_path):
+        package_dir = tmp_path / "mypackage"
+        package_dir.mkdir()
+        write_tool(package_dir / "a.py", "tool_a")
+        write_tool(package_dir / "b.py", "tool_b")
+
+        first = Toolkit.tools_from_directory(package_dir, "mypackage")
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("file was read")):
+            second = Toolkit.tools_from_directory(package_dir, "mypackage")
+
+        assert first == second == {"mypackage.a": ["tool_a"], "mypackage.b": ["tool_b"]}
+
+    def test_tools_from_directory_raises_for_invalid_files(self, tmp_path):
+        package_dir = tmp_path / "mypackage"
+        package_dir.mkdir()
+        (package_dir / "bad.py").write_text("def broken(:\n", encoding="utf-8")
+
+        with pytest.raises(SyntaxError, match=r"bad\.py"):
+            Toolkit.tools_from_directory(package_dir, "mypackage")
+
+    def test_analyze_files_for_tools_skips_unparseable_files(self, tmp_path, files):
+        bad = tmp_path / "bad.py"
+        bad.write_text("def broken(:\n", encoding="utf-8")
+
+        results = analyze_files_for_tools([*files, bad])
+
+        assert results == [(f, [f"tool_{i}"]) for i, f in enumerate(files)]
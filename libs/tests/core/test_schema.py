@@ -76,6 +76,38 @@ def test_get_secret_with_empty_key():
         tool_context.get_secret("")
 
 
+def test_get_secret_first_case_insensitive_match_wins():
+    secrets = [
+        ToolSecretItem(key="Api_Key", value="first"),
+        ToolSecretItem(key="API_KEY", value="second"),
+    ]
+    tool_context = ToolContext(secrets=secrets)
+
+    assert tool_context.get_secret("api_key") == "first"
+
+
+def test_get_secret_sees_reassigned_and_appended_secrets():
+    tool_context = ToolContext(secrets=[ToolSecretItem(key="a", value="1")])
+    assert tool_context.get_secret("A") == "1"
+
+    tool_context.secrets = [ToolSecretItem(key="b", value="2")]
+    assert tool_context.get_secret("b") == "2"
+    with pytest.raises(ValueError, match="Secret 'a' not found in context."):
+        tool_context.get_secret("a")
+
+    tool_context.secrets.append(ToolSecretItem(key="c", value="3"))
+    assert tool_context.get_secret("C") == "3"
+
+
+def test_set_secret_updates_indexed_value():
+    tool_context = ToolContext()
+    tool_context.set_secret("token", "old")
+    assert tool_context.get_secret("TOKEN") == "old"
+
+    tool_context.set_secret("token", "new")
+    assert tool_context.get_secret("TOKEN") == "new"
+
+
 def test_get_metadata_valid():
     key = "my_key"
     val = "metadata_value"
@@ -545,10 +545,8 @@ def helper_tool():
 
         return package_dir
 
-    @patch("arcade_core.toolkit.get_tools_from_file")
-    def test_skips_file_when_path_matches(self, mock_get_tools, temp_package):
+    def test_skips_file_when_path_matches(self, temp_package):
         """Verify skip when __main__.__file__ matches module path (original behavior)."""
-        mock_get_tools.return_value = ["some_tool"]
         entrypoint_path = temp_package / "entrypoint.py"
 
         # Create mock __main__ module with matching file path
@@ -563,15 +561,12 @@ def helper_tool():
         assert "mypackage.entrypoint" not in result
         assert "mypackage.tools.helper" in result
 
-    @patch("arcade_core.toolkit.get_tools_from_file")
-    def test_skips_file_when_module_name_matches(self, mock_get_tools, temp_package):
+    def test_skips_file_when_module_name_matches(self, temp_package):
         """Verify skip when __main__.__spec__.name matches even if paths differ.
 
         This simulates deployment scenarios where the script runs from a bundle
         but the package is installed in site-packages (different paths).
         """
-        mock_get_tools.return_value = ["some_tool"]
-
         # Create mock __main__ module with different file path but matching module name
         mock_main = MagicMock()
         mock_main.__file__ = "/some/other/path/entrypoint.py"  # Different path
@@ -586,11 +581,8 @@ def helper_tool():
         assert "mypackage.entrypoint" not in result
         assert "mypackage.tools.helper" in result
 
-    @patch("arcade_core.toolkit.get_tools_from_file")
-    def test_no_skip_when_different_module(self, mock_get_tools, temp_package):
+    def test_no_skip_when_different_module(self, temp_package):
         """Verify unrelated modules are not skipped."""
-        mock_get_tools.return_value = ["some_tool"]
-
         # Create mock __main__ module with completely different identity
         mock_main = MagicMock()
         mock_main.__file__ = "/some/other/path/other_script.py"
@@ -605,11 +597,8 @@ def helper_tool():
         assert "mypackage.entrypoint" in result
         assert "mypackage.tools.helper" in result
 
-    @patch("arcade_core.toolkit.get_tools_from_file")
-    def test_no_skip_when_no_main_module(self, mock_get_tools, temp_package):
+    def test_no_skip_when_no_main_module(self, temp_package):
         """Handle case where __main__ is not in sys.modules."""
-        mock_get_tools.return_value = ["some_tool"]
-
         # Remove __main__ from sys.modules
         with patch.dict("sys.modules", {"__main__": None}):
             result = Toolkit.tools_from_directory(temp_package, "mypackage")
@@ -618,11 +607,8 @@ def helper_tool():
         assert "mypackage.entrypoint" in result
         assert "mypackage.tools.helper" in result
 
-    @patch("arcade_core.toolkit.get_tools_from_file")
-    def test_no_skip_when_no_spec(self, mock_get_tools, temp_package):
+    def test_no_skip_when_no_spec(self, temp_package):
         """Handle case where __main__ has no __spec__ attribute."""
-        mock_get_tools.return_value = ["some_tool"]
-
         # Create mock __main__ module with different file path and no __spec__
         mock_main = MagicMock()
         mock_main.__file__ = "/some/other/path/script.py"
@@ -635,11 +621,8 @@ def helper_tool():
         assert "mypackage.entrypoint" in result
         assert "mypackage.tools.helper" in result
 
-    @patch("arcade_core.toolkit.get_tools_from_file")
-    def test_no_skip_when_spec_has_no_name(self, mock_get_tools, temp_package):
+    def test_no_skip_when_spec_has_no_name(self, temp_package):
         """Handle case where __main__.__spec__ exists but has no name."""
-        mock_get_tools.return_value = ["some_tool"]
-
         # Create mock __main__ module with __spec__ but no name
         mock_main = MagicMock()
         mock_main.__file__ = "/some/other/path/script.py"
@@ -244,6 +244,35 @@ def test_eval_case_multiple_critics():
     assert result.passed
 
 
+# Test that critic results from the cost matrix are reused for final scoring
+def test_eval_case_evaluates_each_pair_once():
+    """
+    Test that each (expected, actual, critic) combination is scored once, even though
+    the cost matrix and the final scoring both need the assigned pairs.
+    """
+    calls: list[tuple[str, str]] = []
+
+    class CountingCritic(BinaryCritic):
+        def evaluate(self, expected, actual):
+            calls.append((expected, actual))
+            return super().evaluate(expected, actual)
+
+    values = ["a", "b", "c"]
+    case = EvalCase(
+        name="TestCase",
+        system_message="",
+        user_message="",
+        expected_tool_calls=[NamedExpectedToolCall(name="ToolA", args={"p": v}) for v in values],
+        critics=[CountingCritic(critic_field="p", weight=1.0)],
+    )
+
+    result = case.evaluate([("ToolA", {"p": v}) for v in reversed(values)])
+
+    assert result.score == 1.0
+    assert len(calls) == len(values) ** 2
+    assert len(set(calls)) == len(calls)
+
+
 # Test EvalCase with missing expected and actual values in args
 def test_eval_case_with_none_values():
     """
@@ -870,7 +870,7 @@ class TestRunWithProviderFunctions:
 
             await _run_with_openai(minimal_suite, "test-key", "gpt-4o")
 
-            mock_openai_class.assert_called_once_with(api_key="test-key")
+            mock_openai_class.assert_called_once_with(api_key="test-key", max_retries=0)
 
     @pytest.mark.asyncio
     async def test_run_with_anthropic_creates_client(self, minimal_suite: EvalSuite) -> None:
@@ -0,0 +1,160 @@
+import asyncio
+import gzip
+import json
+import zlib
+
+import pytest
+from arcade_serve.fastapi import compression
+from arcade_serve.fastapi.compression import (
+    CompressionMiddleware,
+    is_compressible,
+    negotiate_encoding,
+)
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+LARGE_PAYLOAD = {
+    "tools": [{"name": f"tool_{i}", "description": "Does a thing"} for i in range(200)]
+}
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/large")
+    def large() -> dict:
+        return LARGE_PAYLOAD
+
+    @app.get("/small")
+    def small() -> dict:
+        return {"ok": True}
+
+    @app.get("/png")
+    def png() -> Response:
+        return Response(b"\x89PNG" + b"\x00" * 4096, media_type="image/png")
+
+    @app.get("/encoded")
+    def encoded() -> Response:
+        body = gzip.compress(json.dumps(LARGE_PAYLOAD).encode())
+        return Response(body, media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/chunked")
+    def chunked() -> StreamingResponse:
+        chunks = (json.dumps(LARGE_PAYLOAD).encode() for _ in range(3))
+        return StreamingResponse(chunks, media_type="application/json")
+
+    @app.get("/events")
+    def events() -> StreamingResponse:
+        chunks = (f"event: message\ndata: {i}\n\n".encode() for i in range(3))
+        return StreamingResponse(chunks, media_type="text/event-stream")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=500, encodings=["gzip"])
+    return app
+
+
+@pytest.fixture
+def client(app) -> TestClient:
+    return TestClient(app, headers={"Accept-Encoding": "gzip"})
+
+
+class TestNegotiateEncoding:
+    def test_prefers_encodings_in_offered_order(self):
+        assert negotiate_encoding("gzip, br, zstd", ["zstd", "br", "gzip"]) == "zstd"
+
+    def test_respects_q_values(self):
+        assert negotiate_encoding("zstd;q=0.1, gzip", ["zstd", "gzip"]) == "gzip"
+        assert negotiate_encoding("gzip;q=0", ["gzip"]) is None
+
+    def test_wildcard(self):
+        assert negotiate_encoding("*", ["br", "gzip"]) == "br"
+        assert negotiate_encoding("*, br;q=0", ["br", "gzip"]) == "gzip"
+
+    def test_nothing_acceptable(self):
+        assert negotiate_encoding("", ["gzip"]) is None
+        assert negotiate_encoding("identity, deflate", ["gzip"]) is None
+
+    def test_unavailable_encodings_are_not_offered(self, monkeypatch):
+        monkeypatch.setattr(compression, "_brotli", None)
+        monkeypatch.setattr(compression, "_zstandard", None)
+
+        middleware = CompressionMiddleware(FastAPI(), encodings=["zstd", "br", "gzip"])
+
+        assert middleware.encodings == ["gzip"]
+
+
+class TestCompressionMiddleware:
+    def test_large_json_is_compressed(self, client):
+        response = client.get("/large")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(json.dumps(LARGE_PAYLOAD))
+        assert response.json() == LARGE_PAYLOAD
+
+    def test_small_json_is_not_compressed(self, client):
+        response = client.get("/small")
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"ok": True}
+
+    def test_client_without_accept_encoding_gets_identity(self, app):
+        response = TestClient(app, headers={"Accept-Encoding": "identity"}).get("/large")
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == LARGE_PAYLOAD
+
+    def test_incompressible_and_encoded_bodies_are_skipped(self, client):
+        png = client.get("/png")
+        encoded = client.get("/encoded")
+
+        assert "content-encoding" not in png.headers
+        assert png.content.startswith(b"\x89PNG")
+        assert encoded.headers["content-encoding"] == "gzip"
+        assert encoded.json() == LARGE_PAYLOAD
+
+    def test_streamed_json_is_compressed(self, client):
+        response = client.get("/chunked")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == json.dumps(LARGE_PAYLOAD) * 3
+
+    @pytest.mark.asyncio
+    async def test_each_event_is_decodable_as_it_arrives(self, app):
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/events",
+            "raw_path": b"/events",
+            "query_string": b"",
+            "headers": [(b"accept-encoding", b"gzip")],
+        }
+        messages = []
+        requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+        async def receive() -> dict:
+            if requests:
+                return requests.pop()
+            await asyncio.Event().wait()  # the client never disconnects
+            return {}
+
+        async def send(message: dict) -> None:
+            messages.append(message)
+
+        await app(scope, receive, send)
+
+        start = dict(messages[0]["headers"])
+        assert start[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in start
+        decoder = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        events = [decoder.decompress(m["body"]).decode() for m in messages[1:] if m["body"]]
+        assert events[:3] == [f"event: message\ndata: {i}\n\n" for i in range(3)]
+
+
+def test_is_compressible():
+    assert is_compressible("application/json")
+    assert is_compressible("text/event-stream; charset=utf-8")
+    assert is_compressible("application/problem+json")
+    assert not is_compressible("image/png")
+    assert not is_compressible("")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark: building vs streaming a large eval report.
+
+Generates a synthetic multi-model run with conversations attached to every
+case, then renders it in each format two ways: ``format()`` followed by a
+single write (the whole report held as one string), and ``write()``, which
+streams the report to the file and moves large conversations into fragment
+files next to it. Reports wall time, peak traced memory, and output size.
+
+Usage:
+    python scripts/benchmarks/bench_eval_report.py [--cases N] [--models N] [--formats txt,md,html]
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from arcade_cli.formatters import get_formatter
+from arcade_cli.formatters.base import ReportFragments
+from arcade_evals import EvalRubric
+from arcade_evals.eval import EvaluationResult
+
+
+def make_case(index: int, rng: random.Random) -> dict[str, Any]:
+    score = rng.random()
+    query = " ".join(rng.choices(["weather", "in", "paris", "tomorrow", "rain"], k=8))
+    evaluation = EvaluationResult(
+        score=score,
+        passed=score > 0.8,
+        warning=0.6 < score <= 0.8,
+        results=[
+            {
+                "field": "tool_selection",
+                "match": True,
+                "score": 1.0,
+                "weight": 1.0,
+                "expected": "get_weather",
+                "actual": "get_weather",
+                "is_criticized": True,
+            },
+            {
+                "field": "query",
+                "match": score > 0.5,
+                "score": score,
+                "weight": 1.0,
+                "expected": query,
+                "actual": query[::-1],
+                "is_criticized": True,
+            },
+        ],
+        failure_reason=None if score > 0.3 else "Tool arguments did not match",
+    )
+    tool_output = "Sunny, 22C. " * rng.randint(10, 400)
+    return {
+        "name": f"case {index}",
+        "input": f"What's the {query}?",
+        "system_message": "You are a helpful assistant.",
+        "additional_messages": [
+            {"role": "user", "content": f"What's the {query}?"},
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "get_weather", "arguments": '{"city": "Paris"}'},
+                    }
+                ],
+            },
+            {
+                "role": "tool",
+                "content": tool_output,
+                "tool_call_id": "call_1",
+                "name": "get_weather",
+            },
+            {"role": "assistant", "content": "It will be sunny tomorrow."},
+        ],
+        "expected_tool_calls": [{"name": "get_weather", "args": {"city": "Paris"}}],
+        "predicted_tool_calls": [{"name": "get_weather", "args": {"city": "Paris"}}],
+        "evaluation": evaluation,
+    }
+
+
+def make_results(num_cases: int, num_models: int) -> list[list[dict[str, Any]]]:
+    rng = random.Random(0)  # noqa: S311
+    per_model = num_cases // num_models
+    return [
+        [
+            {
+                "model": f"model-{m}",
+                "suite_name": "weather",
+                "rubric": EvalRubric(),
+                "cases": [make_case(i, rng) for i in range(per_model)],
+            }
+        ]
+        for m in range(num_models)
+    ]
+
+
+def measure(render) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    render()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cases", type=int, default=10_000)
+    parser.add_argument("--models", type=int, default=1)
+    parser.add_argument("--formats", default="txt,md,html")
+    args = parser.parse_args()
+
+    results = make_results(args.cases, args.models)
+    options = {"show_details": True, "include_context": True}
+    out_dir = Path(tempfile.mkdtemp(prefix="bench_eval_report_"))
+    print(f"{args.cases} cases across {args.models} models\n")
+    print(
+        f"{'format':<6} {'mode':<7} {'time (s)':>9} {'peak MB':>9} {'report MB':>10} {'fragments':>10}"
+    )
+
+    try:
+        for fmt in args.formats.split(","):
+            formatter = get_formatter(fmt)
+            built = out_dir / f"built.{fmt}"
+            streamed = out_dir / f"streamed.{fmt}"
+
+            def build(formatter=formatter, built=built) -> None:
+                built.write_text(formatter.format(results, **options), encoding="utf-8")
+
+            fragments = ReportFragments.for_report(streamed)
+
+            def stream(formatter=formatter, streamed=streamed, fragments=fragments) -> None:
+                with streamed.open("w", encoding="utf-8") as f:
+                    formatter.write(results, f, fragments=fragments, **options)
+
+            for mode, render, path, split in (
+                ("build", build, built, None),
+                ("stream", stream, streamed, fragments),
+            ):
+                elapsed, peak = measure(render)
+                size = path.stat().st_size / 1e6
+                frags = "-" if split is None else str(split.count)
+                print(
+                    f"{fmt:<6} {mode:<7} {elapsed:>9.2f} {peak / 1e6:>9.1f} {size:>10.1f} {frags:>10}"
+                )
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: outbound path of the HTTP streamable transport for large results.
+
+Sends large tool results from the session through the transport's message
+router to a per-request stream and builds the SSE event for each, two ways:
+as a plain JSON string (the router parses it back into a model, and the event
+encodes the model again) and as an ``OutboundMessage`` (the router reads the
+attached model and the event reuses the encoded text). Reports wall time and
+peak traced memory.
+
+Usage:
+    python scripts/benchmarks/bench_http_outbound.py [--messages N] [--result-kb N]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import tracemalloc
+
+import anyio
+from arcade_mcp_server.transports.http_streamable import EventMessage, HTTPStreamableTransport
+from arcade_mcp_server.types import JSONRPCResponse, OutboundMessage
+
+
+def make_response(request_id: int, result_kb: int) -> JSONRPCResponse:
+    text = "x" * 1024
+    return JSONRPCResponse(
+        id=request_id,
+        result={
+            "content": [{"type": "text", "text": text} for _ in range(result_kb)],
+            "structuredContent": {"rows": [{"id": i, "value": text} for i in range(result_kb)]},
+            "isError": False,
+        },
+    )
+
+
+async def route(responses: list[JSONRPCResponse], encode_once: bool) -> None:
+    transport = HTTPStreamableTransport(mcp_session_id="bench")
+    async with transport.connect() as (_, write_stream):
+        for response in responses:
+            request_id = str(response.id)
+            transport._request_streams[request_id] = anyio.create_memory_object_stream[
+                EventMessage
+            ](1)
+            if encode_once:
+                await write_stream.send(OutboundMessage.from_message(response))
+            else:
+                await write_stream.send(
+                    response.model_dump_json(exclude_none=True, by_alias=True) + "\n"
+                )
+            event = await transport._request_streams[request_id][1].receive()
+            transport._create_event_data(event)
+            await transport._clean_up_memory_streams(request_id)
+
+
+def measure(responses: list[JSONRPCResponse], encode_once: bool) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(route(responses, encode_once))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--result-kb", type=int, default=512)
+    args = parser.parse_args()
+    # The router logs its stream being closed when the transport shuts down
+    logging.disable(logging.ERROR)
+
+    responses = [make_response(i, args.result_kb) for i in range(args.messages)]
+    print(f"{args.messages} responses of ~{2 * args.result_kb} KB each\n")
+    print(f"{'mode':<12} {'time (s)':>9} {'per msg (ms)':>13} {'peak MB':>9}")
+    for mode, encode_once in (("reparse", False), ("encode once", True)):
+        elapsed, peak = measure(responses, encode_once)
+        per_message = elapsed / args.messages * 1000
+        print(f"{mode:<12} {elapsed:>9.2f} {per_message:>13.2f} {peak / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: resources/read lookups against many URI templates.
+
+Registers N resource templates spread over a few dozen schemes and path
+prefixes, then times ``ResourceManager.read_resource`` for URIs that hit a
+template and for URIs that match none. The template index narrows each
+lookup to the templates sharing the URI's literal prefix; the "linear" row
+runs every template's regex, as the manager did before the index, for
+comparison.
+
+Usage:
+    python scripts/benchmarks/bench_resource_templates.py [--templates N] [--reads N]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import time
+
+from arcade_mcp_server.exceptions import NotFoundError
+from arcade_mcp_server.managers.resource import ResourceManager
+from arcade_mcp_server.types import ResourceTemplate
+
+SCHEMES = [f"svc{i}" for i in range(20)]
+AREAS = ["users", "projects", "docs", "tickets", "files"]
+
+
+def templates(count: int) -> list[str]:
+    return [
+        f"{SCHEMES[i % len(SCHEMES)]}://{AREAS[i % len(AREAS)]}/kind{i}/{{key}}/detail"
+        for i in range(count)
+    ]
+
+
+def uris(count: int) -> tuple[list[str], list[str]]:
+    hits = [
+        f"{SCHEMES[i % len(SCHEMES)]}://{AREAS[i % len(AREAS)]}/kind{i}/{i * 7}/detail"
+        for i in range(0, count, max(count // 50, 1))
+    ]
+    misses = [f"{scheme}://{area}/unknown/1/detail" for scheme in SCHEMES for area in AREAS]
+    return hits, misses
+
+
+async def build(count: int) -> ResourceManager:
+    manager = ResourceManager(multiple_match_policy="ignore")
+    for template in templates(count):
+        await manager.add_template_with_handler(
+            ResourceTemplate(uriTemplate=template, name=template),
+            lambda uri, key: key,
+        )
+    return manager
+
+
+async def indexed_read(manager: ResourceManager, uri: str) -> None:
+    with contextlib.suppress(NotFoundError):
+        await manager.read_resource(uri)
+
+
+async def linear_read(manager: ResourceManager, uri: str) -> None:
+    # The pre-index lookup: every template's regex, then the first match
+    matches = [
+        (template, match)
+        for template, pattern in manager._template_patterns.items()
+        if (match := pattern.match(uri))
+    ]
+    if matches:
+        template, match = matches[0]
+        manager._template_handlers[template](uri, **match.groupdict())
+
+
+async def per_read_us(read, manager: ResourceManager, targets: list[str], reads: int) -> float:
+    start = time.perf_counter()
+    for i in range(reads):
+        await read(manager, targets[i % len(targets)])
+    return (time.perf_counter() - start) / reads * 1e6
+
+
+async def run(count: int, reads: int) -> None:
+    start = time.perf_counter()
+    manager = await build(count)
+    register_ms = (time.perf_counter() - start) * 1000
+    hits, misses = uris(count)
+
+    print(f"{count:,} templates registered in {register_ms:,.0f} ms\n")
+    print(f"{'lookup':<10} {'hit (µs)':>10} {'miss (µs)':>10}")
+    for name, read in (("linear", linear_read), ("indexed", indexed_read)):
+        hit = await per_read_us(read, manager, hits, reads)
+        miss = await per_read_us(read, manager, misses, reads)
+        print(f"{name:<10} {hit:>10,.1f} {miss:>10,.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--templates", type=int, default=1_000)
+    parser.add_argument("--reads", type=int, default=5_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    asyncio.run(run(args.templates, args.reads))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: tools/call response size under each result encoding policy.
+
+Encodes representative tool results (a search page, a wide record, a large
+table, a long document, a short scalar) as complete JSON-RPC responses under
+the ``both``, ``structured``, and ``text`` result encodings, and prints the
+serialized size of each. ``text`` is measured for a tool without an
+outputSchema; tools that declare one always send structuredContent.
+
+Usage:
+    python scripts/benchmarks/bench_result_encoding.py [--rows N]
+"""
+
+import argparse
+import json
+from typing import Any
+
+from arcade_mcp_server.convert import ResultEncoding, encode_tool_result
+from arcade_mcp_server.types import CallToolResult, JSONRPCResponse
+
+ENCODINGS: tuple[ResultEncoding, ...] = ("both", "structured", "text")
+
+
+def payloads(rows: int) -> dict[str, Any]:
+    return {
+        "search page": {
+            "results": [
+                {
+                    "id": f"msg_{i}",
+                    "subject": f"Quarterly planning follow-up #{i}",
+                    "from": "alice@example.com",
+                    "snippet": "Following up on the action items from Tuesday's meeting. " * 2,
+                    "labels": ["INBOX", "IMPORTANT"],
+                }
+                for i in range(25)
+            ],
+            "next_page_token": "CiAKGjBpNDd2Nmp2Zml2cXRwYjBpOXA0",
+        },
+        "wide record": {f"field_{i}": f"value with unicode ✓ {i}" for i in range(80)},
+        "large table": [
+            {"id": i, "name": f"row {i}", "score": i * 0.5, "tags": ["a", "b"]} for i in range(rows)
+        ],
+        "long document": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 400,
+        "short scalar": 42,
+    }
+
+
+def response_size(value: Any, encoding: ResultEncoding) -> int:
+    content, structured = encode_tool_result(value, encoding)
+    response = JSONRPCResponse(
+        id=1,
+        result=CallToolResult(content=content, structuredContent=structured, isError=False),
+    )
+    return len(response.model_dump_json(exclude_none=True, by_alias=True).encode())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000)
+    args = parser.parse_args()
+
+    header = "".join(f"{encoding + ' (B)':>17}" for encoding in ENCODINGS)
+    print(f"{'payload':<15} {'raw (B)':>9}{header} {'saved':>7}")
+    for name, value in payloads(args.rows).items():
+        raw = len(json.dumps(value, ensure_ascii=False).encode())
+        sizes = [response_size(value, encoding) for encoding in ENCODINGS]
+        saved = 1 - min(sizes[1:]) / sizes[0]
+        cells = "".join(f"{size:>17,}" for size in sizes)
+        print(f"{name:<15} {raw:>9,}{cells} {saved:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: toolkit tool discovery with and without the discovery manifest.
+
+Generates a synthetic toolkit of many small modules, each defining a few
+@tool functions, then discovers its tools three ways: the legacy serial path
+(compile each file, then parse it again to find the tools), a cold manifest
+scan (every file parsed, in a thread pool), and a warm manifest scan (no file
+changed since the manifest was written).
+
+Usage:
+    python scripts/benchmarks/bench_tool_discovery.py [--files N] [--tools-per-file N]
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from arcade_core.manifest import DiscoveryManifest, scan_files_for_tools
+from arcade_core.parse import get_tools_from_file
+from arcade_core.toolkit import Toolkit
+
+TOOL_TEMPLATE = '''
+
+@tool
+def {name}(query: Annotated[str, "What to look up"], limit: int = 10) -> dict:
+    """Look up {name}."""
+    results = [{{"id": i, "query": query}} for i in range(limit)]
+    return {{"tool": "{name}", "results": results}}
+'''
+
+
+def make_toolkit(directory: Path, num_files: int, tools_per_file: int) -> list[Path]:
+    files = []
+    for i in range(num_files):
+        body = "from typing import Annotated\n\nfrom arcade_tdk import tool\n"
+        body += "".join(TOOL_TEMPLATE.format(name=f"tool_{i}_{j}") for j in range(tools_per_file))
+        path = directory / f"module_{i}.py"
+        path.write_text(body, encoding="utf-8")
+        files.append(path)
+    return files
+
+
+def legacy(files: list[Path]) -> int:
+    found = 0
+    for path in files:
+        Toolkit.validate_file(path)
+        found += len(get_tools_from_file(path))
+    return found
+
+
+def scan(files: list[Path], manifest: DiscoveryManifest) -> int:
+    found = 0
+    for _, names in scan_files_for_tools(files, manifest=manifest, validate=True):
+        if isinstance(names, Exception):
+            raise names
+        found += len(names)
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2_000)
+    parser.add_argument("--tools-per-file", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp(prefix="bench_tool_discovery_"))
+    try:
+        toolkit_dir = tmp / "toolkit"
+        toolkit_dir.mkdir()
+        files = make_toolkit(toolkit_dir, args.files, args.tools_per_file)
+        manifest_path = tmp / "manifest.json"
+        print(f"{args.files} files, {args.tools_per_file} tools each\n")
+        print(f"{'mode':<16} {'time (s)':>9} {'tools':>7} {'parsed':>7}")
+
+        start = time.perf_counter()
+        found = legacy(files)
+        print(
+            f"{'legacy serial':<16} {time.perf_counter() - start:>9.3f} {found:>7} {len(files):>7}"
+        )
+
+        for mode in ("manifest cold", "manifest warm"):
+            manifest = DiscoveryManifest(manifest_path)
+            start = time.perf_counter()
+            found = scan(files, manifest)
+            elapsed = time.perf_counter() - start
+            print(f"{mode:<16} {elapsed:>9.3f} {found:>7} {manifest.misses:>7}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-call ToolExecutor overhead for tools with nested arguments.
+
+Compares the legacy argument path (``input_model(**kwargs)`` followed by a
+full ``model_dump()`` to build the call kwargs, and ``output_model(**...)``
+for the result) against ``ToolExecutor.run``, which reuses each model's
+compiled validator and only dumps the arguments that hold nested models.
+The tool bodies are trivial so the numbers reflect executor overhead.
+
+Usage:
+    python scripts/benchmarks/bench_tool_executor.py [--iterations N]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Annotated, Any
+
+from arcade_core.catalog import ToolCatalog
+from arcade_core.executor import ToolExecutor
+from arcade_core.output import output_factory
+from arcade_core.schema import ToolCallOutput, ToolContext
+from arcade_tdk import tool
+from pydantic import BaseModel
+from typing_extensions import TypedDict
+
+
+class Point(TypedDict):
+    x: float
+    y: float
+
+
+class Shape(TypedDict, total=False):
+    name: str
+    points: list[Point]
+    labels: list[str]
+
+
+class Owner(BaseModel):
+    name: str
+    email: str
+    groups: list[str] = []
+
+
+class Document(BaseModel):
+    title: str
+    owner: Owner
+    sections: list[str]
+    metadata: dict[str, str] = {}
+
+
+@tool
+async def typeddict_tool(
+    shapes: Annotated[list[Shape], "Shapes"],
+    ids: Annotated[list[int], "Identifiers"],
+    query: Annotated[str, "Free text"],
+) -> Annotated[int, "Number of shapes"]:
+    """Tool with nested TypedDict arguments."""
+    return len(shapes)
+
+
+@tool
+async def pydantic_tool(
+    document: Annotated[Document, "Document"],
+    ids: Annotated[list[int], "Identifiers"],
+    query: Annotated[str, "Free text"],
+) -> Annotated[str, "Document title"]:
+    """Tool with nested Pydantic arguments."""
+    return document["title"]
+
+
+def make_inputs() -> dict[str, dict]:
+    return {
+        "typeddict_tool": {
+            "shapes": [
+                {
+                    "name": f"shape-{i}",
+                    "points": [{"x": float(j), "y": float(j)} for j in range(8)],
+                    "labels": ["a", "b", "c"],
+                }
+                for i in range(10)
+            ],
+            "ids": list(range(200)),
+            "query": "hello " * 50,
+        },
+        "pydantic_tool": {
+            "document": {
+                "title": "Quarterly report",
+                "owner": {"name": "Ada", "email": "ada@example.com", "groups": ["eng"]},
+                "sections": [f"section {i}" for i in range(50)],
+                "metadata": {f"k{i}": f"v{i}" for i in range(20)},
+            },
+            "ids": list(range(200)),
+            "query": "hello " * 50,
+        },
+    }
+
+
+async def legacy_run(
+    func: Any,
+    definition: Any,
+    input_model: Any,
+    output_model: Any,
+    context: ToolContext,
+    **kwargs: Any,
+) -> ToolCallOutput:
+    """The pre-fast-path ``ToolExecutor.run`` argument and result handling."""
+    inputs = input_model(**kwargs)
+    func_args = inputs.model_dump()
+    if definition.input.tool_context_parameter_name is not None:
+        func_args[definition.input.tool_context_parameter_name] = context
+    results = await func(**func_args)
+    output = output_model(**{"result": results})
+    return output_factory.success(data=output)
+
+
+async def measure(
+    runner: Any, materialized: Any, context: ToolContext, inputs: dict, iterations: int
+) -> float:
+    func = materialized.tool
+    definition = materialized.definition
+    input_model = materialized.input_model
+    output_model = materialized.output_model
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await runner(func, definition, input_model, output_model, context, **inputs)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main_async(iterations: int) -> None:
+    catalog = ToolCatalog()
+    catalog.add_tool(typeddict_tool, "Bench")
+    catalog.add_tool(pydantic_tool, "Bench")
+    context = ToolContext()
+    all_inputs = make_inputs()
+
+    print(f"{'tool':<16} {'legacy us/call':>15} {'fast us/call':>13} {'speedup':>8}")
+    for func in (typeddict_tool, pydantic_tool):
+        definition = catalog.find_tool_by_func(func)
+        materialized = catalog.get_tool(definition.get_fully_qualified_name())
+        inputs = all_inputs[func.__name__]
+
+        # Warm up both paths (the fast path builds its plan on first use).
+        legacy_out = await legacy_run(
+            func, definition, materialized.input_model, materialized.output_model, context, **inputs
+        )
+        fast_out = await ToolExecutor.run(
+            func, definition, materialized.input_model, materialized.output_model, context, **inputs
+        )
+        if legacy_out.value != fast_out.value:
+            raise RuntimeError(f"{func.__name__}: fast path diverged from legacy output")
+
+        legacy = await measure(legacy_run, materialized, context, inputs, iterations)
+        fast = await measure(ToolExecutor.run, materialized, context, inputs, iterations)
+        print(f"{func.__name__:<16} {legacy:>15.1f} {fast:>13.1f} {legacy / fast:>7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
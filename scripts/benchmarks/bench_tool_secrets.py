@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: per-call secret injection for a tool declaring 10 secrets.
+
+Compares the legacy per-call resolution (scan the declared secrets, consult
+the tool environment and ``os.environ``, ``set_secret`` each one, then
+``get_secret`` via a linear case-insensitive scan) against the pre-resolved
+bindings that ``ToolManager`` builds at load time and the indexed
+``ToolContext.get_secret`` lookup.
+
+Usage:
+    python scripts/benchmarks/bench_tool_secrets.py [--iterations N]
+"""
+
+import argparse
+import asyncio
+import os
+import timeit
+from typing import Annotated
+
+from arcade_core.catalog import ToolCatalog
+from arcade_core.schema import ToolContext
+from arcade_mcp_server import tool
+from arcade_mcp_server.server import MCPServer
+from arcade_mcp_server.settings import MCPSettings
+
+SECRET_KEYS = [f"BENCH_SECRET_{i}" for i in range(10)]
+
+
+@tool(requires_secrets=SECRET_KEYS)
+def ten_secrets(text: Annotated[str, "Input"]) -> Annotated[str, "Output"]:
+    """Tool that declares ten secrets."""
+    return text
+
+
+def legacy_create_tool_context(server: MCPServer, materialized: object) -> ToolContext:
+    """The pre-bindings implementation of ``MCPServer._create_tool_context``."""
+    tool_context = ToolContext()
+    for secret in materialized.definition.requirements.secrets:  # type: ignore[attr-defined]
+        if secret.key in server.settings.tool_secrets():
+            tool_context.set_secret(secret.key, server.settings.tool_secrets()[secret.key])
+        elif secret.key in os.environ:
+            tool_context.set_secret(secret.key, os.environ[secret.key])
+    tool_context.user_id = server._select_user_id()
+    return tool_context
+
+
+def legacy_get_secret(tool_context: ToolContext, key: str) -> str:
+    """The pre-index linear case-insensitive scan."""
+    normalized = key.lower()
+    for item in tool_context.secrets or []:
+        if item.key.lower() == normalized:
+            return item.value
+    raise ValueError(key)
+
+
+async def build_server() -> MCPServer:
+    settings = MCPSettings()
+    # Short-circuit user selection so the benchmark measures secret handling only.
+    settings.arcade.user_id = "bench-user"
+    settings.tool_environment.tool_environment.update(dict.fromkeys(SECRET_KEYS, "value"))
+    catalog = ToolCatalog()
+    catalog.add_tool(ten_secrets, "Bench")
+    server = MCPServer(catalog=catalog, settings=settings)
+    await server._tool_manager.load_from_catalog(catalog)
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    server = asyncio.run(build_server())
+    materialized = asyncio.run(server._tool_manager.get_tool("Bench.TenSecrets"))
+
+    def legacy() -> None:
+        ctx = legacy_create_tool_context(server, materialized)
+        for key in SECRET_KEYS:
+            legacy_get_secret(ctx, key)
+
+    def bindings() -> None:
+        ctx = server._create_tool_context(materialized)
+        for key in SECRET_KEYS:
+            ctx.get_secret(key)
+
+    for label, fn in (("legacy per-call resolution", legacy), ("pre-resolved bindings", bindings)):
+        seconds = min(timeit.repeat(fn, number=args.iterations, repeat=5))
+        print(f"{label:<28} {seconds / args.iterations * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()